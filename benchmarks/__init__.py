@@ -0,0 +1,6 @@
+"""
+Benchmark tooling for the data structure implementations.
+
+These modules are not part of the installed packages; run them from the
+repository root, e.g. ``python -m benchmarks.complexity_report``.
+"""
@@ -0,0 +1,683 @@
+"""
+Empirical complexity report for the data structure operations.
+
+Each registered operation is timed across a geometric range of input sizes and
+the timings are fitted against the O(1), O(log n), O(n), O(n log n) and O(n^2)
+growth models. Every sweep over the sizes is fitted on its own and the median
+model is reported, so one noisy sweep cannot change the result. Operations
+whose reported model grows faster than their documented complexity are flagged,
+which is how we decide whether an operation is safe to use on a hot path.
+
+Usage:
+    python -m benchmarks.complexity_report --output-dir complexity-report
+    python -m benchmarks.complexity_report --only sll --max-size 4096 --no-plots
+"""
+
+import argparse
+import gc
+import json
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from src.data_structures.linked_lists.linked_list_utilities import (
+    MultipleElementsHandler,
+)
+from src.data_structures.linked_lists.singly_linked_list.singly_linked_list_operations import (
+    delete_sll_last_element,
+    delete_sll_multiple_elements,
+    get_element_at_index as get_sll_element_at_index,
+    insert_sll_element,
+    insert_sll_first_element,
+    insert_sll_multiple_elements,
+)
+from src.data_structures.linked_lists.doubly_linked_list.doubly_linked_list_operations import (
+    delete_dll_tail_element,
+    get_element_at_index as get_dll_element_at_index,
+    insert_dll_element,
+)
+from src.data_structures.linked_lists.circular_singly_linked_list.circular_singly_linked_list_operations import (
+    delete_csll_last_element,
+    insert_csll_element,
+)
+from src.data_structures.linked_lists.circular_doubly_linked_list.circular_doubly_linked_list_operations import (
+    delete_cdll_last_element,
+    insert_cdll_element,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    add_child_nodes_from_index,
+    breadth_first_search,
+    depth_first_search,
+    level_order_traversal,
+    post_order_traversal,
+    pre_order_traversal,
+    search_and_remove_node,
+    search_and_remove_nodes,
+)
+
+from .workloads import (
+    build_balanced_tree,
+    build_cdll,
+    build_csll,
+    build_dll,
+    build_sll,
+    build_wide_tree,
+)
+
+# Growth models ordered from slowest to fastest growing. The order matters:
+# when two models fit equally well the slower-growing one is reported.
+COMPLEXITY_MODELS: list[tuple[str, Callable[[float], float]]] = [
+    ("O(1)", lambda n: 1.0),
+    ("O(log n)", lambda n: math.log2(n)),
+    ("O(n)", lambda n: float(n)),
+    ("O(n log n)", lambda n: n * math.log2(n)),
+    ("O(n^2)", lambda n: float(n) * n),
+]
+
+MODEL_RANK = {name: rank for rank, (name, _) in enumerate(COMPLEXITY_MODELS)}
+
+# Batch size used by the O(1) cases so that a single timing is well above the
+# resolution of the clock.
+CONSTANT_TIME_BATCH = 1000
+
+
+class ComplexityCase:
+    """
+    An operation to time at several input sizes.
+
+    ``setup(n)`` builds the input for size ``n`` and is not timed; ``run`` is
+    called once with the value returned by ``setup`` and is timed. Cases whose
+    documented complexity is quadratic or worse can cap their input size with
+    ``max_size`` to keep the report fast.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        group: str,
+        documented: str,
+        setup: Callable[[int], Any],
+        run: Callable[[Any], Any],
+        max_size: int | None = None,
+    ):
+        if documented not in MODEL_RANK:
+            raise ValueError(f"Unknown complexity model: {documented}")
+
+        self.name = name
+        self.group = group
+        self.documented = documented
+        self.setup = setup
+        self.run = run
+        self.max_size = max_size
+
+
+class ComplexityResult:
+    """Timings for one case together with the fitted complexity model."""
+
+    def __init__(
+        self,
+        case: ComplexityCase,
+        sizes: list[int],
+        timings: list[float],
+        observed: str | None,
+        fit_errors: dict[str, float],
+        coefficients: dict[str, tuple[float, float]],
+    ):
+        self.case = case
+        self.sizes = sizes
+        self.timings = timings
+        self.observed = observed
+        self.fit_errors = fit_errors
+        self.coefficients = coefficients
+
+    @property
+    def is_worse_than_documented(self) -> bool:
+        if self.observed is None:
+            return False
+        return MODEL_RANK[self.observed] > MODEL_RANK[self.case.documented]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.case.name,
+            "group": self.case.group,
+            "documented": self.case.documented,
+            "observed": self.observed,
+            "worse_than_documented": self.is_worse_than_documented,
+            "sizes": self.sizes,
+            "timings": self.timings,
+            "fit_errors": self.fit_errors,
+        }
+
+
+def _fit_model(
+    sizes: list[int], timings: list[float], model: Callable[[float], float]
+) -> tuple[float, float, float]:
+    """
+    Fit ``t = a + b * model(n)`` by least squares on relative error.
+
+    Both coefficients are constrained to be non-negative. Returns the
+    intercept, the slope and the root mean square relative error of the fit.
+    """
+    xs = [model(n) for n in sizes]
+    weights = [1.0 / (t * t) for t in timings]
+
+    sw = sum(weights)
+    swx = sum(w * x for w, x in zip(weights, xs))
+    swy = sum(w * t for w, t in zip(weights, timings))
+    swxx = sum(w * x * x for w, x in zip(weights, xs))
+    swxy = sum(w * x * t for w, x, t in zip(weights, xs, timings))
+
+    determinant = sw * swxx - swx * swx
+    if determinant > 1e-12 * sw * swxx:
+        intercept = (swy * swxx - swx * swxy) / determinant
+        slope = (sw * swxy - swx * swy) / determinant
+    else:
+        # The model is constant over the sampled sizes.
+        intercept, slope = swy / sw, 0.0
+
+    if slope < 0:
+        intercept, slope = swy / sw, 0.0
+    elif intercept < 0:
+        intercept, slope = 0.0, swxy / swxx
+
+    squared_errors = [
+        ((t - (intercept + slope * x)) / t) ** 2 for x, t in zip(xs, timings)
+    ]
+    return intercept, slope, math.sqrt(sum(squared_errors) / len(squared_errors))
+
+
+def fit_complexity(
+    sizes: list[int],
+    timings: list[float],
+    tolerance: float = 1.25,
+    noise_floor: float = 0.05,
+) -> tuple[str | None, dict[str, float], dict[str, tuple[float, float]]]:
+    """
+    Find the growth model that best explains the timings.
+
+    Every model in COMPLEXITY_MODELS is fitted; the slowest-growing model
+    whose error is within ``tolerance`` times the best error (plus
+    ``noise_floor``) is reported. Preferring the slower model absorbs small
+    timer noise; a single noisy sweep can still fit a faster-growing model,
+    which is why run_report fits several sweeps and takes the median.
+
+    Args:
+        sizes (list[int]): The input sizes that were measured
+        timings (list[float]): The time in seconds measured for each size
+        tolerance (float): Relative slack allowed over the best fit error
+        noise_floor (float): Absolute slack allowed over the best fit error
+
+    Returns:
+        tuple: The observed model name (None with fewer than three sizes),
+            the fit error of every model and its (intercept, slope) pair
+
+    Example:
+        >>> sizes = [2**k for k in range(8, 15)]
+        >>> fit_complexity(sizes, [1e-6 * n for n in sizes])[0]
+        'O(n)'
+    """
+    if len(sizes) != len(timings):
+        raise ValueError("sizes and timings must have the same length")
+
+    if len(sizes) < 3:
+        return None, {}, {}
+
+    timings = [max(t, 1e-9) for t in timings]
+    errors: dict[str, float] = {}
+    coefficients: dict[str, tuple[float, float]] = {}
+
+    for name, model in COMPLEXITY_MODELS:
+        intercept, slope, error = _fit_model(sizes, timings, model)
+        errors[name] = error
+        coefficients[name] = (intercept, slope)
+
+    best_error = min(errors.values())
+    threshold = best_error * tolerance + noise_floor
+
+    for name, _ in COMPLEXITY_MODELS:
+        if errors[name] <= threshold:
+            return name, errors, coefficients
+
+    return None, errors, coefficients  # pragma: no cover - threshold >= best
+
+
+def measure_case(
+    case: ComplexityCase, sizes: list[int], repeat: int
+) -> list[list[float]]:
+    """
+    Time a case at each size in ``repeat`` sweeps; returns one timing series
+    per sweep.
+
+    Each sweep covers every size before the next one starts, so a slow spell
+    of the machine lands on neighbouring sizes of one sweep rather than on
+    every run of one size. The garbage collector is disabled while the
+    operation runs so that a collection triggered by the setup is not
+    charged to the operation.
+    """
+    sweeps = []
+
+    for _ in range(repeat):
+        timings = []
+
+        for size in sizes:
+            state = case.setup(size)
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                case.run(state)
+                elapsed = time.perf_counter() - start
+            finally:
+                gc.enable()
+            timings.append(elapsed)
+
+        sweeps.append(timings)
+
+    return sweeps
+
+
+def run_report(
+    cases: list[ComplexityCase], sizes: list[int], repeat: int = 5
+) -> list[ComplexityResult]:
+    """
+    Measure and fit every case, honouring each case's ``max_size``.
+
+    The reported model is the median, by growth rate, of the models fitted
+    to each sweep, so a case is only flagged when most sweeps grow faster
+    than documented. The reported timings, fit errors and coefficients come
+    from the fastest time at each size.
+    """
+    results = []
+
+    for case in cases:
+        case_sizes = [n for n in sizes if case.max_size is None or n <= case.max_size]
+        sweeps = measure_case(case, case_sizes, repeat)
+        timings = [min(runs) for runs in zip(*sweeps)]
+        _, errors, coefficients = fit_complexity(case_sizes, timings)
+        observed = _median_model(
+            [fit_complexity(case_sizes, sweep)[0] for sweep in sweeps]
+        )
+        results.append(
+            ComplexityResult(case, case_sizes, timings, observed, errors, coefficients)
+        )
+
+    return results
+
+
+def _median_model(models: list[str | None]) -> str | None:
+    if not models or models[0] is None:
+        return None
+    ranks = sorted(MODEL_RANK[model] for model in models if model is not None)
+    return COMPLEXITY_MODELS[ranks[(len(ranks) - 1) // 2]][0]
+
+
+def format_summary_table(results: list[ComplexityResult]) -> str:
+    """Render the results as a Markdown table."""
+    lines = [
+        "| Group | Operation | Documented | Observed | Fit error | Largest n | Time at largest n | Status |",
+        "|---|---|---|---|---|---|---|---|",
+    ]
+
+    for result in results:
+        observed = result.observed or "n/a"
+        error = (
+            f"{result.fit_errors[result.observed]:.3f}" if result.observed else "n/a"
+        )
+        largest = result.sizes[-1] if result.sizes else "n/a"
+        slowest = f"{result.timings[-1] * 1e3:.3f} ms" if result.timings else "n/a"
+        status = "WORSE THAN DOCUMENTED" if result.is_worse_than_documented else "ok"
+        lines.append(
+            f"| {result.case.group} | {result.case.name} | {result.case.documented} "
+            f"| {observed} | {error} | {largest} | {slowest} | {status} |"
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def _slug(name: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in name).strip("_").lower()
+
+
+def write_scaling_plots(
+    results: list[ComplexityResult], output_dir: Path
+) -> list[Path]:
+    """
+    Write one log-log scaling plot per operation.
+
+    Each plot shows the measured timings, the fitted observed model and the
+    documented model scaled to the smallest measurement.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    model_functions = dict(COMPLEXITY_MODELS)
+    written = []
+
+    for result in results:
+        if len(result.sizes) < 2:
+            continue
+
+        figure, axes = plt.subplots(figsize=(6, 4))
+        axes.loglog(result.sizes, result.timings, "o", label="measured")
+
+        if result.observed is not None:
+            intercept, slope = result.coefficients[result.observed]
+            model = model_functions[result.observed]
+            axes.loglog(
+                result.sizes,
+                [intercept + slope * model(n) for n in result.sizes],
+                "-",
+                label=f"observed {result.observed}",
+            )
+
+        documented = model_functions[result.case.documented]
+        scale = result.timings[0] / documented(result.sizes[0])
+        axes.loglog(
+            result.sizes,
+            [scale * documented(n) for n in result.sizes],
+            "--",
+            label=f"documented {result.case.documented}",
+        )
+
+        axes.set_title(f"{result.case.group}: {result.case.name}")
+        axes.set_xlabel("input size n")
+        axes.set_ylabel("time (s)")
+        axes.legend()
+        figure.tight_layout()
+
+        path = output_dir / f"{_slug(result.case.group)}__{_slug(result.case.name)}.png"
+        figure.savefig(path)
+        plt.close(figure)
+        written.append(path)
+
+    return written
+
+
+# ---------------------------
+# Registered cases
+# ---------------------------
+
+
+def _repeat_constant_time(operation: Callable[[Any], Any]) -> Callable[[Any], None]:
+    def run(state: Any) -> None:
+        for _ in range(CONSTANT_TIME_BATCH):
+            operation(state)
+
+    return run
+
+
+def _sll_with_handlers(size: int) -> tuple[Any, list[MultipleElementsHandler]]:
+    handlers = [MultipleElementsHandler(index, index) for index in range(2, size + 1)]
+    return build_sll(size), handlers
+
+
+def _sll_with_deletion_indices(size: int) -> tuple[Any, list[int]]:
+    return build_sll(size), list(range(size // 2, size // 2 + size // 4))
+
+
+def _tree_with_targets(size: int) -> tuple[Any, list[int]]:
+    return build_balanced_tree(size), list(range(size, size - size // 8, -1))
+
+
+def _tree_with_pending_children(size: int) -> tuple[Any, list[int]]:
+    return build_wide_tree(size), list(range(size + 1, 2 * size + 1))
+
+
+def default_cases() -> list[ComplexityCase]:
+    """
+    The operations covered by the report with their documented complexity.
+
+    The documented column is the complexity the operation is expected to
+    have for the described workload; O(1) operations are timed in batches of
+    CONSTANT_TIME_BATCH calls.
+    """
+    quadratic_cap = 4096
+
+    return [
+        ComplexityCase(
+            "insert_sll_element",
+            "singly linked list",
+            "O(1)",
+            build_sll,
+            _repeat_constant_time(lambda sll: insert_sll_element(sll, 0)),
+        ),
+        ComplexityCase(
+            "insert_sll_first_element",
+            "singly linked list",
+            "O(1)",
+            build_sll,
+            _repeat_constant_time(lambda sll: insert_sll_first_element(sll, 0)),
+        ),
+        ComplexityCase(
+            "get_element_at_index (last index)",
+            "singly linked list",
+            "O(n)",
+            build_sll,
+            lambda sll: get_sll_element_at_index(sll.size, sll),
+        ),
+        ComplexityCase(
+            "delete_sll_last_element",
+            "singly linked list",
+            "O(n)",
+            build_sll,
+            delete_sll_last_element,
+        ),
+        ComplexityCase(
+            "insert_sll_multiple_elements (n elements)",
+            "singly linked list",
+            "O(n log n)",
+            _sll_with_handlers,
+            lambda state: insert_sll_multiple_elements(*state),
+            max_size=quadratic_cap,
+        ),
+        ComplexityCase(
+            "delete_sll_multiple_elements (n/4 indices)",
+            "singly linked list",
+            "O(n log n)",
+            _sll_with_deletion_indices,
+            lambda state: delete_sll_multiple_elements(*state),
+            max_size=quadratic_cap,
+        ),
+        ComplexityCase(
+            "insert_dll_element",
+            "doubly linked list",
+            "O(1)",
+            build_dll,
+            _repeat_constant_time(lambda dll: insert_dll_element(dll, 0)),
+        ),
+        ComplexityCase(
+            "delete_dll_tail_element",
+            "doubly linked list",
+            "O(1)",
+            lambda size: build_dll(size + CONSTANT_TIME_BATCH),
+            _repeat_constant_time(delete_dll_tail_element),
+        ),
+        ComplexityCase(
+            "get_element_at_index (last index)",
+            "doubly linked list",
+            "O(n)",
+            build_dll,
+            lambda dll: get_dll_element_at_index(dll, dll.size),
+        ),
+        ComplexityCase(
+            "insert_csll_element",
+            "circular singly linked list",
+            "O(1)",
+            build_csll,
+            _repeat_constant_time(lambda csll: insert_csll_element(csll, 0)),
+        ),
+        ComplexityCase(
+            "delete_csll_last_element",
+            "circular singly linked list",
+            "O(n)",
+            build_csll,
+            delete_csll_last_element,
+        ),
+        ComplexityCase(
+            "insert_cdll_element",
+            "circular doubly linked list",
+            "O(1)",
+            build_cdll,
+            _repeat_constant_time(lambda cdll: insert_cdll_element(cdll, 0)),
+        ),
+        ComplexityCase(
+            "delete_cdll_last_element",
+            "circular doubly linked list",
+            "O(1)",
+            lambda size: build_cdll(size + CONSTANT_TIME_BATCH),
+            _repeat_constant_time(delete_cdll_last_element),
+        ),
+        ComplexityCase(
+            "add_child_node (build n nodes)",
+            "n-ary tree",
+            "O(n)",
+            lambda size: size,
+            build_balanced_tree,
+        ),
+        ComplexityCase(
+            "add_child_nodes_from_index (n nodes at index 0)",
+            "n-ary tree",
+            "O(n)",
+            _tree_with_pending_children,
+            lambda state: add_child_nodes_from_index(state[0], state[1], 0),
+        ),
+        ComplexityCase(
+            "pre_order_traversal",
+            "n-ary tree",
+            "O(n)",
+            build_balanced_tree,
+            lambda root: pre_order_traversal(root, []),
+        ),
+        ComplexityCase(
+            "post_order_traversal",
+            "n-ary tree",
+            "O(n)",
+            build_balanced_tree,
+            lambda root: post_order_traversal(root, []),
+        ),
+        ComplexityCase(
+            "level_order_traversal (wide tree)",
+            "n-ary tree",
+            "O(n)",
+            build_wide_tree,
+            lambda root: level_order_traversal(root, []),
+        ),
+        ComplexityCase(
+            "breadth_first_search (miss, wide tree)",
+            "n-ary tree",
+            "O(n)",
+            build_wide_tree,
+            lambda root: breadth_first_search(root, -1),
+        ),
+        ComplexityCase(
+            "depth_first_search (miss)",
+            "n-ary tree",
+            "O(n)",
+            build_balanced_tree,
+            lambda root: depth_first_search(root, -1),
+        ),
+        ComplexityCase(
+            "search_and_remove_node (last leaf)",
+            "n-ary tree",
+            "O(n)",
+            lambda size: (build_balanced_tree(size), size),
+            lambda state: search_and_remove_node(*state),
+        ),
+        ComplexityCase(
+            "search_and_remove_nodes (n/8 targets)",
+            "n-ary tree",
+            "O(n)",
+            _tree_with_targets,
+            lambda state: search_and_remove_nodes(*state),
+            max_size=quadratic_cap,
+        ),
+    ]
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Fit empirical complexity models to operation timings."
+    )
+    parser.add_argument("--min-size", type=int, default=256)
+    parser.add_argument("--max-size", type=int, default=32768)
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="sweeps over the sizes; the median of their fitted models is kept",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        help="only run cases whose group or name contains this text (repeatable)",
+    )
+    parser.add_argument("--output-dir", type=Path, default=Path("complexity-report"))
+    parser.add_argument(
+        "--no-plots", action="store_true", help="skip writing matplotlib plots"
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="exit with status 1 if any operation is worse than documented",
+    )
+    return parser.parse_args(argv)
+
+
+def geometric_sizes(min_size: int, max_size: int) -> list[int]:
+    """Powers of two between ``min_size`` and ``max_size`` inclusive."""
+    if min_size < 2 or max_size < min_size:
+        raise ValueError("Sizes must satisfy 2 <= min_size <= max_size")
+
+    sizes = []
+    size = 1 << (min_size - 1).bit_length()
+    while size <= max_size:
+        sizes.append(size)
+        size *= 2
+    return sizes
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    sizes = geometric_sizes(args.min_size, args.max_size)
+
+    cases = default_cases()
+    if args.only:
+        cases = [
+            case
+            for case in cases
+            if any(text in case.name or text in case.group for text in args.only)
+        ]
+
+    results = run_report(cases, sizes, args.repeat)
+    table = format_summary_table(results)
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    (args.output_dir / "complexity_summary.md").write_text(table)
+    (args.output_dir / "complexity_summary.json").write_text(
+        json.dumps([result.to_dict() for result in results], indent=2)
+    )
+    if not args.no_plots:
+        try:
+            write_scaling_plots(results, args.output_dir)
+        except ImportError:
+            print(
+                "matplotlib is not installed; skipping plots "
+                "(install the 'visualization' extra to enable them)."
+            )
+
+    print(table)
+
+    regressions = [result for result in results if result.is_worse_than_documented]
+    if regressions:
+        print(f"{len(regressions)} operation(s) scale worse than documented.")
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,439 @@
+"""
+Per-operation memory benchmarks based on tracemalloc.
+
+For every registered case and size the report records the peak allocation
+while the operation runs, the bytes still retained once it returns (before
+and after a garbage collection) and the retained bytes per element. Results
+are written as JSON so that two runs, usually two commits, can be compared.
+
+Usage:
+    python -m benchmarks.memory_report run --output memory-head.json
+    python -m benchmarks.memory_report run --commit main --output memory-main.json
+    python -m benchmarks.memory_report compare memory-main.json memory-head.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from src.data_structures.linked_lists.singly_linked_list.singly_linked_list_operations import (
+    deep_clear_singly_linked_list,
+    shallow_clear_singly_linked_list,
+)
+from src.data_structures.linked_lists.doubly_linked_list.doubly_linked_list_operations import (
+    deep_clear_dll,
+    shallow_clear_dll,
+)
+from src.data_structures.linked_lists.circular_singly_linked_list import (
+    circular_singly_linked_list_operations as csll_operations,
+)
+from src.data_structures.linked_lists.circular_doubly_linked_list import (
+    circular_doubly_linked_list_operations as cdll_operations,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    pre_order_traversal,
+)
+
+from .workloads import (
+    build_balanced_tree,
+    build_binary_tree,
+    build_cdll,
+    build_csll,
+    build_dll,
+    build_path_tree,
+    build_sll,
+    build_ternary_tree,
+    build_wide_tree,
+)
+
+REPOSITORY_ROOT = Path(__file__).resolve().parent.parent
+
+METRICS = ("peak_bytes", "retained_bytes", "retained_after_gc_bytes")
+
+
+class MemoryCase:
+    """
+    An operation whose memory use is measured at several sizes.
+
+    ``setup(n)`` prepares the input and is excluded from the figures; the
+    value returned by ``run`` is kept alive until the retained bytes have been
+    read, so a builder's result counts as retained memory.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        group: str,
+        setup: Callable[[int], Any],
+        run: Callable[[Any], Any],
+    ):
+        self.name = name
+        self.group = group
+        self.setup = setup
+        self.run = run
+
+
+def measure_case(case: MemoryCase, size: int) -> dict[str, Any]:
+    """
+    Measure one case at one size.
+
+    Tracing starts before the setup so that memory released by the operation
+    (for example by a clear) shows up as negative retained bytes. Automatic
+    garbage collection is disabled while the operation runs; the retained
+    bytes are read once before and once after an explicit collection, which
+    separates memory freed by reference counting from memory that is only
+    reclaimed by the cycle collector.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        state = case.setup(size)
+        gc.collect()
+        gc.disable()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            result = case.run(state)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            gc.enable()
+        gc.collect()
+        after_gc = tracemalloc.get_traced_memory()[0]
+        del result, state
+    finally:
+        tracemalloc.stop()
+
+    retained = current - baseline
+    return {
+        "name": case.name,
+        "group": case.group,
+        "size": size,
+        "peak_bytes": peak - baseline,
+        "retained_bytes": retained,
+        "retained_after_gc_bytes": after_gc - baseline,
+        "bytes_per_element": retained / size if size else 0.0,
+    }
+
+
+def run_report(cases: list[MemoryCase], sizes: list[int]) -> list[dict[str, Any]]:
+    return [measure_case(case, size) for case in cases for size in sizes]
+
+
+# Set by ``run --commit`` for the child process, whose code may come from
+# this checkout rather than from the measured commit.
+COMMIT_VARIABLE = "DSA_MEMORY_REPORT_COMMIT"
+
+
+def _git_revision(cwd: Path, revision: str = "HEAD") -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--verify", f"{revision}^{{commit}}"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def build_document(results: list[dict[str, Any]], sizes: list[int]) -> dict[str, Any]:
+    return {
+        "metadata": {
+            "commit": os.environ.get(COMMIT_VARIABLE) or _git_revision(REPOSITORY_ROOT),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes,
+        },
+        "results": results,
+    }
+
+
+def compare_documents(
+    old: dict[str, Any], new: dict[str, Any], threshold: float = 0.05
+) -> list[dict[str, Any]]:
+    """
+    Pair up the results of two reports and compute the change of each metric.
+
+    A metric regresses when it grows by more than ``threshold`` (relative to
+    the magnitude of the old value). Cases that only exist in one of the two
+    reports are skipped.
+
+    Returns:
+        list[dict[str, Any]]: One entry per (group, name, size) present in both
+            reports, with the old value, new value and relative change of each
+            metric plus a ``regressions`` list naming the metrics that grew
+    """
+    old_index = {(r["group"], r["name"], r["size"]): r for r in old["results"]}
+    comparisons = []
+
+    for entry in new["results"]:
+        key = (entry["group"], entry["name"], entry["size"])
+        if key not in old_index:
+            continue
+
+        previous = old_index[key]
+        comparison: dict[str, Any] = {
+            "group": key[0],
+            "name": key[1],
+            "size": key[2],
+            "regressions": [],
+        }
+
+        for metric in METRICS:
+            before, after = previous[metric], entry[metric]
+            change = (after - before) / abs(before) if before else 0.0
+            comparison[metric] = {"old": before, "new": after, "change": change}
+            if after > before and change > threshold:
+                comparison["regressions"].append(metric)
+
+        comparisons.append(comparison)
+
+    return comparisons
+
+
+def format_results_table(results: list[dict[str, Any]]) -> str:
+    lines = [
+        "| Group | Operation | n | Peak | Retained | Retained after GC | Bytes/element |",
+        "|---|---|---|---|---|---|---|",
+    ]
+    for r in results:
+        lines.append(
+            f"| {r['group']} | {r['name']} | {r['size']} | {r['peak_bytes']:,} "
+            f"| {r['retained_bytes']:,} | {r['retained_after_gc_bytes']:,} "
+            f"| {r['bytes_per_element']:.1f} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def format_comparison_table(comparisons: list[dict[str, Any]]) -> str:
+    lines = [
+        "| Group | Operation | n | Peak | Retained | Retained after GC | Status |",
+        "|---|---|---|---|---|---|---|",
+    ]
+    for c in comparisons:
+        cells = [
+            f"{c[m]['old']:,} -> {c[m]['new']:,} ({c[m]['change']:+.1%})"
+            for m in METRICS
+        ]
+        status = (
+            "REGRESSED: " + ", ".join(c["regressions"]) if c["regressions"] else "ok"
+        )
+        lines.append(
+            f"| {c['group']} | {c['name']} | {c['size']} | "
+            + " | ".join(cells)
+            + f" | {status} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------
+# Registered cases
+# ---------------------------
+
+
+def default_cases() -> list[MemoryCase]:
+    """Builders for every structure plus shallow against deep clears."""
+
+    def build(builder: Callable[[int], Any]) -> MemoryCase:
+        return MemoryCase(builder.__name__, "build", lambda size: size, builder)
+
+    cases = [
+        build(build_sll),
+        build(build_dll),
+        build(build_csll),
+        build(build_cdll),
+        build(build_balanced_tree),
+        build(build_wide_tree),
+        build(build_path_tree),
+        build(build_binary_tree),
+        build(build_ternary_tree),
+        MemoryCase(
+            "shallow_clear_singly_linked_list",
+            "clear",
+            build_sll,
+            shallow_clear_singly_linked_list,
+        ),
+        MemoryCase(
+            "deep_clear_singly_linked_list",
+            "clear",
+            build_sll,
+            deep_clear_singly_linked_list,
+        ),
+        MemoryCase("shallow_clear_dll", "clear", build_dll, shallow_clear_dll),
+        MemoryCase("deep_clear_dll", "clear", build_dll, deep_clear_dll),
+        MemoryCase(
+            "shallow_clear_singly_linked_list (circular)",
+            "clear",
+            build_csll,
+            csll_operations.shallow_clear_singly_linked_list,
+        ),
+        MemoryCase(
+            "deep_clear_singly_linked_list (circular)",
+            "clear",
+            build_csll,
+            csll_operations.deep_clear_singly_linked_list,
+        ),
+        MemoryCase(
+            "shallow_clear_doubly_linked_list (circular)",
+            "clear",
+            build_cdll,
+            cdll_operations.shallow_clear_doubly_linked_list,
+        ),
+        MemoryCase(
+            "deep_clear_doubly_linked_list (circular)",
+            "clear",
+            build_cdll,
+            cdll_operations.deep_clear_doubly_linked_list,
+        ),
+        MemoryCase(
+            "pre_order_traversal",
+            "traversal",
+            build_balanced_tree,
+            lambda root: pre_order_traversal(root, []),
+        ),
+    ]
+
+    try:
+        from .routing_workloads import build_radix_trie, routing_prefixes
+    except ImportError:  # The measured commit predates the radix trie
+        return cases
+
+    # The prefixes are built in the setup, so both cases count only the
+    # structure; the trie's edges refer to the prefix strings.
+    return cases + [
+        MemoryCase("build_radix_trie", "routing", routing_prefixes, build_radix_trie),
+        MemoryCase(
+            "build_prefix_dict",
+            "routing",
+            routing_prefixes,
+            lambda prefixes: {prefix: index for index, prefix in enumerate(prefixes)},
+        ),
+    ]
+
+
+def _run_at_commit(
+    revision: str, sizes: list[int], only: list[str], output: Path
+) -> int:
+    """
+    Run the report against another commit in a temporary git worktree.
+
+    The worktree comes first on PYTHONPATH so that its ``src`` package is
+    measured; this checkout's ``benchmarks`` package is used when the other
+    commit predates it. The resolved commit is passed to the child in
+    COMMIT_VARIABLE, so the report records what was measured.
+    """
+    commit = _git_revision(REPOSITORY_ROOT, revision)
+    if commit is None:
+        print(f"Unknown revision: {revision}", file=sys.stderr)
+        return 2
+
+    with tempfile.TemporaryDirectory(prefix="memory-report-") as scratch:
+        worktree = Path(scratch) / "tree"
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", str(worktree), commit],
+            cwd=REPOSITORY_ROOT,
+            check=True,
+            capture_output=True,
+        )
+        try:
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join([str(worktree), str(REPOSITORY_ROOT)])
+            env[COMMIT_VARIABLE] = commit
+            command = [
+                sys.executable,
+                "-m",
+                "benchmarks.memory_report",
+                "run",
+                "--output",
+                str(output.resolve()),
+                "--sizes",
+                *map(str, sizes),
+            ]
+            for text in only:
+                command += ["--only", text]
+            return subprocess.run(command, cwd=worktree, env=env).returncode
+        finally:
+            subprocess.run(
+                ["git", "worktree", "remove", "--force", str(worktree)],
+                cwd=REPOSITORY_ROOT,
+                check=False,
+                capture_output=True,
+            )
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="tracemalloc memory benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="measure and write a JSON report")
+    run.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000])
+    run.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        help="only run cases whose group or name contains this text (repeatable)",
+    )
+    run.add_argument("--output", type=Path, default=Path("memory-report.json"))
+    run.add_argument(
+        "--commit", help="measure this git revision instead of the working tree"
+    )
+
+    compare = commands.add_parser("compare", help="compare two JSON reports")
+    compare.add_argument("old", type=Path)
+    compare.add_argument("new", type=Path)
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="relative growth above which a metric counts as a regression",
+    )
+    compare.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="exit with status 1 if any metric regressed",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+
+    if args.command == "compare":
+        comparisons = compare_documents(
+            json.loads(args.old.read_text()),
+            json.loads(args.new.read_text()),
+            args.threshold,
+        )
+        print(format_comparison_table(comparisons))
+        regressed = any(c["regressions"] for c in comparisons)
+        return 1 if regressed and args.fail_on_regression else 0
+
+    if args.commit:
+        return _run_at_commit(args.commit, args.sizes, args.only, args.output)
+
+    cases = default_cases()
+    if args.only:
+        cases = [
+            case
+            for case in cases
+            if any(text in case.name or text in case.group for text in args.only)
+        ]
+
+    results = run_report(cases, args.sizes)
+    args.output.write_text(json.dumps(build_document(results, args.sizes), indent=2))
+    print(format_results_table(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
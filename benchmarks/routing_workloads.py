@@ -0,0 +1,39 @@
+"""
+Routing-table inputs for the radix trie benchmarks.
+
+Kept apart from workloads so that the memory report can still run against
+commits that predate the radix trie.
+"""
+
+import random
+
+from src.data_structures.trees.radix_trie.radix_trie import RadixTrie
+from src.data_structures.trees.radix_trie.radix_trie_operations import (
+    create_radix_trie,
+    radix_insert,
+)
+
+# Prefix lengths of an IPv4 routing table, weighted roughly like a BGP
+# table where about half of the routes are /24s.
+_ROUTE_LENGTHS = list(range(8, 33))
+_ROUTE_WEIGHTS = [1] * 8 + [4, 2, 2, 2, 3, 4, 3, 3, 50] + [1] * 8
+
+
+def routing_prefixes(size: int) -> list[str]:
+    """
+    Generate ``size`` distinct IPv4 route prefixes as strings of "0"/"1" bits.
+    """
+    rng = random.Random(size)
+    prefixes: dict[str, None] = {}
+    while len(prefixes) < size:
+        length = rng.choices(_ROUTE_LENGTHS, _ROUTE_WEIGHTS)[0]
+        prefixes[format(rng.getrandbits(32), "032b")[:length]] = None
+    return list(prefixes)
+
+
+def build_radix_trie(prefixes: list[str]) -> RadixTrie:
+    """Build a radix trie mapping every prefix to its index."""
+    trie = create_radix_trie()
+    for index, prefix in enumerate(prefixes):
+        radix_insert(trie, prefix, index)
+    return trie
@@ -0,0 +1,81 @@
+"""
+Ancestor index benchmarks: building the index, and LCA queries against
+walking parent pointers.
+
+Trees are balanced 4-ary and path-shaped with 10^5 nodes (10^6 with
+DSA_BENCHMARK_FULL=1). Batch queries answer 10^5 random pairs at once.
+
+Run with:
+    pytest benchmarks/test_ancestor_index_benchmarks.py
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.data_structures.trees.flat_tree.ancestor_index_operations import (  # noqa: E402
+    create_ancestor_index,
+    lowest_common_ancestor,
+    lowest_common_ancestors,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (  # noqa: E402
+    iter_pre_order,
+)
+
+from .workloads import build_balanced_tree, build_path_tree, scaled  # noqa: E402
+
+SIZE = scaled([100_000], [1_000_000])[0]
+SHAPES = {"balanced": build_balanced_tree, "path": build_path_tree}
+PAIRS = 100_000
+SCALAR_PAIRS = 1_000
+
+
+@pytest.fixture(scope="module", params=SHAPES)
+def indexed_tree(request):
+    root = SHAPES[request.param](SIZE)
+    return root, list(iter_pre_order(root)), create_ancestor_index(root)
+
+
+def _walk_lca(first, second):
+    ancestors = set()
+    while first is not None:
+        ancestors.add(first)
+        first = first.parent
+    while second not in ancestors:
+        second = second.parent
+    return second
+
+
+def _pairs(nodes, count):
+    rng = random.Random(0)
+    return [(rng.choice(nodes), rng.choice(nodes)) for _ in range(count)]
+
+
+@pytest.mark.performance_test
+def test_build_index(benchmark, indexed_tree):
+    root, _, _ = indexed_tree
+    benchmark.pedantic(create_ancestor_index, args=(root,), rounds=3)
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("method", ["parent_walk", "index"])
+def test_scalar_lca(benchmark, method, indexed_tree):
+    _, nodes, index = indexed_tree
+    pairs = _pairs(nodes, SCALAR_PAIRS)
+    if method == "parent_walk":
+        benchmark.pedantic(lambda: [_walk_lca(u, v) for u, v in pairs], rounds=1)
+    else:
+        benchmark.pedantic(
+            lambda: [lowest_common_ancestor(index, u, v) for u, v in pairs], rounds=3
+        )
+
+
+@pytest.mark.performance_test
+def test_batch_lca(benchmark, indexed_tree):
+    _, _, index = indexed_tree
+    rng = np.random.default_rng(0)
+    u = rng.integers(0, SIZE, PAIRS)
+    v = rng.integers(0, SIZE, PAIRS)
+    benchmark.pedantic(lowest_common_ancestors, args=(index, u, v), rounds=3)
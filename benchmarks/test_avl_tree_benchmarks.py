@@ -0,0 +1,182 @@
+"""
+AVL tree benchmarks.
+
+Compares an AVL tree of 10^5 random keys (10^6 at full scale with
+DSA_BENCHMARK_FULL=1) against a dict (lookups) and a sorted Python list
+searched with bisect (lookups, floor, rank, range scans and inserts). The
+O(n) bulk build from sorted keys is compared against inserting the keys
+one by one and against sorting a list.
+
+Run with:
+    pytest benchmarks/test_avl_tree_benchmarks.py
+"""
+
+import bisect
+import random
+from itertools import islice
+
+import pytest
+
+from src.data_structures.trees.avl_tree.avl_tree_operations import (
+    avl_floor,
+    avl_get,
+    avl_insert,
+    avl_iter_range,
+    avl_rank,
+    build_avl_tree,
+    create_avl_tree,
+)
+
+from .workloads import scaled
+
+SIZE = scaled([100_000], [1_000_000])[0]
+QUERIES = 100_000
+RANGE_LENGTH = 100
+
+
+@pytest.fixture(scope="module")
+def keys():
+    return random.Random(0).sample(range(4 * SIZE), SIZE)
+
+
+@pytest.fixture(scope="module")
+def sorted_keys(keys):
+    return sorted(keys)
+
+
+@pytest.fixture(scope="module")
+def tree(sorted_keys):
+    return build_avl_tree(sorted_keys, sorted_keys)
+
+
+@pytest.fixture(scope="module")
+def queries():
+    rng = random.Random(1)
+    return [rng.randrange(4 * SIZE) for _ in range(QUERIES)]
+
+
+def _avl_lookups(tree, queries):
+    for key in queries:
+        avl_get(tree, key)
+
+
+def _dict_lookups(mapping, queries):
+    for key in queries:
+        mapping.get(key)
+
+
+def _bisect_lookups(keys, queries):
+    for key in queries:
+        index = bisect.bisect_left(keys, key)
+        index < len(keys) and keys[index] == key
+
+
+def _avl_floors(tree, queries):
+    for key in queries:
+        avl_floor(tree, key)
+
+
+def _bisect_floors(keys, queries):
+    for key in queries:
+        index = bisect.bisect_right(keys, key)
+        index and keys[index - 1]
+
+
+def _avl_ranks(tree, queries):
+    for key in queries:
+        avl_rank(tree, key)
+
+
+def _bisect_ranks(keys, queries):
+    for key in queries:
+        bisect.bisect_left(keys, key)
+
+
+def _avl_range_scans(tree, queries):
+    for key in queries[: QUERIES // 10]:
+        for _ in islice(avl_iter_range(tree, key), RANGE_LENGTH):
+            pass
+
+
+def _list_range_scans(keys, queries):
+    for key in queries[: QUERIES // 10]:
+        index = bisect.bisect_left(keys, key)
+        for _ in keys[index : index + RANGE_LENGTH]:
+            pass
+
+
+def _avl_inserts(keys):
+    tree = create_avl_tree()
+    for key in keys:
+        avl_insert(tree, key)
+
+
+def _insort_inserts(keys):
+    sorted_list = []
+    for key in keys:
+        bisect.insort(sorted_list, key)
+
+
+@pytest.mark.performance_test
+def test_avl_lookups(benchmark, tree, queries):
+    benchmark.pedantic(_avl_lookups, args=(tree, queries), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_dict_lookups(benchmark, keys, queries):
+    benchmark.pedantic(_dict_lookups, args=(dict.fromkeys(keys), queries), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_bisect_lookups(benchmark, sorted_keys, queries):
+    benchmark.pedantic(_bisect_lookups, args=(sorted_keys, queries), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_avl_floors(benchmark, tree, queries):
+    benchmark.pedantic(_avl_floors, args=(tree, queries), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_bisect_floors(benchmark, sorted_keys, queries):
+    benchmark.pedantic(_bisect_floors, args=(sorted_keys, queries), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_avl_ranks(benchmark, tree, queries):
+    benchmark.pedantic(_avl_ranks, args=(tree, queries), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_bisect_ranks(benchmark, sorted_keys, queries):
+    benchmark.pedantic(_bisect_ranks, args=(sorted_keys, queries), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_avl_range_scans(benchmark, tree, queries):
+    benchmark.pedantic(_avl_range_scans, args=(tree, queries), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_list_range_scans(benchmark, sorted_keys, queries):
+    benchmark.pedantic(_list_range_scans, args=(sorted_keys, queries), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_avl_inserts(benchmark, keys):
+    benchmark.pedantic(_avl_inserts, args=(keys,), rounds=1)
+
+
+@pytest.mark.performance_test
+def test_insort_inserts(benchmark, keys):
+    benchmark.pedantic(_insort_inserts, args=(keys,), rounds=1)
+
+
+@pytest.mark.performance_test
+def test_avl_bulk_build(benchmark, sorted_keys):
+    benchmark.pedantic(build_avl_tree, args=(sorted_keys,), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_list_sort(benchmark, keys):
+    benchmark.pedantic(sorted, args=(keys,), rounds=3)
@@ -0,0 +1,104 @@
+"""
+Indexed d-ary heap benchmarks on a Dijkstra-like workload: shortest paths
+over a random directed graph with 8 edges per node, using decrease-key
+with arities 2, 4 and 8, against heapq with lazy deletion (push a new
+entry per improvement and skip stale ones on pop). Also measured: the
+O(n) build against n pushes, for random and descending priorities.
+
+The graph has 10^4 nodes (10^5 with DSA_BENCHMARK_FULL=1).
+
+Run with:
+    pytest benchmarks/test_d_ary_heap_benchmarks.py
+"""
+
+import heapq
+import random
+
+import pytest
+
+from src.data_structures.heaps.d_ary_heap.d_ary_heap_operations import (
+    build_d_ary_heap,
+    create_d_ary_heap,
+    heap_decrease_key,
+    heap_pop,
+    heap_push,
+)
+
+from .workloads import scaled
+
+SIZE = scaled([10_000], [100_000])[0]
+DEGREE = 8
+
+
+@pytest.fixture(scope="module")
+def graph():
+    rng = random.Random(0)
+    return [
+        [(rng.randrange(SIZE), rng.randint(1, 100)) for _ in range(DEGREE)]
+        for _ in range(SIZE)
+    ]
+
+
+def _dijkstra_heapq(graph):
+    distances = [None] * len(graph)
+    queue = [(0, 0)]
+    while queue:
+        distance, node = heapq.heappop(queue)
+        if distances[node] is not None:
+            continue
+        distances[node] = distance
+        for neighbour, weight in graph[node]:
+            if distances[neighbour] is None:
+                heapq.heappush(queue, (distance + weight, neighbour))
+    return distances
+
+
+def _dijkstra_d_ary(graph, arity):
+    distances = [None] * len(graph)
+    handles = [None] * len(graph)
+    heap = create_d_ary_heap(arity)
+    handles[0] = heap_push(heap, 0, 0)
+    while heap:
+        handle = heap_pop(heap)
+        distance = distances[handle.item] = handle.priority
+        for neighbour, weight in graph[handle.item]:
+            known = handles[neighbour]
+            if known is None:
+                handles[neighbour] = heap_push(heap, neighbour, distance + weight)
+            elif known.index >= 0 and distance + weight < known.priority:
+                heap_decrease_key(heap, known, distance + weight)
+    return distances
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("method", ["heapq", "binary", "4-ary", "8-ary"])
+def test_dijkstra(benchmark, method, graph):
+    if method == "heapq":
+        benchmark.pedantic(_dijkstra_heapq, args=(graph,), rounds=3)
+    else:
+        arity = {"binary": 2, "4-ary": 4, "8-ary": 8}[method]
+        benchmark.pedantic(_dijkstra_d_ary, args=(graph, arity), rounds=3)
+
+
+def _push_all(priorities):
+    heap = create_d_ary_heap()
+    for item, priority in enumerate(priorities):
+        heap_push(heap, item, priority)
+    return heap
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("order", ["random", "descending"])
+@pytest.mark.parametrize("method", ["build", "pushes"])
+def test_build(benchmark, method, order):
+    # A push into random priorities sifts up about one level on average, so
+    # the build only pulls ahead when every push would climb to the root.
+    if order == "random":
+        rng = random.Random(1)
+        priorities = [rng.random() for _ in range(SIZE)]
+    else:
+        priorities = list(range(SIZE, 0, -1))
+    if method == "build":
+        benchmark.pedantic(build_d_ary_heap, args=(range(SIZE), priorities), rounds=3)
+    else:
+        benchmark.pedantic(_push_all, args=(priorities,), rounds=3)
@@ -0,0 +1,98 @@
+"""
+Fenwick tree benchmarks on running bucket counts.
+
+Counts live in 10^6 buckets (10^7 with DSA_BENCHMARK_FULL=1). Each round
+applies 10^4 increments and then reads 10^4 prefix counts, either through a
+Fenwick tree or by recomputing the prefix sums from scratch with
+np.cumsum. Also measured: the O(n) build, single updates and queries, and
+batched lower bounds.
+
+Run with:
+    pytest benchmarks/test_fenwick_tree_benchmarks.py
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.data_structures.trees.fenwick_tree.fenwick_tree_operations import (  # noqa: E402
+    create_fenwick_tree,
+    fenwick_add,
+    fenwick_add_at,
+    fenwick_lower_bounds,
+    fenwick_prefix_sum,
+    fenwick_prefix_sums,
+)
+
+from .workloads import scaled  # noqa: E402
+
+SIZE = scaled([1_000_000], [10_000_000])[0]
+OPERATIONS = 10_000
+SINGLE_OPERATIONS = 1_000
+
+
+@pytest.fixture(scope="module")
+def counts():
+    return np.random.default_rng(0).integers(0, 100, SIZE)
+
+
+@pytest.fixture(scope="module")
+def operations():
+    rng = np.random.default_rng(1)
+    return (
+        rng.integers(0, SIZE, OPERATIONS),
+        rng.integers(0, SIZE + 1, OPERATIONS),
+    )
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("method", ["fenwick", "cumsum"])
+def test_build(benchmark, method, counts):
+    if method == "fenwick":
+        benchmark.pedantic(create_fenwick_tree, args=(counts,), rounds=3)
+    else:
+        benchmark.pedantic(np.cumsum, args=(counts,), rounds=3)
+
+
+def _recompute_round(counts, positions, queries):
+    np.add.at(counts, positions, 1)
+    running = np.concatenate(([0], np.cumsum(counts)))
+    return running[queries]
+
+
+def _fenwick_round(tree, positions, queries):
+    fenwick_add_at(tree, positions, 1)
+    return fenwick_prefix_sums(tree, queries)
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("method", ["fenwick", "recompute"])
+def test_update_then_query_round(benchmark, method, counts, operations):
+    positions, queries = operations
+    if method == "fenwick":
+        build, run = create_fenwick_tree, _fenwick_round
+    else:
+        build, run = np.copy, _recompute_round
+    setup = lambda: ((build(counts), positions, queries), {})  # noqa: E731
+    benchmark.pedantic(run, setup=setup, rounds=3)
+
+
+@pytest.mark.performance_test
+def test_single_operations(benchmark, counts, operations):
+    tree = create_fenwick_tree(counts)
+    positions = operations[0][:SINGLE_OPERATIONS].tolist()
+    queries = operations[1][:SINGLE_OPERATIONS].tolist()
+
+    def run():
+        for position, count in zip(positions, queries):
+            fenwick_add(tree, position, 1)
+            fenwick_prefix_sum(tree, count)
+
+    benchmark.pedantic(run, rounds=3)
+
+
+@pytest.mark.performance_test
+def test_batched_lower_bounds(benchmark, counts):
+    tree = create_fenwick_tree(counts)
+    targets = np.random.default_rng(2).integers(0, int(counts.sum()), OPERATIONS)
+    benchmark.pedantic(fenwick_lower_bounds, args=(tree, targets), rounds=3)
@@ -0,0 +1,144 @@
+"""
+FlatTree benchmarks against the TreeNode traversals of n_ary_tree_operations.
+
+Trees are balanced 4-ary and path-shaped; full scale (DSA_BENCHMARK_FULL=1)
+uses 10^6 and 10^7 nodes. The TreeNode baselines compute depths and subtree
+sizes the way code on the object graph has to: with one Python-level pass
+over the nodes.
+
+Run with:
+    pytest benchmarks/test_flat_tree_benchmarks.py
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.data_structures.trees.flat_tree.flat_tree import FlatTree  # noqa: E402
+from src.data_structures.trees.flat_tree.flat_tree_operations import (  # noqa: E402
+    create_flat_tree,
+    flat_tree_depths,
+    flat_tree_level_order,
+    flat_tree_post_order,
+    flat_tree_subtree_sizes,
+    flat_tree_to_tree_node,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (  # noqa: E402
+    iter_level_order,
+    iter_post_order,
+)
+
+from .workloads import build_balanced_tree, build_path_tree, scaled  # noqa: E402
+
+SIZES = scaled([100_000], [1_000_000, 10_000_000])
+SHAPES = {"balanced": build_balanced_tree, "path": build_path_tree}
+
+CASES = [(shape, size) for shape in SHAPES for size in SIZES]
+
+
+@pytest.fixture(scope="module")
+def trees(request):
+    # Parametrized indirectly with a (shape, size) pair. Module-scoped
+    # parametrized fixtures keep one instance alive at a time, so at most one
+    # pair of large trees is in memory.
+    shape, size = request.param
+    root = SHAPES[shape](size)
+    return root, create_flat_tree(root)
+
+
+def _case_id(case):
+    return "-".join(map(str, case))
+
+
+def _uncached(tree):
+    # A fresh FlatTree over the same arrays, without cached depths or sizes.
+    return FlatTree(tree.parent, tree.child_offsets, tree.children, tree.payload)
+
+
+def _exhaust(iterator):
+    for _ in iterator:
+        pass
+
+
+def _node_depths(root):
+    depths = {id(root): 0}
+    for node in iter_level_order(root):
+        depth = depths[id(node)] + 1
+        for child in node.children:
+            depths[id(child)] = depth
+    return depths
+
+
+def _node_subtree_sizes(root):
+    sizes = {}
+    for node in iter_post_order(root):
+        sizes[id(node)] = 1 + sum(sizes[id(child)] for child in node.children)
+    return sizes
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("trees", CASES, ids=_case_id, indirect=True)
+@pytest.mark.parametrize("representation", ["tree_node", "flat_tree"])
+def test_post_order(benchmark, representation, trees):
+    root, tree = trees
+    if representation == "tree_node":
+        benchmark.pedantic(lambda: _exhaust(iter_post_order(root)), rounds=3)
+    else:
+        benchmark.pedantic(
+            flat_tree_post_order, setup=lambda: ((_uncached(tree),), {}), rounds=3
+        )
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("trees", CASES, ids=_case_id, indirect=True)
+@pytest.mark.parametrize("representation", ["tree_node", "flat_tree"])
+def test_level_order(benchmark, representation, trees):
+    root, tree = trees
+    if representation == "tree_node":
+        benchmark.pedantic(lambda: _exhaust(iter_level_order(root)), rounds=3)
+    else:
+        benchmark.pedantic(
+            flat_tree_level_order, setup=lambda: ((_uncached(tree),), {}), rounds=3
+        )
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("trees", CASES, ids=_case_id, indirect=True)
+@pytest.mark.parametrize("representation", ["tree_node", "flat_tree"])
+def test_depths(benchmark, representation, trees):
+    root, tree = trees
+    if representation == "tree_node":
+        benchmark.pedantic(_node_depths, args=(root,), rounds=3)
+    else:
+        benchmark.pedantic(
+            flat_tree_depths, setup=lambda: ((_uncached(tree),), {}), rounds=3
+        )
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("trees", CASES, ids=_case_id, indirect=True)
+@pytest.mark.parametrize("representation", ["tree_node", "flat_tree"])
+def test_subtree_sizes(benchmark, representation, trees):
+    root, tree = trees
+    if representation == "tree_node":
+        benchmark.pedantic(_node_subtree_sizes, args=(root,), rounds=3)
+    else:
+        benchmark.pedantic(
+            flat_tree_subtree_sizes, setup=lambda: ((_uncached(tree),), {}), rounds=3
+        )
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize(
+    "trees",
+    [case for case in CASES if case[0] == "balanced"],
+    ids=_case_id,
+    indirect=True,
+)
+@pytest.mark.parametrize("direction", ["to_flat_tree", "to_tree_node"])
+def test_conversion(benchmark, direction, trees):
+    root, tree = trees
+    if direction == "to_flat_tree":
+        benchmark.pedantic(create_flat_tree, args=(root,), rounds=3)
+    else:
+        benchmark.pedantic(flat_tree_to_tree_node, args=(tree,), rounds=3)
@@ -0,0 +1,73 @@
+"""
+Graphviz DOT rendering benchmarks.
+
+Writes DOT for a balanced 4-ary tree, a star-shaped tree and a singly
+linked list of 10^5 nodes each (10^7 for the trees and 10^6 for the list
+at full scale with DSA_BENCHMARK_FULL=1). The capped renderings should take
+the same time at both scales; the uncapped tree rendering is the baseline
+that grows with the tree. Output goes to os.devnull so that only the
+renderer is measured.
+
+Run with:
+    pytest benchmarks/test_graphviz_rendering_benchmarks.py
+"""
+
+import os
+
+import pytest
+
+from src.data_structures.visualization.graphviz_rendering import (
+    write_linked_list_dot,
+    write_tree_dot,
+)
+
+from .workloads import build_balanced_tree, build_sll, build_wide_tree, scaled
+
+TREE_SIZE = scaled([100_000], [10_000_000])[0]
+LIST_SIZE = scaled([100_000], [1_000_000])[0]
+
+
+@pytest.fixture(scope="module")
+def balanced_tree():
+    return build_balanced_tree(TREE_SIZE)
+
+
+def _render_tree(root, **caps):
+    with open(os.devnull, "w") as output:
+        return write_tree_dot(root, output, **caps)
+
+
+@pytest.mark.performance_test
+def test_capped_tree_rendering(benchmark, balanced_tree):
+    benchmark.pedantic(
+        _render_tree,
+        args=(balanced_tree,),
+        kwargs={"max_depth": 8, "max_children": 3, "max_level_nodes": 500},
+        rounds=3,
+    )
+
+
+@pytest.mark.performance_test
+def test_sampled_wide_tree_rendering(benchmark):
+    root = build_wide_tree(TREE_SIZE // 10)
+    benchmark.pedantic(
+        _render_tree, args=(root,), kwargs={"max_level_nodes": 1_000}, rounds=3
+    )
+
+
+@pytest.mark.performance_test
+def test_uncapped_tree_rendering(benchmark, balanced_tree):
+    benchmark.pedantic(
+        _render_tree, args=(balanced_tree,), kwargs={"max_nodes": None}, rounds=1
+    )
+
+
+@pytest.mark.performance_test
+def test_capped_linked_list_rendering(benchmark):
+    sll = build_sll(LIST_SIZE)
+
+    def render():
+        with open(os.devnull, "w") as output:
+            return write_linked_list_dot(sll, output, max_nodes=1_000)
+
+    benchmark.pedantic(render, rounds=3)
@@ -0,0 +1,100 @@
+"""
+Heavy-light decomposition benchmarks: building the decomposition, path sums
+against walking the parent pointers, and point against batched weight
+updates.
+
+Trees are balanced 4-ary and path-shaped with 10^5 nodes (10^6 with
+DSA_BENCHMARK_FULL=1). Queries and updates touch 1000 random nodes.
+
+Run with:
+    pytest benchmarks/test_heavy_light_benchmarks.py
+"""
+
+import random
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.heavy_light_decomposition import (
+    create_heavy_light_decomposition,
+    hld_path_sum,
+    hld_path_sums,
+    hld_set_weight,
+    hld_set_weights,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    iter_pre_order,
+)
+
+from .workloads import build_balanced_tree, build_path_tree, scaled
+
+SIZE = scaled([100_000], [1_000_000])[0]
+SHAPES = {"balanced": build_balanced_tree, "path": build_path_tree}
+QUERIES = 1_000
+
+
+@pytest.fixture(scope="module", params=SHAPES)
+def tree(request):
+    root = SHAPES[request.param](SIZE)
+    return root, list(iter_pre_order(root))
+
+
+def _walk_path_sum(first, second):
+    ancestors = {}
+    total = 0
+    while first is not None:
+        total += first.data
+        ancestors[first] = total
+        first = first.parent
+    while second not in ancestors:
+        total += second.data
+        second = second.parent
+    # Drop the part of the first walk above the lowest common ancestor.
+    return total - ancestors[next(reversed(ancestors))] + ancestors[second]
+
+
+def _pairs(nodes):
+    rng = random.Random(0)
+    return [(rng.choice(nodes), rng.choice(nodes)) for _ in range(QUERIES)]
+
+
+@pytest.mark.performance_test
+def test_build_decomposition(benchmark, tree):
+    root, _ = tree
+    benchmark.pedantic(create_heavy_light_decomposition, args=(root,), rounds=3)
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("method", ["parent_walk", "decomposition", "batched"])
+def test_path_sums(benchmark, method, tree):
+    root, nodes = tree
+    pairs = _pairs(nodes)
+    if method == "parent_walk":
+        benchmark.pedantic(lambda: [_walk_path_sum(u, v) for u, v in pairs], rounds=1)
+        return
+
+    hld = create_heavy_light_decomposition(root)
+    if method == "decomposition":
+        benchmark.pedantic(
+            lambda: [hld_path_sum(hld, u, v) for u, v in pairs], rounds=3
+        )
+    else:
+        benchmark.pedantic(hld_path_sums, args=(hld, pairs), rounds=3)
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("tree", ["balanced"], indirect=True)
+@pytest.mark.parametrize("method", ["point", "batched"])
+def test_weight_updates(benchmark, method, tree):
+    root, nodes = tree
+    hld = create_heavy_light_decomposition(root)
+    rng = random.Random(0)
+    updates = [(rng.choice(nodes), rng.randint(0, 100)) for _ in range(QUERIES)]
+
+    def point_updates():
+        for node, weight in updates:
+            hld_set_weight(hld, node, weight)
+
+    if method == "point":
+        benchmark.pedantic(point_updates, rounds=3)
+    else:
+        benchmark.pedantic(hld_set_weights, args=(hld, updates), rounds=3)
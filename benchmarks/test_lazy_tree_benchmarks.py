@@ -0,0 +1,65 @@
+"""
+Lazy tree benchmarks.
+
+Traverses a 4-ary tree of 10^5 nodes (10^6 at full scale with
+DSA_BENCHMARK_FULL=1) whose children come from a loader. Three cases are
+measured: a traversal that loads everything, a traversal with a cache 100
+times smaller than the tree, and a traversal of the same tree once it is
+fully loaded. The last case is the per-node overhead of the lazy children
+property over a plain TreeNode walk.
+
+Run with:
+    pytest benchmarks/test_lazy_tree_benchmarks.py
+"""
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.lazy_tree import create_lazy_root
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    iter_pre_order,
+)
+
+from .workloads import build_balanced_tree, scaled
+
+SIZE = scaled([100_000], [1_000_000])[0]
+BRANCHING = 4
+
+
+def _children(value):
+    first = BRANCHING * value + 1
+    return range(first, min(first + BRANCHING, SIZE))
+
+
+def _count(root):
+    return sum(1 for _ in iter_pre_order(root))
+
+
+@pytest.mark.performance_test
+def test_eager_tree_traversal(benchmark):
+    root = build_balanced_tree(SIZE, BRANCHING)
+    benchmark.pedantic(_count, args=(root,), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_lazy_tree_cold_traversal(benchmark):
+    benchmark.pedantic(
+        _count,
+        setup=lambda: ((create_lazy_root(0, _children, max_nodes=2 * SIZE),), {}),
+        rounds=3,
+    )
+
+
+@pytest.mark.performance_test
+def test_lazy_tree_bounded_cache_traversal(benchmark):
+    benchmark.pedantic(
+        _count,
+        setup=lambda: ((create_lazy_root(0, _children, max_nodes=SIZE // 100),), {}),
+        rounds=3,
+    )
+
+
+@pytest.mark.performance_test
+def test_lazy_tree_warm_traversal(benchmark):
+    root = create_lazy_root(0, _children, max_nodes=2 * SIZE)
+    _count(root)
+    benchmark.pedantic(_count, args=(root,), rounds=3)
@@ -0,0 +1,71 @@
+"""
+Merkle hash benchmarks.
+
+On two equal balanced 4-ary trees of 10^5 nodes (10^6 at full scale with
+DSA_BENCHMARK_FULL=1), compares equality by traversing both trees against
+equality by tracked hashes. Also measures hashing a tree from scratch and
+the incremental rehash after inserting one leaf.
+
+Run with:
+    pytest benchmarks/test_merkle_hash_benchmarks.py
+"""
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.merkle_hashes import (
+    merkle_hash,
+    track_merkle_hashes,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    add_child_node,
+    iter_pre_order,
+)
+
+from .workloads import build_balanced_tree, scaled
+
+SIZE = scaled([100_000], [1_000_000])[0]
+
+
+def _traversal_equal(first, second):
+    pairs = zip(iter_pre_order(first), iter_pre_order(second), strict=True)
+    return all(
+        a.data == b.data and len(a.children) == len(b.children) for a, b in pairs
+    )
+
+
+@pytest.fixture(scope="module")
+def trees():
+    return build_balanced_tree(SIZE), build_balanced_tree(SIZE)
+
+
+@pytest.mark.performance_test
+def test_equality_by_traversal(benchmark, trees):
+    assert benchmark.pedantic(_traversal_equal, args=trees, rounds=3)
+
+
+@pytest.mark.performance_test
+def test_equality_by_tracked_hashes(benchmark, trees):
+    first, second = trees
+    first_hashes = track_merkle_hashes(first)
+    second_hashes = track_merkle_hashes(second)
+
+    def compare():
+        return first_hashes[first] == second_hashes[second]
+
+    assert benchmark.pedantic(compare, rounds=100)
+
+
+@pytest.mark.performance_test
+def test_merkle_hash_from_scratch(benchmark, trees):
+    benchmark.pedantic(merkle_hash, args=(trees[0],), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_incremental_rehash_on_insert(benchmark):
+    root = build_balanced_tree(SIZE)
+    track_merkle_hashes(root)
+    leaves = iter([node for node in iter_pre_order(root) if not node.children])
+
+    benchmark.pedantic(
+        add_child_node, setup=lambda: ((next(leaves), -1), {}), rounds=100
+    )
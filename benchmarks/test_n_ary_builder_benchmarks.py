@@ -0,0 +1,69 @@
+"""
+Bulk builder benchmarks against building trees one add_child_node at a time.
+
+Builds a balanced 4-ary tree of 10^5 nodes (10^6 at full scale with
+DSA_BENCHMARK_FULL=1), and inserts a block of children at the front of a
+wide node, where add_child_nodes_from_index used to insert one child at a
+time.
+
+Run with:
+    pytest benchmarks/test_n_ary_builder_benchmarks.py
+"""
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_builders import (
+    build_tree_from_edges,
+    build_tree_from_nested_dict,
+    build_tree_from_parent_array,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    add_child_nodes_from_index,
+)
+
+from .workloads import build_balanced_tree, build_wide_tree, scaled
+
+SIZE = scaled([100_000], [1_000_000])[0]
+BRANCHING = 4
+
+
+def _parents(size):
+    return [-1] + [(value - 1) // BRANCHING for value in range(1, size)]
+
+
+def _nested(size):
+    nodes = [{"data": value} for value in range(size)]
+    for value in range(1, size):
+        nodes[(value - 1) // BRANCHING].setdefault("children", []).append(nodes[value])
+    return nodes[0]
+
+
+@pytest.mark.performance_test
+def test_add_child_node_loop(benchmark):
+    benchmark.pedantic(build_balanced_tree, args=(SIZE, BRANCHING), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_build_from_parent_array(benchmark):
+    benchmark.pedantic(build_tree_from_parent_array, args=(_parents(SIZE),), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_build_from_edges(benchmark):
+    edges = [(parent, child) for child, parent in enumerate(_parents(SIZE)) if child]
+    benchmark.pedantic(build_tree_from_edges, args=(edges,), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_build_from_nested_dict(benchmark):
+    benchmark.pedantic(build_tree_from_nested_dict, args=(_nested(SIZE),), rounds=3)
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("block", [100, 10_000])
+def test_insert_block_at_front_of_wide_node(benchmark, block):
+    benchmark.pedantic(
+        add_child_nodes_from_index,
+        setup=lambda: ((build_wide_tree(SIZE), list(range(block)), 0), {}),
+        rounds=3,
+    )
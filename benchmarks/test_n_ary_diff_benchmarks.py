@@ -0,0 +1,90 @@
+"""
+Tree diff benchmarks.
+
+Diffs a balanced 4-ary tree of 10^5 nodes (10^6 at full scale with
+DSA_BENCHMARK_FULL=1) against a copy with 0.1% or 5% of its nodes changed
+by relabels, leaf inserts, subtree deletes and subtree moves. The diff is
+measured on untracked trees (hashes computed by the diff) and on trees
+whose Merkle hashes are already tracked. Applying the resulting patch is
+measured too.
+
+Run with:
+    pytest benchmarks/test_n_ary_diff_benchmarks.py
+"""
+
+import random
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.merkle_hashes import track_merkle_hashes
+from src.data_structures.trees.n_ary_trees.n_ary_tree_diff import (
+    apply_patch,
+    diff_trees,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    attach_subtree,
+    detach_subtree,
+    iter_pre_order,
+    move_subtree,
+    set_node_data,
+)
+from src.data_structures.trees.tree_node import TreeNode
+
+from .workloads import build_balanced_tree, scaled
+
+SIZE = scaled([100_000], [1_000_000])[0]
+FRACTIONS = [0.001, 0.05]
+
+
+def _changed_copy(fraction, seed=0):
+    rng = random.Random(seed)
+    tree = build_balanced_tree(SIZE)
+    nodes = list(iter_pre_order(tree))
+
+    for _ in range(int(SIZE * fraction)):
+        node = rng.choice(nodes)
+        action = rng.random()
+        if node.parent is None or action < 0.4:
+            set_node_data(node, -node.data - 1)
+        elif action < 0.7:
+            attach_subtree(node, TreeNode(-1))
+        elif action < 0.85 and not node.children:
+            detach_subtree(node)
+        else:
+            target = rng.choice(nodes)
+            ancestor = target
+            while ancestor is not None and ancestor is not node:
+                ancestor = ancestor.parent
+            if ancestor is None and target.parent is not None:
+                move_subtree(node, target)
+
+    return tree
+
+
+@pytest.fixture(scope="module", params=FRACTIONS, ids=["0.1%", "5%"])
+def changed_tree(request):
+    return _changed_copy(request.param)
+
+
+@pytest.mark.performance_test
+def test_diff_untracked(benchmark, changed_tree):
+    old = build_balanced_tree(SIZE)
+    benchmark.pedantic(diff_trees, args=(old, changed_tree), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_diff_tracked(benchmark, changed_tree):
+    old = build_balanced_tree(SIZE)
+    track_merkle_hashes(old)
+    track_merkle_hashes(changed_tree)
+    benchmark.pedantic(diff_trees, args=(old, changed_tree), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_apply_patch(benchmark, changed_tree):
+    script = diff_trees(build_balanced_tree(SIZE), changed_tree)
+    benchmark.pedantic(
+        apply_patch,
+        setup=lambda: ((build_balanced_tree(SIZE), script), {}),
+        rounds=3,
+    )
@@ -0,0 +1,84 @@
+"""
+Multi-target removal benchmarks.
+
+Removes target sets of several sizes from a balanced 4-ary tree of 10^6 nodes
+at full scale (DSA_BENCHMARK_FULL=1). Every node holds a distinct value, so a
+target set of k values removes k nodes. The per-target baseline repeats
+search_and_remove_node once per target, as search_and_remove_nodes used to.
+On a tree with a ValueIndex, small target sets are looked up instead of
+scanned, so their cost should not grow with the tree.
+
+Run with:
+    pytest benchmarks/test_n_ary_removal_benchmarks.py
+"""
+
+import random
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    search_and_remove_node,
+    search_and_remove_nodes,
+)
+from src.data_structures.trees.n_ary_trees.tree_observers import (
+    ValueIndex,
+    register_observer,
+)
+
+from .workloads import build_balanced_tree, scaled
+
+TREE_SIZE = scaled([100_000], [1_000_000])[0]
+TARGET_COUNTS = scaled([10, 100, 1_000, 10_000], [10, 100, 1_000, 10_000, 100_000])
+# The per-target baseline is quadratic; only run it where it finishes quickly.
+BASELINE_TARGET_COUNTS = [10, 100]
+INDEXED_TARGET_COUNTS = [1, 10]
+
+
+def _targets(count):
+    return random.Random(count).sample(range(2, TREE_SIZE + 1), count)
+
+
+def _search_and_remove_each(root, targets):
+    return [search_and_remove_node(root, target) for target in targets]
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("count", TARGET_COUNTS)
+def test_single_pass_removal(benchmark, count):
+    targets = _targets(count)
+    removed = benchmark.pedantic(
+        search_and_remove_nodes,
+        setup=lambda: ((build_balanced_tree(TREE_SIZE), targets), {}),
+        rounds=3,
+    )
+    assert len(removed) == count
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("count", BASELINE_TARGET_COUNTS)
+def test_per_target_removal_baseline(benchmark, count):
+    targets = _targets(count)
+    removed = benchmark.pedantic(
+        _search_and_remove_each,
+        setup=lambda: ((build_balanced_tree(TREE_SIZE), targets), {}),
+        rounds=1,
+    )
+    assert len(removed) == count
+
+
+def _indexed_tree():
+    root = build_balanced_tree(TREE_SIZE)
+    register_observer(root, ValueIndex())
+    return root
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("count", INDEXED_TARGET_COUNTS)
+def test_indexed_removal_of_a_few_targets(benchmark, count):
+    targets = _targets(count)
+    removed = benchmark.pedantic(
+        search_and_remove_nodes,
+        setup=lambda: ((_indexed_tree(), targets), {}),
+        rounds=3,
+    )
+    assert len(removed) == count
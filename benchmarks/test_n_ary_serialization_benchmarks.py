@@ -0,0 +1,64 @@
+"""
+Serialization benchmarks for n-ary trees.
+
+Writes a balanced 4-ary tree of 10^5 nodes (10^7 at full scale with
+DSA_BENCHMARK_FULL=1) to the compact format. The tree is then loaded
+eagerly into TreeNode objects and opened lazily through MappedTree, and
+pickling the TreeNode graph serves as a baseline.
+
+Run with:
+    pytest benchmarks/test_n_ary_serialization_benchmarks.py
+"""
+
+import pickle
+import sys
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_serialization import (
+    MappedTree,
+    load_tree,
+    serialize_tree,
+)
+
+from .workloads import build_balanced_tree, scaled
+
+SIZE = scaled([100_000], [10_000_000])[0]
+
+
+@pytest.fixture(scope="module")
+def tree():
+    return build_balanced_tree(SIZE, 4)
+
+
+@pytest.fixture(scope="module")
+def tree_file(tree, tmp_path_factory):
+    path = tmp_path_factory.mktemp("serialization") / "tree.bin"
+    serialize_tree(tree, path)
+    return path
+
+
+@pytest.mark.performance_test
+def test_serialize_tree(benchmark, tree, tmp_path):
+    benchmark.pedantic(serialize_tree, args=(tree, tmp_path / "tree.bin"), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_pickle_tree_baseline(benchmark, tree):
+    # TreeNode pickling recurses once per level and follows parent links.
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100_000))
+    benchmark.pedantic(pickle.dumps, args=(tree,), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_load_tree(benchmark, tree_file):
+    benchmark.pedantic(load_tree, args=(tree_file,), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_mapped_tree_root_children(benchmark, tree_file):
+    def open_and_query():
+        with MappedTree(tree_file) as mapped:
+            return [mapped.data(child) for child in mapped.children(mapped.root)]
+
+    benchmark.pedantic(open_and_query, rounds=3)
@@ -0,0 +1,123 @@
+"""
+Traversal benchmarks on wide (star-shaped) and path-shaped n-ary trees.
+
+Full scale (DSA_BENCHMARK_FULL=1) uses 10^6-node trees, so the path-shaped
+tree is 10^6 levels deep. The ``list.pop(0)`` baseline reproduces the queue
+the level-order traversal used before it moved to collections.deque.
+
+Run with:
+    pytest benchmarks/test_n_ary_traversal_benchmarks.py
+"""
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    breadth_first_search,
+    depth_first_search,
+    iter_level_order,
+    iter_post_order,
+    iter_pre_order,
+    level_order_traversal,
+)
+from src.data_structures.trees.n_ary_trees.tree_observers import (
+    ValueIndex,
+    register_observer,
+)
+
+from .workloads import build_path_tree, build_wide_tree, scaled
+
+SIZES = scaled([10_000, 100_000], [100_000, 1_000_000])
+SHAPES = {"wide": build_wide_tree, "path": build_path_tree}
+
+CASES = [(shape, size) for shape in SHAPES for size in SIZES]
+
+
+@pytest.fixture(scope="module")
+def tree(request):
+    # Parametrized indirectly with a (shape, size) pair, so that every test on
+    # the same pair shares one tree.
+    shape, size = request.param
+    return SHAPES[shape](size)
+
+
+def _case_id(case):
+    return "-".join(map(str, case))
+
+
+def _pop_front_level_order(root):
+    result, queue = [], [root]
+    while queue:
+        node = queue.pop(0)
+        result.append(node.data)
+        queue.extend(node.children)
+    return result
+
+
+def _exhaust(iterator):
+    for _ in iterator:
+        pass
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("tree", CASES, ids=_case_id, indirect=True)
+@pytest.mark.parametrize(
+    "traversal",
+    [iter_pre_order, iter_post_order, iter_level_order],
+    ids=lambda f: f.__name__,
+)
+def test_generator_traversal(benchmark, traversal, tree):
+    benchmark.pedantic(lambda: _exhaust(traversal(tree)), rounds=3, iterations=1)
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize(
+    "tree", [case for case in CASES if case[0] == "wide"], ids=_case_id, indirect=True
+)
+@pytest.mark.parametrize(
+    "implementation",
+    [level_order_traversal, _pop_front_level_order],
+    ids=["deque", "list_pop_front"],
+)
+def test_level_order_on_wide_tree(benchmark, implementation, tree):
+    if implementation is level_order_traversal:
+        result = benchmark.pedantic(lambda: implementation(tree, []), rounds=3)
+    else:
+        result = benchmark.pedantic(lambda: implementation(tree), rounds=1)
+    assert len(result) == 1 + len(tree.children)
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("tree", CASES, ids=_case_id, indirect=True)
+def test_search_miss(benchmark, tree):
+    benchmark.pedantic(
+        lambda: (depth_first_search(tree, -1), breadth_first_search(tree, -1)),
+        rounds=3,
+    )
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize(
+    "tree",
+    [case for case in CASES if case[1] == SIZES[-1]],
+    ids=_case_id,
+    indirect=True,
+)
+def test_early_stop_is_constant_time(benchmark, tree):
+    first_ten = benchmark(
+        lambda: [node for _, node in zip(range(10), iter_pre_order(tree))]
+    )
+    assert len(first_ten) == 10
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("indexed", [False, True], ids=["scan", "indexed"])
+def test_search_deepest_value(benchmark, indexed, size):
+    root = build_path_tree(size)
+    if indexed:
+        register_observer(root, ValueIndex())
+    found = benchmark.pedantic(
+        lambda: (depth_first_search(root, size), breadth_first_search(root, size)),
+        rounds=3,
+    )
+    assert found[0] is found[1] is not None
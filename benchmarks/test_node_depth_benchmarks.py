@@ -0,0 +1,73 @@
+"""
+Node depth benchmarks: the depth of every node by walking parent pointers,
+from a DepthCache, and from one batch BFS, plus the cost of keeping the
+cache current through node removals.
+
+Uses a balanced 4-ary tree and a path-shaped tree of 10^5 nodes (10^6 with
+DSA_BENCHMARK_FULL=1; the path tree stays at 10^4 nodes, as walking it is
+quadratic).
+
+Run with:
+    pytest benchmarks/test_node_depth_benchmarks.py
+"""
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    iter_pre_order,
+    search_and_remove_node,
+)
+from src.data_structures.trees.n_ary_trees.node_depths import (
+    compute_depths,
+    node_depth,
+    track_depths,
+)
+
+from .workloads import build_balanced_tree, build_path_tree, scaled
+
+SIZE = scaled([100_000], [1_000_000])[0]
+PATH_SIZE = 10_000
+REMOVALS = 100
+
+SHAPES = {
+    "balanced": lambda: build_balanced_tree(SIZE),
+    "path": lambda: build_path_tree(PATH_SIZE),
+}
+
+
+def _all_depths(nodes):
+    for node in nodes:
+        node_depth(node)
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("mode", ["walked", "cached", "batch"])
+def test_all_node_depths(benchmark, shape, mode):
+    root = SHAPES[shape]()
+    nodes = list(iter_pre_order(root))
+    if mode == "batch":
+        benchmark.pedantic(compute_depths, args=(root,), rounds=3)
+        return
+
+    if mode == "cached":
+        track_depths(root)
+    benchmark.pedantic(_all_depths, args=(nodes,), rounds=3)
+
+
+def _remove_inner_nodes(root):
+    # Removing a child of the root moves its whole subtree up a level.
+    for _ in range(REMOVALS):
+        search_and_remove_node(root, root.children[0].data)
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("tracked", [False, True], ids=["untracked", "tracked"])
+def test_removal_cost(benchmark, tracked):
+    def setup():
+        root = build_balanced_tree(SIZE)
+        if tracked:
+            track_depths(root)
+        return (root,), {}
+
+    benchmark.pedantic(_remove_inner_nodes, setup=setup, rounds=3)
@@ -0,0 +1,79 @@
+"""
+Speedup of the process-pool traversals across worker counts.
+
+The filter runs an artificially expensive predicate over a balanced 4-ary
+tree of 10^5 nodes (10^7 with DSA_BENCHMARK_FULL=1). The serial baseline
+runs the same predicate over iter_pre_order. The search uses a plain
+equality test that misses, which shows the fixed cost of encoding and
+shipping the tree.
+
+Run with:
+    pytest benchmarks/test_parallel_traversal_benchmarks.py
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    depth_first_search,
+    iter_pre_order,
+)
+from src.data_structures.trees.n_ary_trees.parallel_tree_operations import (
+    parallel_depth_first_search,
+    parallel_filter,
+)
+
+from .workloads import build_balanced_tree, scaled
+
+SIZE = scaled([100_000], [10_000_000])[0]
+WORKERS = sorted({1, 2, 4, os.cpu_count() or 1})
+
+
+@pytest.fixture(scope="module")
+def tree():
+    return build_balanced_tree(SIZE)
+
+
+def expensive_predicate(value):
+    # Stands in for real per-node work such as parsing or scoring a payload.
+    total = 0
+    for step in range(50):
+        total += (value * step) % 7
+    return total % 11 == 0
+
+
+@pytest.mark.performance_test
+def test_serial_filter(benchmark, tree):
+    benchmark.pedantic(
+        lambda: [n for n in iter_pre_order(tree) if expensive_predicate(n.data)],
+        rounds=3,
+    )
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("workers", WORKERS)
+def test_parallel_filter(benchmark, workers, tree):
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        benchmark.pedantic(
+            parallel_filter,
+            args=(tree, expensive_predicate, workers, executor),
+            rounds=3,
+        )
+
+
+@pytest.mark.performance_test
+def test_serial_search_miss(benchmark, tree):
+    benchmark.pedantic(depth_first_search, args=(tree, -1), rounds=3)
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("workers", WORKERS)
+def test_parallel_search_miss(benchmark, workers, tree):
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        benchmark.pedantic(
+            parallel_depth_first_search,
+            args=(tree, -1, workers, executor),
+            rounds=3,
+        )
@@ -0,0 +1,91 @@
+"""
+Radix trie benchmarks on a routing-table workload.
+
+The table holds 10^5 IPv4 route prefixes as bit strings (10^6 with
+DSA_BENCHMARK_FULL=1), about half of them /24s. Longest-prefix lookups of
+10^5 random addresses are compared against a dict probed once per prefix
+length present in the table, longest first; building is compared against
+building the dict. The memory report compares their memory:
+``python -m benchmarks.memory_report run --only routing``; the trie takes
+about 340 bytes per prefix against about 70 for the dict, the prefix
+strings excluded.
+
+Run with:
+    pytest benchmarks/test_radix_trie_benchmarks.py
+"""
+
+import random
+
+import pytest
+
+from src.data_structures.trees.radix_trie.radix_trie_operations import (
+    radix_iter_prefix,
+    radix_longest_prefix,
+)
+
+from .routing_workloads import build_radix_trie, routing_prefixes
+from .workloads import scaled
+
+SIZE = scaled([100_000], [1_000_000])[0]
+LOOKUPS = 100_000
+
+
+@pytest.fixture(scope="module")
+def prefixes():
+    return routing_prefixes(SIZE)
+
+
+@pytest.fixture(scope="module")
+def trie(prefixes):
+    return build_radix_trie(prefixes)
+
+
+@pytest.fixture(scope="module")
+def routes(prefixes):
+    return {prefix: index for index, prefix in enumerate(prefixes)}
+
+
+@pytest.fixture(scope="module")
+def addresses():
+    rng = random.Random(0)
+    return [format(rng.getrandbits(32), "032b") for _ in range(LOOKUPS)]
+
+
+def _trie_lookups(trie, addresses):
+    for address in addresses:
+        radix_longest_prefix(trie, address)
+
+
+def _dict_lookups(routes, addresses):
+    lengths = sorted({len(prefix) for prefix in routes}, reverse=True)
+    for address in addresses:
+        for length in lengths:
+            if address[:length] in routes:
+                break
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("structure", ["radix_trie", "dict"])
+def test_build(benchmark, structure, prefixes):
+    if structure == "radix_trie":
+        benchmark.pedantic(build_radix_trie, args=(prefixes,), rounds=1)
+    else:
+        benchmark.pedantic(
+            lambda: {prefix: index for index, prefix in enumerate(prefixes)},
+            rounds=3,
+        )
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("structure", ["radix_trie", "dict"])
+def test_longest_prefix_lookups(benchmark, structure, trie, routes, addresses):
+    if structure == "radix_trie":
+        benchmark.pedantic(_trie_lookups, args=(trie, addresses), rounds=3)
+    else:
+        benchmark.pedantic(_dict_lookups, args=(routes, addresses), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_prefix_iteration(benchmark, trie):
+    # Every route inside 10.0.0.0/8.
+    benchmark.pedantic(lambda: list(radix_iter_prefix(trie, "00001010")), rounds=3)
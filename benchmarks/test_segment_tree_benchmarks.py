@@ -0,0 +1,110 @@
+"""
+Segment tree benchmarks: building, range queries and range updates, one
+call per operation against one batched call, with NumPy slicing of a plain
+array as the baseline.
+
+The array holds 10^5 values (10^6 with DSA_BENCHMARK_FULL=1); queries and
+updates use 10^4 random ranges.
+
+Run with:
+    pytest benchmarks/test_segment_tree_benchmarks.py
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.data_structures.trees.segment_tree.segment_tree_operations import (  # noqa: E402
+    create_segment_tree,
+    segment_tree_add,
+    segment_tree_add_ranges,
+    segment_tree_assign,
+    segment_tree_assign_ranges,
+    segment_tree_min,
+    segment_tree_minima,
+)
+
+from .workloads import scaled  # noqa: E402
+
+SIZE = scaled([100_000], [1_000_000])[0]
+OPERATIONS = 10_000
+
+
+@pytest.fixture(scope="module")
+def values():
+    return np.random.default_rng(0).integers(0, 1_000, SIZE)
+
+
+@pytest.fixture(scope="module")
+def ranges():
+    rng = np.random.default_rng(1)
+    lows = rng.integers(0, SIZE - 1, OPERATIONS)
+    highs = np.minimum(lows + rng.integers(1, SIZE // 10, OPERATIONS), SIZE)
+    return lows, highs
+
+
+@pytest.mark.performance_test
+def test_build(benchmark, values):
+    benchmark.pedantic(create_segment_tree, args=(values,), rounds=3)
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("method", ["slicing", "single", "batched"])
+def test_range_minima(benchmark, method, values, ranges):
+    lows, highs = ranges
+    if method == "slicing":
+        benchmark.pedantic(
+            lambda: [values[low:high].min() for low, high in zip(lows, highs)],
+            rounds=3,
+        )
+        return
+
+    tree = create_segment_tree(values)
+    segment_tree_add(tree, 0, SIZE // 2, 1)  # Leaves a pending tag on a path.
+    if method == "single":
+        benchmark.pedantic(
+            lambda: [
+                segment_tree_min(tree, int(low), int(high))
+                for low, high in zip(lows, highs)
+            ],
+            rounds=3,
+        )
+    else:
+        benchmark.pedantic(segment_tree_minima, args=(tree, lows, highs), rounds=3)
+
+
+def _slice_updates(array, lows, highs):
+    for i, (low, high) in enumerate(zip(lows, highs)):
+        if i % 2:
+            array[low:high] += 3
+        else:
+            array[low:high] = i
+
+
+def _single_updates(tree, lows, highs):
+    for i, (low, high) in enumerate(zip(lows.tolist(), highs.tolist())):
+        if i % 2:
+            segment_tree_add(tree, low, high, 3)
+        else:
+            segment_tree_assign(tree, low, high, i)
+
+
+def _batched_updates(tree, lows, highs):
+    segment_tree_assign_ranges(tree, lows[::2], highs[::2], np.arange(0, OPERATIONS, 2))
+    segment_tree_add_ranges(tree, lows[1::2], highs[1::2], 3)
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("method", ["slicing", "single", "batched"])
+def test_range_updates(benchmark, method, values, ranges):
+    # The batched run applies the assignments before the additions, so it is
+    # a different (but equally sized) workload from the interleaved ones.
+    lows, highs = ranges
+    if method == "slicing":
+        setup = lambda: ((values.copy(), lows, highs), {})  # noqa: E731
+        benchmark.pedantic(_slice_updates, setup=setup, rounds=3)
+        return
+
+    setup = lambda: ((create_segment_tree(values), lows, highs), {})  # noqa: E731
+    run = _single_updates if method == "single" else _batched_updates
+    benchmark.pedantic(run, setup=setup, rounds=3)
@@ -0,0 +1,55 @@
+"""
+Subtree aggregate benchmarks: cached queries against full traversals, and the
+cost aggregates add to each insertion.
+
+Uses a balanced 4-ary tree of 10^5 nodes (10^6 with DSA_BENCHMARK_FULL=1).
+
+Run with:
+    pytest benchmarks/test_subtree_aggregate_benchmarks.py
+"""
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    add_child_node,
+    iter_pre_order,
+)
+from src.data_structures.trees.n_ary_trees.subtree_aggregates import (
+    track_subtree_heights,
+    track_subtree_sizes,
+)
+
+from .workloads import build_balanced_tree, scaled
+
+SIZE = scaled([100_000], [1_000_000])[0]
+
+
+def _leaves(root):
+    return [node for node in iter_pre_order(root) if not node.children]
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("mode", ["traversal", "cached"])
+def test_subtree_size_query(benchmark, mode):
+    root = build_balanced_tree(SIZE)
+    if mode == "cached":
+        sizes = track_subtree_sizes(root)
+        result = benchmark(lambda: sizes[root])
+    else:
+        result = benchmark.pedantic(
+            lambda: sum(1 for _ in iter_pre_order(root)), rounds=3
+        )
+    assert result == SIZE
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("tracked", [0, 1, 2], ids=["none", "sizes", "sizes+heights"])
+def test_leaf_insertion_cost(benchmark, tracked):
+    root = build_balanced_tree(SIZE)
+    for track in [track_subtree_sizes, track_subtree_heights][:tracked]:
+        track(root)
+    # A different leaf every round, so no node accumulates children.
+    leaves = iter(_leaves(root))
+    benchmark.pedantic(
+        add_child_node, setup=lambda: ((next(leaves), -1), {}), rounds=1_000
+    )
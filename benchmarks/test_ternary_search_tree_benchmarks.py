@@ -0,0 +1,180 @@
+"""
+Ternary search tree benchmarks.
+
+Compares a ternary search tree of 10^5 random lowercase words (10^6 at full
+scale with DSA_BENCHMARK_FULL=1) against a dict, whose prefix queries scan
+every key, and against a sorted list searched with bisect. Measured:
+building, exact lookups, prefix queries, top-10 autocomplete and Hamming
+distance 1 neighbours. The tree takes about 500 MB at full scale.
+
+Run with:
+    pytest benchmarks/test_ternary_search_tree_benchmarks.py
+"""
+
+import bisect
+import heapq
+import random
+import string
+from itertools import islice
+
+import pytest
+
+from src.data_structures.trees.ternary_search_tree.ternary_search_tree_operations import (
+    build_ternary_search_tree,
+    tst_autocomplete,
+    tst_get,
+    tst_hamming_neighbors,
+    tst_iter_prefix,
+)
+
+from .workloads import scaled
+
+SIZE = scaled([100_000], [1_000_000])[0]
+LOOKUPS = 100_000
+PREFIX_QUERIES = 20
+TOP_K = 10
+
+
+@pytest.fixture(scope="module")
+def words():
+    rng = random.Random(0)
+    letters = string.ascii_lowercase
+    return [
+        "".join(rng.choice(letters) for _ in range(rng.randint(4, 10)))
+        for _ in range(SIZE)
+    ]
+
+
+@pytest.fixture(scope="module")
+def weights(words):
+    rng = random.Random(1)
+    return [rng.randrange(1_000_000) for _ in words]
+
+
+@pytest.fixture(scope="module")
+def tree(words, weights):
+    return build_ternary_search_tree(words, weights=weights)
+
+
+@pytest.fixture(scope="module")
+def mapping(words, weights):
+    return dict(zip(words, weights))
+
+
+@pytest.fixture(scope="module")
+def prefixes(words):
+    rng = random.Random(2)
+    return [word[:3] for word in rng.sample(words, PREFIX_QUERIES)]
+
+
+def _tst_lookups(tree, words):
+    for word in islice(words, LOOKUPS):
+        tst_get(tree, word)
+
+
+def _dict_lookups(mapping, words):
+    for word in islice(words, LOOKUPS):
+        mapping.get(word)
+
+
+def _tst_prefix_queries(tree, prefixes):
+    for prefix in prefixes:
+        for _ in tst_iter_prefix(tree, prefix):
+            pass
+
+
+def _dict_prefix_queries(mapping, prefixes):
+    for prefix in prefixes:
+        sorted(word for word in mapping if word.startswith(prefix))
+
+
+def _bisect_prefix_queries(sorted_words, prefixes):
+    for prefix in prefixes:
+        start = bisect.bisect_left(sorted_words, prefix)
+        end = bisect.bisect_left(sorted_words, prefix + "{")
+        for _ in sorted_words[start:end]:
+            pass
+
+
+def _tst_autocomplete(tree, prefixes):
+    for prefix in prefixes:
+        tst_autocomplete(tree, prefix, TOP_K)
+
+
+def _dict_autocomplete(mapping, prefixes):
+    for prefix in prefixes:
+        matches = (word for word in mapping if word.startswith(prefix))
+        heapq.nlargest(TOP_K, matches, key=mapping.__getitem__)
+
+
+def _tst_neighbors(tree, queries):
+    for query in queries:
+        tst_hamming_neighbors(tree, query, 1)
+
+
+def _dict_neighbors(mapping, queries):
+    for query in queries:
+        sorted(
+            word
+            for word in mapping
+            if len(word) == len(query) and sum(a != b for a, b in zip(word, query)) <= 1
+        )
+
+
+@pytest.mark.performance_test
+def test_tst_build(benchmark, words, weights):
+    benchmark.pedantic(
+        build_ternary_search_tree, args=(words,), kwargs={"weights": weights}, rounds=1
+    )
+
+
+@pytest.mark.performance_test
+def test_dict_build(benchmark, words, weights):
+    benchmark.pedantic(lambda: dict(zip(words, weights)), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_tst_lookups(benchmark, tree, words):
+    benchmark.pedantic(_tst_lookups, args=(tree, words), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_dict_lookups(benchmark, mapping, words):
+    benchmark.pedantic(_dict_lookups, args=(mapping, words), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_tst_prefix_queries(benchmark, tree, prefixes):
+    benchmark.pedantic(_tst_prefix_queries, args=(tree, prefixes), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_dict_prefix_queries(benchmark, mapping, prefixes):
+    benchmark.pedantic(_dict_prefix_queries, args=(mapping, prefixes), rounds=1)
+
+
+@pytest.mark.performance_test
+def test_bisect_prefix_queries(benchmark, words, prefixes):
+    benchmark.pedantic(_bisect_prefix_queries, args=(sorted(words), prefixes), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_tst_autocomplete(benchmark, tree, prefixes):
+    benchmark.pedantic(_tst_autocomplete, args=(tree, prefixes), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_dict_autocomplete(benchmark, mapping, prefixes):
+    benchmark.pedantic(_dict_autocomplete, args=(mapping, prefixes), rounds=1)
+
+
+@pytest.mark.performance_test
+def test_tst_hamming_neighbors(benchmark, tree, words):
+    benchmark.pedantic(_tst_neighbors, args=(tree, words[:PREFIX_QUERIES]), rounds=3)
+
+
+@pytest.mark.performance_test
+def test_dict_hamming_neighbors(benchmark, mapping, words):
+    benchmark.pedantic(
+        _dict_neighbors, args=(mapping, words[:PREFIX_QUERIES]), rounds=1
+    )
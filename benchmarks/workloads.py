@@ -0,0 +1,156 @@
+"""
+Input builders shared by the benchmark tools.
+
+Every builder is deterministic for a given size so that runs on different
+commits measure the same workload.
+"""
+
+import os
+from typing import cast
+
+from src.data_structures.linked_lists.singly_linked_list.singly_linked_list import (
+    SinglyLinkedList,
+)
+from src.data_structures.linked_lists.singly_linked_list.singly_linked_list_operations import (
+    insert_sll_element,
+)
+from src.data_structures.linked_lists.doubly_linked_list.doubly_linked_list import (
+    DoublyLinkedList,
+)
+from src.data_structures.linked_lists.doubly_linked_list.doubly_linked_list_operations import (
+    insert_dll_element,
+)
+from src.data_structures.linked_lists.circular_singly_linked_list.circular_singly_linked_list import (
+    CircularSinglyLinkedList,
+)
+from src.data_structures.linked_lists.circular_singly_linked_list.circular_singly_linked_list_operations import (
+    insert_csll_element,
+)
+from src.data_structures.linked_lists.circular_doubly_linked_list.circular_doubly_linked_list import (
+    CircularDoublyLinkedList,
+)
+from src.data_structures.linked_lists.circular_doubly_linked_list.circular_doubly_linked_list_operations import (
+    insert_cdll_element,
+)
+from src.data_structures.trees.tree_node import (
+    BinaryTreeNode,
+    TernaryTreeNode,
+    TreeNode,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    add_child_node,
+    create_root,
+)
+
+# The pytest-benchmark suites in this directory run small sizes by default;
+# set DSA_BENCHMARK_FULL=1 to run them at the sizes quoted in their docstrings.
+FULL_SCALE = os.environ.get("DSA_BENCHMARK_FULL") == "1"
+
+
+def scaled(quick: list[int], full: list[int]) -> list[int]:
+    """Pick the benchmark sizes for the current scale."""
+    return full if FULL_SCALE else quick
+
+
+def build_sll(size: int) -> SinglyLinkedList:
+    """Build a singly linked list holding the integers 1..size."""
+    sll = SinglyLinkedList()
+    for value in range(1, size + 1):
+        insert_sll_element(sll, value)
+    return sll
+
+
+def build_dll(size: int) -> DoublyLinkedList:
+    """Build a doubly linked list holding the integers 1..size."""
+    dll = DoublyLinkedList()
+    for value in range(1, size + 1):
+        insert_dll_element(dll, value)
+    return dll
+
+
+def build_csll(size: int) -> CircularSinglyLinkedList:
+    """Build a circular singly linked list holding the integers 1..size."""
+    csll = CircularSinglyLinkedList()
+    for value in range(1, size + 1):
+        insert_csll_element(csll, value)
+    return csll
+
+
+def build_cdll(size: int) -> CircularDoublyLinkedList:
+    """Build a circular doubly linked list holding the integers 1..size."""
+    cdll = CircularDoublyLinkedList()
+    for value in range(1, size + 1):
+        insert_cdll_element(cdll, value)
+    return cdll
+
+
+def build_balanced_tree(size: int, branching: int = 4) -> TreeNode:
+    """
+    Build an n-ary tree of ``size`` nodes filled level by level.
+
+    Node values are the integers 1..size in level order, so the tree is a
+    complete ``branching``-ary tree.
+    """
+    root = create_root(1)
+    nodes = [root]
+    for value in range(2, size + 1):
+        parent = nodes[(value - 2) // branching]
+        nodes.append(cast(TreeNode, add_child_node(parent, value)))
+    return root
+
+
+def build_wide_tree(size: int) -> TreeNode:
+    """Build a star-shaped tree: a root with ``size - 1`` leaf children."""
+    root = create_root(1)
+    for value in range(2, size + 1):
+        add_child_node(root, value)
+    return root
+
+
+def build_path_tree(size: int) -> TreeNode:
+    """Build a path-shaped tree where every node has exactly one child."""
+    root = create_root(1)
+    current = root
+    for value in range(2, size + 1):
+        current = cast(TreeNode, add_child_node(current, value))
+    return root
+
+
+def build_binary_tree(size: int) -> BinaryTreeNode:
+    """Build a complete binary tree of ``size`` BinaryTreeNode objects."""
+    nodes = [BinaryTreeNode(1)]
+    nodes[0].is_root = True
+    for value in range(2, size + 1):
+        parent = nodes[(value - 2) // 2]
+        node = BinaryTreeNode(value, parent=parent)
+        if value % 2 == 0:
+            parent.left_child = node
+            node.is_left = True
+        else:
+            parent.right_child = node
+            node.is_right = True
+        parent.is_parent = True
+        nodes.append(node)
+    return nodes[0]
+
+
+def build_ternary_tree(size: int) -> TernaryTreeNode:
+    """Build a complete ternary tree of ``size`` TernaryTreeNode objects."""
+    nodes = [TernaryTreeNode(1)]
+    nodes[0].is_root = True
+    for value in range(2, size + 1):
+        parent = nodes[(value - 2) // 3]
+        node = TernaryTreeNode(value, parent=parent)
+        position = (value - 2) % 3
+        if position == 0:
+            parent.left_child = node
+            node.is_left = True
+        elif position == 1:
+            parent.middle_child = node
+            node.is_middle = True
+        else:
+            parent.right_child = node
+            node.is_right = True
+        parent.is_parent = True
+        nodes.append(node)
+    return nodes[0]
@@ -1,3 +1,8 @@
 """
 Algorithms package containing various algorithm implementations.
+
+The package has no subpackages yet, so it has no lazy loader either. It is
+installed as a top-level package of its own and cannot use
+``data_structures._lazy``; when subpackages are added, import them lazily in
+the same way.
 """
@@ -1,3 +1,14 @@
 """
 Data structures package containing various data structure implementations.
+
+Subpackages are imported lazily on first attribute access (PEP 562), so that
+``import data_structures`` does not pay for implementations that are never used.
 """
+
+from ._lazy import lazy_submodules
+
+_SUBMODULES = frozenset({"heaps", "linked_lists", "trees", "visualization"})
+
+__all__ = sorted(_SUBMODULES)
+
+__getattr__, __dir__ = lazy_submodules(__name__, _SUBMODULES)
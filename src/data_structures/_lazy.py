@@ -0,0 +1,84 @@
+"""
+Lazy loading of the submodules of a package, or of names re-exported from its
+submodules, on first attribute access (PEP 562).
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Iterable, Mapping
+
+
+def lazy_submodules(
+    package: str, names: Iterable[str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the module-level ``__getattr__`` and ``__dir__`` of a package whose
+    submodules are imported only when first accessed.
+
+    A loaded submodule is stored in the package's namespace, so later
+    accesses no longer go through ``__getattr__``.
+
+    Args:
+        package (str): The ``__name__`` of the package
+        names (Iterable[str]): The submodules to load lazily
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: The
+            ``__getattr__`` and ``__dir__`` functions of the package
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_submodules(__name__, ["tree_node"])
+    """
+    submodules = frozenset(names)
+    namespace = vars(sys.modules[package])
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            module = importlib.import_module(f".{name}", package)
+            namespace[name] = module
+            return module
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | submodules)
+
+    return __getattr__, __dir__
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the module-level ``__getattr__`` and ``__dir__`` of a package that
+    re-exports names from its submodules, importing a submodule only when
+    one of its names is first accessed.
+
+    A loaded name is stored in the package's namespace, so later accesses no
+    longer go through ``__getattr__``.
+
+    Args:
+        package (str): The ``__name__`` of the package
+        exports (Mapping[str, str]): The submodule, relative to the package
+            (e.g. ``".tree_node"``), that defines each re-exported name
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: The
+            ``__getattr__`` and ``__dir__`` functions of the package
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, {"TreeNode": ".tree_node"})
+    """
+    modules = dict(exports)
+    namespace = vars(sys.modules[package])
+
+    def __getattr__(name: str) -> Any:
+        if name in modules:
+            value = getattr(importlib.import_module(modules[name], package), name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(modules))
+
+    return __getattr__, __dir__
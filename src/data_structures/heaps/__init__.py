@@ -0,0 +1,13 @@
+"""
+Heaps package containing priority queue implementations.
+
+Each implementation is imported lazily on first attribute access.
+"""
+
+from .._lazy import lazy_submodules
+
+_SUBMODULES = frozenset({"d_ary_heap"})
+
+__all__ = sorted(_SUBMODULES)
+
+__getattr__, __dir__ = lazy_submodules(__name__, _SUBMODULES)
@@ -0,0 +1,3 @@
+"""
+Indexed d-ary min-heap with stable handles, decrease-key and removal.
+"""
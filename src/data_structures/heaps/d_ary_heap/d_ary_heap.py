@@ -0,0 +1,76 @@
+from typing import Any, Iterator
+
+
+class HeapHandle:
+    """
+    Stable reference to an entry of a DAryHeap.
+
+    A handle is returned when an item is pushed and stays valid while the
+    entry moves around the heap, so its priority can later be decreased or
+    the entry removed in O(log n) without searching for it.
+
+    Attributes:
+        item (Any): The item
+        priority (Any): The item's current priority
+        index (int): The entry's position in the heap array, -1 once it has
+            been popped or removed
+    """
+
+    __slots__ = ("item", "priority", "index")
+
+    def __init__(self, item: Any, priority: Any, index: int = -1):
+        self.item = item
+        self.priority = priority
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"HeapHandle({self.item!r}, priority={self.priority!r})"
+
+
+class DAryHeap:
+    """
+    Indexed min-heap in which every node has up to ``arity`` children.
+
+    The heap is stored level by level in two parallel lists: the children of
+    position i are at ``arity * i + 1 .. arity * i + arity``. ``priorities``
+    holds the keys that are compared, so sifting does not go through handle
+    attributes; ``handles`` holds the matching handles, whose ``index`` is
+    kept in step. A larger arity makes the heap shallower, which speeds up
+    pushes and decrease-key at the cost of more comparisons per pop.
+
+    Priorities must be mutually comparable with ``<``; entries with equal
+    priorities come out in no particular order.
+
+    Attributes:
+        arity (int): The maximum number of children of a node, at least 2
+        priorities (list[Any]): The priorities, in heap order
+        handles (list[HeapHandle]): The handles, in heap order
+
+    Example:
+        >>> heap = create_d_ary_heap(arity=4)
+        >>> handle = heap_push(heap, "b", 5)
+        >>> heap_push(heap, "a", 3)
+        >>> heap_decrease_key(heap, handle, 1)
+        >>> print(heap_pop(heap).item)  # b
+    """
+
+    __slots__ = ("arity", "priorities", "handles")
+
+    def __init__(self, arity: int = 4):
+        self.arity = arity
+        self.priorities: list[Any] = []
+        self.handles: list[HeapHandle] = []
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def __bool__(self) -> bool:
+        return bool(self.handles)
+
+    def __contains__(self, handle: HeapHandle) -> bool:
+        index = handle.index
+        return 0 <= index < len(self.handles) and self.handles[index] is handle
+
+    def __iter__(self) -> Iterator[HeapHandle]:
+        """Iterate over the handles in heap (not sorted) order."""
+        return iter(self.handles)
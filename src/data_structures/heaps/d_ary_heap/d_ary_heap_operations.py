@@ -0,0 +1,271 @@
+from typing import Any, Iterable
+
+from .d_ary_heap import DAryHeap, HeapHandle
+
+
+def _sift_up(heap: DAryHeap, index: int, priority: Any, handle: HeapHandle) -> None:
+    # Move parents down into the hole at index until priority fits, then
+    # place the entry there; each level costs one comparison and no swap.
+    priorities, handles, arity = heap.priorities, heap.handles, heap.arity
+    while index:
+        parent = (index - 1) // arity
+        parent_priority = priorities[parent]
+        if not priority < parent_priority:
+            break
+        moved = handles[parent]
+        priorities[index] = parent_priority
+        handles[index] = moved
+        moved.index = index
+        index = parent
+    priorities[index] = priority
+    handles[index] = handle
+    handle.index = index
+
+
+def _sift_down(heap: DAryHeap, index: int, priority: Any, handle: HeapHandle) -> None:
+    # Move the smallest child up into the hole at index until priority fits.
+    priorities, handles, arity = heap.priorities, heap.handles, heap.arity
+    size = len(priorities)
+    while True:
+        first = arity * index + 1
+        if first >= size:
+            break
+        child, child_priority = first, priorities[first]
+        for position in range(first + 1, min(first + arity, size)):
+            candidate = priorities[position]
+            if candidate < child_priority:
+                child, child_priority = position, candidate
+        if not child_priority < priority:
+            break
+        moved = handles[child]
+        priorities[index] = child_priority
+        handles[index] = moved
+        moved.index = index
+        index = child
+    priorities[index] = priority
+    handles[index] = handle
+    handle.index = index
+
+
+def _check_handle(heap: DAryHeap, handle: HeapHandle) -> None:
+    if heap is None:
+        raise ValueError("Heap cannot be None")
+    if handle not in heap:
+        raise ValueError("Handle is not in the heap")
+
+
+def _take_last(heap: DAryHeap) -> tuple[Any, HeapHandle]:
+    return heap.priorities.pop(), heap.handles.pop()
+
+
+def create_d_ary_heap(arity: int = 4) -> DAryHeap:
+    """
+    Create an empty d-ary min-heap.
+
+    Args:
+        arity (int): The maximum number of children of a node
+
+    Returns:
+        DAryHeap: The empty heap
+
+    Raises:
+        ValueError: If arity is not an integer of at least 2
+
+    Example:
+        >>> heap = create_d_ary_heap(arity=2)
+        >>> print(len(heap))  # 0
+    """
+    if not isinstance(arity, int) or arity < 2:
+        raise ValueError("Arity must be an integer of at least 2")
+    return DAryHeap(arity)
+
+
+def build_d_ary_heap(
+    items: Iterable[Any], priorities: Iterable[Any], arity: int = 4
+) -> tuple[DAryHeap, list[HeapHandle]]:
+    """
+    Build a d-ary min-heap from items and their priorities in O(n).
+
+    The entries are laid out in input order and then sifted down from the
+    last parent to the root (Floyd's heapify), which is cheaper than n
+    pushes.
+
+    Args:
+        items (Iterable[Any]): The items
+        priorities (Iterable[Any]): The priority of every item
+        arity (int): The maximum number of children of a node
+
+    Returns:
+        tuple[DAryHeap, list[HeapHandle]]: The heap and the handles of the
+            items, in input order
+
+    Raises:
+        ValueError: If arity is not an integer of at least 2, or priorities
+            has a different length from items
+
+    Example:
+        >>> heap, handles = build_d_ary_heap("abc", [3, 1, 2])
+        >>> print(heap_peek(heap).item)  # b
+    """
+    heap = create_d_ary_heap(arity)
+    items, keys = list(items), list(priorities)
+    if len(items) != len(keys):
+        raise ValueError("Items and priorities must have the same length")
+
+    handles = [
+        HeapHandle(item, priority, index)
+        for index, (item, priority) in enumerate(zip(items, keys))
+    ]
+    heap.priorities = keys
+    heap.handles = list(handles)
+    for index in range((len(keys) - 2) // arity, -1, -1):
+        _sift_down(heap, index, keys[index], heap.handles[index])
+    return heap, handles
+
+
+def heap_push(heap: DAryHeap, item: Any, priority: Any) -> HeapHandle:
+    """
+    Add ``item`` with ``priority`` in O(log_d n).
+
+    Args:
+        heap (DAryHeap): The heap
+        item (Any): The item
+        priority (Any): Its priority, comparable with the others
+
+    Returns:
+        HeapHandle: The handle of the new entry
+
+    Raises:
+        ValueError: If heap is None
+
+    Example:
+        >>> heap = create_d_ary_heap()
+        >>> handle = heap_push(heap, "task", 7)
+        >>> print(handle in heap)  # True
+    """
+    if heap is None:
+        raise ValueError("Heap cannot be None")
+    handle = HeapHandle(item, priority)
+    heap.priorities.append(priority)
+    heap.handles.append(handle)
+    _sift_up(heap, len(heap.handles) - 1, priority, handle)
+    return handle
+
+
+def heap_peek(heap: DAryHeap) -> HeapHandle:
+    """
+    Return the handle of an entry with the smallest priority, in O(1).
+
+    Raises:
+        ValueError: If heap is None or empty
+
+    Example:
+        >>> heap, _ = build_d_ary_heap(["x", "y"], [2, 1])
+        >>> print(heap_peek(heap).priority)  # 1
+    """
+    if not heap:
+        raise ValueError("Heap cannot be None or empty")
+    return heap.handles[0]
+
+
+def heap_pop(heap: DAryHeap) -> HeapHandle:
+    """
+    Remove and return an entry with the smallest priority, in O(d log_d n).
+
+    The returned handle keeps its item and priority; its index becomes -1.
+
+    Raises:
+        ValueError: If heap is None or empty
+
+    Example:
+        >>> heap, _ = build_d_ary_heap(["x", "y"], [2, 1])
+        >>> print(heap_pop(heap).item)  # y
+        >>> print(len(heap))  # 1
+    """
+    if not heap:
+        raise ValueError("Heap cannot be None or empty")
+    top = heap.handles[0]
+    priority, handle = _take_last(heap)
+    if heap.handles:
+        _sift_down(heap, 0, priority, handle)
+    top.index = -1
+    return top
+
+
+def heap_decrease_key(heap: DAryHeap, handle: HeapHandle, priority: Any) -> None:
+    """
+    Lower the priority of the entry of ``handle`` in O(log_d n).
+
+    Args:
+        heap (DAryHeap): The heap
+        handle (HeapHandle): The handle of an entry still in the heap
+        priority (Any): The new priority, not greater than the current one
+
+    Raises:
+        ValueError: If heap is None, handle is not in the heap, or priority
+            is greater than the current priority
+
+    Example:
+        >>> heap, (a, b) = build_d_ary_heap("ab", [1, 5])
+        >>> heap_decrease_key(heap, b, 0)
+        >>> print(heap_peek(heap).item)  # b
+    """
+    _check_handle(heap, handle)
+    if handle.priority < priority:
+        raise ValueError("New priority is greater than the current priority")
+    handle.priority = priority
+    _sift_up(heap, handle.index, priority, handle)
+
+
+def heap_update_key(heap: DAryHeap, handle: HeapHandle, priority: Any) -> None:
+    """
+    Change the priority of the entry of ``handle`` in either direction.
+
+    A lower priority sifts the entry up in O(log_d n), a higher one sifts
+    it down in O(d log_d n).
+
+    Args:
+        heap (DAryHeap): The heap
+        handle (HeapHandle): The handle of an entry still in the heap
+        priority (Any): The new priority
+
+    Raises:
+        ValueError: If heap is None or handle is not in the heap
+
+    Example:
+        >>> heap, (a, b) = build_d_ary_heap("ab", [1, 5])
+        >>> heap_update_key(heap, a, 9)
+        >>> print(heap_peek(heap).item)  # b
+    """
+    _check_handle(heap, handle)
+    previous, handle.priority = handle.priority, priority
+    if priority < previous:
+        _sift_up(heap, handle.index, priority, handle)
+    else:
+        _sift_down(heap, handle.index, priority, handle)
+
+
+def heap_remove(heap: DAryHeap, handle: HeapHandle) -> None:
+    """
+    Remove the entry of ``handle`` from anywhere in the heap in O(d log_d n).
+
+    The last entry fills the hole and is sifted up or down; the removed
+    handle's index becomes -1.
+
+    Raises:
+        ValueError: If heap is None or handle is not in the heap
+
+    Example:
+        >>> heap, (a, b) = build_d_ary_heap("ab", [1, 5])
+        >>> heap_remove(heap, a)
+        >>> print(a in heap, heap_peek(heap).item)  # False b
+    """
+    _check_handle(heap, handle)
+    index = handle.index
+    priority, last = _take_last(heap)
+    if last is not handle:
+        if priority < handle.priority:
+            _sift_up(heap, index, priority, last)
+        else:
+            _sift_down(heap, index, priority, last)
+    handle.index = -1
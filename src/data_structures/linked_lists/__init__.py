@@ -1,3 +1,21 @@
 """
 Linked lists package containing various linked list implementations.
+
+Each implementation is imported lazily on first attribute access.
 """
+
+from .._lazy import lazy_submodules
+
+_SUBMODULES = frozenset(
+    {
+        "singly_linked_list",
+        "doubly_linked_list",
+        "circular_singly_linked_list",
+        "circular_doubly_linked_list",
+        "linked_list_utilities",
+    }
+)
+
+__all__ = sorted(_SUBMODULES)
+
+__getattr__, __dir__ = lazy_submodules(__name__, _SUBMODULES)
@@ -1,13 +1,18 @@
 """
 Singly linked list implementation.
+
+The re-exported names are resolved lazily on first access.
 """
 
-from .singly_linked_list import SinglyLinkedList, SinglyLinkedListNode
-from .singly_linked_list_operations import (
-    initialize_sll,
-    insert_sll_element,
-    delete_sll_last_element,
-)
+from ..._lazy import lazy_exports
+
+_EXPORTS = {
+    "SinglyLinkedList": ".singly_linked_list",
+    "SinglyLinkedListNode": ".singly_linked_list",
+    "initialize_sll": ".singly_linked_list_operations",
+    "insert_sll_element": ".singly_linked_list_operations",
+    "delete_sll_last_element": ".singly_linked_list_operations",
+}
 
 __all__ = [
     "SinglyLinkedList",
@@ -16,3 +21,5 @@ __all__ = [
     "insert_sll_element",
     "delete_sll_last_element",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,24 @@
+"""
+Trees package containing tree node types and tree implementations.
+
+Submodules are imported lazily on first attribute access.
+"""
+
+from .._lazy import lazy_submodules
+
+_SUBMODULES = frozenset(
+    {
+        "tree_node",
+        "n_ary_trees",
+        "flat_tree",
+        "avl_tree",
+        "ternary_search_tree",
+        "radix_trie",
+        "segment_tree",
+        "fenwick_tree",
+    }
+)
+
+__all__ = sorted(_SUBMODULES)
+
+__getattr__, __dir__ = lazy_submodules(__name__, _SUBMODULES)
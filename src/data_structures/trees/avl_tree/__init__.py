@@ -0,0 +1,3 @@
+"""
+Ordered map and set built on a height-balanced (AVL) binary search tree.
+"""
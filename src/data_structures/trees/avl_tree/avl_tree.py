@@ -0,0 +1,97 @@
+from typing import Any, Iterator
+
+from ..tree_node import BinaryTreeNode, _derived_flag_property
+
+
+class AVLTreeNode(BinaryTreeNode):
+    """
+    Node of an AVL tree; ``data`` is the key and ``value`` the mapped value.
+
+    Every node caches the height and the size of its subtree, which keep the
+    tree balanced and make rank and select O(log n). Rotations move nodes
+    around, so the structural flags (is_root, is_left, ...) are computed from
+    the links instead of being stored.
+    """
+
+    __slots__ = ("value", "height", "size")
+
+    # Links only ever point at other AVL nodes.
+    parent: "AVLTreeNode | None"
+    left_child: "AVLTreeNode | None"
+    right_child: "AVLTreeNode | None"
+
+    def __init__(
+        self, data: Any, value: Any = None, parent: "AVLTreeNode | None" = None
+    ):
+        super().__init__(data, parent)
+        self.value = value
+        self.height = 1
+        self.size = 1
+
+    is_root = _derived_flag_property(lambda node: node.parent is None, "is the root")
+    is_parent = _derived_flag_property(
+        lambda node: node.left_child is not None or node.right_child is not None,
+        "has children",
+    )
+    is_leaf = _derived_flag_property(
+        lambda node: node.left_child is None and node.right_child is None,
+        "is a leaf",
+    )
+    is_left = _derived_flag_property(
+        lambda node: node.parent is not None and node.parent.left_child is node,
+        "is a left child",
+    )
+    is_right = _derived_flag_property(
+        lambda node: node.parent is not None and node.parent.right_child is node,
+        "is a right child",
+    )
+
+
+class AVLTree:
+    """
+    Ordered map (or set, with every value None) backed by an AVL tree.
+
+    Keys must be mutually comparable. Insertion, deletion and lookup are
+    O(log n); see avl_tree_operations. Iteration yields the keys in order.
+
+    Attributes:
+        root (AVLTreeNode | None): The root node, None when the tree is empty
+
+    Example:
+        >>> tree = build_avl_tree([1, 3, 5])
+        >>> avl_insert(tree, 4)
+        >>> print(list(tree))  # [1, 3, 4, 5]
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self, root: AVLTreeNode | None = None):
+        self.root = root
+
+    def __len__(self) -> int:
+        return self.root.size if self.root is not None else 0
+
+    def __bool__(self) -> bool:
+        return self.root is not None
+
+    def __contains__(self, key: Any) -> bool:
+        node = self.root
+        while node is not None:
+            if key < node.data:
+                node = node.left_child
+            elif node.data < key:
+                node = node.right_child
+            else:
+                return True
+        return False
+
+    def __iter__(self) -> Iterator[Any]:
+        stack: list[AVLTreeNode] = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left_child
+            node = stack.pop()
+            yield node.data
+            node = node.right_child
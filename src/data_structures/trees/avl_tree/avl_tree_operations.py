@@ -0,0 +1,377 @@
+from typing import Any, Iterable, Iterator, cast
+
+from .avl_tree import AVLTree, AVLTreeNode
+
+
+def _height(node: AVLTreeNode | None) -> int:
+    return node.height if node is not None else 0
+
+
+def _size(node: AVLTreeNode | None) -> int:
+    return node.size if node is not None else 0
+
+
+def _update(node: AVLTreeNode) -> None:
+    left, right = node.left_child, node.right_child
+    node.height = 1 + max(_height(left), _height(right))
+    node.size = 1 + _size(left) + _size(right)
+
+
+def _replace_child(
+    tree: AVLTree, parent: AVLTreeNode | None, old: AVLTreeNode, new: Any
+) -> None:
+    if parent is None:
+        tree.root = new
+    elif parent.left_child is old:
+        parent.left_child = new
+    else:
+        parent.right_child = new
+
+    if new is not None:
+        new.parent = parent
+
+
+def _rotate_left(tree: AVLTree, node: AVLTreeNode) -> AVLTreeNode:
+    pivot = cast(AVLTreeNode, node.right_child)  # Right-heavy, so not None
+    node.right_child = pivot.left_child
+    if pivot.left_child is not None:
+        pivot.left_child.parent = node
+
+    _replace_child(tree, node.parent, node, pivot)
+    pivot.left_child = node
+    node.parent = pivot
+
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_right(tree: AVLTree, node: AVLTreeNode) -> AVLTreeNode:
+    pivot = cast(AVLTreeNode, node.left_child)  # Left-heavy, so not None
+    node.left_child = pivot.right_child
+    if pivot.right_child is not None:
+        pivot.right_child.parent = node
+
+    _replace_child(tree, node.parent, node, pivot)
+    pivot.right_child = node
+    node.parent = pivot
+
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance_path(tree: AVLTree, node: AVLTreeNode | None) -> None:
+    # Every ancestor's size changed, so the walk always reaches the root;
+    # heights are restored with at most two rotations per level.
+    while node is not None:
+        _update(node)
+        left, right = node.left_child, node.right_child
+        balance = _height(left) - _height(right)
+
+        if balance > 1:
+            left = cast(AVLTreeNode, left)
+            if _height(left.left_child) < _height(left.right_child):
+                _rotate_left(tree, left)
+            node = _rotate_right(tree, node)
+        elif balance < -1:
+            right = cast(AVLTreeNode, right)
+            if _height(right.right_child) < _height(right.left_child):
+                _rotate_right(tree, right)
+            node = _rotate_left(tree, node)
+
+        node = node.parent
+
+
+def _find(tree: AVLTree, key: Any) -> AVLTreeNode | None:
+    node = tree.root
+    while node is not None:
+        if key < node.data:
+            node = node.left_child
+        elif node.data < key:
+            node = node.right_child
+        else:
+            return node
+    return None
+
+
+def create_avl_tree() -> AVLTree:
+    """
+    Create an empty AVL tree.
+
+    Example:
+        >>> tree = create_avl_tree()
+        >>> print(len(tree))  # 0
+    """
+    return AVLTree()
+
+
+def build_avl_tree(keys: Iterable[Any], values: Iterable[Any] | None = None) -> AVLTree:
+    """
+    Build an AVL tree from keys in strictly increasing order in O(n).
+
+    Each subtree is rooted at the middle key of its range, so the tree is
+    perfectly balanced without any rotation.
+
+    Args:
+        keys (Iterable[Any]): The keys, sorted and without duplicates
+        values (Iterable[Any] | None): The value of every key; defaults to None
+            for every key (a set)
+
+    Returns:
+        AVLTree: The built tree
+
+    Raises:
+        ValueError: If the keys are not strictly increasing, or values has a
+            different length
+
+    Example:
+        >>> tree = build_avl_tree(["a", "b", "c"], [1, 2, 3])
+        >>> print(avl_get(tree, "b"))  # 2
+    """
+    keys = list(keys)
+    values = [None] * len(keys) if values is None else list(values)
+    if len(values) != len(keys):
+        raise ValueError("Keys and values must have the same length")
+
+    for previous, key in zip(keys, keys[1:]):
+        if not previous < key:
+            raise ValueError("Keys must be sorted and unique")
+
+    def build(low: int, high: int, parent: AVLTreeNode | None) -> Any:
+        if low >= high:
+            return None
+        middle = (low + high) // 2
+        node = AVLTreeNode(keys[middle], values[middle], parent)
+        node.left_child = build(low, middle, node)
+        node.right_child = build(middle + 1, high, node)
+        _update(node)
+        return node
+
+    # The recursion depth is log2(n), far below the recursion limit.
+    return AVLTree(build(0, len(keys), None))
+
+
+def avl_insert(tree: AVLTree, key: Any, value: Any = None) -> AVLTreeNode:
+    """
+    Insert ``key`` with ``value``, or replace the value if the key exists.
+
+    Args:
+        tree (AVLTree): The tree
+        key (Any): The key
+        value (Any): The value to map the key to
+
+    Returns:
+        AVLTreeNode: The node holding the key
+
+    Example:
+        >>> tree = create_avl_tree()
+        >>> avl_insert(tree, 2, "two")
+        >>> print(avl_get(tree, 2))  # "two"
+    """
+    if tree is None:
+        raise ValueError("Tree cannot be None")
+
+    parent, node = None, tree.root
+    while node is not None:
+        if key < node.data:
+            parent, node = node, node.left_child
+        elif node.data < key:
+            parent, node = node, node.right_child
+        else:
+            node.value = value
+            return node
+
+    node = AVLTreeNode(key, value, parent)
+    if parent is None:
+        tree.root = node
+    elif key < parent.data:
+        parent.left_child = node
+    else:
+        parent.right_child = node
+
+    _rebalance_path(tree, parent)
+    return node
+
+
+def avl_delete(tree: AVLTree, key: Any) -> bool:
+    """
+    Remove ``key`` (and its value) from the tree.
+
+    Returns:
+        bool: True if the key was present
+
+    Example:
+        >>> tree = build_avl_tree([1, 2, 3])
+        >>> print(avl_delete(tree, 2), list(tree))  # True [1, 3]
+    """
+    if tree is None:
+        raise ValueError("Tree cannot be None")
+
+    node = _find(tree, key)
+    if node is None:
+        return False
+
+    if node.left_child is not None and node.right_child is not None:
+        # Move the in-order successor's entry here and remove the successor,
+        # which has no left child.
+        successor = node.right_child
+        while successor.left_child is not None:
+            successor = successor.left_child
+        node.data, node.value = successor.data, successor.value
+        node = successor
+
+    child = node.left_child if node.left_child is not None else node.right_child
+    parent = node.parent
+    _replace_child(tree, parent, node, child)
+    node.parent = node.left_child = node.right_child = None
+
+    _rebalance_path(tree, parent)
+    return True
+
+
+def avl_get(tree: AVLTree, key: Any, default: Any = None) -> Any:
+    """
+    Return the value of ``key``, or ``default`` if the key is absent.
+
+    Example:
+        >>> tree = build_avl_tree([1], ["one"])
+        >>> print(avl_get(tree, 1), avl_get(tree, 2))  # one None
+    """
+    node = _find(tree, key)
+    return node.value if node is not None else default
+
+
+def avl_search(tree: AVLTree, key: Any) -> AVLTreeNode | None:
+    """Return the node holding ``key``, or None."""
+    return _find(tree, key)
+
+
+def avl_floor(tree: AVLTree, key: Any) -> AVLTreeNode | None:
+    """
+    Return the node with the largest key less than or equal to ``key``.
+
+    Example:
+        >>> tree = build_avl_tree([10, 20, 30])
+        >>> print(avl_floor(tree, 25).data)  # 20
+    """
+    node, best = tree.root, None
+    while node is not None:
+        if key < node.data:
+            node = node.left_child
+        else:
+            best = node
+            if not node.data < key:
+                break
+            node = node.right_child
+    return best
+
+
+def avl_ceiling(tree: AVLTree, key: Any) -> AVLTreeNode | None:
+    """
+    Return the node with the smallest key greater than or equal to ``key``.
+
+    Example:
+        >>> tree = build_avl_tree([10, 20, 30])
+        >>> print(avl_ceiling(tree, 25).data)  # 30
+    """
+    node, best = tree.root, None
+    while node is not None:
+        if node.data < key:
+            node = node.right_child
+        else:
+            best = node
+            if not key < node.data:
+                break
+            node = node.left_child
+    return best
+
+
+def avl_rank(tree: AVLTree, key: Any) -> int:
+    """
+    Return the number of keys strictly less than ``key``.
+
+    Example:
+        >>> tree = build_avl_tree([10, 20, 30])
+        >>> print(avl_rank(tree, 25))  # 2
+    """
+    node, rank = tree.root, 0
+    while node is not None:
+        if node.data < key:
+            left = node.left_child
+            rank += left.size + 1 if left is not None else 1
+            node = node.right_child
+        else:
+            node = node.left_child
+    return rank
+
+
+def avl_select(tree: AVLTree, index: int) -> AVLTreeNode:
+    """
+    Return the node with the ``index``-th smallest key (0-based).
+
+    Raises:
+        IndexError: If index is out of range
+
+    Example:
+        >>> tree = build_avl_tree([10, 20, 30])
+        >>> print(avl_select(tree, 1).data)  # 20
+    """
+    if not 0 <= index < len(tree):
+        raise IndexError(f"Index {index} is out of range")
+
+    # The index is in range, so the walk never steps off the tree.
+    node = cast(AVLTreeNode, tree.root)
+    while True:
+        left_size = _size(node.left_child)
+        if index < left_size:
+            node = cast(AVLTreeNode, node.left_child)
+        elif index > left_size:
+            index -= left_size + 1
+            node = cast(AVLTreeNode, node.right_child)
+        else:
+            return node
+
+
+def avl_iter_range(
+    tree: AVLTree, low: Any = None, high: Any = None
+) -> Iterator[AVLTreeNode]:
+    """
+    Lazily yield the nodes with ``low <= key < high``, in key order.
+
+    Only the path to ``low`` and the yielded nodes are visited, so taking
+    the first few nodes of a range costs O(log n) each.
+
+    Args:
+        tree (AVLTree): The tree
+        low (Any): The inclusive lower bound, or None for no bound
+        high (Any): The exclusive upper bound, or None for no bound
+
+    Yields:
+        AVLTreeNode: The nodes in the range, in increasing key order
+
+    Example:
+        >>> tree = build_avl_tree(range(10))
+        >>> print([node.data for node in avl_iter_range(tree, 3, 6)])  # [3, 4, 5]
+    """
+    # The stack holds the ancestors still to be yielded after their left
+    # subtree: the path to ``low`` minus the nodes below the bound.
+    stack = []
+    node = tree.root
+    while node is not None:
+        if low is not None and node.data < low:
+            node = node.right_child
+        else:
+            stack.append(node)
+            node = node.left_child
+
+    while stack:
+        node = stack.pop()
+        if high is not None and not node.data < high:
+            return
+        yield node
+
+        node = node.right_child
+        while node is not None:
+            stack.append(node)
+            node = node.left_child
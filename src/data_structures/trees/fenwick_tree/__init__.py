@@ -0,0 +1,6 @@
+"""
+Fenwick (binary indexed) trees for prefix sums, with range updates and a 2D
+variant.
+
+The modules in this package need NumPy (``poetry install --extras numeric``).
+"""
@@ -0,0 +1,79 @@
+try:
+    import numpy as np
+except ImportError as error:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "FenwickTree needs NumPy; install it with `poetry install --extras numeric`"
+    ) from error
+
+
+class FenwickTree:
+    """
+    Fenwick (binary indexed) tree: point updates and prefix sums in O(log n).
+
+    ``tree[i]`` for ``1 <= i <= n`` holds the sum of the values at positions
+    ``i - lowbit(i) .. i - 1``, where ``lowbit(i) = i & -i``; ``tree[0]`` is
+    always 0. A prefix sum adds the entries found by repeatedly clearing the
+    lowest set bit of the count, and a point update adds to the entries
+    found by repeatedly adding the lowest set bit to the position.
+
+    Attributes:
+        tree (np.ndarray): The n + 1 partial sums
+    """
+
+    __slots__ = ("tree",)
+
+    def __init__(self, tree: np.ndarray):
+        self.tree = tree
+
+    def __len__(self) -> int:
+        return len(self.tree) - 1
+
+
+class RangeFenwickTree:
+    """
+    Fenwick tree pair supporting range updates and range sums in O(log n).
+
+    Adding ``d`` to positions ``low .. high - 1`` is recorded as two point
+    updates of a difference array, in ``slopes``, and of the difference
+    array weighted by position, in ``intercepts``. The sum of the first
+    ``count`` values is then ``count * slopes_prefix - intercepts_prefix``.
+
+    Attributes:
+        slopes (np.ndarray): Fenwick tree over the difference array
+        intercepts (np.ndarray): Fenwick tree over the difference array
+            times the position
+    """
+
+    __slots__ = ("slopes", "intercepts")
+
+    def __init__(self, slopes: np.ndarray, intercepts: np.ndarray):
+        self.slopes = slopes
+        self.intercepts = intercepts
+
+    def __len__(self) -> int:
+        return len(self.slopes) - 1
+
+
+class FenwickTree2D:
+    """
+    Two-dimensional Fenwick tree: point updates and rectangle sums in
+    O(log rows * log columns).
+
+    ``tree`` is a Fenwick tree along both axes: entry ``(i, j)`` holds the
+    sum of the block of rows ``i - lowbit(i) .. i - 1`` and columns
+    ``j - lowbit(j) .. j - 1``. Row 0 and column 0 are always 0.
+
+    Attributes:
+        tree (np.ndarray): The (rows + 1) x (columns + 1) partial sums
+    """
+
+    __slots__ = ("tree",)
+
+    def __init__(self, tree: np.ndarray):
+        self.tree = tree
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """The number of rows and columns."""
+        rows, columns = self.tree.shape
+        return rows - 1, columns - 1
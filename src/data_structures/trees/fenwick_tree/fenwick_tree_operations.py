@@ -0,0 +1,496 @@
+from typing import Any
+
+from .fenwick_tree import FenwickTree, FenwickTree2D, RangeFenwickTree, np
+
+
+def _as_values(values: Any, dtype: Any, ndim: int) -> np.ndarray:
+    values = np.asarray(values, dtype=dtype)
+    if values.ndim != ndim or values.size == 0:
+        raise ValueError(f"Values must be a non-empty {ndim}-dimensional array")
+    if values.dtype == bool or not np.issubdtype(values.dtype, np.number):
+        raise ValueError("Values must be numbers")
+    return values
+
+
+def _fenwick_array(values: np.ndarray, axis: int = 0) -> np.ndarray:
+    # Entry i of a Fenwick tree is prefix[i] - prefix[i - lowbit(i)], so one
+    # cumulative sum builds it in O(n). Along ``axis``, with a leading 0.
+    values = np.moveaxis(values, axis, 0)
+    size = len(values)
+    prefix = np.zeros((size + 1,) + values.shape[1:], dtype=values.dtype)
+    np.cumsum(values, axis=0, out=prefix[1:])
+
+    positions = np.arange(1, size + 1)
+    array = np.zeros_like(prefix)
+    array[1:] = prefix[1:] - prefix[positions & (positions - 1)]
+    return np.moveaxis(array, 0, axis)
+
+
+def _add(array: np.ndarray, position: int, delta: Any) -> None:
+    # position is 1-based.
+    size = len(array) - 1
+    while position <= size:
+        array[position] += delta
+        position += position & -position
+
+
+def _prefix(array: np.ndarray, count: int) -> Any:
+    total = array.dtype.type(0)
+    while count:
+        total += array[count]
+        count &= count - 1
+    return total
+
+
+def _add_at(array: np.ndarray, positions: np.ndarray, deltas: np.ndarray) -> None:
+    # Vectorized _add: every update climbs one level per step.
+    size = len(array) - 1
+    while True:
+        inside = positions <= size
+        positions, deltas = positions[inside], deltas[inside]
+        if not len(positions):
+            return
+        np.add.at(array, positions, deltas)
+        positions = positions + (positions & -positions)
+
+
+def _prefix_at(array: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    # Vectorized _prefix; array[0] is 0, so finished counts add nothing.
+    totals = np.zeros(len(counts), dtype=array.dtype)
+    counts = counts.copy()
+    while counts.any():
+        totals += array[counts]
+        counts &= counts - 1
+    return totals
+
+
+def _positions(positions: Any, upper: int) -> np.ndarray:
+    positions = np.asarray(positions, dtype=np.int64)
+    if positions.ndim != 1:
+        raise ValueError("Positions must be a one-dimensional array")
+    if positions.size and (positions.min() < 0 or positions.max() > upper):
+        raise ValueError(f"Positions must be between 0 and {upper}")
+    return positions
+
+
+def _ranges(size: int, lows: Any, highs: Any) -> tuple[np.ndarray, np.ndarray]:
+    lows, highs = _positions(lows, size), _positions(highs, size)
+    if lows.shape != highs.shape or (lows > highs).any():
+        raise ValueError("Ranges must have low <= high and the arrays one shape")
+    return lows, highs
+
+
+def _deltas(array: np.ndarray, deltas: Any, shape: tuple[int, ...]) -> np.ndarray:
+    return np.broadcast_to(np.asarray(deltas, dtype=array.dtype), shape)
+
+
+def _check_position(size: int, position: int) -> None:
+    if not 0 <= position < size:
+        raise ValueError(f"Position {position} is out of bounds")
+
+
+def _check_range(size: int, low: int, high: int) -> None:
+    if not 0 <= low <= high <= size:
+        raise ValueError(f"Range [{low}, {high}) is out of bounds")
+
+
+def create_fenwick_tree(values: Any, dtype: Any = None) -> FenwickTree:
+    """
+    Build a Fenwick tree over ``values`` in O(n) with one cumulative sum.
+
+    Args:
+        values (Any): Non-empty one-dimensional array-like of numbers; use
+            np.zeros(n) for n empty counters
+        dtype (Any): NumPy dtype of the tree; defaults to the dtype NumPy
+            infers for values
+
+    Returns:
+        FenwickTree: The tree
+
+    Raises:
+        ValueError: If values is empty, not one-dimensional or not numeric
+
+    Example:
+        >>> tree = create_fenwick_tree([3, 1, 4, 1, 5])
+        >>> print(fenwick_prefix_sum(tree, 3))  # 8
+    """
+    return FenwickTree(_fenwick_array(_as_values(values, dtype, 1)))
+
+
+def fenwick_add(tree: FenwickTree, position: int, delta: Any) -> None:
+    """
+    Add ``delta`` to the value at ``position`` in O(log n).
+
+    Raises:
+        ValueError: If position is out of bounds
+
+    Example:
+        >>> fenwick_add(tree, 0, 10)
+        >>> print(fenwick_prefix_sum(tree, 1))  # 13
+    """
+    _check_position(len(tree), position)
+    _add(tree.tree, position + 1, delta)
+
+
+def fenwick_prefix_sum(tree: FenwickTree, count: int) -> Any:
+    """
+    Return the sum of the first ``count`` values in O(log n).
+
+    Args:
+        tree (FenwickTree): The tree
+        count (int): The number of values to add up, 0 to len(tree)
+
+    Returns:
+        Any: The sum, as a Python number
+
+    Raises:
+        ValueError: If count is out of bounds
+
+    Example:
+        >>> tree = create_fenwick_tree([3, 1, 4, 1, 5])
+        >>> print(fenwick_prefix_sum(tree, 5))  # 14
+    """
+    _check_range(len(tree), 0, count)
+    return _prefix(tree.tree, count).item()
+
+
+def fenwick_range_sum(tree: FenwickTree, low: int, high: int) -> Any:
+    """
+    Return the sum of the values at positions ``low <= i < high``.
+
+    Example:
+        >>> tree = create_fenwick_tree([3, 1, 4, 1, 5])
+        >>> print(fenwick_range_sum(tree, 1, 4))  # 6
+    """
+    _check_range(len(tree), low, high)
+    return (_prefix(tree.tree, high) - _prefix(tree.tree, low)).item()
+
+
+def fenwick_lower_bound(tree: FenwickTree, target: Any) -> int:
+    """
+    Return the first position where the running sum reaches ``target``.
+
+    This is the smallest ``i`` with ``sum(values[: i + 1]) >= target``, or
+    len(tree) if the total is below target; for a tree of counts, it is the
+    position of the target-th item. The search descends the implicit tree
+    by binary lifting in O(log n) and needs every value to be non-negative.
+
+    Example:
+        >>> tree = create_fenwick_tree([3, 1, 4, 1, 5])
+        >>> print(fenwick_lower_bound(tree, 5))  # 2
+    """
+    array = tree.tree
+    size = len(array) - 1
+    position, step = 0, 1 << (size.bit_length() - 1)
+    while step:
+        candidate = position + step
+        if candidate <= size and array[candidate] < target:
+            position = candidate
+            target -= array[candidate]
+        step >>= 1
+    return position
+
+
+def fenwick_add_at(tree: FenwickTree, positions: Any, deltas: Any) -> None:
+    """
+    Batched fenwick_add, like np.add.at: repeated positions add up.
+
+    The updates move up the tree together, one vectorized step per level,
+    in O(k log n) vectorized work for k updates.
+
+    Args:
+        tree (FenwickTree): The tree
+        positions (Any): Array-like of positions
+        deltas (Any): Scalar or array-like of the delta of every position
+
+    Raises:
+        ValueError: If a position is out of bounds
+
+    Example:
+        >>> tree = create_fenwick_tree([0, 0, 0])
+        >>> fenwick_add_at(tree, [0, 2, 2], 1)
+        >>> print(fenwick_prefix_sums(tree, [1, 3]))  # [1 3]
+    """
+    size = len(tree)
+    positions = _positions(positions, size - 1)
+    deltas = _deltas(tree.tree, deltas, positions.shape)
+    _add_at(tree.tree, positions + 1, deltas)
+
+
+def fenwick_prefix_sums(tree: FenwickTree, counts: Any) -> np.ndarray:
+    """
+    Vectorized fenwick_prefix_sum over an array of counts.
+
+    Example:
+        >>> tree = create_fenwick_tree([3, 1, 4, 1, 5])
+        >>> print(fenwick_prefix_sums(tree, [0, 2, 5]))  # [ 0  4 14]
+    """
+    return _prefix_at(tree.tree, _positions(counts, len(tree)))
+
+
+def fenwick_range_sums(tree: FenwickTree, lows: Any, highs: Any) -> np.ndarray:
+    """
+    Vectorized fenwick_range_sum over arrays of ranges.
+
+    Example:
+        >>> tree = create_fenwick_tree([3, 1, 4, 1, 5])
+        >>> print(fenwick_range_sums(tree, [0, 1], [2, 4]))  # [4 6]
+    """
+    lows, highs = _ranges(len(tree), lows, highs)
+    return _prefix_at(tree.tree, highs) - _prefix_at(tree.tree, lows)
+
+
+def fenwick_lower_bounds(tree: FenwickTree, targets: Any) -> np.ndarray:
+    """
+    Vectorized fenwick_lower_bound over an array of targets.
+
+    Example:
+        >>> tree = create_fenwick_tree([3, 1, 4, 1, 5])
+        >>> print(fenwick_lower_bounds(tree, [1, 5, 100]))  # [0 2 5]
+    """
+    array = tree.tree
+    size = len(array) - 1
+    remaining = np.array(targets)
+    remaining = remaining.astype(np.result_type(remaining, array.dtype))
+    positions = np.zeros(remaining.shape, dtype=np.int64)
+    step = 1 << (size.bit_length() - 1)
+    while step:
+        candidates = positions + step
+        sums = array[np.minimum(candidates, size)]
+        taken = (candidates <= size) & (sums < remaining)
+        positions[taken] = candidates[taken]
+        remaining[taken] -= sums[taken]
+        step >>= 1
+    return positions
+
+
+def create_range_fenwick_tree(values: Any, dtype: Any = None) -> RangeFenwickTree:
+    """
+    Build a RangeFenwickTree over ``values`` in O(n).
+
+    Example:
+        >>> tree = create_range_fenwick_tree([3, 1, 4, 1, 5])
+        >>> range_fenwick_add(tree, 1, 4, 10)
+        >>> print(range_fenwick_range_sum(tree, 0, 2))  # 14
+    """
+    values = _as_values(values, dtype, 1)
+    differences = np.diff(values, prepend=values.dtype.type(0))
+    weighted = differences * np.arange(len(values), dtype=values.dtype)
+    return RangeFenwickTree(_fenwick_array(differences), _fenwick_array(weighted))
+
+
+def range_fenwick_add(tree: RangeFenwickTree, low: int, high: int, delta: Any) -> None:
+    """
+    Add ``delta`` to every position ``low <= i < high`` in O(log n).
+
+    Raises:
+        ValueError: If the range is out of bounds
+    """
+    _check_range(len(tree), low, high)
+    delta = tree.slopes.dtype.type(delta)
+    _add(tree.slopes, low + 1, delta)
+    _add(tree.slopes, high + 1, -delta)
+    _add(tree.intercepts, low + 1, delta * low)
+    _add(tree.intercepts, high + 1, -delta * high)
+
+
+def range_fenwick_prefix_sum(tree: RangeFenwickTree, count: int) -> Any:
+    """
+    Return the sum of the first ``count`` values in O(log n).
+
+    Example:
+        >>> tree = create_range_fenwick_tree([3, 1, 4, 1, 5])
+        >>> print(range_fenwick_prefix_sum(tree, 3))  # 8
+    """
+    _check_range(len(tree), 0, count)
+    return (
+        count * _prefix(tree.slopes, count) - _prefix(tree.intercepts, count)
+    ).item()
+
+
+def range_fenwick_range_sum(tree: RangeFenwickTree, low: int, high: int) -> Any:
+    """
+    Return the sum of the values at positions ``low <= i < high``.
+
+    Example:
+        >>> tree = create_range_fenwick_tree([3, 1, 4, 1, 5])
+        >>> print(range_fenwick_range_sum(tree, 1, 4))  # 6
+    """
+    _check_range(len(tree), low, high)
+    return range_fenwick_prefix_sum(tree, high) - range_fenwick_prefix_sum(tree, low)
+
+
+def range_fenwick_add_ranges(
+    tree: RangeFenwickTree, lows: Any, highs: Any, deltas: Any
+) -> None:
+    """
+    Batched range_fenwick_add: add every delta to its range.
+
+    Example:
+        >>> tree = create_range_fenwick_tree([0, 0, 0, 0])
+        >>> range_fenwick_add_ranges(tree, [0, 1], [2, 4], [1, 10])
+        >>> print(range_fenwick_range_sums(tree, [0], [4]))  # [32]
+    """
+    lows, highs = _ranges(len(tree), lows, highs)
+    deltas = _deltas(tree.slopes, deltas, lows.shape)
+    positions = np.concatenate((lows, highs)) + 1
+    _add_at(tree.slopes, positions, np.concatenate((deltas, -deltas)))
+    _add_at(
+        tree.intercepts, positions, np.concatenate((deltas * lows, -deltas * highs))
+    )
+
+
+def _range_prefix_at(tree: RangeFenwickTree, counts: np.ndarray) -> np.ndarray:
+    return counts * _prefix_at(tree.slopes, counts) - _prefix_at(
+        tree.intercepts, counts
+    )
+
+
+def range_fenwick_range_sums(
+    tree: RangeFenwickTree, lows: Any, highs: Any
+) -> np.ndarray:
+    """
+    Vectorized range_fenwick_range_sum over arrays of ranges.
+
+    Example:
+        >>> tree = create_range_fenwick_tree([3, 1, 4, 1, 5])
+        >>> print(range_fenwick_range_sums(tree, [0, 1], [2, 4]))  # [4 6]
+    """
+    lows, highs = _ranges(len(tree), lows, highs)
+    return _range_prefix_at(tree, highs) - _range_prefix_at(tree, lows)
+
+
+def create_fenwick_tree_2d(values: Any, dtype: Any = None) -> FenwickTree2D:
+    """
+    Build a FenwickTree2D over a two-dimensional array in O(rows * columns).
+
+    Example:
+        >>> tree = create_fenwick_tree_2d([[1, 2], [3, 4]])
+        >>> print(fenwick_2d_rectangle_sum(tree, 0, 1, 2, 2))  # 6
+    """
+    values = _as_values(values, dtype, 2)
+    return FenwickTree2D(_fenwick_array(_fenwick_array(values, 0), 1))
+
+
+def fenwick_2d_add(tree: FenwickTree2D, row: int, column: int, delta: Any) -> None:
+    """
+    Add ``delta`` to the value at ``(row, column)``.
+
+    Raises:
+        ValueError: If the cell is out of bounds
+    """
+    rows, columns = tree.shape
+    _check_position(rows, row)
+    _check_position(columns, column)
+
+    array = tree.tree
+    row += 1
+    while row <= rows:
+        _add(array[row], column + 1, delta)
+        row += row & -row
+
+
+def _prefix_2d(array: np.ndarray, rows: int, columns: int) -> Any:
+    total = array.dtype.type(0)
+    while rows:
+        total += _prefix(array[rows], columns)
+        rows &= rows - 1
+    return total
+
+
+def fenwick_2d_rectangle_sum(
+    tree: FenwickTree2D, top: int, left: int, bottom: int, right: int
+) -> Any:
+    """
+    Return the sum of the cells in rows ``top <= i < bottom`` and columns
+    ``left <= j < right``.
+
+    Example:
+        >>> tree = create_fenwick_tree_2d([[1, 2], [3, 4]])
+        >>> print(fenwick_2d_rectangle_sum(tree, 0, 0, 2, 2))  # 10
+    """
+    rows, columns = tree.shape
+    _check_range(rows, top, bottom)
+    _check_range(columns, left, right)
+
+    array = tree.tree
+    total = (
+        _prefix_2d(array, bottom, right)
+        - _prefix_2d(array, top, right)
+        - _prefix_2d(array, bottom, left)
+        + _prefix_2d(array, top, left)
+    )
+    return total.item()
+
+
+def fenwick_2d_add_at(
+    tree: FenwickTree2D, rows: Any, columns: Any, deltas: Any
+) -> None:
+    """
+    Batched fenwick_2d_add: repeated cells add up.
+
+    Example:
+        >>> tree = create_fenwick_tree_2d([[0, 0], [0, 0]])
+        >>> fenwick_2d_add_at(tree, [0, 1], [1, 1], [5, 7])
+        >>> print(fenwick_2d_rectangle_sums(tree, [0], [1], [2], [2]))  # [12]
+    """
+    row_count, column_count = tree.shape
+    rows = _positions(rows, row_count - 1) + 1
+    columns = _positions(columns, column_count - 1) + 1
+    if rows.shape != columns.shape:
+        raise ValueError("Rows and columns must have the same shape")
+    deltas = _deltas(tree.tree, deltas, rows.shape)
+
+    array = tree.tree
+    while len(rows):
+        # Every update climbs the columns of its current row entry.
+        row_steps, column_steps, step_deltas = rows, columns, deltas
+        while len(column_steps):
+            np.add.at(array, (row_steps, column_steps), step_deltas)
+            column_steps = column_steps + (column_steps & -column_steps)
+            inside = column_steps <= column_count
+            row_steps = row_steps[inside]
+            column_steps = column_steps[inside]
+            step_deltas = step_deltas[inside]
+
+        rows = rows + (rows & -rows)
+        inside = rows <= row_count
+        rows, columns, deltas = rows[inside], columns[inside], deltas[inside]
+
+
+def _prefix_2d_at(array: np.ndarray, rows: np.ndarray, columns: np.ndarray) -> Any:
+    totals = np.zeros(len(rows), dtype=array.dtype)
+    rows = rows.copy()
+    while rows.any():
+        column_steps = columns.copy()
+        while column_steps.any():
+            totals += array[rows, column_steps]
+            column_steps &= column_steps - 1
+        rows &= rows - 1
+    return totals
+
+
+def fenwick_2d_rectangle_sums(
+    tree: FenwickTree2D, tops: Any, lefts: Any, bottoms: Any, rights: Any
+) -> np.ndarray:
+    """
+    Vectorized fenwick_2d_rectangle_sum over arrays of rectangles.
+
+    Example:
+        >>> tree = create_fenwick_tree_2d([[1, 2], [3, 4]])
+        >>> sums = fenwick_2d_rectangle_sums(tree, [0, 1], [0, 0], [1, 2], [2, 1])
+        >>> print(sums)  # [3 3]
+    """
+    rows, columns = tree.shape
+    tops, bottoms = _ranges(rows, tops, bottoms)
+    lefts, rights = _ranges(columns, lefts, rights)
+    if tops.shape != lefts.shape:
+        raise ValueError("Rectangle bounds must have the same shape")
+
+    array = tree.tree
+    return (
+        _prefix_2d_at(array, bottoms, rights)
+        - _prefix_2d_at(array, tops, rights)
+        - _prefix_2d_at(array, bottoms, lefts)
+        + _prefix_2d_at(array, tops, lefts)
+    )
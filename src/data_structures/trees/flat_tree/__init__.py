@@ -0,0 +1,5 @@
+"""
+Frozen, array-backed n-ary trees.
+
+The modules in this package need NumPy (``poetry install --extras numeric``).
+"""
@@ -0,0 +1,58 @@
+from .flat_tree import FlatTree, np
+from ..tree_node import TreeNode
+
+
+class AncestorIndex:
+    """
+    Index answering ancestor, lowest common ancestor (LCA) and distance
+    queries on a tree in O(1).
+
+    Node ids are the pre-order ids of the underlying FlatTree, so node ``u``
+    is an ancestor of ``v`` iff ``u <= v <= last_descendants[u]`` (entry and
+    exit times of a depth-first walk). For ``u < v`` that are not ancestor
+    and descendant, the LCA is the parent of the shallowest node with an id
+    in ``u + 1 .. v``; ``sparse_table[k, i]`` holds the shallowest node with
+    an id in ``i .. i + 2**k - 1``, so any such range is covered by two
+    overlapping table entries.
+
+    Attributes:
+        tree (FlatTree): The indexed tree
+        depths (np.ndarray): Depth of every node
+        last_descendants (np.ndarray): Largest id in every node's subtree
+        sparse_table (np.ndarray): Shallowest node of every power-of-two
+            range of ids, one row per power of two
+        nodes (list[TreeNode] | None): The TreeNode of every id, when the
+            index was built from a TreeNode tree
+        node_ids (dict[TreeNode, int] | None): The id of every TreeNode
+    """
+
+    __slots__ = (
+        "tree",
+        "depths",
+        "last_descendants",
+        "sparse_table",
+        "nodes",
+        "node_ids",
+    )
+
+    def __init__(
+        self,
+        tree: FlatTree,
+        depths: np.ndarray,
+        last_descendants: np.ndarray,
+        sparse_table: np.ndarray,
+        nodes: list[TreeNode] | None = None,
+    ):
+        self.tree = tree
+        self.depths = depths
+        self.last_descendants = last_descendants
+        self.sparse_table = sparse_table
+        self.nodes = nodes
+        self.node_ids = (
+            {node: node_id for node_id, node in enumerate(nodes)}
+            if nodes is not None
+            else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.tree)
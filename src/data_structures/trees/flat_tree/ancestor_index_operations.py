@@ -0,0 +1,242 @@
+from typing import Any, cast
+
+from ..n_ary_trees.n_ary_tree_operations import iter_pre_order
+from ..tree_node import TreeNode
+from .ancestor_index import AncestorIndex
+from .flat_tree import FlatTree, np
+from .flat_tree_operations import (
+    create_flat_tree,
+    flat_tree_depths,
+    flat_tree_subtree_sizes,
+)
+
+
+def _build_sparse_table(depths: np.ndarray) -> np.ndarray:
+    size = len(depths)
+    dtype = np.int32 if size < 2**31 else np.int64
+    level = np.arange(size, dtype=dtype)
+    levels = [level]
+    span = 1
+
+    # Level k covers ranges of 2**k ids: combine the two halves of length
+    # 2**(k - 1), keeping the shallower node.
+    while 2 * span <= size:
+        left = level[: size - 2 * span + 1]
+        right = level[span : size - span + 1]
+        level = np.where(depths[left] <= depths[right], left, right)
+        levels.append(level)
+        span *= 2
+
+    table = np.zeros((len(levels), size), dtype=dtype)
+    for row, level in zip(table, levels):
+        row[: len(level)] = level
+    return table
+
+
+def create_ancestor_index(tree: TreeNode | FlatTree) -> AncestorIndex:
+    """
+    Build an AncestorIndex for an n-ary tree in O(n log n) time and space.
+
+    Args:
+        tree (TreeNode | FlatTree): The root of a TreeNode tree, or a FlatTree
+
+    Returns:
+        AncestorIndex: The index. When built from a TreeNode tree, queries
+            accept TreeNode objects as well as pre-order ids
+
+    Raises:
+        ValueError: If tree is None
+
+    Example:
+        >>> root = create_root_with_children_data_list("a", ["b", "c"])
+        >>> index = create_ancestor_index(root)
+        >>> b, c = root.children_nodes
+        >>> print(lowest_common_ancestor(index, b, c).data)  # "a"
+    """
+    if tree is None:
+        raise ValueError("Tree cannot be None")
+
+    nodes = None
+    if isinstance(tree, TreeNode):
+        nodes = list(iter_pre_order(tree))
+        tree = create_flat_tree(tree)
+
+    depths = flat_tree_depths(tree)
+    ids = np.arange(len(tree), dtype=np.intp)
+    last_descendants = ids + flat_tree_subtree_sizes(tree) - 1
+    last_descendants.flags.writeable = False
+
+    sparse_table = _build_sparse_table(depths)
+    sparse_table.flags.writeable = False
+
+    return AncestorIndex(tree, depths, last_descendants, sparse_table, nodes)
+
+
+def _node_id(index: AncestorIndex, node: TreeNode | int) -> int:
+    if isinstance(node, TreeNode):
+        if index.node_ids is None or node not in index.node_ids:
+            raise ValueError("Node is not part of the indexed tree")
+        return index.node_ids[node]
+
+    node = int(node)
+    if not 0 <= node < len(index):
+        raise ValueError(f"Node id {node} is out of range")
+    return node
+
+
+def _same_kind(index: AncestorIndex, like: TreeNode | int, node_id: int) -> Any:
+    # Nodes can only be passed in when the index kept them.
+    if isinstance(like, TreeNode):
+        return cast(list[TreeNode], index.nodes)[node_id]
+    return node_id
+
+
+def is_ancestor(
+    index: AncestorIndex, ancestor: TreeNode | int, node: TreeNode | int
+) -> bool:
+    """
+    Check whether ``ancestor`` is an ancestor of ``node`` (or the node itself).
+
+    Args:
+        index (AncestorIndex): The index of the tree
+        ancestor (TreeNode | int): The candidate ancestor
+        node (TreeNode | int): The candidate descendant
+
+    Returns:
+        bool: True if ancestor lies on the path from node to the root
+
+    Example:
+        >>> print(is_ancestor(index, root, root.children_nodes[0]))  # True
+    """
+    u, v = _node_id(index, ancestor), _node_id(index, node)
+    return u <= v <= index.last_descendants[u]
+
+
+def lowest_common_ancestor(
+    index: AncestorIndex, first: TreeNode | int, second: TreeNode | int
+) -> Any:
+    """
+    Return the lowest common ancestor of two nodes in O(1).
+
+    Args:
+        index (AncestorIndex): The index of the tree
+        first (TreeNode | int): The first node
+        second (TreeNode | int): The second node
+
+    Returns:
+        TreeNode | int: The deepest node that is an ancestor of both, as a
+            TreeNode if ``first`` is a TreeNode and as an id otherwise
+
+    Example:
+        >>> b, c = root.children_nodes
+        >>> print(lowest_common_ancestor(index, b, c).data)  # "a"
+    """
+    u, v = _node_id(index, first), _node_id(index, second)
+    if u > v:
+        u, v = v, u
+
+    if v <= index.last_descendants[u]:
+        return _same_kind(index, first, u)
+
+    start = u + 1
+    level = (v - start + 1).bit_length() - 1
+    row = index.sparse_table[level]
+    a, b = row[start], row[v - (1 << level) + 1]
+    shallowest = a if index.depths[a] <= index.depths[b] else b
+
+    return _same_kind(index, first, int(index.tree.parent[shallowest]))
+
+
+def node_distance(
+    index: AncestorIndex, first: TreeNode | int, second: TreeNode | int
+) -> int:
+    """
+    Return the number of edges on the path between two nodes.
+
+    Example:
+        >>> b, c = root.children_nodes
+        >>> print(node_distance(index, b, c))  # 2
+    """
+    u, v = _node_id(index, first), _node_id(index, second)
+    lca = lowest_common_ancestor(index, u, v)
+    depths = index.depths
+    return int(depths[u] + depths[v] - 2 * depths[lca])
+
+
+def _id_arrays(
+    index: AncestorIndex, first: Any, second: Any
+) -> tuple[np.ndarray, np.ndarray]:
+    u = np.asarray(first, dtype=np.intp)
+    v = np.asarray(second, dtype=np.intp)
+    if u.shape != v.shape:
+        raise ValueError("Node id arrays must have the same shape")
+
+    size = len(index)
+    for ids in (u, v):
+        if ids.size and (ids.min() < 0 or ids.max() >= size):
+            raise ValueError("Node ids are out of range")
+
+    return u, v
+
+
+def are_ancestors(index: AncestorIndex, ancestors: Any, nodes: Any) -> np.ndarray:
+    """
+    Vectorized is_ancestor over arrays of node ids.
+
+    Args:
+        index (AncestorIndex): The index of the tree
+        ancestors (Any): Array-like of candidate ancestor ids
+        nodes (Any): Array-like of candidate descendant ids, same shape
+
+    Returns:
+        np.ndarray: Boolean array, True where ancestors[i] is an ancestor of
+            (or equal to) nodes[i]
+
+    Example:
+        >>> print(are_ancestors(index, [0, 1], [2, 2]))  # [ True False]
+    """
+    u, v = _id_arrays(index, ancestors, nodes)
+    return (u <= v) & (v <= index.last_descendants[u])
+
+
+def lowest_common_ancestors(
+    index: AncestorIndex, first: Any, second: Any
+) -> np.ndarray:
+    """
+    Vectorized lowest_common_ancestor over arrays of node ids.
+
+    Args:
+        index (AncestorIndex): The index of the tree
+        first (Any): Array-like of node ids
+        second (Any): Array-like of node ids, same shape
+
+    Returns:
+        np.ndarray: The id of the LCA of every pair
+
+    Example:
+        >>> print(lowest_common_ancestors(index, [1, 1], [2, 1]))  # [0 1]
+    """
+    u, v = _id_arrays(index, first, second)
+    low, high = np.minimum(u, v), np.maximum(u, v)
+    nested = high <= index.last_descendants[low]
+
+    # Nested pairs query a valid one-id range; their answer is ``low``.
+    start = np.where(nested, high, low + 1)
+    level = np.frexp(high - start + 1)[1] - 1
+    a = index.sparse_table[level, start]
+    b = index.sparse_table[level, high - (1 << level) + 1]
+    shallowest = np.where(index.depths[a] <= index.depths[b], a, b)
+
+    return np.where(nested, low, index.tree.parent[shallowest])
+
+
+def node_distances(index: AncestorIndex, first: Any, second: Any) -> np.ndarray:
+    """
+    Vectorized node_distance over arrays of node ids.
+
+    Example:
+        >>> print(node_distances(index, [1, 1], [2, 1]))  # [2 0]
+    """
+    u, v = _id_arrays(index, first, second)
+    depths = index.depths
+    return depths[u] + depths[v] - 2 * depths[lowest_common_ancestors(index, u, v)]
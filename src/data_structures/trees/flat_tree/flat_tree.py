@@ -0,0 +1,60 @@
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError as error:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "FlatTree needs NumPy; install it with `poetry install --extras numeric`"
+    ) from error
+
+
+class FlatTree:
+    """
+    Frozen n-ary tree stored in flat NumPy arrays.
+
+    Node ids are positions in pre-order, so the root is node 0 and the subtree
+    of node ``i`` is the id range ``i .. i + subtree_size - 1``. The children
+    are stored in compressed sparse row (CSR) form: the children of node ``i``
+    are ``children[child_offsets[i]:child_offsets[i + 1]]``, left to right.
+
+    Attributes:
+        parent (np.ndarray): Parent id of every node, -1 for the root
+        child_offsets (np.ndarray): Start of each node's children, plus the end
+        children (np.ndarray): Child ids grouped by parent
+        payload (np.ndarray): The data of every node
+
+    All arrays are read-only. Depths and subtree sizes are computed on first
+    use and cached, since the tree never changes.
+    """
+
+    __slots__ = (
+        "parent",
+        "child_offsets",
+        "children",
+        "payload",
+        "_depths",
+        "_subtree_sizes",
+    )
+
+    def __init__(
+        self,
+        parent: np.ndarray,
+        child_offsets: np.ndarray,
+        children: np.ndarray,
+        payload: np.ndarray,
+    ):
+        for array in (parent, child_offsets, children, payload):
+            array.flags.writeable = False
+
+        self.parent = parent
+        self.child_offsets = child_offsets
+        self.children = children
+        self.payload = payload
+        self._depths: np.ndarray | None = None
+        self._subtree_sizes: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def __getitem__(self, node: int) -> Any:
+        return self.payload[node]
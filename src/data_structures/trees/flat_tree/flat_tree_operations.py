@@ -0,0 +1,305 @@
+from typing import Any
+
+from ..tree_node import TreeNode
+from .flat_tree import FlatTree, np
+
+
+def _pointer_jump_to_fixed_point(pointers: np.ndarray) -> np.ndarray:
+    # Replace every pointer by the pointer it points at until nothing changes.
+    # Each round doubles the distance covered, so a tree of height h needs
+    # O(log h) vectorized rounds.
+    while True:
+        jumped = pointers[pointers]
+        if np.array_equal(jumped, pointers):
+            return pointers
+        pointers = jumped
+
+
+def _depths(parent: np.ndarray) -> np.ndarray:
+    # Invariant: depths[i] is the distance from node i to jump[i]. Needs
+    # parent[i] < i so that every pointer chain reaches the root.
+    jump = parent.copy()
+    jump[0] = 0
+    depths = np.ones(len(parent), dtype=np.intp)
+    depths[0] = 0
+
+    while jump.any():
+        depths += depths[jump]
+        jump = jump[jump]
+
+    return depths
+
+
+def _is_pre_order(parent: np.ndarray, depths: np.ndarray) -> bool:
+    # A numbering is a pre-order iff the parent of every node is the most
+    # recent earlier node one level up. Sorting the nodes by (depth, id)
+    # lets one binary search per node find that most recent node.
+    size = len(parent)
+    ids = np.arange(size, dtype=np.int64)
+    keys = np.sort(depths.astype(np.int64) * size + ids)
+    targets = (depths[1:].astype(np.int64) - 1) * size + ids[1:]
+    previous = keys[np.searchsorted(keys, targets) - 1] - targets + ids[1:]
+    return bool((previous == parent[1:]).all())
+
+
+def _build_flat_tree(parent: np.ndarray, payload: np.ndarray) -> FlatTree:
+    size = len(parent)
+    child_counts = np.bincount(parent[1:], minlength=size)
+    child_offsets = np.zeros(size + 1, dtype=np.intp)
+    np.cumsum(child_counts, out=child_offsets[1:])
+    # In pre-order every parent's children appear in increasing id order, so
+    # a stable sort by parent yields the CSR children array.
+    children = np.argsort(parent[1:], kind="stable").astype(np.intp) + 1
+
+    return FlatTree(parent, child_offsets, children, payload)
+
+
+def create_flat_tree_from_parent_array(
+    parent: Any, payload: Any = None, dtype: Any = object
+) -> FlatTree:
+    """
+    Create a FlatTree from a parent array whose node ids are in pre-order.
+
+    Args:
+        parent (Any): Array-like of parent ids, -1 for the root. Node 0 must be
+            the root and the ids must be a pre-order numbering of the tree
+        payload (Any): Optional array-like with the data of every node;
+            defaults to the node ids
+        dtype (Any): NumPy dtype of the payload array
+
+    Returns:
+        FlatTree: The created tree
+
+    Raises:
+        ValueError: If the arrays are empty, have different lengths or are not
+            a pre-order numbering of a tree
+
+    Example:
+        >>> tree = create_flat_tree_from_parent_array([-1, 0, 1, 0], "abcd")
+        >>> print(flat_tree_children(tree, 0))  # [1 3]
+    """
+    parent = np.array(parent, dtype=np.intp)
+    size = len(parent)
+
+    if parent.ndim != 1 or size == 0:
+        raise ValueError("Parent array must be a non-empty list of ids")
+    if parent[0] != -1:
+        raise ValueError("Node 0 must be the root of the tree")
+
+    ids = np.arange(size, dtype=np.intp)
+    if not ((parent[1:] >= 0) & (parent[1:] < ids[1:])).all():
+        raise ValueError("Parent array must number the nodes in pre-order")
+
+    depths = _depths(parent)
+    if not _is_pre_order(parent, depths):
+        raise ValueError("Parent array must number the nodes in pre-order")
+
+    if payload is None:
+        payload = ids.tolist() if dtype is object else ids
+
+    tree = _build_flat_tree(parent, _payload_array(payload, size, dtype))
+    depths.flags.writeable = False
+    tree._depths = depths
+    return tree
+
+
+def _last_descendants(tree: FlatTree) -> np.ndarray:
+    # In pre-order, the last descendant of a node is reached by following
+    # last children; a leaf points at itself.
+    offsets = tree.child_offsets
+    last_child = np.arange(len(tree), dtype=np.intp)
+    has_children = offsets[1:] > offsets[:-1]
+    last_child[has_children] = tree.children[offsets[1:][has_children] - 1]
+    return _pointer_jump_to_fixed_point(last_child)
+
+
+def _payload_array(values: Any, size: int, dtype: Any) -> np.ndarray:
+    if dtype is object:
+        # fromiter never turns nested sequences into extra array dimensions.
+        values = values if isinstance(values, list) else list(values)
+        if len(values) != size:
+            raise ValueError("Payload and parent arrays must have the same length")
+        return np.fromiter(values, dtype=object, count=size)
+
+    payload = np.asarray(values, dtype=dtype)
+    if payload.shape != (size,):
+        raise ValueError("Payload and parent arrays must have the same length")
+    return payload
+
+
+def create_flat_tree(root: TreeNode, dtype: Any = object) -> FlatTree:
+    """
+    Create a FlatTree holding a copy of the n-ary tree rooted at ``root``.
+
+    The conversion walks the tree once with an explicit stack, so it is
+    linear in the number of nodes and works on trees of any depth.
+
+    Args:
+        root (TreeNode): The root of the tree to convert
+        dtype (Any): NumPy dtype of the payload array; use a numeric dtype
+            when every node holds a number
+
+    Returns:
+        FlatTree: The created tree
+
+    Raises:
+        ValueError: If root is None
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a", "b"])
+        >>> tree = create_flat_tree(root)
+        >>> print(list(tree.payload))  # ["root", "a", "b"]
+    """
+    if root is None:
+        raise ValueError("Root node cannot be None")
+
+    parent: list[int] = []
+    payload: list[Any] = []
+    stack = [(root, -1)]
+
+    while stack:
+        node, parent_id = stack.pop()
+        node_id = len(parent)
+        parent.append(parent_id)
+        payload.append(node.data)
+
+        children = node.children
+        if children:
+            stack.extend((child, node_id) for child in reversed(children))
+
+    return _build_flat_tree(
+        np.array(parent, dtype=np.intp), _payload_array(payload, len(parent), dtype)
+    )
+
+
+def flat_tree_to_tree_node(tree: FlatTree) -> TreeNode:
+    """
+    Rebuild a TreeNode tree from a FlatTree in linear time.
+
+    The nodes get parent pointers and their is_root, is_parent and is_leaf
+    flags.
+
+    Args:
+        tree (FlatTree): The tree to convert
+
+    Returns:
+        TreeNode: The root of the rebuilt tree
+
+    Example:
+        >>> root = flat_tree_to_tree_node(create_flat_tree_from_parent_array([-1, 0]))
+        >>> print(root.children_nodes[0].data)  # 1
+    """
+    nodes = [TreeNode(data) for data in tree.payload.tolist()]
+    parents = tree.parent.tolist()
+
+    for node, parent_id in zip(nodes[1:], parents[1:]):
+        parent = nodes[parent_id]
+        node.parent = parent
+        parent.children_nodes.append(node)
+
+    for node in nodes:
+        if node.children:
+            node.is_parent = True
+        else:
+            node.is_leaf = True
+
+    nodes[0].is_root = True
+    return nodes[0]
+
+
+def flat_tree_children(tree: FlatTree, node: int) -> np.ndarray:
+    """
+    Return the ids of the children of ``node``, left to right, as a view.
+
+    Example:
+        >>> tree = create_flat_tree_from_parent_array([-1, 0, 1, 0])
+        >>> print(flat_tree_children(tree, 0))  # [1 3]
+    """
+    offsets = tree.child_offsets
+    return tree.children[offsets[node] : offsets[node + 1]]
+
+
+def flat_tree_depths(tree: FlatTree) -> np.ndarray:
+    """
+    Return the depth of every node (the root has depth 0).
+
+    Depths are computed by vectorized pointer jumping in O(n log h) for a
+    tree of height h, then cached on the tree.
+
+    Example:
+        >>> tree = create_flat_tree_from_parent_array([-1, 0, 1, 0])
+        >>> print(flat_tree_depths(tree))  # [0 1 2 1]
+    """
+    if tree._depths is not None:
+        return tree._depths
+
+    depths = _depths(tree.parent)
+    depths.flags.writeable = False
+    tree._depths = depths
+    return depths
+
+
+def flat_tree_subtree_sizes(tree: FlatTree) -> np.ndarray:
+    """
+    Return the number of nodes in the subtree of every node.
+
+    Because node ids are in pre-order, a subtree ends at its last descendant,
+    which is found by pointer jumping along last children. The result is
+    cached on the tree.
+
+    Example:
+        >>> tree = create_flat_tree_from_parent_array([-1, 0, 1, 0])
+        >>> print(flat_tree_subtree_sizes(tree))  # [4 2 1 1]
+    """
+    if tree._subtree_sizes is not None:
+        return tree._subtree_sizes
+
+    sizes = _last_descendants(tree) - np.arange(len(tree), dtype=np.intp) + 1
+
+    sizes.flags.writeable = False
+    tree._subtree_sizes = sizes
+    return sizes
+
+
+def flat_tree_pre_order(tree: FlatTree) -> np.ndarray:
+    """
+    Return the node ids in pre-order (root, children).
+
+    Example:
+        >>> tree = create_flat_tree_from_parent_array([-1, 0, 1, 0], "abcd")
+        >>> print(tree.payload[flat_tree_pre_order(tree)])  # ['a' 'b' 'c' 'd']
+    """
+    return np.arange(len(tree), dtype=np.intp)
+
+
+def flat_tree_post_order(tree: FlatTree) -> np.ndarray:
+    """
+    Return the node ids in post-order (children, root).
+
+    Node ``i`` is preceded in post-order by the ``i - depth`` earlier nodes
+    that are not its ancestors and by its ``size - 1`` descendants, so its
+    post-order position is ``i + size - 1 - depth``.
+
+    Example:
+        >>> tree = create_flat_tree_from_parent_array([-1, 0, 1, 0], "abcd")
+        >>> print(tree.payload[flat_tree_post_order(tree)])  # ['c' 'b' 'd' 'a']
+    """
+    ids = np.arange(len(tree), dtype=np.intp)
+    positions = ids + flat_tree_subtree_sizes(tree) - 1 - flat_tree_depths(tree)
+    order = np.empty_like(ids)
+    order[positions] = ids
+    return order
+
+
+def flat_tree_level_order(tree: FlatTree) -> np.ndarray:
+    """
+    Return the node ids level by level (breadth-first).
+
+    Within a level, pre-order is left-to-right order, so a stable sort of the
+    ids by depth gives the level order.
+
+    Example:
+        >>> tree = create_flat_tree_from_parent_array([-1, 0, 1, 0], "abcd")
+        >>> print(tree.payload[flat_tree_level_order(tree)])  # ['a' 'b' 'd' 'c']
+    """
+    return np.argsort(flat_tree_depths(tree), kind="stable").astype(np.intp)
@@ -0,0 +1,3 @@
+"""
+N-ary tree operations built on TreeNode.
+"""
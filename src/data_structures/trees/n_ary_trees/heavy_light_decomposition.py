@@ -0,0 +1,428 @@
+"""
+Heavy-light decomposition of n-ary trees for path aggregate queries.
+
+Every node picks the child with the largest subtree as its heavy child, which
+splits the tree into heavy paths (chains). Numbering the nodes so that every
+chain gets consecutive positions turns any tree path into O(log n) position
+ranges, since a path from a node to the root crosses at most log2(n) light
+edges. Segment trees over the positions hold the sum, maximum and minimum of
+the node weights, so a path query or a weight update costs O(log^2 n)
+instead of the O(depth) of walking the path.
+
+The decomposition is a snapshot of the shape of the tree: weights can change
+through hld_set_weight, but adding, removing or moving nodes requires
+building a new decomposition.
+"""
+
+from typing import Any, Callable, Iterable
+
+from ..tree_node import TreeNode
+from .n_ary_tree_operations import iter_pre_order
+
+
+class HeavyLightDecomposition:
+    """
+    Heavy-light decomposition of a tree with a weight on every node.
+
+    Nodes are identified internally by their position: chains occupy
+    consecutive positions, from their head (the shallowest node) down. The
+    segment trees store node ``i`` at index ``size + i``; index ``j < size``
+    aggregates indices ``2j`` and ``2j + 1``.
+
+    Attributes:
+        nodes (list[TreeNode]): The node at every position
+        positions (dict[TreeNode, int]): The position of every node
+        parents (list[int]): Position of the parent of every position (-1
+            for the root)
+        heads (list[int]): Position of the head of every position's chain
+        depths (list[int]): Depth of every position
+        sums (list): Segment tree of weight sums
+        maxima (list): Segment tree of weight maxima
+        minima (list): Segment tree of weight minima
+    """
+
+    __slots__ = (
+        "nodes",
+        "positions",
+        "parents",
+        "heads",
+        "depths",
+        "sums",
+        "maxima",
+        "minima",
+    )
+
+    def __init__(
+        self,
+        nodes: list[TreeNode],
+        parents: list[int],
+        heads: list[int],
+        depths: list[int],
+        weights: list[Any],
+    ):
+        self.nodes = nodes
+        self.positions = {node: position for position, node in enumerate(nodes)}
+        self.parents = parents
+        self.heads = heads
+        self.depths = depths
+
+        size = len(nodes)
+        self.sums = [0] * size + weights
+        self.maxima = [0] * size + weights
+        self.minima = [0] * size + weights
+        sums, maxima, minima = self.sums, self.maxima, self.minima
+        for index in range(size - 1, 0, -1):
+            left, right = 2 * index, 2 * index + 1
+            sums[index] = sums[left] + sums[right]
+            maxima[index] = max(maxima[left], maxima[right])
+            minima[index] = min(minima[left], minima[right])
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+
+def create_heavy_light_decomposition(
+    root: TreeNode, weight: Callable[[Any], Any] | None = None
+) -> HeavyLightDecomposition:
+    """
+    Decompose the tree rooted at ``root`` into heavy paths in O(n).
+
+    Args:
+        root (TreeNode): The root of the tree
+        weight (Callable[[Any], Any] | None): Maps node data to the node's
+            weight. Defaults to the node data itself
+
+    Returns:
+        HeavyLightDecomposition: The decomposition, ready for path queries
+
+    Raises:
+        ValueError: If root is None
+
+    Example:
+        >>> root = create_root_with_children_data_list(1, [2, 3])
+        >>> hld = create_heavy_light_decomposition(root)
+        >>> b, c = root.children_nodes
+        >>> print(hld_path_sum(hld, b, c))  # 6
+    """
+    if root is None:
+        raise ValueError("Root node cannot be None")
+
+    # Subtree sizes, children before parents.
+    pre_order = list(iter_pre_order(root))
+    subtree_sizes = dict.fromkeys(pre_order, 1)
+    for node in reversed(pre_order):
+        if node.parent is not None and node is not root:
+            subtree_sizes[node.parent] += subtree_sizes[node]
+
+    nodes: list[TreeNode] = []
+    parents: list[int] = []
+    heads: list[int] = []
+    depths: list[int] = []
+
+    # Depth-first walk that visits the heavy child right after its parent,
+    # so every chain gets consecutive positions.
+    stack: list[tuple[TreeNode, int, int, int]] = [(root, -1, 0, 0)]
+    while stack:
+        node, parent, head, depth = stack.pop()
+        position = len(nodes)
+        if head < 0:
+            head = position
+        nodes.append(node)
+        parents.append(parent)
+        heads.append(head)
+        depths.append(depth)
+
+        children = node.children
+        if not children:
+            continue
+        heavy = max(children, key=subtree_sizes.__getitem__)
+        for child in reversed(children):
+            if child is not heavy:
+                stack.append((child, position, -1, depth + 1))
+        stack.append((heavy, position, head, depth + 1))
+
+    if weight is None:
+        weights = [node.data for node in nodes]
+    else:
+        weights = [weight(node.data) for node in nodes]
+
+    return HeavyLightDecomposition(nodes, parents, heads, depths, weights)
+
+
+def _position(hld: HeavyLightDecomposition, node: TreeNode) -> int:
+    position = hld.positions.get(node)
+    if position is None:
+        raise ValueError("Node is not part of the decomposed tree")
+    return position
+
+
+def _path_segments(hld: HeavyLightDecomposition, u: int, v: int) -> list[int]:
+    # The segment tree indices covering the path between positions u and v:
+    # one position range per chain the path visits, each covered by
+    # O(log n) indices.
+    heads, parents, depths = hld.heads, hld.parents, hld.depths
+    size = len(hld.nodes)
+    segments = []
+
+    while True:
+        head_u, head_v = heads[u], heads[v]
+        if head_u == head_v:
+            low, high = (u, v) if u <= v else (v, u)
+        elif depths[head_u] >= depths[head_v]:
+            low, high, u = head_u, u, parents[head_u]
+        else:
+            low, high, v = head_v, v, parents[head_v]
+
+        low += size
+        high += size + 1
+        while low < high:
+            if low & 1:
+                segments.append(low)
+                low += 1
+            if high & 1:
+                high -= 1
+                segments.append(high)
+            low >>= 1
+            high >>= 1
+
+        if head_u == head_v:
+            return segments
+
+
+def _fold_path(
+    hld: HeavyLightDecomposition,
+    tree: list[Any],
+    fold: Callable[[Iterable[Any]], Any],
+    first: TreeNode,
+    second: TreeNode,
+) -> Any:
+    segments = _path_segments(hld, _position(hld, first), _position(hld, second))
+    return fold(map(tree.__getitem__, segments))
+
+
+def hld_path_sum(
+    hld: HeavyLightDecomposition, first: TreeNode, second: TreeNode
+) -> Any:
+    """
+    Return the sum of the weights on the path between two nodes, both
+    included, in O(log^2 n).
+
+    Args:
+        hld (HeavyLightDecomposition): The decomposition of the tree
+        first (TreeNode): One end of the path
+        second (TreeNode): The other end of the path
+
+    Returns:
+        Any: The sum of the weights of the nodes on the path
+
+    Raises:
+        ValueError: If a node is not part of the decomposed tree
+
+    Example:
+        >>> b, c = root.children_nodes
+        >>> print(hld_path_sum(hld, b, c))  # 6
+    """
+    return _fold_path(hld, hld.sums, sum, first, second)
+
+
+def hld_path_max(
+    hld: HeavyLightDecomposition, first: TreeNode, second: TreeNode
+) -> Any:
+    """
+    Return the largest weight on the path between two nodes in O(log^2 n).
+
+    Example:
+        >>> b, c = root.children_nodes
+        >>> print(hld_path_max(hld, b, c))  # 3
+    """
+    return _fold_path(hld, hld.maxima, max, first, second)
+
+
+def hld_path_min(
+    hld: HeavyLightDecomposition, first: TreeNode, second: TreeNode
+) -> Any:
+    """
+    Return the smallest weight on the path between two nodes in O(log^2 n).
+
+    Example:
+        >>> b, c = root.children_nodes
+        >>> print(hld_path_min(hld, b, c))  # 1
+    """
+    return _fold_path(hld, hld.minima, min, first, second)
+
+
+def _fold_paths(
+    hld: HeavyLightDecomposition,
+    tree: list[Any],
+    fold: Callable[[Iterable[Any]], Any],
+    pairs: Iterable[tuple[TreeNode, TreeNode]],
+) -> list[Any]:
+    positions, getitem = hld.positions, tree.__getitem__
+    results = []
+    for first, second in pairs:
+        u, v = positions.get(first), positions.get(second)
+        if u is None or v is None:
+            raise ValueError("Node is not part of the decomposed tree")
+        results.append(fold(map(getitem, _path_segments(hld, u, v))))
+    return results
+
+
+def hld_path_sums(
+    hld: HeavyLightDecomposition, pairs: Iterable[tuple[TreeNode, TreeNode]]
+) -> list[Any]:
+    """
+    Batched hld_path_sum: the weight sum of the path between every pair.
+
+    Args:
+        hld (HeavyLightDecomposition): The decomposition of the tree
+        pairs (Iterable[tuple[TreeNode, TreeNode]]): The ends of every path
+
+    Returns:
+        list[Any]: The sum of every path, in the order of ``pairs``
+
+    Raises:
+        ValueError: If a node is not part of the decomposed tree
+
+    Example:
+        >>> b, c = root.children_nodes
+        >>> print(hld_path_sums(hld, [(b, c), (b, b)]))  # [6, 2]
+    """
+    return _fold_paths(hld, hld.sums, sum, pairs)
+
+
+def hld_path_maxima(
+    hld: HeavyLightDecomposition, pairs: Iterable[tuple[TreeNode, TreeNode]]
+) -> list[Any]:
+    """
+    Batched hld_path_max: the largest weight on the path between every pair.
+
+    Example:
+        >>> b, c = root.children_nodes
+        >>> print(hld_path_maxima(hld, [(b, c), (root, b)]))  # [3, 2]
+    """
+    return _fold_paths(hld, hld.maxima, max, pairs)
+
+
+def hld_path_minima(
+    hld: HeavyLightDecomposition, pairs: Iterable[tuple[TreeNode, TreeNode]]
+) -> list[Any]:
+    """
+    Batched hld_path_min: the smallest weight on the path between every pair.
+
+    Example:
+        >>> b, c = root.children_nodes
+        >>> print(hld_path_minima(hld, [(b, c), (c, c)]))  # [1, 3]
+    """
+    return _fold_paths(hld, hld.minima, min, pairs)
+
+
+def hld_get_weight(hld: HeavyLightDecomposition, node: TreeNode) -> Any:
+    """
+    Return the weight of ``node``.
+
+    Example:
+        >>> print(hld_get_weight(hld, root))  # 1
+    """
+    return hld.sums[len(hld.nodes) + _position(hld, node)]
+
+
+def _refresh(hld: HeavyLightDecomposition, leaves: Iterable[int]) -> None:
+    # Recompute every aggregate above the given leaves once. Children have
+    # larger indices than their parent, so descending order is bottom-up.
+    ancestors = set()
+    for index in leaves:
+        index >>= 1
+        while index and index not in ancestors:
+            ancestors.add(index)
+            index >>= 1
+
+    sums, maxima, minima = hld.sums, hld.maxima, hld.minima
+    for index in sorted(ancestors, reverse=True):
+        left, right = 2 * index, 2 * index + 1
+        sums[index] = sums[left] + sums[right]
+        maxima[index] = max(maxima[left], maxima[right])
+        minima[index] = min(minima[left], minima[right])
+
+
+def hld_set_weight(hld: HeavyLightDecomposition, node: TreeNode, weight: Any) -> None:
+    """
+    Set the weight of ``node`` in O(log n).
+
+    The node data is left unchanged.
+
+    Args:
+        hld (HeavyLightDecomposition): The decomposition of the tree
+        node (TreeNode): The node to update
+        weight (Any): The new weight
+
+    Raises:
+        ValueError: If node is not part of the decomposed tree
+
+    Example:
+        >>> hld_set_weight(hld, root, 10)
+        >>> print(hld_path_sum(hld, b, c))  # 15
+    """
+    sums, maxima, minima = hld.sums, hld.maxima, hld.minima
+    index = len(hld.nodes) + _position(hld, node)
+    sums[index] = maxima[index] = minima[index] = weight
+
+    index >>= 1
+    while index:
+        left, right = 2 * index, 2 * index + 1
+        sums[index] = sums[left] + sums[right]
+        maxima[index] = max(maxima[left], maxima[right])
+        minima[index] = min(minima[left], minima[right])
+        index >>= 1
+
+
+def hld_set_weights(
+    hld: HeavyLightDecomposition, updates: Iterable[tuple[TreeNode, Any]]
+) -> None:
+    """
+    Batched hld_set_weight: set the weight of every node in ``updates``.
+
+    The aggregates the updates share are recomputed once, so k updates cost
+    at most O(k log n) and less when the nodes are close together. Later
+    updates of the same node win.
+
+    Args:
+        hld (HeavyLightDecomposition): The decomposition of the tree
+        updates (Iterable[tuple[TreeNode, Any]]): Pairs of node and weight
+
+    Raises:
+        ValueError: If a node is not part of the decomposed tree; no weight
+            is changed in that case
+
+    Example:
+        >>> hld_set_weights(hld, [(b, 0), (c, 0)])
+        >>> print(hld_path_sum(hld, b, c))  # 1
+    """
+    size = len(hld.nodes)
+    leaves = [(size + _position(hld, node), weight) for node, weight in updates]
+
+    sums, maxima, minima = hld.sums, hld.maxima, hld.minima
+    for index, weight in leaves:
+        sums[index] = maxima[index] = minima[index] = weight
+    _refresh(hld, (index for index, _ in leaves))
+
+
+def hld_lowest_common_ancestor(
+    hld: HeavyLightDecomposition, first: TreeNode, second: TreeNode
+) -> TreeNode:
+    """
+    Return the lowest common ancestor of two nodes in O(log n).
+
+    Example:
+        >>> b, c = root.children_nodes
+        >>> print(hld_lowest_common_ancestor(hld, b, c).data)  # 1
+    """
+    heads, parents, depths = hld.heads, hld.parents, hld.depths
+    u, v = _position(hld, first), _position(hld, second)
+
+    while heads[u] != heads[v]:
+        if depths[heads[u]] >= depths[heads[v]]:
+            u = parents[heads[u]]
+        else:
+            v = parents[heads[v]]
+
+    return hld.nodes[min(u, v)]
@@ -0,0 +1,194 @@
+"""
+Lazily materialized n-ary trees for hierarchies too large to hold in memory.
+
+A LazyTreeNode asks a loader callback for the data of its children the first
+time its children are read. The traversals and searches in
+n_ary_tree_operations only read ``node.children``, so they work unchanged
+and load only the nodes they visit.
+
+Loaded children lists are kept in an LRU cache bounded by a node count. When
+the bound is exceeded, the least recently read node is unloaded together with
+everything loaded below it, except for the path to the node being loaded,
+which stays in memory even if it alone exceeds the bound. Reading the children
+of an unloaded node calls the loader again. Node objects obtained before an
+eviction stay valid (their data and parent are unchanged) but are no longer
+linked from their parent.
+
+Lazy trees mirror an external source and are meant to be read: children
+added to a lazy node are lost when it is evicted, and observers such as
+ValueIndex would load the whole tree.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, cast
+
+from ..tree_node import TreeNode
+
+
+class LazyTreeNode(TreeNode):
+    """
+    TreeNode whose children are produced by its tree's LazyTreeCache.
+
+    Example:
+        >>> root = create_lazy_root("/", list_directory)
+        >>> print(root.is_loaded)  # False
+        >>> print([child.data for child in root.children])  # ["/bin", "/etc"]
+        >>> print(root.is_loaded)  # True
+    """
+
+    __slots__ = ("cache",)
+    # Links only ever point at other nodes of the same lazy tree.
+    parent: "LazyTreeNode | None"
+
+    def __init__(
+        self,
+        data: Any,
+        cache: "LazyTreeCache",
+        parent: "LazyTreeNode | None" = None,
+    ):
+        super().__init__(data, parent)
+        self.cache = cache
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the children of the node are currently in memory."""
+        return self._children is not None
+
+    @property
+    def children_nodes(self) -> list[TreeNode]:
+        return self.cache.load(self)
+
+    @children_nodes.setter
+    def children_nodes(self, children: list[TreeNode] | None) -> None:
+        if children is None:
+            self.cache.unload(self)
+        else:
+            self.cache.store(self, children)
+
+    @property
+    def children(self) -> list[TreeNode]:
+        """The children list, loaded first if needed."""
+        return self.cache.load(self)
+
+
+class LazyTreeCache:
+    """
+    LRU cache of the loaded children lists of one lazy tree.
+
+    The size of the cache is the number of loaded nodes: every node whose
+    children are in memory counts once for itself and once per child.
+
+    Args:
+        loader (Callable[[Any], Iterable[Any]]): Returns the data of the
+            children of a node, given the node's data
+        max_nodes (int): The size above which cold subtrees are evicted
+
+    Raises:
+        ValueError: If max_nodes is less than 1
+    """
+
+    def __init__(self, loader: Callable[[Any], Iterable[Any]], max_nodes: int):
+        if max_nodes < 1:
+            raise ValueError("max_nodes must be at least 1")
+
+        self.loader = loader
+        self.max_nodes = max_nodes
+        self._loaded: OrderedDict[LazyTreeNode, int] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def load(self, node: LazyTreeNode) -> list[TreeNode]:
+        """Return the children of ``node``, calling the loader if needed."""
+        children = node._children
+        if children is not None:
+            self._loaded.move_to_end(node)
+            return children
+
+        children = [LazyTreeNode(data, self, node) for data in self.loader(node.data)]
+        self.store(node, children)
+        return children
+
+    def store(self, node: LazyTreeNode, children: list[TreeNode]) -> None:
+        """Make ``children`` the loaded children of ``node``."""
+        loaded = self._loaded
+        self._size -= loaded.pop(node, 0)
+
+        node._children = children
+        node.is_parent = bool(children)
+        node.is_leaf = not children
+        for child in children:
+            child.parent = node
+
+        # Reading a node reads the path to it, so its loaded ancestors become
+        # the most recently used entries, oldest first, followed by the node.
+        path: list[LazyTreeNode] = []
+        ancestor = node.parent
+        while ancestor is not None:
+            if ancestor in loaded:
+                path.append(ancestor)
+            ancestor = ancestor.parent
+        for ancestor in reversed(path):
+            loaded.move_to_end(ancestor)
+
+        loaded[node] = cost = len(children) + 1
+        self._size += cost
+
+        # Evicting an ancestor would unload the node itself, so the path is
+        # never evicted; a node with more children than max_nodes can still
+        # be read.
+        while self._size > self.max_nodes and len(loaded) > len(path) + 1:
+            self.unload(next(iter(loaded)))
+
+    def unload(self, node: LazyTreeNode) -> None:
+        """Drop the children of ``node`` and everything loaded below them."""
+        loaded = self._loaded
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+            cost = loaded.pop(node, None)
+            if cost is None:
+                continue
+
+            self._size -= cost
+            children = cast(list[LazyTreeNode], node._children)
+            stack.extend(child for child in children if child._children is not None)
+            node._children = None
+
+    def clear(self) -> None:
+        """Unload every node of the tree."""
+        for node in self._loaded:
+            node._children = None
+        self._loaded.clear()
+        self._size = 0
+
+
+def create_lazy_root(
+    data: Any, loader: Callable[[Any], Iterable[Any]], max_nodes: int = 100_000
+) -> LazyTreeNode:
+    """
+    Create the root of a lazy n-ary tree.
+
+    Args:
+        data (Any): The data of the root node
+        loader (Callable[[Any], Iterable[Any]]): Returns the data of the
+            children of a node, given the node's data; called once per node
+            each time its children are loaded
+        max_nodes (int): How many loaded nodes to keep before evicting the
+            least recently used subtrees
+
+    Returns:
+        LazyTreeNode: The root node, with no children loaded yet
+
+    Raises:
+        ValueError: If max_nodes is less than 1
+
+    Example:
+        >>> root = create_lazy_root(1, lambda n: [2 * n, 2 * n + 1] if n < 8 else [])
+        >>> print(depth_first_search(root, 11).data)  # 11
+    """
+    root = LazyTreeNode(data, LazyTreeCache(loader, max_nodes))
+    root.is_root = True
+    return root
@@ -0,0 +1,204 @@
+"""
+Structural (Merkle) hashes of n-ary trees.
+
+The hash of a node digests the hash of its own data followed by the hashes
+of its children, in order; a node with more than WIDE_NODE_DEGREE children
+digests the root of a binary Merkle tree over its children's hashes instead.
+Two subtrees have equal hashes exactly when they have equal data in the same
+shape (up to blake2b collisions), so comparing whole trees or subtrees is
+one comparison of two short byte strings.
+
+Node data is turned into bytes with ``encode`` (pickle by default, as in
+n_ary_tree_serialization). Hashes are therefore stable across processes as
+long as equal data encodes to equal bytes.
+"""
+
+import hashlib
+import pickle
+from typing import Any, Callable
+
+from ..tree_node import TreeNode
+from .n_ary_tree_operations import iter_post_order
+from .subtree_aggregates import SubtreeFold, _identity
+from .tree_observers import TreeObserver, register_observer
+
+DIGEST_SIZE = 16
+
+
+# Nodes with more children than this hash them through a binary Merkle
+# tree, so that tracked hashes of wide nodes update in O(log degree).
+WIDE_NODE_DEGREE = 32
+
+
+def _data_hash(node: TreeNode, encode: Callable[[Any], bytes]) -> bytes:
+    return hashlib.blake2b(encode(node.data), digest_size=DIGEST_SIZE).digest()
+
+
+def _pair(left: bytes, right: bytes) -> bytes:
+    return hashlib.blake2b(
+        left + right, digest_size=DIGEST_SIZE, person=b"pair"
+    ).digest()
+
+
+def _wide_digest(node: TreeNode, encode: Callable[[Any], bytes], root: bytes) -> bytes:
+    # A distinct personalization keeps wide and narrow digests apart.
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE, person=b"wide")
+    digest.update(_data_hash(node, encode))
+    digest.update(root)
+    return digest.digest()
+
+
+def _pair_up(hashes: list[bytes]) -> bytes:
+    # Root of the perfect binary tree over hashes; a missing right sibling
+    # passes the left one up, as in SubtreeFold.
+    while len(hashes) > 1:
+        paired = [_pair(left, right) for left, right in zip(hashes[::2], hashes[1::2])]
+        if len(hashes) % 2:
+            paired.append(hashes[-1])
+        hashes = paired
+    return hashes[0]
+
+
+def _digest(
+    node: TreeNode, encode: Callable[[Any], bytes], hashes: dict[TreeNode, bytes]
+) -> bytes:
+    children = node.children
+    if len(children) > WIDE_NODE_DEGREE:
+        return _wide_digest(
+            node, encode, _pair_up([hashes[child] for child in children])
+        )
+
+    # Every part has the same length, so the concatenation is unambiguous.
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    digest.update(_data_hash(node, encode))
+    for child in children:
+        digest.update(hashes[child])
+    return digest.digest()
+
+
+class MerkleHashes(TreeObserver):
+    """
+    Observer keeping the Merkle hash of every subtree up to date.
+
+    Adding or removing nodes rehashes only the path to the root (see
+    SubtreeFold): O(degree) per node with at most WIDE_NODE_DEGREE
+    children, O(log degree) per wider one. Change node data with
+    set_node_data, or call ``refresh`` after changing it directly.
+
+    Example:
+        >>> first = create_root_with_children_data_list("a", ["b", "c"])
+        >>> second = create_root_with_children_data_list("a", ["b", "c"])
+        >>> print(track_merkle_hashes(first)[first] == merkle_hash(second))  # True
+    """
+
+    def __init__(self, encode: Callable[[Any], bytes] = pickle.dumps):
+        self.encode = encode
+        self._fold = SubtreeFold(
+            self._compute,
+            _identity,
+            _pair,
+            self._finish,
+            wide=WIDE_NODE_DEGREE,
+        )
+
+    def __getitem__(self, node: TreeNode) -> bytes:
+        """Return the hash of the subtree rooted at ``node``."""
+        return self._fold.values[node]
+
+    def __contains__(self, node: TreeNode) -> bool:
+        return node in self._fold.values
+
+    def refresh(self, node: TreeNode) -> None:
+        """Rehash ``node`` and its ancestors after its data changed."""
+        self._fold.refresh(node)
+
+    def _compute(self, node: TreeNode) -> bytes:
+        return _digest(node, self.encode, self._fold.values)
+
+    def _finish(self, node: TreeNode, root: bytes) -> bytes:
+        return _wide_digest(node, self.encode, root)
+
+    def nodes_attached(self, parent: TreeNode | None, nodes: list[TreeNode]) -> None:
+        self._fold.nodes_attached(parent, nodes)
+
+    def node_removed(
+        self, node: TreeNode, parent: TreeNode, moved_children: list[TreeNode]
+    ) -> None:
+        self._fold.node_removed(node, parent, moved_children)
+
+    def subtree_detached(self, node: TreeNode, parent: TreeNode) -> None:
+        self._fold.subtree_detached(node, parent)
+
+    def node_relabeled(self, node: TreeNode, old_data: Any) -> None:
+        self._fold.refresh(node)
+
+
+def track_merkle_hashes(
+    root: TreeNode, encode: Callable[[Any], bytes] = pickle.dumps
+) -> MerkleHashes:
+    """
+    Hash every subtree of the tree rooted at ``root`` and keep the hashes current.
+
+    Args:
+        root (TreeNode): The root of the tree
+        encode (Callable[[Any], bytes]): Encodes a node's data to bytes
+
+    Returns:
+        MerkleHashes: The registered observer; ``hashes[node]`` is the hash of
+            the subtree rooted at node
+
+    Raises:
+        ValueError: If root is None or not the root of its tree
+
+    Example:
+        >>> root = create_root_with_children_data_list("a", ["b", "b"])
+        >>> hashes = track_merkle_hashes(root)
+        >>> b1, b2 = root.children_nodes
+        >>> print(hashes[b1] == hashes[b2])  # True
+    """
+    return register_observer(root, MerkleHashes(encode))
+
+
+def merkle_hash(root: TreeNode, encode: Callable[[Any], bytes] = pickle.dumps) -> bytes:
+    """
+    Compute the Merkle hash of the tree rooted at ``root`` once, in O(n).
+
+    The result equals what track_merkle_hashes would report for root.
+
+    Example:
+        >>> root = create_root_with_children_data_list("a", ["b"])
+        >>> print(len(merkle_hash(root)))  # 16
+    """
+    if root is None:
+        raise ValueError("Root node cannot be None")
+
+    hashes: dict[TreeNode, bytes] = {}
+    for node in iter_post_order(root):
+        hashes[node] = _digest(node, encode, hashes)
+        for child in node.children:
+            del hashes[child]
+
+    return hashes[root]
+
+
+def subtree_hashes(
+    root: TreeNode, encode: Callable[[Any], bytes] = pickle.dumps
+) -> dict[TreeNode, bytes]:
+    """
+    Compute the Merkle hash of every subtree once, without tracking changes.
+
+    Returns:
+        dict[TreeNode, bytes]: The hash of the subtree rooted at every node
+
+    Example:
+        >>> root = create_root_with_children_data_list("a", ["b"])
+        >>> hashes = subtree_hashes(root)
+        >>> print(hashes[root] == merkle_hash(root))  # True
+    """
+    if root is None:
+        raise ValueError("Root node cannot be None")
+
+    hashes: dict[TreeNode, bytes] = {}
+    for node in iter_post_order(root):
+        hashes[node] = _digest(node, encode, hashes)
+    return hashes
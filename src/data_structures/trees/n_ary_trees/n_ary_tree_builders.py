@@ -0,0 +1,222 @@
+"""
+Linear-time bulk builders for n-ary trees.
+
+Each builder creates every TreeNode once, links it to its parent with a
+single append and sets the is_root, is_parent and is_leaf flags in a final
+pass, instead of going through add_child_node for every node.
+"""
+
+import json
+from typing import Any, Hashable, Iterable, Sequence
+
+from ..tree_node import TreeNode
+from .tree_observers import ValueIndex, register_observer
+
+
+def _finish_tree(root: TreeNode, nodes: list[TreeNode], indexed: bool) -> TreeNode:
+    for node in nodes:
+        if node.children:
+            node.is_parent = True
+        else:
+            node.is_leaf = True
+
+    root.is_root = True
+
+    if indexed:
+        register_observer(root, ValueIndex())
+
+    return root
+
+
+def build_tree_from_parent_array(
+    parents: Sequence[int], data: Sequence[Any] | None = None, indexed: bool = False
+) -> TreeNode:
+    """
+    Build an n-ary tree from a parent-pointer array in O(n).
+
+    Node ``i`` is a child of node ``parents[i]``; the root is the only node
+    whose parent is -1. Siblings are ordered by their position in the array.
+
+    Args:
+        parents (Sequence[int]): The parent index of every node, -1 for the root
+        data (Sequence[Any] | None): The data of every node; defaults to the
+            node indices
+        indexed (bool): Keep a ValueIndex on the tree (see create_root)
+
+    Returns:
+        TreeNode: The root of the built tree
+
+    Raises:
+        ValueError: If there is not exactly one root, a parent index is out of
+            range, data has a different length, or the parents form a cycle
+
+    Example:
+        >>> root = build_tree_from_parent_array([-1, 0, 0, 1], ["a", "b", "c", "d"])
+        >>> print([child.data for child in root.children_nodes])  # ["b", "c"]
+    """
+    size = len(parents)
+    if data is None:
+        data = range(size)
+    elif len(data) != size:
+        raise ValueError("Parent array and data must have the same length")
+
+    nodes = [TreeNode(value) for value in data]
+    root = None
+
+    for node, parent_index in zip(nodes, parents):
+        if parent_index == -1:
+            if root is not None:
+                raise ValueError("Parent array must contain exactly one root")
+            root = node
+        elif 0 <= parent_index < size:
+            parent = nodes[parent_index]
+            node.parent = parent
+            parent.children_nodes.append(node)
+        else:
+            raise ValueError(f"Parent index {parent_index} is out of range")
+
+    if root is None:
+        raise ValueError("Parent array must contain exactly one root")
+
+    _check_reaches_every_node(root, size)
+    return _finish_tree(root, nodes, indexed)
+
+
+def build_tree_from_edges(
+    edges: Iterable[tuple[Hashable, Hashable]], indexed: bool = False
+) -> TreeNode:
+    """
+    Build an n-ary tree from (parent, child) value pairs in O(n).
+
+    Node values identify the nodes, so they must be hashable and unique. The
+    root is the only value that never appears as a child, and siblings are
+    ordered by the position of their edge.
+
+    Args:
+        edges (Iterable[tuple[Hashable, Hashable]]): The (parent, child) pairs
+        indexed (bool): Keep a ValueIndex on the tree (see create_root)
+
+    Returns:
+        TreeNode: The root of the built tree
+
+    Raises:
+        ValueError: If there are no edges, a child has two parents, or the
+            edges do not form a single tree
+
+    Example:
+        >>> root = build_tree_from_edges([("a", "b"), ("a", "c"), ("b", "d")])
+        >>> print(root.data)  # "a"
+    """
+    nodes: dict[Hashable, TreeNode] = {}
+
+    for parent_value, child_value in edges:
+        parent = nodes.get(parent_value)
+        if parent is None:
+            parent = nodes[parent_value] = TreeNode(parent_value)
+
+        child = nodes.get(child_value)
+        if child is None:
+            child = nodes[child_value] = TreeNode(child_value)
+        elif child.parent is not None:
+            raise ValueError(f"Node {child_value!r} has more than one parent")
+
+        child.parent = parent
+        parent.children_nodes.append(child)
+
+    if not nodes:
+        raise ValueError("Edge list cannot be empty")
+
+    roots = [node for node in nodes.values() if node.parent is None]
+    if len(roots) != 1:
+        raise ValueError("Edges must form a single tree with exactly one root")
+
+    _check_reaches_every_node(roots[0], len(nodes))
+    return _finish_tree(roots[0], list(nodes.values()), indexed)
+
+
+def build_tree_from_nested_dict(
+    nested: dict[str, Any],
+    data_key: str = "data",
+    children_key: str = "children",
+    indexed: bool = False,
+) -> TreeNode:
+    """
+    Build an n-ary tree from nested dictionaries in O(n).
+
+    Every dictionary describes one node: ``{"data": ..., "children": [...]}``,
+    where the children entry is optional. The walk is iterative, so the
+    nesting may be deeper than the recursion limit.
+
+    Args:
+        nested (dict[str, Any]): The dictionary describing the root
+        data_key (str): The key holding a node's data
+        children_key (str): The key holding a node's list of children
+        indexed (bool): Keep a ValueIndex on the tree (see create_root)
+
+    Returns:
+        TreeNode: The root of the built tree
+
+    Raises:
+        ValueError: If a node is not a dictionary or has no data entry
+
+    Example:
+        >>> root = build_tree_from_nested_dict(
+        ...     {"data": "a", "children": [{"data": "b"}, {"data": "c"}]}
+        ... )
+        >>> print(len(root.children_nodes))  # 2
+    """
+    root = TreeNode(_nested_data(nested, data_key))
+    nodes = [root]
+    stack = [(root, nested)]
+
+    while stack:
+        node, description = stack.pop()
+
+        for child_description in description.get(children_key) or ():
+            child = TreeNode(_nested_data(child_description, data_key), parent=node)
+            node.children_nodes.append(child)
+            nodes.append(child)
+            stack.append((child, child_description))
+
+    return _finish_tree(root, nodes, indexed)
+
+
+def build_tree_from_json(
+    text: str,
+    data_key: str = "data",
+    children_key: str = "children",
+    indexed: bool = False,
+) -> TreeNode:
+    """
+    Build an n-ary tree from a JSON document of nested node objects.
+
+    The document uses the format of build_tree_from_nested_dict.
+
+    Example:
+        >>> root = build_tree_from_json('{"data": 1, "children": [{"data": 2}]}')
+        >>> print(root.children_nodes[0].data)  # 2
+    """
+    return build_tree_from_nested_dict(
+        json.loads(text), data_key, children_key, indexed
+    )
+
+
+def _nested_data(description: Any, data_key: str) -> Any:
+    if not isinstance(description, dict) or data_key not in description:
+        raise ValueError(f"Every node must be a dictionary with a {data_key!r} key")
+    return description[data_key]
+
+
+def _check_reaches_every_node(root: TreeNode, size: int) -> None:
+    # Nodes on a cycle are not reachable from the root, so counting the
+    # reachable nodes detects cycles and disconnected parts.
+    reached = 0
+    stack = [root]
+
+    while stack:
+        node = stack.pop()
+        reached += 1
+        stack.extend(node.children)
+
+    if reached != size:
+        raise ValueError("Input does not describe a single tree (cycle found)")
@@ -0,0 +1,399 @@
+"""
+Edit scripts between n-ary trees: diff_trees computes one, apply_patch
+replays it.
+
+An edit script is a list of Insert, Delete, Move and Relabel records. They
+refer to nodes of the old tree by their path of child positions from the
+root, as it was before the script started (``()`` is the root). Nodes
+created by the script are referred to by the int id of their Insert. Edits
+are applied in order, and every ``position`` is an index in the parent's
+children list at the moment the edit is applied. Scripts hold only paths,
+ints and node data, so they can be pickled and shipped to another process
+that has a copy of the old tree.
+
+diff_trees matches the two trees top-down and never descends into a pair of
+subtrees whose Merkle hashes are equal, so unchanged regions cost one hash
+comparison each. Children are matched by equal hash first, then by equal
+data, then by position when they look like the same node with new data. A
+subtree deleted in one place and inserted unchanged in another becomes a
+Move. The result is small but not guaranteed minimal.
+"""
+
+import pickle
+from bisect import bisect_left
+from collections import deque
+from itertools import count
+from typing import Any, Callable, NamedTuple, cast
+
+from ..tree_node import TreeNode
+from .merkle_hashes import MerkleHashes, subtree_hashes
+from .n_ary_tree_operations import (
+    attach_subtree,
+    detach_subtree,
+    iter_pre_order,
+    move_subtree,
+    set_node_data,
+)
+from .tree_observers import find_observer
+
+NodeRef = tuple[int, ...] | int
+
+
+class Insert(NamedTuple):
+    """Create node ``node`` holding ``data`` as child ``position`` of ``parent``."""
+
+    node: int
+    parent: NodeRef
+    position: int
+    data: Any
+
+
+class Delete(NamedTuple):
+    """Remove ``node`` together with all its descendants."""
+
+    node: NodeRef
+
+
+class Move(NamedTuple):
+    """Move ``node`` and its descendants to child ``position`` of ``parent``."""
+
+    node: NodeRef
+    parent: NodeRef
+    position: int
+
+
+class Relabel(NamedTuple):
+    """Replace the data of ``node``."""
+
+    node: NodeRef
+    data: Any
+
+
+Edit = Insert | Delete | Move | Relabel
+
+
+def _hash_lookup(root: TreeNode, encode: Callable[[Any], bytes]) -> Callable:
+    tracked = find_observer(root, MerkleHashes)
+    if tracked is not None and tracked.encode is encode:
+        return tracked.__getitem__
+    return subtree_hashes(root, encode).__getitem__
+
+
+def _looks_relabeled(
+    old_hash: Callable, new_hash: Callable, a: TreeNode, b: TreeNode
+) -> bool:
+    if not a.children and not b.children:
+        return True
+    old_children = {old_hash(child) for child in a.children}
+    return any(new_hash(child) in old_children for child in b.children)
+
+
+def _match_by_data(unmatched: dict[int, TreeNode], pending: list) -> list:
+    # Pairs each pending new child with the first unmatched old child holding
+    # equal data; returns (old position or None, new child) in pending order.
+    by_data: dict[Any, deque] = {}
+    unhashable = []
+    for position, child in unmatched.items():
+        try:
+            by_data.setdefault(child.data, deque()).append(position)
+        except TypeError:
+            unhashable.append(position)
+
+    pairs = []
+    for child in pending:
+        found: int | None = None
+        try:
+            candidates = by_data.get(child.data)
+            if candidates:
+                found = candidates.popleft()
+        except TypeError:
+            for candidate in unhashable:
+                if candidate in unmatched and unmatched[candidate].data == child.data:
+                    found = candidate
+                    break
+        if found is not None:
+            del unmatched[found]
+        pairs.append((found, child))
+    return pairs
+
+
+def _longest_increasing(positions: list[int]) -> set[int]:
+    # Patience sorting; returns the positions of one longest increasing run.
+    tails: list[int] = []
+    tail_indices: list[int] = []
+    previous = [-1] * len(positions)
+    for i, position in enumerate(positions):
+        slot = bisect_left(tails, position)
+        if slot:
+            previous[i] = tail_indices[slot - 1]
+        if slot == len(tails):
+            tails.append(position)
+            tail_indices.append(i)
+        else:
+            tails[slot] = position
+            tail_indices[slot] = i
+
+    keep = set()
+    i = tail_indices[-1] if tail_indices else -1
+    while i != -1:
+        keep.add(positions[i])
+        i = previous[i]
+    return keep
+
+
+def diff_trees(
+    old: TreeNode, new: TreeNode, encode: Callable[[Any], bytes] = pickle.dumps
+) -> list[Edit]:
+    """
+    Compute an edit script that turns the tree ``old`` into the tree ``new``.
+
+    Hashes come from a MerkleHashes observer when a tree has one that uses
+    the same ``encode``; otherwise they are computed once for that tree.
+
+    Args:
+        old (TreeNode): The root of the tree to transform
+        new (TreeNode): The root of the target tree
+        encode (Callable[[Any], bytes]): Encodes node data for hashing
+
+    Returns:
+        list[Edit]: The edit script; empty if the trees are equal
+
+    Raises:
+        ValueError: If either root is None
+
+    Example:
+        >>> old = create_root_with_children_data_list("a", ["b", "c"])
+        >>> new = create_root_with_children_data_list("a", ["c", "d"])
+        >>> script = diff_trees(old, new)
+        >>> print(pre_order_traversal(apply_patch(old, script), []))
+        ["a", "c", "d"]
+    """
+    if old is None or new is None:
+        raise ValueError("Root nodes cannot be None")
+
+    old_hash = _hash_lookup(old, encode)
+    new_hash = _hash_lookup(new, encode)
+    if old_hash(old) == new_hash(new):
+        return []
+
+    # Phase 1: match children of matched nodes, top-down, skipping equal
+    # subtrees. matches maps a new node to its old node and old path.
+    matches: dict[TreeNode, tuple[TreeNode, tuple]] = {new: (old, ())}
+    deleted: list[tuple[TreeNode, tuple]] = []
+    inserted: list[TreeNode] = []
+    stack: list[tuple[TreeNode, tuple[int, ...], TreeNode]] = [(old, (), new)]
+
+    while stack:
+        a, path, b = stack.pop()
+        a_children = a.children
+        unmatched = dict(enumerate(a_children))
+        by_hash: dict[bytes, deque] = {}
+        for position, child in unmatched.items():
+            by_hash.setdefault(old_hash(child), deque()).append(position)
+
+        pending = []
+        for child in b.children:
+            candidates = by_hash.get(new_hash(child))
+            if candidates:
+                position = candidates.popleft()
+                del unmatched[position]
+                matches[child] = (a_children[position], path + (position,))
+            else:
+                pending.append(child)
+
+        leftovers = []
+        for position, child in _match_by_data(unmatched, pending):
+            if position is None:
+                leftovers.append(child)
+            else:
+                matched = (a_children[position], path + (position,))
+                matches[child] = matched
+                stack.append((*matched, child))
+
+        for (position, a_child), child in zip(list(unmatched.items()), leftovers):
+            if _looks_relabeled(old_hash, new_hash, a_child, child):
+                del unmatched[position]
+                matched = (a_child, path + (position,))
+                matches[child] = matched
+                stack.append((*matched, child))
+
+        for position, a_child in unmatched.items():
+            deleted.append((a_child, path + (position,)))
+        inserted.extend(child for child in leftovers if child not in matches)
+
+    # Phase 2: an inserted subtree equal to a deleted subtree, or to a part
+    # of one, is moved instead. Larger subtrees claim first, so a claimed
+    # node never has a claimed ancestor.
+    moves: dict[TreeNode, tuple[TreeNode, tuple]] = {}
+    claimed: set[TreeNode] = set()
+    deleted_roots = {node for node, _ in deleted}
+
+    if deleted and inserted:
+        sources: dict[bytes, list] = {}
+        for region, region_path in deleted:
+            paths = {region: region_path}
+            for node in iter_pre_order(region):
+                node_path = paths.pop(node)
+                sources.setdefault(old_hash(node), []).append((node, node_path))
+                for position, child in enumerate(node.children):
+                    paths[child] = node_path + (position,)
+
+        sizes = {child: sum(1 for _ in iter_pre_order(child)) for child in inserted}
+        for child in sorted(inserted, key=sizes.__getitem__, reverse=True):
+            for node, node_path in sources.get(new_hash(child), ()):
+                if _free(node, claimed, deleted_roots):
+                    claimed.add(node)
+                    moves[child] = (node, node_path)
+                    break
+
+    # Phase 3: emit edits top-down in pre-order of the new tree, then the
+    # deletions, once everything worth keeping has been moved out.
+    script: list[Edit] = []
+    new_ids = count()
+    live: dict[TreeNode, list] = {}
+
+    def live_children(node: TreeNode) -> list:
+        children = live.get(node)
+        if children is None:
+            children = live[node] = list(node.children)
+        return children
+
+    stack = [(old, (), new)]
+    while stack:
+        a, a_ref, b = stack.pop()
+        if a.data != b.data:
+            script.append(Relabel(a_ref, b.data))
+
+        current = live_children(a)
+        local = [matches[child][1][-1] for child in b.children if child in matches]
+        staying = _longest_increasing(local)
+        pairs = []
+        position = -1
+
+        for child in b.children:
+            match = matches.get(child)
+            if match is not None and match[1][-1] in staying:
+                position = current.index(match[0], position + 1)
+            elif match is not None:
+                moved = current.index(match[0])
+                del current[moved]
+                if moved <= position:
+                    position -= 1
+                position += 1
+                current.insert(position, match[0])
+                script.append(Move(match[1], a_ref, position))
+            elif child in moves:
+                node, node_path = moves[child]
+                live_children(cast(TreeNode, node.parent)).remove(node)
+                position += 1
+                current.insert(position, node)
+                script.append(Move(node_path, a_ref, position))
+            else:
+                position += 1
+                current.insert(
+                    position, _emit_inserts(child, a_ref, position, script, new_ids)
+                )
+
+            if match is not None and old_hash(match[0]) != new_hash(child):
+                pairs.append((*match, child))
+
+        stack.extend(reversed(pairs))
+
+    script.extend(Delete(path) for node, path in deleted if node not in claimed)
+    return script
+
+
+def _free(node: TreeNode, claimed: set, deleted_roots: set) -> bool:
+    while True:
+        if node in claimed:
+            return False
+        if node in deleted_roots:
+            return True
+        node = cast(TreeNode, node.parent)
+
+
+def _emit_inserts(
+    node: TreeNode, parent: NodeRef, position: int, script: list, new_ids: count
+) -> int:
+    node_id = next(new_ids)
+    script.append(Insert(node_id, parent, position, node.data))
+    stack = [(node, node_id)]
+
+    while stack:
+        node, parent_id = stack.pop()
+        for position, child in enumerate(node.children):
+            child_id = next(new_ids)
+            script.append(Insert(child_id, parent_id, position, child.data))
+            stack.append((child, child_id))
+
+    return node_id
+
+
+def _resolve(root: TreeNode, path: tuple[int, ...]) -> TreeNode:
+    node = root
+    for position in path:
+        children = node.children
+        if not 0 <= position < len(children):
+            raise ValueError(f"Path {path} does not exist in the tree")
+        node = children[position]
+    return node
+
+
+def apply_patch(root: TreeNode, script: list[Edit]) -> TreeNode:
+    """
+    Apply an edit script from diff_trees to the tree rooted at ``root``, in place.
+
+    Paths are resolved against the tree before any edit is applied, and the
+    edits go through attach_subtree, detach_subtree, move_subtree and
+    set_node_data, so observers of the tree stay up to date.
+
+    Args:
+        root (TreeNode): The root of the tree the script was computed from
+        script (list[Edit]): The edit script
+
+    Returns:
+        TreeNode: The root, now equal to the diff's target tree
+
+    Raises:
+        ValueError: If root is None, or the script refers to a node that does
+            not exist or holds an unknown edit
+        IndexError: If an edit's position is out of range
+
+    Example:
+        >>> old = create_root_with_children_data_list("a", ["b"])
+        >>> apply_patch(old, [Relabel((0,), "z")])
+        >>> print(old.children_nodes[0].data)  # "z"
+    """
+    if root is None:
+        raise ValueError("Root node cannot be None")
+
+    nodes: dict[NodeRef, TreeNode] = {}
+    for edit in script:
+        if not isinstance(edit, (Insert, Delete, Move, Relabel)):
+            raise ValueError(f"Unknown edit {edit!r}")
+        for ref in (edit.node, getattr(edit, "parent", None)):
+            if isinstance(ref, tuple) and ref not in nodes:
+                nodes[ref] = _resolve(root, ref)
+
+    def node_of(ref: NodeRef) -> TreeNode:
+        node = nodes.get(ref)
+        if node is None:
+            raise ValueError(f"Edit refers to unknown node {ref!r}")
+        return node
+
+    for edit in script:
+        if isinstance(edit, Insert):
+            if edit.node in nodes:
+                raise ValueError(f"Node id {edit.node} is inserted twice")
+            parent = node_of(edit.parent)
+            nodes[edit.node] = attach_subtree(
+                parent, TreeNode(edit.data), edit.position
+            )
+        elif isinstance(edit, Move):
+            move_subtree(node_of(edit.node), node_of(edit.parent), edit.position)
+        elif isinstance(edit, Delete):
+            detach_subtree(node_of(edit.node))
+        else:
+            set_node_data(node_of(edit.node), edit.data)
+
+    return root
@@ -1,8 +1,22 @@
-from ..tree_node import TreeNode
-from typing import Any
-
+from collections import deque
+from typing import Any, Iterator, cast
 
-def create_root(data: Any, children: list[TreeNode] | None = None) -> TreeNode:
+from ..tree_node import TreeNode
+from .tree_observers import (
+    ValueIndex,
+    _in_pre_order,
+    find_observer,
+    notify_node_relabeled,
+    notify_node_removed,
+    notify_nodes_attached,
+    notify_subtree_detached,
+    register_observer,
+)
+
+
+def create_root(
+    data: Any, children: list[TreeNode] | None = None, indexed: bool = False
+) -> TreeNode:
     """
     Create a root node for an n-ary tree with proper initialization.
 
@@ -12,6 +26,8 @@ def create_root(data: Any, children: list[TreeNode] | None = None) -> TreeNode:
     Args:
         data (Any): The data to store in the root node
         children (list[TreeNode] | None): Optional list of existing child nodes
+        indexed (bool): Keep a ValueIndex on the tree so that value searches
+            and removals are O(1) on average
 
     Returns:
         TreeNode: The created root node with is_root=True and is_parent=True
@@ -21,7 +37,7 @@ def create_root(data: Any, children: list[TreeNode] | None = None) -> TreeNode:
         >>> print(root.is_root)  # True
         >>> print(root.data)  # "root_data"
     """
-    root = TreeNode(data, parent=None, children_nodes=children or [])  #  Ensure list
+    root = TreeNode(data, parent=None, children_nodes=children or None)
     root.is_root = True
 
     if children:  #  Only set is_parent if there are actually children
@@ -30,11 +46,14 @@ def create_root(data: Any, children: list[TreeNode] | None = None) -> TreeNode:
         for child in children:
             child.parent = root
 
+    if indexed:
+        register_observer(root, ValueIndex())
+
     return root
 
 
 def create_root_with_children_data_list(
-    data: Any, children_data_list: list[Any]
+    data: Any, children_data_list: list[Any], indexed: bool = False
 ) -> TreeNode:
     """
     Create a root node and initialize it with child nodes from data list.
@@ -45,13 +64,14 @@ def create_root_with_children_data_list(
     Args:
         data (Any): The data to store in the root node
         children_data_list (list[Any]): List of data items to create child nodes
+        indexed (bool): Keep a ValueIndex on the tree (see create_root)
 
     Returns:
         TreeNode: The created root node with children attached
 
     Note:
-        Children nodes are initialized with children_nodes=[], so they are ready
-        to accept further children if needed.
+        Children nodes allocate their own children list when their first
+        child is added, so leaves do not carry an empty list.
 
     Example:
         >>> root = create_root_with_children_data_list("root", ["child1", "child2"])
@@ -65,14 +85,20 @@ def create_root_with_children_data_list(
     if children_data_list:
         for child_data in children_data_list:
             if child_data:
-                child = TreeNode(child_data, root, [])  #  Use [] instead of None
+                child = TreeNode(child_data, root)
+                child.is_leaf = True
                 root.children_nodes.append(child)
 
+    if indexed:
+        register_observer(root, ValueIndex())
+
     return root
 
 
 def create_root_with_children_nodes_list(
-    data: Any, children_nodes_list: list[TreeNode] | None = None
+    data: Any,
+    children_nodes_list: list[TreeNode] | None = None,
+    indexed: bool = False,
 ) -> TreeNode:
     """
     Create a root node and attach existing TreeNode objects as children.
@@ -84,6 +110,7 @@ def create_root_with_children_nodes_list(
         data (Any): The data to store in the root node
         children_nodes_list (list[TreeNode] | None): Optional list of existing
             TreeNode objects to attach as children
+        indexed (bool): Keep a ValueIndex on the tree (see create_root)
 
     Returns:
         TreeNode: The created root node with attached children
@@ -105,6 +132,9 @@ def create_root_with_children_nodes_list(
                 child_node.parent = root
                 root.children_nodes.append(child_node)
 
+    if indexed:
+        register_observer(root, ValueIndex())
+
     return root
 
 
@@ -131,15 +161,17 @@ def add_child_node(parent_node: TreeNode, child_node_data: Any) -> TreeNode | No
     if parent_node is None:
         raise ValueError("Parent node cannot be None")
 
-    if parent_node.children_nodes is None:
-        parent_node.children_nodes = []  #  Initialize if None
-
     if child_node_data:
-        child_node = TreeNode(child_node_data, parent=parent_node, children_nodes=[])
+        child_node = TreeNode(child_node_data, parent=parent_node)
+        child_node.is_leaf = True
         parent_node.children_nodes.append(child_node)
 
         if not parent_node.is_parent:  #  Update parent flag
             parent_node.is_parent = True
+            parent_node.is_leaf = False
+
+        if parent_node.observers:
+            notify_nodes_attached(parent_node, [child_node])
 
         return child_node
 
@@ -205,15 +237,17 @@ def add_child_node_at_index(
     if parent_node is None:
         raise ValueError("Parent node cannot be None")
 
-    if parent_node.children_nodes is None:
-        parent_node.children_nodes = []
-
-    if child_node_data and (0 <= index <= len(parent_node.children_nodes)):
-        child_node = TreeNode(child_node_data, parent=parent_node, children_nodes=[])
+    if child_node_data and (0 <= index <= len(parent_node.children)):
+        child_node = TreeNode(child_node_data, parent=parent_node)
+        child_node.is_leaf = True
         parent_node.children_nodes.insert(index, child_node)
 
         if not parent_node.is_parent:
             parent_node.is_parent = True
+            parent_node.is_leaf = False
+
+        if parent_node.observers:
+            notify_nodes_attached(parent_node, [child_node])
 
         return child_node
 
@@ -246,36 +280,133 @@ def add_child_nodes_from_index(
     if parent_node is None:
         raise ValueError("Parent node cannot be None")
 
-    if parent_node.children_nodes is None:
-        parent_node.children_nodes = []
-
     added_children = []
 
-    if children_nodes_data and 0 <= index <= len(parent_node.children_nodes):
-        count = index
-
-        for child_node_data in children_nodes_data:
-            child_node = TreeNode(
-                child_node_data,
-                parent=parent_node,
-                children_nodes=[],  #  Use [] instead of None
-            )
-            parent_node.children_nodes.insert(count, child_node)
-            count += 1
-            added_children.append(child_node)
+    if children_nodes_data and 0 <= index <= len(parent_node.children):
+        added_children = [
+            TreeNode(child_node_data, parent=parent_node)
+            for child_node_data in children_nodes_data
+        ]
+        for child_node in added_children:
+            child_node.is_leaf = True
+
+        # One slice assignment shifts the existing children once, instead of
+        # once per inserted child.
+        parent_node.children_nodes[index:index] = added_children
 
         if not parent_node.is_parent:  #  Update parent flag
             parent_node.is_parent = True
+            parent_node.is_leaf = False
+
+        if parent_node.observers:
+            notify_nodes_attached(parent_node, added_children)
 
     return added_children if added_children else None
 
 
+def iter_pre_order(root: TreeNode | None) -> Iterator[TreeNode]:
+    """
+    Lazily yield the nodes of the tree in pre-order (root, children).
+
+    The traversal uses an explicit stack, so it works on trees deeper than the
+    recursion limit, and it stops as soon as the caller stops iterating. The
+    tree must not be modified while the generator is running.
+
+    Args:
+        root (TreeNode | None): The root of the tree to traverse
+
+    Yields:
+        TreeNode: Each node of the tree, in pre-order
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["child1", "child2"])
+        >>> print([node.data for node in iter_pre_order(root)])
+        ["root", "child1", "child2"]
+    """
+    if root is None:
+        return
+
+    stack = [root]
+
+    while stack:
+        node = stack.pop()
+        yield node
+
+        children = node.children
+        if children:
+            stack.extend(reversed(children))
+
+
+def iter_post_order(root: TreeNode | None) -> Iterator[TreeNode]:
+    """
+    Lazily yield the nodes of the tree in post-order (children, root).
+
+    Each stack entry holds a node and an iterator over its remaining children,
+    so the stack never holds more than one entry per level of the tree.
+
+    Args:
+        root (TreeNode | None): The root of the tree to traverse
+
+    Yields:
+        TreeNode: Each node of the tree, in post-order
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["child1", "child2"])
+        >>> print([node.data for node in iter_post_order(root)])
+        ["child1", "child2", "root"]
+    """
+    if root is None:
+        return
+
+    stack = [(root, iter(root.children))]
+
+    while stack:
+        node, remaining_children = stack[-1]
+        child = next(remaining_children, None)
+
+        if child is None:
+            stack.pop()
+            yield node
+        else:
+            stack.append((child, iter(child.children)))
+
+
+def iter_level_order(root: TreeNode | None) -> Iterator[TreeNode]:
+    """
+    Lazily yield the nodes of the tree level by level (breadth-first).
+
+    The queue is a collections.deque, so every node is enqueued and dequeued
+    in O(1).
+
+    Args:
+        root (TreeNode | None): The root of the tree to traverse
+
+    Yields:
+        TreeNode: Each node of the tree, in level order
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["child1", "child2"])
+        >>> print([node.data for node in iter_level_order(root)])
+        ["root", "child1", "child2"]
+    """
+    if root is None:
+        return
+
+    queue = deque([root])
+
+    while queue:
+        node = queue.popleft()
+        yield node
+        queue.extend(node.children)
+
+
 def pre_order_traversal(root: TreeNode, result: list[Any]) -> list[Any] | None:
     """
     Perform a pre-order traversal of the tree.
 
     This function traverses the tree in pre-order (root, children) and appends
-    the data of each visited node to the result list.
+    the data of each visited node to the result list. It is a thin wrapper
+    around iter_pre_order.
 
     Args:
         root (TreeNode): The root of the tree to traverse
@@ -293,12 +424,7 @@ def pre_order_traversal(root: TreeNode, result: list[Any]) -> list[Any] | None:
     if root is None:
         return None
 
-    result.append(root.data)
-
-    if root.children_nodes:  #  Check for None and non-empty
-        for child in root.children_nodes:
-            pre_order_traversal(child, result)  #  No reassignment needed
-
+    result.extend(node.data for node in iter_pre_order(root))
     return result
 
 
@@ -307,7 +433,8 @@ def post_order_traversal(root: TreeNode, result: list[Any]) -> list[Any] | None:
     Perform a post-order traversal of the tree.
 
     This function traverses the tree in post-order (children, root) and appends
-    the data of each visited node to the result list.
+    the data of each visited node to the result list. It is a thin wrapper
+    around iter_post_order.
 
     Args:
         root (TreeNode): The root of the tree to traverse
@@ -325,12 +452,8 @@ def post_order_traversal(root: TreeNode, result: list[Any]) -> list[Any] | None:
     if root is None:
         return None
 
-    if root.children_nodes:  #  Check for None and non-empty
-        for child in root.children_nodes:
-            post_order_traversal(child, result)
-
-    result.append(root.data)
-    return result  #  Always return result
+    result.extend(node.data for node in iter_post_order(root))
+    return result
 
 
 def level_order_traversal(root: TreeNode, result: list[Any]) -> list[Any] | None:
@@ -338,7 +461,8 @@ def level_order_traversal(root: TreeNode, result: list[Any]) -> list[Any] | None
     Perform a level-order traversal of the tree.
 
     This function traverses the tree level by level (breadth-first) and appends
-    the data of each visited node to the result list.
+    the data of each visited node to the result list. It is a thin wrapper
+    around iter_level_order.
 
     Args:
         root (TreeNode): The root of the tree to traverse
@@ -355,17 +479,8 @@ def level_order_traversal(root: TreeNode, result: list[Any]) -> list[Any] | None
     """
     if root is None:
         return None
-    else:
-        queue = [root]
-
-        while queue:
-            current = queue.pop(0)
-            result.append(current.data)
-
-            if current.children_nodes:
-                for child in current.children_nodes:
-                    queue.append(child)
 
+    result.extend(node.data for node in iter_level_order(root))
     return result
 
 
@@ -374,7 +489,9 @@ def breadth_first_search(root: TreeNode, target: Any) -> TreeNode | None:
     Perform a breadth-first search for a target value in the tree.
 
     This function searches for a node with the specified target value using
-    breadth-first search. Returns the first matching node found.
+    breadth-first search. Returns the first matching node found; the
+    traversal stops at the first match. On an indexed tree the node is
+    looked up in the ValueIndex instead of traversing the tree.
 
     Args:
         root (TreeNode): The root of the tree to search
@@ -388,25 +505,13 @@ def breadth_first_search(root: TreeNode, target: Any) -> TreeNode | None:
         >>> result = breadth_first_search(root, "child2")
         >>> print(result.data)  # "child2"
     """
-    if root is None:
-        return None
-    elif root.children_nodes is None:
-        if root.data == target:
-            return root
-        else:
-            return None
-    else:
-        queue = [root]
-
-        while queue:
-            current = queue.pop(0)
+    index = find_observer(root, ValueIndex)
+    if index is not None:
+        return index.first(target, root, breadth_first=True)
 
-            if current.data == target:
-                return current
-            else:
-                if current.children_nodes:
-                    for child in current.children_nodes:
-                        queue.append(child)
+    for node in iter_level_order(root):
+        if node.data == target:
+            return node
 
     return None
 
@@ -416,7 +521,9 @@ def depth_first_search(root: TreeNode, target: Any) -> TreeNode | None:
     Perform a depth-first search for a target value in the tree.
 
     This function searches for a node with the specified target value using
-    depth-first search. Returns the first matching node found.
+    depth-first search. Returns the first matching node found in pre-order;
+    the traversal stops at the first match. On an indexed tree the node is
+    looked up in the ValueIndex instead of traversing the tree.
 
     Args:
         root (TreeNode): The root of the tree to search
@@ -430,23 +537,13 @@ def depth_first_search(root: TreeNode, target: Any) -> TreeNode | None:
         >>> result = depth_first_search(root, "child2")
         >>> print(result.data)  # "child2"
     """
-    if root is None:
-        return None
-    elif root.children_nodes is None:
-        if root.data == target:
-            return root
-        else:
-            return None
-    else:
-        if root.data == target:
-            return root
-        else:
-            if root.children_nodes:
-                for child in root.children_nodes:
-                    result = depth_first_search(child, target)
+    index = find_observer(root, ValueIndex)
+    if index is not None:
+        return index.first(target, root)
 
-                    if result is not None:
-                        return result
+    for node in iter_pre_order(root):
+        if node.data == target:
+            return node
 
     return None
 
@@ -457,7 +554,8 @@ def search_and_remove_node(root: TreeNode, target: Any) -> TreeNode | None:
 
     This function searches for a node with the specified target value, removes
     it from the tree, and returns the removed node. The removed node's children
-    are reattached to the parent of the removed node.
+    are reattached to the parent of the removed node. On an indexed tree the
+    node is found in O(1) on average and the index is updated.
 
     Args:
         root (TreeNode): The root of the tree to search
@@ -478,24 +576,29 @@ def search_and_remove_node(root: TreeNode, target: Any) -> TreeNode | None:
     result = depth_first_search(root, target)
 
     if result is not None and result.parent is not None:
+        parent = result.parent
+
         # Save children before clearing references
-        children_to_move = result.children_nodes.copy() if result.children_nodes else []
+        children_to_move = list(result.children)
 
         # Update parent references for children
         for child in children_to_move:
-            child.parent = result.parent
+            child.parent = parent
 
         # Remove node from parent
-        result.parent.children_nodes.remove(result)
+        parent.children_nodes.remove(result)
 
-        # Add children to parent (ensure parent has children_nodes list)
-        if result.parent.children_nodes is None:
-            result.parent.children_nodes = []
-        result.parent.children_nodes.extend(children_to_move)
+        # Add children to parent
+        parent.children_nodes.extend(children_to_move)
+        if not parent.children:
+            parent.is_parent = False
+            parent.is_leaf = True
 
         # Clean up removed node
         result.parent = None
-        result.children_nodes = []
+        result.children_nodes = None
+
+        notify_node_removed(result, parent, children_to_move)
         return result
 
     return None
@@ -507,16 +610,22 @@ def search_and_remove_nodes(
     """
     Search for multiple nodes by value and remove them from the tree.
 
-    This function searches for nodes with the specified target values, removes
-    them from the tree, and returns a list of the removed nodes. The removed nodes'
-    children are reattached to the parents of the removed nodes.
+    This function removes every node (other than the root) whose value is in
+    targets, in a single traversal of the tree, and returns the removed nodes
+    in pre-order. On an indexed tree the nodes are looked up in the
+    ValueIndex instead, and only the paths from the root down to them are
+    walked. The children of a removed node are reattached to its nearest
+    remaining ancestor: each affected parent keeps its remaining children in
+    their original order, followed by the children moved up from its removed
+    children, the same order search_and_remove_node produces.
 
     Args:
         root (TreeNode): The root of the tree to search
         targets (list[Any]): The list of target values to search for and remove
 
     Returns:
-        list[TreeNode] | None: A list of the removed nodes, or None if none were found or if all are root nodes
+        list[TreeNode] | None: The removed nodes in pre-order, or None if no
+            node other than the root matched
 
     Example:
         >>> root = create_root("root", ["child1", "child2", "child3"])
@@ -527,12 +636,227 @@ def search_and_remove_nodes(
     if root is None or not targets:
         return None
 
-    removed_nodes = []
+    try:
+        target_values: set[Any] | list[Any] = set(targets)
+    except TypeError:
+        target_values = list(targets)  # Unhashable targets: linear lookups
+
+    index = find_observer(root, ValueIndex)
+    if index is None:
+        nodes = list(iter_pre_order(root))
+        removed_nodes = [node for node in nodes[1:] if node.data in target_values]
+    else:
+        # The removed nodes and their parents, in pre-order, are all the
+        # rebuild below needs.
+        found = index.nodes_under(target_values, root)
+        found = [node for node in found if node is not root]
+        parents = [cast(TreeNode, node.parent) for node in found]
+        nodes = _in_pre_order(found + parents, root)
+        found_ids = {id(node) for node in found}
+        removed_nodes = [node for node in nodes if id(node) in found_ids]
+    if not removed_nodes:
+        return None
+
+    removed_ids = {id(node) for node in removed_nodes}
+    affected_ids = {id(node.parent) for node in removed_nodes}
+    # Observers are notified as if the nodes were removed one at a time in
+    # pre-order, so each event lists the children a node had before the batch
+    # and incremental observers count every moved node exactly once.
+    original_children = {id(node): list(node.children) for node in removed_nodes}
+
+    # Children before parents, so a removed node's children list already
+    # holds its own moved-up descendants when its parent is rebuilt.
+    for node in reversed(nodes):
+        if id(node) not in affected_ids:
+            continue
+
+        kept: list[TreeNode] = []
+        moved: list[TreeNode] = []
+        for child in node.children:
+            if id(child) in removed_ids:
+                moved.extend(child.children)
+            else:
+                kept.append(child)
+
+        for child in moved:
+            child.parent = node
+
+        kept.extend(moved)
+        node.children_nodes[:] = kept
+        if not kept:
+            node.is_parent = False
+            node.is_leaf = True
+
+    for node in removed_nodes:
+        parent = cast(TreeNode, node.parent)
+        if id(parent) in removed_ids:
+            # Removed ancestors come first in pre-order and already point at
+            # the remaining node that received their children.
+            parent = cast(TreeNode, parent.parent)
+        node.parent = parent
+        notify_node_removed(node, parent, original_children[id(node)])
+
+    for node in removed_nodes:
+        node.parent = None
+        node.children_nodes = None
+
+    return removed_nodes
+
+
+def attach_subtree(
+    parent_node: TreeNode, node: TreeNode, index: int | None = None
+) -> TreeNode:
+    """
+    Attach a detached subtree as a child of ``parent_node``.
+
+    Unlike the add_child_* functions this links an existing node (with all
+    its descendants), and any data is accepted, including falsy values.
+
+    Args:
+        parent_node (TreeNode): The node receiving the subtree
+        node (TreeNode): The root of the subtree; it must not have a parent
+            and must not be the root of a tree
+        index (int | None): The position among the parent's children;
+            defaults to the end
+
+    Returns:
+        TreeNode: The attached node
+
+    Raises:
+        ValueError: If either node is None or node is already part of a tree
+        IndexError: If index is out of range
+
+    Example:
+        >>> root = create_root("root")
+        >>> attach_subtree(root, TreeNode(0))
+        >>> print(root.children_nodes[0].data)  # 0
+    """
+    if parent_node is None or node is None:
+        raise ValueError("Parent node and node cannot be None")
+    if node.parent is not None or node.is_root or node is parent_node:
+        raise ValueError("Only a detached subtree can be attached")
+
+    children = parent_node.children_nodes
+    if index is None:
+        index = len(children)
+    elif not 0 <= index <= len(children):
+        raise IndexError(f"Index {index} is out of range")
+
+    children.insert(index, node)
+    node.parent = parent_node
+    if not node.children:
+        node.is_leaf = True
+
+    if not parent_node.is_parent:
+        parent_node.is_parent = True
+        parent_node.is_leaf = False
+
+    if parent_node.observers:
+        notify_nodes_attached(parent_node, [node])
+
+    return node
+
+
+def detach_subtree(node: TreeNode) -> TreeNode:
+    """
+    Detach ``node``, with all its descendants, from its parent.
+
+    Args:
+        node (TreeNode): The root of the subtree to detach
+
+    Returns:
+        TreeNode: The detached node, now the root of a separate subtree
+            (without the is_root flag, so it can be attached again)
+
+    Raises:
+        ValueError: If node is None or is the root of its tree
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a", "b"])
+        >>> detach_subtree(root.children_nodes[0])
+        >>> print([child.data for child in root.children_nodes])  # ["b"]
+    """
+    if node is None:
+        raise ValueError("Node cannot be None")
+
+    parent = node.parent
+    if parent is None:
+        raise ValueError("The root of a tree cannot be detached")
+
+    parent.children_nodes.remove(node)
+    node.parent = None
+
+    if not parent.children:
+        parent.is_parent = False
+        parent.is_leaf = True
+
+    if node.observers:
+        notify_subtree_detached(node, parent)
+
+    return node
+
+
+def move_subtree(
+    node: TreeNode, new_parent: TreeNode, index: int | None = None
+) -> TreeNode:
+    """
+    Move ``node``, with all its descendants, under ``new_parent``.
+
+    ``index`` is the node's position among the new parent's children after
+    the move, so moving a node within its own parent works as expected.
+
+    Args:
+        node (TreeNode): The root of the subtree to move
+        new_parent (TreeNode): The node receiving the subtree
+        index (int | None): The position among the new parent's children;
+            defaults to the end
+
+    Returns:
+        TreeNode: The moved node
+
+    Raises:
+        ValueError: If node is the root, or new_parent is inside the subtree
+        IndexError: If index is out of range
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a", "b"])
+        >>> a, b = root.children_nodes
+        >>> move_subtree(b, a)
+        >>> print(b.parent.data)  # "a"
+    """
+    if node is None or new_parent is None:
+        raise ValueError("Node and new parent cannot be None")
+
+    ancestor: TreeNode | None = new_parent
+    while ancestor is not None:
+        if ancestor is node:
+            raise ValueError("Cannot move a subtree into itself")
+        ancestor = ancestor.parent
+
+    children = new_parent.children
+    limit = len(children) - (1 if node.parent is new_parent else 0)
+    if index is not None and not 0 <= index <= limit:
+        raise IndexError(f"Index {index} is out of range")
+
+    return attach_subtree(new_parent, detach_subtree(node), index)
+
+
+def set_node_data(node: TreeNode, data: Any) -> TreeNode:
+    """
+    Replace the data of ``node``, keeping the tree's observers up to date.
+
+    Example:
+        >>> root = create_root("a", indexed=True)
+        >>> set_node_data(root, "b")
+        >>> print(depth_first_search(root, "b") is root)  # True
+    """
+    if node is None:
+        raise ValueError("Node cannot be None")
+
+    old_data = node.data
+    node.data = data
 
-    for target in targets:
-        #  Use the corrected single removal function
-        removed_node = search_and_remove_node(root, target)
-        if removed_node is not None:
-            removed_nodes.append(removed_node)
+    if node.observers:
+        notify_node_relabeled(node, old_data)
 
-    return removed_nodes if removed_nodes else None
+    return node
@@ -0,0 +1,292 @@
+"""
+Compact binary serialization of n-ary trees.
+
+File layout (all integers little-endian)::
+
+    header      8 bytes   MAGIC
+    heap        payloads, each encoded with ``encode`` (pickle by default)
+    node table  one 24-byte record per node, in post-order:
+                heap offset (u64), payload length (u32), child count (u32),
+                subtree size (u64)
+    footer      24 bytes  node count (u64), table offset (u64), MAGIC
+
+Nodes are written in post-order because a node's subtree size is known when
+it is emitted, so the writer streams: payloads go straight to the output and
+table records to a spooled temporary file that is appended at the end. The
+writer keeps only the traversal stack and a bounded buffer in memory.
+
+In post-order the subtree of node ``i`` is the id range
+``i - size + 1 .. i`` and its last child is ``i - 1``, so MappedTree can
+find any node's children from the fixed-width table alone, without loading
+the tree.
+"""
+
+import io
+import mmap
+import os
+import pickle
+import shutil
+import struct
+import tempfile
+from typing import IO, Any, Callable, Iterator
+
+from ..tree_node import TreeNode
+
+MAGIC = b"DSATREE\x01"
+RECORD = struct.Struct("<QIIQ")
+FOOTER = struct.Struct("<QQ8s")
+
+# Table records stay in memory up to this size before spilling to disk.
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+
+def _iter_post_order_with_counts(root: TreeNode) -> Iterator[tuple[TreeNode, int]]:
+    # Yields (node, subtree size) in post-order; the stack holds one entry
+    # per level: [node, next child position, subtree size so far].
+    stack: list[list[Any]] = [[root, 0, 1]]
+
+    while stack:
+        entry = stack[-1]
+        node, position = entry[0], entry[1]
+        children = node.children
+
+        if position < len(children):
+            entry[1] = position + 1
+            stack.append([children[position], 0, 1])
+        else:
+            stack.pop()
+            if stack:
+                stack[-1][2] += entry[2]
+            yield node, entry[2]
+
+
+def serialize_tree(
+    root: TreeNode,
+    destination: str | os.PathLike | IO[bytes],
+    encode: Callable[[Any], bytes] = pickle.dumps,
+) -> int:
+    """
+    Write the n-ary tree rooted at ``root`` to a file in the compact format.
+
+    Args:
+        root (TreeNode): The root of the tree to write
+        destination (str | os.PathLike | IO[bytes]): A path or a binary file
+            opened for writing
+        encode (Callable[[Any], bytes]): Encodes a node's data to bytes
+
+    Returns:
+        int: The number of nodes written
+
+    Raises:
+        ValueError: If root is None or a node has too many children or too
+            large a payload for the format
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a", "b"])
+        >>> print(serialize_tree(root, "tree.bin"))  # 3
+    """
+    if root is None:
+        raise ValueError("Root node cannot be None")
+
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, "wb") as file:
+            return serialize_tree(root, file, encode)
+
+    output = destination
+    output.write(MAGIC)
+    heap_offset = len(MAGIC)
+    count = 0
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as table:
+        for node, subtree_size in _iter_post_order_with_counts(root):
+            payload = encode(node.data)
+            child_count = len(node.children)
+            if len(payload) >= 2**32 or child_count >= 2**32:
+                raise ValueError("Node payload or child count is too large")
+
+            output.write(payload)
+            table.write(
+                RECORD.pack(heap_offset, len(payload), child_count, subtree_size)
+            )
+            heap_offset += len(payload)
+            count += 1
+
+        table.seek(0)
+        shutil.copyfileobj(table, output)
+
+    output.write(FOOTER.pack(count, heap_offset, MAGIC))
+    return count
+
+
+def _read_footer(buffer: Any) -> tuple[int, int]:
+    if len(buffer) < len(MAGIC) + FOOTER.size or buffer[: len(MAGIC)] != MAGIC:
+        raise ValueError("Not a serialized tree")
+
+    count, table_offset, magic = FOOTER.unpack_from(buffer, len(buffer) - FOOTER.size)
+    if (
+        magic != MAGIC
+        or table_offset + count * RECORD.size != len(buffer) - FOOTER.size
+    ):
+        raise ValueError("Serialized tree is truncated or corrupt")
+    return count, table_offset
+
+
+def load_tree(
+    source: str | os.PathLike | IO[bytes],
+    decode: Callable[[bytes], Any] = pickle.loads,
+) -> TreeNode:
+    """
+    Load a serialized tree into TreeNode objects in linear time.
+
+    Post-order records are rebuilt with a stack: each node adopts the last
+    ``child count`` nodes on the stack as its children.
+
+    Args:
+        source (str | os.PathLike | IO[bytes]): A path or a binary file
+        decode (Callable[[bytes], Any]): Decodes a node's data from bytes
+
+    Returns:
+        TreeNode: The root of the loaded tree, with parent pointers and the
+            is_root, is_parent and is_leaf flags set
+
+    Raises:
+        ValueError: If the file is not a valid serialized tree
+
+    Example:
+        >>> root = load_tree("tree.bin")
+        >>> print([child.data for child in root.children_nodes])  # ["a", "b"]
+    """
+    with MappedTree(source, decode) as mapped, memoryview(mapped._buffer) as view:
+        start = mapped._table_offset
+        with view[start : start + len(mapped) * RECORD.size] as table:
+            stack = _build_from_records(mapped._buffer, table, decode)
+
+    if len(stack) != 1:
+        raise ValueError("Serialized tree is truncated or corrupt")
+
+    stack[0].is_root = True
+    return stack[0]
+
+
+def _build_from_records(
+    buffer: Any, table: memoryview, decode: Callable[[bytes], Any]
+) -> list[TreeNode]:
+    stack: list[TreeNode] = []
+
+    for offset, length, child_count, _ in RECORD.iter_unpack(table):
+        node = TreeNode(decode(buffer[offset : offset + length]))
+
+        if child_count:
+            if child_count > len(stack):
+                raise ValueError("Serialized tree is truncated or corrupt")
+            children = stack[-child_count:]
+            del stack[-child_count:]
+            for child in children:
+                child.parent = node
+            node.children_nodes = children
+            node.is_parent = True
+        else:
+            node.is_leaf = True
+
+        stack.append(node)
+
+    return stack
+
+
+class MappedTree:
+    """
+    Read-only view of a serialized tree backed by mmap.
+
+    Nothing is loaded up front: a node's data is decoded, and its children
+    found, only when asked for. Node ids are post-order positions, so the
+    root is ``len(tree) - 1``.
+
+    Example:
+        >>> with MappedTree("tree.bin") as tree:
+        ...     print([tree.data(child) for child in tree.children(tree.root)])
+        ["a", "b"]
+    """
+
+    def __init__(
+        self,
+        source: str | os.PathLike | IO[bytes],
+        decode: Callable[[bytes], Any] = pickle.loads,
+    ):
+        self._decode = decode
+        self._file: IO[bytes] | None = None
+        self._buffer: mmap.mmap | bytes
+
+        if isinstance(source, (str, os.PathLike)):
+            self._file = source = open(source, "rb")
+
+        try:
+            self._buffer = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except io.UnsupportedOperation:
+            # In-memory streams such as BytesIO have no file to map.
+            source.seek(0)
+            self._buffer = source.read()
+        except ValueError:
+            self._close_file()
+            raise ValueError("Not a serialized tree")
+
+        try:
+            self._count, self._table_offset = _read_footer(self._buffer)
+        except ValueError:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "MappedTree":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file (and close it if the view opened it)."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._close_file()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+    @property
+    def root(self) -> int:
+        """The id of the root node."""
+        return self._count - 1
+
+    def _record(self, node: int) -> tuple[int, int, int, int]:
+        if not 0 <= node < self._count:
+            raise IndexError(f"Node id {node} is out of range")
+        return RECORD.unpack_from(self._buffer, self._table_offset + node * RECORD.size)
+
+    def data(self, node: int) -> Any:
+        """Decode and return the data of ``node``."""
+        offset, length, _, _ = self._record(node)
+        return self._decode(self._buffer[offset : offset + length])
+
+    def child_count(self, node: int) -> int:
+        """Return the number of children of ``node``."""
+        return self._record(node)[2]
+
+    def subtree_size(self, node: int) -> int:
+        """Return the number of nodes in the subtree of ``node``."""
+        return self._record(node)[3]
+
+    def children(self, node: int) -> list[int]:
+        """Return the ids of the children of ``node``, left to right."""
+        child_count = self._record(node)[2]
+        children = []
+        child = node - 1
+
+        # Walk from the last child leftwards, skipping each child's subtree.
+        for _ in range(child_count):
+            children.append(child)
+            child -= self._record(child)[3]
+
+        children.reverse()
+        return children
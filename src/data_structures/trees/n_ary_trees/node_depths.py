@@ -0,0 +1,185 @@
+"""
+Node depths and root paths of n-ary trees, walked or cached.
+
+The depth of a node is the number of edges between it and the root. Without
+a cache, node_depth walks the parent pointers, which costs O(depth) per
+call. A DepthCache registered on the tree answers in O(1) and is kept
+correct by the tree operations: whenever nodes are attached, removed
+(search_and_remove_node moves the children up a level) or moved, the depths
+of the affected subtrees are recomputed.
+"""
+
+from typing import Iterator
+
+from ..tree_node import TreeNode
+from .tree_observers import TreeObserver, find_observer, register_observer
+
+
+def _assign_depths(depths: dict[TreeNode, int], node: TreeNode, depth: int) -> None:
+    # One BFS over the subtree of node, which is at ``depth``.
+    level, depth_of_level = [node], depth
+    while level:
+        next_level = []
+        for node in level:
+            depths[node] = depth_of_level
+            children = node.children
+            if children:
+                next_level.extend(children)
+        level = next_level
+        depth_of_level += 1
+
+
+class DepthCache(TreeObserver):
+    """
+    Observer caching the depth of every node of a tree.
+
+    Queries are O(1). Attaching, moving or detaching a subtree, or removing a
+    node whose children move up a level, recomputes the depths of the
+    affected subtrees only, in time proportional to their size.
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a", "b"])
+        >>> depths = track_depths(root)
+        >>> child = add_child_node(root.children_nodes[0], "c")
+        >>> print(depths[child])  # 2
+    """
+
+    def __init__(self):
+        self._depths: dict[TreeNode, int] = {}
+
+    def __getitem__(self, node: TreeNode) -> int:
+        """Return the depth of ``node``."""
+        return self._depths[node]
+
+    def __contains__(self, node: TreeNode) -> bool:
+        return node in self._depths
+
+    def __len__(self) -> int:
+        return len(self._depths)
+
+    def nodes_attached(self, parent: TreeNode | None, nodes: list[TreeNode]) -> None:
+        depth = self._depths[parent] + 1 if parent is not None else 0
+        for node in nodes:
+            _assign_depths(self._depths, node, depth)
+
+    def node_removed(
+        self, node: TreeNode, parent: TreeNode, moved_children: list[TreeNode]
+    ) -> None:
+        depths = self._depths
+        depths.pop(node, None)
+        depth = depths[parent] + 1
+        for child in moved_children:
+            _assign_depths(depths, child, depth)
+
+    def subtree_detached(self, node: TreeNode, parent: TreeNode) -> None:
+        depths = self._depths
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            depths.pop(node, None)
+            stack.extend(node.children)
+
+
+def track_depths(root: TreeNode) -> DepthCache:
+    """
+    Cache the depth of every node of the tree rooted at ``root``.
+
+    The depths are computed with one BFS and kept current as the tree
+    changes; node_depth uses the cache once it is registered.
+
+    Args:
+        root (TreeNode): The root of the tree
+
+    Returns:
+        DepthCache: The registered observer; ``depths[node]`` is the depth
+            of node
+
+    Raises:
+        ValueError: If root is None or not the root of its tree
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a"])
+        >>> depths = track_depths(root)
+        >>> print(depths[root.children_nodes[0]])  # 1
+    """
+    return register_observer(root, DepthCache())
+
+
+def node_depth(node: TreeNode) -> int:
+    """
+    Return the number of edges between ``node`` and the root of its tree.
+
+    Uses the tree's DepthCache when it has one, and walks the parent
+    pointers otherwise.
+
+    Raises:
+        ValueError: If node is None
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a"])
+        >>> print(node_depth(root.children_nodes[0]))  # 1
+    """
+    if node is None:
+        raise ValueError("Node cannot be None")
+
+    cache = find_observer(node, DepthCache)
+    if cache is not None:
+        return cache[node]
+
+    depth = 0
+    ancestor = node.parent
+    while ancestor is not None:
+        depth += 1
+        ancestor = ancestor.parent
+    return depth
+
+
+def compute_depths(root: TreeNode) -> dict[TreeNode, int]:
+    """
+    Compute the depth of every node of the tree rooted at ``root`` in one BFS.
+
+    Use this for one-off batch queries; track_depths keeps the result
+    current instead.
+
+    Returns:
+        dict[TreeNode, int]: The depth of every node, in level order
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a", "b"])
+        >>> print(sorted(compute_depths(root).values()))  # [0, 1, 1]
+    """
+    if root is None:
+        raise ValueError("Root node cannot be None")
+
+    depths: dict[TreeNode, int] = {}
+    _assign_depths(depths, root, 0)
+    return depths
+
+
+def iter_path_to_root(node: TreeNode) -> Iterator[TreeNode]:
+    """
+    Yield ``node``, its parent, and so on up to the root of its tree.
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a"])
+        >>> a = root.children_nodes[0]
+        >>> print([n.data for n in iter_path_to_root(a)])  # ["a", "root"]
+    """
+    current: TreeNode | None = node
+    while current is not None:
+        yield current
+        current = current.parent
+
+
+def path_from_root(node: TreeNode) -> list[TreeNode]:
+    """
+    Return the nodes from the root of the tree down to ``node``.
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a"])
+        >>> a = root.children_nodes[0]
+        >>> print([n.data for n in path_from_root(a)])  # ["root", "a"]
+    """
+    path = list(iter_path_to_root(node))
+    path.reverse()
+    return path
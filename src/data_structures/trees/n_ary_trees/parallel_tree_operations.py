@@ -0,0 +1,291 @@
+"""
+Process-pool versions of the n-ary tree searches, filters and reductions.
+
+The tree is encoded once, in the calling process, as the node data in
+pre-order (plus node depths where level order matters). That encoding is cut
+into consecutive pre-order chunks. Each chunk holds whole subtrees, plus the
+ends of the paths leading to them. The chunks are sent to a
+concurrent.futures executor, and the per-chunk results are merged back in
+traversal order.
+
+Encoding and pickling cost about as much as one serial scan, so these
+functions pay off when the per-node work (the predicate or map function) is
+expensive. For a plain equality search, the serial depth_first_search is
+faster. Predicates and functions run in other processes, so they must be
+picklable (defined at module level) and only see node data, not TreeNode
+objects.
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable
+
+from ..tree_node import TreeNode
+from .n_ary_tree_operations import iter_pre_order
+
+# Chunks per worker: more chunks balance uneven work and let a search stop
+# earlier, fewer chunks cost less scheduling.
+CHUNKS_PER_WORKER = 4
+
+
+def _encode(root: TreeNode, with_depths: bool) -> tuple[list, list, list | None]:
+    if not with_depths:
+        nodes = list(iter_pre_order(root))
+        return nodes, [node.data for node in nodes], None
+
+    nodes, payloads, depths = [], [], []
+    stack = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        nodes.append(node)
+        payloads.append(node.data)
+        depths.append(depth)
+        children = node.children
+        if children:
+            stack.extend((child, depth + 1) for child in reversed(children))
+
+    return nodes, payloads, depths
+
+
+def _chunk_bounds(size: int, workers: int) -> list[tuple[int, int]]:
+    count = max(1, min(size, workers * CHUNKS_PER_WORKER))
+    step, extra = divmod(size, count)
+    bounds, start = [], 0
+    for chunk in range(count):
+        end = start + step + (1 if chunk < extra else 0)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _run_chunks(
+    root: TreeNode,
+    task: Callable,
+    arguments: tuple,
+    with_depths: bool,
+    max_workers: int | None,
+    executor: Executor | None,
+    stop_early: Callable[[Any], bool] | None = None,
+) -> tuple[list[TreeNode], list[tuple[int, Any]]]:
+    nodes, payloads, depths = _encode(root, with_depths)
+    bounds = _chunk_bounds(len(nodes), max_workers or os.cpu_count() or 1)
+
+    own_executor = executor is None
+    pool = executor
+    if pool is None:
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+
+    try:
+        futures = [
+            pool.submit(
+                task,
+                payloads[start:end],
+                depths[start:end] if depths is not None else None,
+                *arguments,
+            )
+            for start, end in bounds
+        ]
+
+        results = []
+        for (start, _), future in zip(bounds, futures):
+            result = future.result()
+            results.append((start, result))
+            if stop_early is not None and stop_early(result):
+                for pending in futures:
+                    pending.cancel()
+                break
+    finally:
+        if own_executor:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    return nodes, results
+
+
+def _first_match(payloads: list, depths: None, target: Any) -> int | None:
+    for position, data in enumerate(payloads):
+        if data == target:
+            return position
+    return None
+
+
+def _shallowest_match(payloads: list, depths: list, target: Any) -> Any:
+    best = None
+    for position, data in enumerate(payloads):
+        if data == target and (best is None or depths[position] < best[0]):
+            best = (depths[position], position)
+    return best
+
+
+def _matching_positions(payloads: list, depths: None, predicate: Callable) -> list:
+    return [position for position, data in enumerate(payloads) if predicate(data)]
+
+
+def _map_reduce(payloads: list, depths: None, function: Callable, combine: Callable):
+    values = map(function, payloads)
+    result = next(values)
+    for value in values:
+        result = combine(result, value)
+    return result
+
+
+def parallel_depth_first_search(
+    root: TreeNode,
+    target: Any,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> TreeNode | None:
+    """
+    Find the first node in pre-order holding ``target``, using a process pool.
+
+    The result is always the node depth_first_search returns. Chunks are
+    checked in pre-order, so once a chunk has a match the later chunks are
+    cancelled.
+
+    Args:
+        root (TreeNode): The root of the tree to search
+        target (Any): The target value to search for
+        max_workers (int | None): Number of worker processes (and the basis
+            of the chunk count); defaults to the CPU count
+        executor (Executor | None): An executor to reuse; by default a
+            ProcessPoolExecutor is created and shut down for this call
+
+    Returns:
+        TreeNode | None: The first node matching the target value, or None
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a", "b"])
+        >>> print(parallel_depth_first_search(root, "b", max_workers=2).data)  # "b"
+    """
+    if root is None:
+        return None
+
+    nodes, results = _run_chunks(
+        root,
+        _first_match,
+        (target,),
+        False,
+        max_workers,
+        executor,
+        stop_early=lambda position: position is not None,
+    )
+
+    for start, position in results:
+        if position is not None:
+            return nodes[start + position]
+    return None
+
+
+def parallel_breadth_first_search(
+    root: TreeNode,
+    target: Any,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> TreeNode | None:
+    """
+    Find the first node in level order holding ``target``, using a process pool.
+
+    Every chunk reports its shallowest match. Within a level, pre-order is
+    left-to-right order, so the match with the smallest (depth, pre-order
+    position) is the node breadth_first_search returns.
+
+    Args:
+        root (TreeNode): The root of the tree to search
+        target (Any): The target value to search for
+        max_workers (int | None): Number of worker processes
+        executor (Executor | None): An executor to reuse
+
+    Returns:
+        TreeNode | None: The first node matching the target value, or None
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a", "b"])
+        >>> print(parallel_breadth_first_search(root, "a", max_workers=2).data)  # "a"
+    """
+    if root is None:
+        return None
+
+    nodes, results = _run_chunks(
+        root, _shallowest_match, (target,), True, max_workers, executor
+    )
+
+    matches = [
+        (match[0], start + match[1]) for start, match in results if match is not None
+    ]
+    return nodes[min(matches)[1]] if matches else None
+
+
+def parallel_filter(
+    root: TreeNode,
+    predicate: Callable[[Any], bool],
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> list[TreeNode]:
+    """
+    Return the nodes whose data satisfies ``predicate``, in pre-order.
+
+    Args:
+        root (TreeNode): The root of the tree to filter
+        predicate (Callable[[Any], bool]): A picklable function of node data
+        max_workers (int | None): Number of worker processes
+        executor (Executor | None): An executor to reuse
+
+    Returns:
+        list[TreeNode]: The matching nodes, in pre-order
+
+    Example:
+        >>> root = create_root_with_children_data_list(1, [2, 3, 4])
+        >>> print([n.data for n in parallel_filter(root, is_even)])  # [2, 4]
+    """
+    if root is None:
+        return []
+
+    nodes, results = _run_chunks(
+        root, _matching_positions, (predicate,), False, max_workers, executor
+    )
+
+    return [nodes[start + position] for start, chunk in results for position in chunk]
+
+
+def parallel_map_reduce(
+    root: TreeNode,
+    function: Callable[[Any], Any],
+    combine: Callable[[Any, Any], Any],
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> Any:
+    """
+    Map every node's data with ``function`` and fold the results with ``combine``.
+
+    Values are combined in pre-order, first within each chunk and then
+    across chunks, so ``combine`` must be associative but need not be
+    commutative.
+
+    Args:
+        root (TreeNode): The root of the tree
+        function (Callable[[Any], Any]): A picklable function of node data
+        combine (Callable[[Any, Any], Any]): A picklable associative function
+        max_workers (int | None): Number of worker processes
+        executor (Executor | None): An executor to reuse
+
+    Returns:
+        Any: The combined value
+
+    Raises:
+        ValueError: If root is None
+
+    Example:
+        >>> root = create_root_with_children_data_list(1, [2, 3])
+        >>> print(parallel_map_reduce(root, square, operator.add))  # 14
+    """
+    if root is None:
+        raise ValueError("Root node cannot be None")
+
+    _, results = _run_chunks(
+        root, _map_reduce, (function, combine), False, max_workers, executor
+    )
+
+    values = iter(value for _, value in results)
+    result = next(values)
+    for value in values:
+        result = combine(result, value)
+    return result
@@ -0,0 +1,349 @@
+"""
+Subtree aggregates (size, height, sums, ...) cached per node and kept up to
+date as the tree changes.
+"""
+
+import operator
+from typing import Any, Callable
+
+from ..tree_node import TreeNode
+from .n_ary_tree_operations import iter_post_order
+from .tree_observers import TreeObserver, register_observer
+
+_EMPTY = object()
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class SubtreeFold:
+    """
+    Values of every subtree of a tree, computed bottom-up and kept current
+    along the path from a changed node to the root.
+
+    The value of a node is either ``compute(node)``, which reads the values
+    of its children from ``values``, or, for a node with more than ``wide``
+    children, ``finish(node, fold)``, where ``fold`` merges the
+    ``contribution`` of every child's value left to right. A wide node keeps
+    those contributions in a segment tree, so a change below one child
+    costs O(log degree) at that node instead of a refold of all children;
+    appending children is O(log degree) amortized, while inserting or
+    removing one elsewhere rebuilds the node's segment tree in O(degree),
+    like the list operation itself. The fold of a wide node is shaped like
+    a perfect binary tree over its children, missing leaves passing the
+    other side through, so it depends only on the children even when
+    ``merge`` is not associative (as with hashing).
+
+    With ``inverse`` given, ``merge`` must be commutative and
+    ``inverse(merge(a, b), b) == a``. A change then updates each ancestor
+    by removing the child's old contribution and merging in the new one, so
+    no segment trees are kept and ``compute`` is only called for new nodes
+    and refreshes.
+
+    Updates stop at the first ancestor whose value did not change.
+    SubtreeAggregates and MerkleHashes each hold one of these and forward
+    their observer events to it.
+
+    Attributes:
+        values (dict[TreeNode, Any]): The value of every tracked node
+    """
+
+    def __init__(
+        self,
+        compute: Callable[[TreeNode], Any],
+        contribution: Callable[[Any], Any],
+        merge: Callable[[Any, Any], Any],
+        finish: Callable[[TreeNode, Any], Any],
+        inverse: Callable[[Any, Any], Any] | None = None,
+        wide: int = 32,
+    ):
+        self.values: dict[TreeNode, Any] = {}
+        self._compute = compute
+        self._contribution = contribution
+        self._merge = merge
+        self._finish = finish
+        self._inverse = inverse
+        self._wide = wide
+        self._folds: dict[TreeNode, list[Any]] = {}
+        self._positions: dict[TreeNode, int] = {}
+
+    def _join(self, left: Any, right: Any) -> Any:
+        if right is _EMPTY:
+            return left
+        if left is _EMPTY:
+            return right
+        return self._merge(left, right)
+
+    def _build(self, node: TreeNode) -> Any:
+        # Compute the value of node from scratch, (re)building its fold.
+        children = node.children
+        if self._inverse is not None or len(children) <= self._wide:
+            self._folds.pop(node, None)
+            return self._compute(node)
+
+        values, positions, contribution = (
+            self.values,
+            self._positions,
+            self._contribution,
+        )
+        capacity = 1 << (len(children) - 1).bit_length()
+        fold = [_EMPTY] * (2 * capacity)
+        for position, child in enumerate(children):
+            fold[capacity + position] = contribution(values[child])
+            positions[child] = position
+        for index in range(capacity - 1, 0, -1):
+            fold[index] = self._join(fold[2 * index], fold[2 * index + 1])
+
+        self._folds[node] = fold
+        return self._finish(node, fold[1])
+
+    def _set_leaf(self, fold: list[Any], position: int, contribution: Any) -> None:
+        index = len(fold) // 2 + position
+        fold[index] = contribution
+        index //= 2
+        while index:
+            fold[index] = self._join(fold[2 * index], fold[2 * index + 1])
+            index //= 2
+
+    def _appended(self, parent: TreeNode, nodes: list[TreeNode]) -> Any:
+        # New value of parent after nodes were attached to it.
+        fold = self._folds.get(parent)
+        children = parent.children
+        first = len(children) - len(nodes)
+        if (
+            fold is None
+            or len(children) > len(fold) // 2
+            or any(child is not node for child, node in zip(children[first:], nodes))
+        ):
+            return self._build(parent)
+
+        values, positions, contribution = (
+            self.values,
+            self._positions,
+            self._contribution,
+        )
+        for position in range(first, len(children)):
+            child = children[position]
+            positions[child] = position
+            self._set_leaf(fold, position, contribution(values[child]))
+        return self._finish(parent, fold[1])
+
+    def _discard(self, node: TreeNode) -> None:
+        self.values.pop(node, None)
+        self._folds.pop(node, None)
+        self._positions.pop(node, None)
+
+    def _propagate(self, node: TreeNode, old: Any, new: Any) -> None:
+        values, folds, inverse = self.values, self._folds, self._inverse
+        contribution = self._contribution
+
+        while new != old:
+            values[node] = new
+            parent = node.parent
+            if parent is None or parent not in values:
+                return
+
+            parent_old = values[parent]
+            if inverse is not None:
+                parent_new = self._merge(
+                    inverse(parent_old, contribution(old)), contribution(new)
+                )
+            elif parent in folds:
+                fold = folds[parent]
+                self._set_leaf(fold, self._positions[node], contribution(new))
+                parent_new = self._finish(parent, fold[1])
+            else:
+                parent_new = self._compute(parent)
+            node, old, new = parent, parent_old, parent_new
+
+    def refresh(self, node: TreeNode) -> None:
+        """Recompute the value of ``node`` and propagate it to its ancestors."""
+        fold = self._folds.get(node)
+        new = self._compute(node) if fold is None else self._finish(node, fold[1])
+        self._propagate(node, self.values[node], new)
+
+    def nodes_attached(self, parent: TreeNode | None, nodes: list[TreeNode]) -> None:
+        values = self.values
+        for node in nodes:
+            for descendant in iter_post_order(node):
+                values[descendant] = self._build(descendant)
+
+        if parent is None:
+            return
+
+        old = values[parent]
+        if self._inverse is None:
+            new = self._appended(parent, nodes)
+        else:
+            new = old
+            for node in nodes:
+                new = self._merge(new, self._contribution(values[node]))
+        self._propagate(parent, old, new)
+
+    def node_removed(
+        self, node: TreeNode, parent: TreeNode, moved_children: list[TreeNode]
+    ) -> None:
+        values, contribution = self.values, self._contribution
+        old = values[parent]
+        if self._inverse is not None:
+            new = self._inverse(old, contribution(values[node]))
+            for child in moved_children:
+                new = self._merge(new, contribution(values[child]))
+
+        self._discard(node)
+        if self._inverse is None:
+            new = self._build(parent)
+        self._propagate(parent, old, new)
+
+    def subtree_detached(self, node: TreeNode, parent: TreeNode) -> None:
+        old = self.values[parent]
+        if self._inverse is not None:
+            new = self._inverse(old, self._contribution(self.values[node]))
+
+        for descendant in iter_post_order(node):
+            self._discard(descendant)
+        if self._inverse is None:
+            new = self._build(parent)
+        self._propagate(parent, old, new)
+
+
+class SubtreeAggregates(TreeObserver):
+    """
+    Observer caching an aggregate of every subtree of a tree.
+
+    The aggregate of a node is its own value combined, left to right, with
+    the lifted aggregates of its children::
+
+        aggregate(node) = combine(... combine(value(node), lift(aggregate(c1))) ...)
+
+    ``combine`` must be associative. After a node is added or removed, only
+    the aggregates on the path to the root are updated (see SubtreeFold),
+    and the update stops at the first ancestor whose aggregate did not
+    change. Without ``inverse`` an update costs O(depth * log degree)
+    combines; with it, O(depth). Queries are O(1).
+
+    Change node data with set_node_data, or call ``refresh`` on a node after
+    changing its data directly.
+
+    Args:
+        value (Callable[[TreeNode], Any]): The value of a single node
+        combine (Callable[[Any, Any], Any]): Associative combine
+        lift (Callable[[Any], Any] | None): Applied to a child's aggregate
+            before it is combined into its parent's
+        inverse (Callable[[Any, Any], Any] | None): For a commutative
+            combine, undoes it: ``inverse(combine(a, b), b) == a``. Float
+            sums updated this way can drift by rounding errors.
+
+    Example:
+        >>> root = create_root_with_children_data_list(1, [2, 3])
+        >>> sums = track_subtree_sums(root)
+        >>> add_child_node(root.children_nodes[0], 4)
+        >>> print(sums[root])  # 10
+    """
+
+    def __init__(
+        self,
+        value: Callable[[TreeNode], Any],
+        combine: Callable[[Any, Any], Any],
+        lift: Callable[[Any], Any] | None = None,
+        inverse: Callable[[Any, Any], Any] | None = None,
+    ):
+        self._value = value
+        self._combine = combine
+        self._lift = lift
+        self._fold = SubtreeFold(
+            self._compute, lift or _identity, combine, self._finish, inverse
+        )
+
+    def __getitem__(self, node: TreeNode) -> Any:
+        """Return the aggregate of the subtree rooted at ``node``."""
+        return self._fold.values[node]
+
+    def __contains__(self, node: TreeNode) -> bool:
+        return node in self._fold.values
+
+    def refresh(self, node: TreeNode) -> None:
+        """Recompute the aggregates of ``node`` and its ancestors."""
+        self._fold.refresh(node)
+
+    def _compute(self, node: TreeNode) -> Any:
+        aggregates, combine, lift = self._fold.values, self._combine, self._lift
+        result = self._value(node)
+
+        for child in node.children:
+            child_aggregate = aggregates[child]
+            if lift is not None:
+                child_aggregate = lift(child_aggregate)
+            result = combine(result, child_aggregate)
+
+        return result
+
+    def _finish(self, node: TreeNode, children_aggregate: Any) -> Any:
+        return self._combine(self._value(node), children_aggregate)
+
+    def nodes_attached(self, parent: TreeNode | None, nodes: list[TreeNode]) -> None:
+        self._fold.nodes_attached(parent, nodes)
+
+    def node_removed(
+        self, node: TreeNode, parent: TreeNode, moved_children: list[TreeNode]
+    ) -> None:
+        self._fold.node_removed(node, parent, moved_children)
+
+    def subtree_detached(self, node: TreeNode, parent: TreeNode) -> None:
+        self._fold.subtree_detached(node, parent)
+
+    def node_relabeled(self, node: TreeNode, old_data: Any) -> None:
+        self._fold.refresh(node)
+
+
+def track_subtree_sizes(root: TreeNode) -> SubtreeAggregates:
+    """
+    Cache the number of nodes in every subtree of the tree rooted at ``root``.
+
+    Example:
+        >>> root = create_root_with_children_data_list("a", ["b"])
+        >>> sizes = track_subtree_sizes(root)
+        >>> print(sizes[root])  # 2
+    """
+    return register_observer(
+        root, SubtreeAggregates(lambda node: 1, operator.add, inverse=operator.sub)
+    )
+
+
+def track_subtree_heights(root: TreeNode) -> SubtreeAggregates:
+    """
+    Cache the height of every subtree (edges on its longest downward path).
+
+    Example:
+        >>> root = create_root_with_children_data_list("a", ["b"])
+        >>> heights = track_subtree_heights(root)
+        >>> print(heights[root])  # 1
+    """
+    return register_observer(
+        root, SubtreeAggregates(lambda node: 0, max, lambda height: height + 1)
+    )
+
+
+def track_subtree_sums(
+    root: TreeNode, key: Callable[[Any], Any] | None = None
+) -> SubtreeAggregates:
+    """
+    Cache the sum of the node data (or of ``key(data)``) over every subtree.
+
+    Example:
+        >>> root = create_root_with_children_data_list(1, [2, 3])
+        >>> sums = track_subtree_sums(root)
+        >>> print(sums[root])  # 6
+    """
+    value: Callable[[TreeNode], Any]
+    if key is None:
+        value = operator.attrgetter("data")
+    else:
+
+        def value(node: TreeNode) -> Any:
+            return key(node.data)
+
+    return register_observer(
+        root, SubtreeAggregates(value, operator.add, inverse=operator.sub)
+    )
@@ -0,0 +1,344 @@
+"""
+Observers that keep per-tree side structures in sync with an n-ary tree.
+
+Every node of an observed tree shares one ``observers`` list. The functions in
+n_ary_tree_operations notify the observers after each structural change, so
+an observer such as ValueIndex never has to rescan the tree.
+"""
+
+from typing import Any, Iterable, Iterator, TypeVar, cast
+
+from ..tree_node import TreeNode
+
+
+def _iter_subtree(node: TreeNode) -> Iterator[TreeNode]:
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        children = node.children
+        if children:
+            stack.extend(reversed(children))
+
+
+class TreeObserver:
+    """
+    Base class for objects notified of structural changes to a tree.
+
+    Subclasses override the events they care about; the default
+    implementations do nothing.
+    """
+
+    def nodes_attached(self, parent: TreeNode | None, nodes: list[TreeNode]) -> None:
+        """
+        Called after ``nodes`` (and their subtrees) were attached to ``parent``.
+
+        ``parent`` is None when the observer is registered, in which case
+        ``nodes`` holds the root of the tree.
+        """
+
+    def node_removed(
+        self, node: TreeNode, parent: TreeNode, moved_children: list[TreeNode]
+    ) -> None:
+        """
+        Called after ``node`` was removed and its children moved to ``parent``.
+
+        Nodes removed together are reported in pre-order as if removed one
+        at a time: ``moved_children`` are the children ``node`` had before
+        the removal, so each moved node is reported once.
+        """
+
+    def subtree_detached(self, node: TreeNode, parent: TreeNode) -> None:
+        """
+        Called after the subtree rooted at ``node`` was detached from ``parent``.
+
+        The subtree is still intact, so the observer can walk it.
+        """
+
+    def node_relabeled(self, node: TreeNode, old_data: Any) -> None:
+        """Called after the data of ``node`` was changed from ``old_data``."""
+
+
+ObserverT = TypeVar("ObserverT", bound=TreeObserver)
+
+
+def register_observer(root: TreeNode, observer: ObserverT) -> ObserverT:
+    """
+    Start notifying ``observer`` of every change to the tree rooted at ``root``.
+
+    The observer immediately receives a nodes_attached event for the whole
+    tree, so it can build its initial state.
+
+    Args:
+        root (TreeNode): The root of the tree to observe
+        observer (TreeObserver): The observer to register
+
+    Returns:
+        TreeObserver: The registered observer
+
+    Raises:
+        ValueError: If root is None or is not the root of its tree
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", ["a", "b"])
+        >>> index = register_observer(root, ValueIndex())
+        >>> print(index.first("b", root).data)  # "b"
+    """
+    if root is None:
+        raise ValueError("Root node cannot be None")
+    if root.parent is not None:
+        raise ValueError("Observers must be registered on the root of the tree")
+
+    observers = root.observers
+    if observers is None:
+        observers = []
+        for node in _iter_subtree(root):
+            node.observers = observers
+
+    observers.append(observer)
+    observer.nodes_attached(None, [root])
+    return observer
+
+
+def unregister_observer(root: TreeNode, observer: TreeObserver) -> None:
+    """
+    Stop notifying ``observer`` of changes to the tree rooted at ``root``.
+
+    Raises:
+        ValueError: If the observer is not registered on the tree
+    """
+    if root is None or not root.observers or observer not in root.observers:
+        raise ValueError("Observer is not registered on this tree")
+
+    root.observers.remove(observer)
+
+
+def find_observer(node: TreeNode | None, observer_type: type) -> Any:
+    """
+    Return the first observer of ``observer_type`` on the tree holding ``node``.
+
+    Returns:
+        The observer, or None if the tree has no such observer
+    """
+    if node is None or not node.observers:
+        return None
+
+    for observer in node.observers:
+        if isinstance(observer, observer_type):
+            return observer
+
+    return None
+
+
+def notify_nodes_attached(parent: TreeNode, nodes: list[TreeNode]) -> None:
+    """Share the parent's observers with ``nodes`` and notify the observers."""
+    observers = parent.observers
+    if not observers or not nodes:
+        return
+
+    for node in nodes:
+        for descendant in _iter_subtree(node):
+            descendant.observers = observers
+
+    for observer in observers:
+        observer.nodes_attached(parent, nodes)
+
+
+def notify_node_removed(
+    node: TreeNode, parent: TreeNode, moved_children: list[TreeNode]
+) -> None:
+    """Notify the observers of a removed node and detach it from them."""
+    observers = node.observers
+    if not observers:
+        return
+
+    node.observers = None
+    for observer in observers:
+        observer.node_removed(node, parent, moved_children)
+
+
+def notify_subtree_detached(node: TreeNode, parent: TreeNode) -> None:
+    """Notify the observers of a detached subtree and detach it from them."""
+    observers = node.observers
+    if not observers:
+        return
+
+    for descendant in _iter_subtree(node):
+        descendant.observers = None
+    for observer in observers:
+        observer.subtree_detached(node, parent)
+
+
+def notify_node_relabeled(node: TreeNode, old_data: Any) -> None:
+    """Notify the observers that the data of ``node`` changed."""
+    for observer in node.observers or ():
+        observer.node_relabeled(node, old_data)
+
+
+def _depth_below(node: TreeNode, root: TreeNode) -> int:
+    depth = 0
+    while node is not root:
+        node = cast(TreeNode, node.parent)
+        depth += 1
+    return depth
+
+
+def _first_in_pre_order(candidates: list[TreeNode], root: TreeNode) -> TreeNode:
+    # Mark every node on the paths from the candidates up to root, then walk
+    # down from root, always into the first marked child. Pre-order visits a
+    # node before its subtree and subtrees left to right, so the first
+    # candidate met this way is the one a traversal would find first.
+    targets = {id(node) for node in candidates}
+    marked: set[int] = set()
+    for node in candidates:
+        while node is not root and id(node) not in marked:
+            marked.add(id(node))
+            node = cast(TreeNode, node.parent)
+
+    node = root
+    while id(node) not in targets:
+        node = next(child for child in node.children if id(child) in marked)
+    return node
+
+
+def _in_pre_order(nodes: list[TreeNode], root: TreeNode) -> list[TreeNode]:
+    # Sort nodes from the subtree of root into pre-order. Like
+    # _first_in_pre_order, only the marked paths down to the nodes are
+    # walked, so the cost does not grow with the rest of the tree.
+    targets = {id(node) for node in nodes}
+    marked: set[int] = set()
+    for node in nodes:
+        while node is not root and id(node) not in marked:
+            marked.add(id(node))
+            node = cast(TreeNode, node.parent)
+
+    ordered = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in targets:
+            ordered.append(node)
+        stack.extend(child for child in reversed(node.children) if id(child) in marked)
+    return ordered
+
+
+def _is_descendant(node: TreeNode | None, ancestor: TreeNode) -> bool:
+    while node is not None:
+        if node is ancestor:
+            return True
+        node = node.parent
+    return False
+
+
+class ValueIndex(TreeObserver):
+    """
+    Index from node value to the nodes holding it.
+
+    Lookups are O(1) on average. When several nodes hold the same value,
+    ``first`` returns the node a full traversal would have found first, so
+    indexed and unindexed searches always agree. Resolving duplicates costs
+    O(depth) per candidate, plus one scan of the children along the path to
+    the answer, up to the child leading to it. Indexed trees need hashable
+    node values, and node values must only be changed with set_node_data.
+    """
+
+    def __init__(self):
+        self._nodes: dict[Any, list[TreeNode]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(nodes) for nodes in self._nodes.values())
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            return value in self._nodes
+        except TypeError:
+            return False
+
+    def nodes(self, value: Any) -> list[TreeNode]:
+        """Return every indexed node holding ``value``, in no particular order."""
+        try:
+            return list(self._nodes.get(value, ()))
+        except TypeError:
+            return []
+
+    def nodes_under(self, values: Iterable[Any], root: TreeNode) -> list[TreeNode]:
+        """
+        Return every node in the subtree of ``root``, root included, holding
+        one of ``values``, in no particular order.
+        """
+        found: dict[int, TreeNode] = {}
+        for value in values:
+            for node in self.nodes(value):
+                found[id(node)] = node
+
+        nodes = list(found.values())
+        if root.parent is not None:
+            nodes = [node for node in nodes if _is_descendant(node, root)]
+        return nodes
+
+    def first(
+        self, value: Any, root: TreeNode, breadth_first: bool = False
+    ) -> TreeNode | None:
+        """
+        Return the first node under ``root`` holding ``value``.
+
+        Args:
+            value (Any): The value to look up
+            root (TreeNode): The node whose subtree is searched
+            breadth_first (bool): Resolve duplicates in level order instead
+                of pre-order
+
+        Returns:
+            TreeNode | None: The matching node, or None if there is none
+        """
+        try:
+            candidates = self._nodes.get(value)
+        except TypeError:
+            return None  # Unhashable values can never be in the index
+
+        if not candidates:
+            return None
+
+        if root.parent is not None:
+            candidates = [node for node in candidates if _is_descendant(node, root)]
+            if not candidates:
+                return None
+
+        if len(candidates) == 1:
+            return candidates[0]
+
+        if breadth_first:
+            # Level order visits shallower nodes first and, within a level,
+            # nodes in pre-order.
+            depths = [_depth_below(node, root) for node in candidates]
+            shallowest = min(depths)
+            candidates = [
+                node for node, depth in zip(candidates, depths) if depth == shallowest
+            ]
+
+        return _first_in_pre_order(candidates, root)
+
+    def nodes_attached(self, parent: TreeNode | None, nodes: list[TreeNode]) -> None:
+        index = self._nodes
+        for node in nodes:
+            for descendant in _iter_subtree(node):
+                index.setdefault(descendant.data, []).append(descendant)
+
+    def node_removed(
+        self, node: TreeNode, parent: TreeNode, moved_children: list[TreeNode]
+    ) -> None:
+        self._remove(node, node.data)
+
+    def subtree_detached(self, node: TreeNode, parent: TreeNode) -> None:
+        for descendant in _iter_subtree(node):
+            self._remove(descendant, descendant.data)
+
+    def node_relabeled(self, node: TreeNode, old_data: Any) -> None:
+        self._remove(node, old_data)
+        self._nodes.setdefault(node.data, []).append(node)
+
+    def _remove(self, node: TreeNode, value: Any) -> None:
+        nodes = self._nodes[value]
+        nodes.remove(node)
+        if not nodes:
+            del self._nodes[value]
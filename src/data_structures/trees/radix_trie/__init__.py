@@ -0,0 +1,4 @@
+"""
+Compressed radix trie (Patricia tree): a str- or bytes-keyed map with
+longest-prefix matching and sorted prefix iteration.
+"""
@@ -0,0 +1,116 @@
+from typing import Any, Iterator
+
+Key = str | bytes
+
+
+class RadixTrieNode:
+    """
+    Node of a radix trie, reached from its parent by a multi-character edge.
+
+    The edge label is not copied out of the key that created it: it is
+    ``key[start:end]``, a slice of that key kept as a reference and two
+    offsets. The nodes along a key's path share the same key object, and
+    ``key[:end]`` is always the full path from the root to the node, even
+    after edges are split or merged. ``children`` maps the first character
+    of every child edge (an int for bytes keys) to the child, and is None on
+    leaves.
+    """
+
+    __slots__ = ("key", "start", "end", "children", "value", "is_key")
+
+    def __init__(self, key: Key, start: int, end: int):
+        # Any rather than Key: the edges are compared with slices of the
+        # looked-up key, which is of the same type, but mypy cannot tell.
+        self.key: Any = key
+        self.start = start
+        self.end = end
+        self.children: dict[Any, RadixTrieNode] | None = None
+        self.value: Any = None
+        self.is_key = False
+
+    @property
+    def label(self) -> Key:
+        """The edge label from the parent, copied out of the shared key."""
+        return self.key[self.start : self.end]
+
+
+class RadixTrie:
+    """
+    Map from str or bytes keys to values, with the keys of a trie all of one
+    type.
+
+    Every internal node other than the root branches or ends a key, so the
+    trie has at most 2n nodes for n keys and a lookup follows at most
+    len(key) edges. The empty key is allowed and lives at the root.
+    Iteration yields the keys in sorted order.
+
+    Attributes:
+        root (RadixTrieNode | None): The root node, created by the first
+            insert
+        size (int): The number of keys
+
+    Example:
+        >>> trie = create_radix_trie()
+        >>> radix_insert(trie, "10", "A")
+        >>> print(radix_longest_prefix(trie, "1011"))  # ("10", "A")
+    """
+
+    __slots__ = ("root", "size")
+
+    def __init__(self):
+        self.root: RadixTrieNode | None = None
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    def __contains__(self, key: Any) -> bool:
+        node = _find(self, key)
+        return node is not None and node.is_key
+
+    def __iter__(self) -> Iterator[Key]:
+        if self.root is None:
+            return iter(())
+        return _iter_keys(self.root)
+
+
+def _find(trie: RadixTrie, key: Any) -> RadixTrieNode | None:
+    # The node whose path is exactly key, whether or not a key ends there.
+    node = trie.root
+    if node is None or not isinstance(key, type(node.key)):
+        return None
+
+    i, size = 0, len(key)
+    while i < size:
+        children = node.children
+        if children is None:
+            return None
+        node = children.get(key[i])
+        if node is None:
+            return None
+        # The dict lookup matched the first character of the edge.
+        start = node.start
+        length = node.end - start
+        if length > 1 and (
+            size - i < length
+            or not node.key.startswith(key[i + 1 : i + length], start + 1)
+        ):
+            return None
+        i += length
+    return node
+
+
+def _iter_keys(node: RadixTrieNode) -> Iterator[Key]:
+    # Pre-order walk of the subtree at node, children by first character,
+    # which is sorted order since a key sorts before its extensions.
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.is_key:
+            yield node.key[: node.end]
+        children = node.children
+        if children:
+            stack.extend(children[first] for first in sorted(children, reverse=True))
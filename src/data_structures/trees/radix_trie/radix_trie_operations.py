@@ -0,0 +1,286 @@
+from typing import Any, Iterator, cast
+
+from .radix_trie import Key, RadixTrie, RadixTrieNode, _find, _iter_keys
+
+
+def _check_key(trie: RadixTrie, key: Any) -> None:
+    if not isinstance(key, (str, bytes)):
+        raise ValueError("Keys must be str or bytes")
+    if trie.root is not None and not isinstance(key, type(trie.root.key)):
+        raise ValueError("Keys of one trie must all be str or all be bytes")
+
+
+def _common_length(key: Key, i: int, node: RadixTrieNode) -> int:
+    # Length of the common prefix of key[i:] and the node's edge label; the
+    # first characters are known to match.
+    source, start = node.key, node.start
+    limit = min(len(key) - i, node.end - start)
+    length = 1
+    while length < limit and key[i + length] == source[start + length]:
+        length += 1
+    return length
+
+
+def _merge_with_child(parent: RadixTrieNode, node: RadixTrieNode) -> None:
+    # Replace node, which has no key and one child, by that child. The
+    # child's key runs through node's edge, so its edge just starts earlier.
+    (child,) = cast(dict[Any, RadixTrieNode], node.children).values()
+    child.start -= node.end - node.start
+    cast(dict[Any, RadixTrieNode], parent.children)[child.key[child.start]] = child
+
+
+def create_radix_trie() -> RadixTrie:
+    """
+    Create an empty radix trie.
+
+    Example:
+        >>> trie = create_radix_trie()
+        >>> print(len(trie))  # 0
+    """
+    return RadixTrie()
+
+
+def radix_insert(trie: RadixTrie, key: Key, value: Any = None) -> RadixTrieNode:
+    """
+    Insert ``key``, or replace its value if it exists.
+
+    At most one edge is split and one node is created. The new node's edge
+    label refers to ``key`` rather than a copy of it.
+
+    Args:
+        trie (RadixTrie): The trie
+        key (str | bytes): The key, of the same type as the trie's other keys
+        value (Any): The value to map the key to
+
+    Returns:
+        RadixTrieNode: The node where the key ends
+
+    Raises:
+        ValueError: If trie is None, or key is not str or bytes or not of
+            the type of the trie's keys
+
+    Example:
+        >>> trie = create_radix_trie()
+        >>> radix_insert(trie, b"\\x0a\\x00", "ten")
+        >>> print(radix_get(trie, b"\\x0a\\x00"))  # "ten"
+    """
+    if trie is None:
+        raise ValueError("Trie cannot be None")
+    _check_key(trie, key)
+
+    node = trie.root
+    if node is None:
+        node = trie.root = RadixTrieNode(key[:0], 0, 0)
+
+    i, size = 0, len(key)
+    while i < size:
+        children = node.children
+        if children is None:
+            children = node.children = {}
+        first = key[i]
+        child = children.get(first)
+        if child is None:
+            node = children[first] = RadixTrieNode(key, i, size)
+            break
+
+        start = child.start
+        length = child.end - start
+        if length == 1 or (
+            size - i >= length
+            and child.key.startswith(key[i + 1 : i + length], start + 1)
+        ):
+            node = child
+            i += length
+            continue
+
+        # Split the edge where key leaves it. The upper half keeps referring
+        # to the child's key, whose path runs through it.
+        common = _common_length(key, i, child)
+        middle = RadixTrieNode(child.key, start, start + common)
+        child.start = start + common
+        middle.children = {child.key[child.start]: child}
+        node = children[first] = middle
+        i += common
+
+    if not node.is_key:
+        node.is_key = True
+        trie.size += 1
+    node.value = value
+    return node
+
+
+def radix_search(trie: RadixTrie, key: Key) -> RadixTrieNode | None:
+    """Return the node where ``key`` ends, or None if the key is absent."""
+    node = _find(trie, key)
+    return node if node is not None and node.is_key else None
+
+
+def radix_get(trie: RadixTrie, key: Key, default: Any = None) -> Any:
+    """
+    Return the value of ``key``, or ``default`` if the key is absent.
+
+    Example:
+        >>> trie = create_radix_trie()
+        >>> radix_insert(trie, "car", 1)
+        >>> print(radix_get(trie, "car"), radix_get(trie, "ca"))  # 1 None
+    """
+    node = radix_search(trie, key)
+    return node.value if node is not None else default
+
+
+def radix_delete(trie: RadixTrie, key: Key) -> bool:
+    """
+    Remove ``key`` and merge the edges no other key needs apart.
+
+    Returns:
+        bool: True if the key was present
+
+    Raises:
+        ValueError: If trie is None
+
+    Example:
+        >>> trie = create_radix_trie()
+        >>> radix_insert(trie, "car")
+        >>> radix_insert(trie, "cart")
+        >>> print(radix_delete(trie, "car"), list(trie))  # True ["cart"]
+    """
+    if trie is None:
+        raise ValueError("Trie cannot be None")
+
+    node = trie.root
+    if node is None or not isinstance(key, type(node.key)):
+        return False
+
+    # Walk down like _find, remembering the last two nodes above.
+    grandparent = parent = None
+    i, size = 0, len(key)
+    while i < size:
+        children = node.children
+        child = children.get(key[i]) if children is not None else None
+        if child is None:
+            return False
+        start = child.start
+        length = child.end - start
+        if length > 1 and (
+            size - i < length
+            or not child.key.startswith(key[i + 1 : i + length], start + 1)
+        ):
+            return False
+        grandparent, parent, node = parent, node, child
+        i += length
+
+    if not node.is_key:
+        return False
+    node.is_key = False
+    node.value = None
+    trie.size -= 1
+
+    if parent is None:
+        return True
+    children = node.children
+    if children is None:
+        siblings = cast(dict[Any, RadixTrieNode], parent.children)
+        del siblings[node.key[node.start]]
+        if not siblings:
+            parent.children = None
+        elif grandparent is not None and not parent.is_key:
+            if len(siblings) == 1:
+                _merge_with_child(grandparent, parent)
+    elif len(children) == 1:
+        _merge_with_child(parent, node)
+    return True
+
+
+def radix_longest_prefix(
+    trie: RadixTrie, key: Key, default: Any = None
+) -> tuple[Key, Any] | Any:
+    """
+    Return the longest key of the trie that is a prefix of ``key``.
+
+    This is the lookup of a routing table: with network prefixes as keys,
+    the longest prefix of an address is its most specific route. It follows
+    at most one edge per character of the result.
+
+    Args:
+        trie (RadixTrie): The trie
+        key (str | bytes): The key to match
+        default (Any): Returned when no key is a prefix of ``key``
+
+    Returns:
+        tuple[str | bytes, Any] | Any: The matching key and its value, or
+            ``default``
+
+    Example:
+        >>> trie = create_radix_trie()
+        >>> radix_insert(trie, "10", "A")
+        >>> radix_insert(trie, "1011", "B")
+        >>> print(radix_longest_prefix(trie, "1010"))  # ("10", "A")
+    """
+    node = trie.root
+    if node is None or not isinstance(key, type(node.key)):
+        return default
+
+    best, best_length = (node, 0) if node.is_key else (None, 0)
+    i, size = 0, len(key)
+    while i < size:
+        children = node.children
+        if children is None:
+            break
+        node = children.get(key[i])
+        if node is None:
+            break
+        start = node.start
+        length = node.end - start
+        if length > 1 and (
+            size - i < length
+            or not node.key.startswith(key[i + 1 : i + length], start + 1)
+        ):
+            break
+        i += length
+        if node.is_key:
+            best, best_length = node, i
+
+    if best is None:
+        return default
+    return key[:best_length], best.value
+
+
+def radix_iter_prefix(trie: RadixTrie, prefix: Key) -> Iterator[Key]:
+    """
+    Lazily yield the keys starting with ``prefix``, in sorted order.
+
+    Args:
+        trie (RadixTrie): The trie
+        prefix (str | bytes): The prefix; an empty prefix yields every key
+
+    Yields:
+        str | bytes: The matching keys
+
+    Example:
+        >>> trie = create_radix_trie()
+        >>> for word in ["cart", "car", "dog"]:
+        ...     radix_insert(trie, word)
+        >>> print(list(radix_iter_prefix(trie, "ca")))  # ["car", "cart"]
+    """
+    node = trie.root
+    if node is None or not isinstance(prefix, type(node.key)):
+        return
+
+    i, size = 0, len(prefix)
+    while i < size:
+        children = node.children
+        if children is None:
+            return
+        node = children.get(prefix[i])
+        if node is None:
+            return
+        start = node.start
+        length = node.end - start
+        # The prefix may end inside the edge; every key below still matches.
+        if length > 1 and not node.key.startswith(
+            prefix[i + 1 : i + length], start + 1
+        ):
+            return
+        i += length
+
+    yield from _iter_keys(node)
@@ -0,0 +1,5 @@
+"""
+Array-backed segment tree with lazy range updates.
+
+The modules in this package need NumPy (``poetry install --extras numeric``).
+"""
@@ -0,0 +1,84 @@
+try:
+    import numpy as np
+except ImportError as error:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "SegmentTree needs NumPy; install it with `poetry install --extras numeric`"
+    ) from error
+
+
+class SegmentTree:
+    """
+    Segment tree over a fixed-length array, stored in flat NumPy arrays.
+
+    The tree is a perfect binary tree in heap order: node 1 is the root, the
+    children of node ``i`` are ``2i`` and ``2i + 1``, and position ``p`` of
+    the array is the leaf ``capacity + p``. ``capacity`` is the smallest
+    power of two holding the values; the leaves past the end are padding
+    that never takes part in a query.
+
+    Every node stores the sum, minimum and maximum of its leaves. A range
+    update that covers a node entirely updates the node's aggregates and
+    leaves a lazy tag for its children: either "assign ``assign_values[i]``"
+    (when ``assigned[i]``) or "add ``additions[i]``". Tags are pushed to the
+    children when a later operation needs to go below the node, so an
+    update never touches more than O(log n) nodes.
+
+    Attributes:
+        size (int): The number of values
+        capacity (int): The number of leaves, a power of two
+        counts (np.ndarray): Number of real (non-padding) leaves under every
+            node
+        sums (np.ndarray): Sum of every node's leaves
+        minima (np.ndarray): Minimum of every node's leaves
+        maxima (np.ndarray): Maximum of every node's leaves
+        assigned (np.ndarray): Whether every internal node has a pending
+            assignment
+        assign_values (np.ndarray): The value of pending assignments
+        additions (np.ndarray): Pending additions of internal nodes without
+            an assignment
+    """
+
+    __slots__ = (
+        "size",
+        "capacity",
+        "counts",
+        "sums",
+        "minima",
+        "maxima",
+        "assigned",
+        "assign_values",
+        "additions",
+    )
+
+    def __init__(self, size: int, dtype: np.dtype):
+        capacity = 1 << max(size - 1, 0).bit_length()
+        self.size = size
+        self.capacity = capacity
+
+        counts = np.zeros(2 * capacity, dtype=np.int64)
+        counts[capacity : capacity + size] = 1
+        level = capacity
+        while level > 1:
+            counts[level // 2 : level] = counts[level : 2 * level : 2]
+            counts[level // 2 : level] += counts[level + 1 : 2 * level : 2]
+            level //= 2
+        self.counts = counts
+
+        # Padding leaves hold the identities of min and max, so that the
+        # aggregates of the nodes above them are unaffected.
+        highest: float
+        lowest: float
+        if np.issubdtype(dtype, np.integer):
+            highest, lowest = np.iinfo(dtype).max, np.iinfo(dtype).min
+        else:
+            highest, lowest = np.inf, -np.inf
+        self.sums = np.zeros(2 * capacity, dtype=dtype)
+        self.minima = np.full(2 * capacity, highest, dtype=dtype)
+        self.maxima = np.full(2 * capacity, lowest, dtype=dtype)
+
+        self.assigned = np.zeros(capacity, dtype=bool)
+        self.assign_values = np.zeros(capacity, dtype=dtype)
+        self.additions = np.zeros(capacity, dtype=dtype)
+
+    def __len__(self) -> int:
+        return self.size
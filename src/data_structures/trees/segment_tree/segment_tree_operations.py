@@ -0,0 +1,475 @@
+from typing import Any
+
+from .segment_tree import SegmentTree, np
+
+
+def _rebuild(tree: SegmentTree, values: np.ndarray) -> None:
+    # Store values in the leaves, recompute every internal node level by
+    # level and drop the pending tags, in O(n).
+    capacity, size = tree.capacity, tree.size
+    sums, minima, maxima = tree.sums, tree.minima, tree.maxima
+    sums[capacity : capacity + size] = values
+    minima[capacity : capacity + size] = values
+    maxima[capacity : capacity + size] = values
+
+    level = capacity
+    while level > 1:
+        parents = slice(level // 2, level)
+        left, right = slice(level, 2 * level, 2), slice(level + 1, 2 * level, 2)
+        np.add(sums[left], sums[right], out=sums[parents])
+        np.minimum(minima[left], minima[right], out=minima[parents])
+        np.maximum(maxima[left], maxima[right], out=maxima[parents])
+        level //= 2
+
+    tree.assigned[:] = False
+    tree.additions[:] = 0
+
+
+def create_segment_tree(values: Any, dtype: Any = None) -> SegmentTree:
+    """
+    Build a segment tree over ``values`` in O(n).
+
+    Args:
+        values (Any): Non-empty one-dimensional array-like of numbers
+        dtype (Any): NumPy dtype of the tree; defaults to the dtype NumPy
+            infers for values. Sums are computed in this dtype, so integer
+            sums can overflow
+
+    Returns:
+        SegmentTree: The tree
+
+    Raises:
+        ValueError: If values is empty, not one-dimensional or not numeric
+
+    Example:
+        >>> tree = create_segment_tree([5, 1, 4, 2])
+        >>> print(segment_tree_sum(tree, 1, 3))  # 5
+    """
+    values = np.asarray(values, dtype=dtype)
+    if values.ndim != 1 or len(values) == 0:
+        raise ValueError("Values must be a non-empty one-dimensional array")
+    if values.dtype == bool or not np.issubdtype(values.dtype, np.number):
+        raise ValueError("Values must be numbers")
+
+    tree = SegmentTree(len(values), values.dtype)
+    _rebuild(tree, values)
+    return tree
+
+
+def _check_range(tree: SegmentTree, low: int, high: int) -> None:
+    if not 0 <= low < high <= tree.size:
+        raise ValueError(f"Range [{low}, {high}) is empty or out of bounds")
+
+
+def _assign_node(tree: SegmentTree, node: int, value: Any) -> None:
+    tree.sums[node] = value * tree.counts[node]
+    tree.minima[node] = tree.maxima[node] = value
+    if node < tree.capacity:
+        tree.assigned[node] = True
+        tree.assign_values[node] = value
+        tree.additions[node] = 0
+
+
+def _add_node(tree: SegmentTree, node: int, delta: Any) -> None:
+    tree.sums[node] += delta * tree.counts[node]
+    tree.minima[node] += delta
+    tree.maxima[node] += delta
+    if node < tree.capacity:
+        if tree.assigned[node]:
+            tree.assign_values[node] += delta
+        else:
+            tree.additions[node] += delta
+
+
+def _push(tree: SegmentTree, node: int) -> None:
+    # Hand the tag of an internal node over to its children.
+    left = 2 * node
+    if tree.assigned[node]:
+        value = tree.assign_values[node]
+        _assign_node(tree, left, value)
+        _assign_node(tree, left + 1, value)
+        tree.assigned[node] = False
+    else:
+        delta = tree.additions[node]
+        if delta:
+            _add_node(tree, left, delta)
+            _add_node(tree, left + 1, delta)
+            tree.additions[node] = 0
+
+
+def _pull(tree: SegmentTree, node: int) -> None:
+    left, right = 2 * node, 2 * node + 1
+    sums, minima, maxima = tree.sums, tree.minima, tree.maxima
+    sums[node] = sums[left] + sums[right]
+    minima[node] = min(minima[left], minima[right])
+    maxima[node] = max(maxima[left], maxima[right])
+
+
+def _decompose(tree: SegmentTree, low: int, high: int) -> tuple[list[int], list[int]]:
+    # The O(log n) nodes covering [low, high) exactly, and the nodes above
+    # them that the range covers partially. Tags of the partial nodes are
+    # pushed down, so the covering nodes hold current aggregates. Partial
+    # nodes are listed parents first.
+    covering, partial = [], []
+    stack = [(1, 0, tree.capacity)]
+    while stack:
+        node, node_low, node_high = stack.pop()
+        if high <= node_low or node_high <= low:
+            continue
+        if low <= node_low and node_high <= high:
+            covering.append(node)
+            continue
+        _push(tree, node)
+        partial.append(node)
+        middle = (node_low + node_high) // 2
+        stack.append((2 * node + 1, middle, node_high))
+        stack.append((2 * node, node_low, middle))
+    return covering, partial
+
+
+def segment_tree_sum(tree: SegmentTree, low: int, high: int) -> Any:
+    """
+    Return the sum of the values at positions ``low <= i < high``.
+
+    Args:
+        tree (SegmentTree): The tree
+        low (int): The first position of the range
+        high (int): One past the last position of the range
+
+    Returns:
+        Any: The sum, as a Python number
+
+    Raises:
+        ValueError: If the range is empty or out of bounds
+
+    Example:
+        >>> tree = create_segment_tree([5, 1, 4, 2])
+        >>> print(segment_tree_sum(tree, 0, 4))  # 12
+    """
+    _check_range(tree, low, high)
+    covering, _ = _decompose(tree, low, high)
+    return tree.sums[covering].sum().item()
+
+
+def segment_tree_min(tree: SegmentTree, low: int, high: int) -> Any:
+    """
+    Return the smallest value at positions ``low <= i < high``.
+
+    Example:
+        >>> tree = create_segment_tree([5, 1, 4, 2])
+        >>> print(segment_tree_min(tree, 2, 4))  # 2
+    """
+    _check_range(tree, low, high)
+    covering, _ = _decompose(tree, low, high)
+    return tree.minima[covering].min().item()
+
+
+def segment_tree_max(tree: SegmentTree, low: int, high: int) -> Any:
+    """
+    Return the largest value at positions ``low <= i < high``.
+
+    Example:
+        >>> tree = create_segment_tree([5, 1, 4, 2])
+        >>> print(segment_tree_max(tree, 1, 3))  # 4
+    """
+    _check_range(tree, low, high)
+    covering, _ = _decompose(tree, low, high)
+    return tree.maxima[covering].max().item()
+
+
+def segment_tree_assign(tree: SegmentTree, low: int, high: int, value: Any) -> None:
+    """
+    Set every position ``low <= i < high`` to ``value`` in O(log n).
+
+    Args:
+        tree (SegmentTree): The tree
+        low (int): The first position of the range
+        high (int): One past the last position of the range
+        value (Any): The new value, cast to the tree's dtype
+
+    Raises:
+        ValueError: If the range is empty or out of bounds
+
+    Example:
+        >>> tree = create_segment_tree([5, 1, 4, 2])
+        >>> segment_tree_assign(tree, 0, 3, 7)
+        >>> print(segment_tree_sum(tree, 0, 4))  # 23
+    """
+    _check_range(tree, low, high)
+    value = tree.sums.dtype.type(value)
+    covering, partial = _decompose(tree, low, high)
+    for node in covering:
+        _assign_node(tree, node, value)
+    for node in reversed(partial):
+        _pull(tree, node)
+
+
+def segment_tree_add(tree: SegmentTree, low: int, high: int, delta: Any) -> None:
+    """
+    Add ``delta`` to every position ``low <= i < high`` in O(log n).
+
+    Example:
+        >>> tree = create_segment_tree([5, 1, 4, 2])
+        >>> segment_tree_add(tree, 1, 4, 10)
+        >>> print(segment_tree_min(tree, 0, 4))  # 5
+    """
+    _check_range(tree, low, high)
+    delta = tree.sums.dtype.type(delta)
+    covering, partial = _decompose(tree, low, high)
+    for node in covering:
+        _add_node(tree, node, delta)
+    for node in reversed(partial):
+        _pull(tree, node)
+
+
+def _range_arrays(
+    tree: SegmentTree, lows: Any, highs: Any
+) -> tuple[np.ndarray, np.ndarray]:
+    lows = np.asarray(lows, dtype=np.int64)
+    highs = np.asarray(highs, dtype=np.int64)
+    if lows.ndim != 1 or lows.shape != highs.shape:
+        raise ValueError("Range bounds must be one-dimensional arrays of one shape")
+    if lows.size and not ((0 <= lows) & (lows < highs) & (highs <= tree.size)).all():
+        raise ValueError("Ranges must be non-empty and within bounds")
+    return lows, highs
+
+
+def _covering_nodes(
+    tree: SegmentTree, lows: np.ndarray, highs: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    # Bottom-up decomposition of every range at once: at each level, a range
+    # whose left end is a right child (or right end a left child) takes that
+    # node and moves inwards. Returns the covering nodes and the index of the
+    # range each belongs to.
+    left, right = lows + tree.capacity, highs + tree.capacity
+    ranges = np.arange(len(lows))
+    nodes, owners = [], []
+
+    while len(ranges):
+        taken = (left & 1).astype(bool)
+        nodes.append(left[taken])
+        owners.append(ranges[taken])
+        left += taken
+
+        taken = (right & 1).astype(bool)
+        right -= taken
+        nodes.append(right[taken])
+        owners.append(ranges[taken])
+
+        left >>= 1
+        right >>= 1
+        active = left < right
+        left, right, ranges = left[active], right[active], ranges[active]
+
+    if not nodes:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(nodes), np.concatenate(owners)
+
+
+def _current(tree: SegmentTree, aggregates: np.ndarray, nodes: np.ndarray) -> Any:
+    # The aggregates of nodes with the tags still pending above them applied,
+    # nearest ancestor first since higher tags are more recent. Node 0 has
+    # no tag, so ancestors past the root change nothing.
+    current = aggregates[nodes]
+    is_sum = aggregates is tree.sums
+    counts = tree.counts[nodes] if is_sum else None
+    ancestors = nodes >> 1
+
+    for _ in range(tree.capacity.bit_length()):
+        assigned = tree.assigned[ancestors]
+        values = tree.assign_values[ancestors]
+        deltas = tree.additions[ancestors]
+        if is_sum:
+            current = np.where(assigned, values * counts, current + deltas * counts)
+        else:
+            current = np.where(assigned, values, current + deltas)
+        ancestors >>= 1
+    return current
+
+
+def _fold_ranges(
+    tree: SegmentTree, lows: Any, highs: Any, aggregates: np.ndarray, fold: Any
+) -> np.ndarray:
+    lows, highs = _range_arrays(tree, lows, highs)
+    nodes, owners = _covering_nodes(tree, lows, highs)
+    current = _current(tree, aggregates, nodes)
+
+    # Group the covering nodes by range and fold every group; each range
+    # has at least one node.
+    order = np.argsort(owners, kind="stable")
+    if not len(order):
+        return np.zeros(0, dtype=aggregates.dtype)
+    starts = np.flatnonzero(np.diff(owners[order], prepend=-1))
+    return fold.reduceat(current[order], starts)
+
+
+def segment_tree_sums(tree: SegmentTree, lows: Any, highs: Any) -> np.ndarray:
+    """
+    Vectorized segment_tree_sum over arrays of ranges.
+
+    All ranges are decomposed together, level by level, and pending lazy
+    tags are applied on the fly, so the tree is not modified and the call
+    costs O(k log^2 n) vectorized work for k ranges.
+
+    Args:
+        tree (SegmentTree): The tree
+        lows (Any): Array-like of first positions
+        highs (Any): Array-like of end positions, same shape
+
+    Returns:
+        np.ndarray: The sum of every range
+
+    Raises:
+        ValueError: If the arrays differ in shape or a range is empty or out
+            of bounds
+
+    Example:
+        >>> tree = create_segment_tree([5, 1, 4, 2])
+        >>> print(segment_tree_sums(tree, [0, 1], [4, 3]))  # [12  5]
+    """
+    return _fold_ranges(tree, lows, highs, tree.sums, np.add)
+
+
+def segment_tree_minima(tree: SegmentTree, lows: Any, highs: Any) -> np.ndarray:
+    """
+    Vectorized segment_tree_min over arrays of ranges.
+
+    Example:
+        >>> tree = create_segment_tree([5, 1, 4, 2])
+        >>> print(segment_tree_minima(tree, [0, 2], [4, 4]))  # [1 2]
+    """
+    return _fold_ranges(tree, lows, highs, tree.minima, np.minimum)
+
+
+def segment_tree_maxima(tree: SegmentTree, lows: Any, highs: Any) -> np.ndarray:
+    """
+    Vectorized segment_tree_max over arrays of ranges.
+
+    Example:
+        >>> tree = create_segment_tree([5, 1, 4, 2])
+        >>> print(segment_tree_maxima(tree, [0, 1], [4, 3]))  # [5 4]
+    """
+    return _fold_ranges(tree, lows, highs, tree.maxima, np.maximum)
+
+
+def segment_tree_values(tree: SegmentTree) -> np.ndarray:
+    """
+    Return the current values, with every pending update applied, in O(n).
+
+    The tags are resolved top-down one level at a time on copies; the tree
+    itself is not modified.
+
+    Example:
+        >>> tree = create_segment_tree([5, 1, 4, 2])
+        >>> segment_tree_add(tree, 0, 2, 1)
+        >>> print(segment_tree_values(tree))  # [6 2 4 2]
+    """
+    capacity = tree.capacity
+    assigned = tree.assigned[1:2].copy()
+    values = tree.assign_values[1:2].copy()
+    deltas = tree.additions[1:2].copy()
+    level = 2
+
+    # Fold each level's tags into the next, parents' tags being more recent.
+    while level < capacity:
+        parent_assigned = np.repeat(assigned, 2)
+        parent_values = np.repeat(values, 2)
+        parent_deltas = np.repeat(deltas, 2)
+        own_assigned = tree.assigned[level : 2 * level]
+
+        values = np.where(
+            parent_assigned,
+            parent_values,
+            tree.assign_values[level : 2 * level]
+            + np.where(own_assigned, parent_deltas, 0),
+        )
+        deltas = np.where(
+            parent_assigned | own_assigned,
+            0,
+            tree.additions[level : 2 * level] + parent_deltas,
+        )
+        assigned = parent_assigned | own_assigned
+        level *= 2
+
+    leaves = tree.sums[capacity : capacity + tree.size]
+    if capacity == 1:
+        return leaves.copy()
+    assigned = np.repeat(assigned, 2)[: tree.size]
+    values = np.repeat(values, 2)[: tree.size]
+    deltas = np.repeat(deltas, 2)[: tree.size]
+    return np.where(assigned, values, leaves + deltas)
+
+
+def segment_tree_assign_ranges(
+    tree: SegmentTree, lows: Any, highs: Any, values: Any
+) -> None:
+    """
+    Batched segment_tree_assign, applied in order: where ranges overlap, the
+    later assignment wins.
+
+    The winning assignment of every position is found with one vectorized
+    decomposition of all ranges, then the tree is rebuilt, in O(n + k log n)
+    vectorized work for k ranges. For a handful of ranges on a large tree,
+    calling segment_tree_assign in a loop is cheaper.
+
+    Args:
+        tree (SegmentTree): The tree
+        lows (Any): Array-like of first positions
+        highs (Any): Array-like of end positions, same shape
+        values (Any): Scalar or array-like of the value of every range
+
+    Raises:
+        ValueError: If the arrays differ in shape or a range is empty or out
+            of bounds
+
+    Example:
+        >>> tree = create_segment_tree([5, 1, 4, 2])
+        >>> segment_tree_assign_ranges(tree, [0, 1], [3, 2], [7, 0])
+        >>> print(segment_tree_values(tree))  # [7 0 7 2]
+    """
+    lows, highs = _range_arrays(tree, lows, highs)
+    values = np.broadcast_to(np.asarray(values, dtype=tree.sums.dtype), lows.shape)
+    nodes, owners = _covering_nodes(tree, lows, highs)
+
+    # Every node keeps the latest range covering it, then passes it down.
+    capacity = tree.capacity
+    latest = np.full(2 * capacity, -1, dtype=np.int64)
+    np.maximum.at(latest, nodes, owners)
+    level = 1
+    while level < capacity:
+        parents = np.repeat(latest[level : 2 * level], 2)
+        np.maximum(
+            latest[2 * level : 4 * level], parents, out=latest[2 * level : 4 * level]
+        )
+        level *= 2
+
+    current = segment_tree_values(tree)
+    latest = latest[capacity : capacity + tree.size]
+    covered = latest >= 0
+    current[covered] = values[latest[covered]]
+    _rebuild(tree, current)
+
+
+def segment_tree_add_ranges(
+    tree: SegmentTree, lows: Any, highs: Any, deltas: Any
+) -> None:
+    """
+    Batched segment_tree_add: add every delta to its range.
+
+    The additions are summed per position with a difference array, then the
+    tree is rebuilt, in O(n + k) vectorized work for k ranges. For a handful
+    of ranges on a large tree, calling segment_tree_add in a loop is cheaper.
+
+    Example:
+        >>> tree = create_segment_tree([5, 1, 4, 2])
+        >>> segment_tree_add_ranges(tree, [0, 1], [2, 4], [1, 10])
+        >>> print(segment_tree_values(tree))  # [ 6 12 14 12]
+    """
+    lows, highs = _range_arrays(tree, lows, highs)
+    dtype = tree.sums.dtype
+    deltas = np.broadcast_to(np.asarray(deltas, dtype=dtype), lows.shape)
+
+    difference = np.zeros(tree.size + 1, dtype=dtype)
+    np.add.at(difference, lows, deltas)
+    np.subtract.at(difference, highs, deltas)
+    _rebuild(tree, segment_tree_values(tree) + np.cumsum(difference[:-1]))
@@ -0,0 +1,3 @@
+"""
+Ternary search tree: a string-keyed ordered map with prefix search.
+"""
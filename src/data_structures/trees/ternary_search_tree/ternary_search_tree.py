@@ -0,0 +1,132 @@
+from typing import Any, Iterator
+
+from ..tree_node import TernaryTreeNode, _derived_flag_property
+
+NO_WEIGHT = float("-inf")
+
+
+class TernarySearchTreeNode(TernaryTreeNode):
+    """
+    Node of a ternary search tree, holding one character of the keys in ``data``.
+
+    The left and right children hold other characters at the same position
+    and the middle child the next character. A key ends at a node when the
+    node has a ``weight``; its value is in ``value``. ``best`` caches the
+    largest weight of any key ending in the node's subtree (left, middle and
+    right), which lets autocomplete skip subtrees of light keys. Deletion
+    splices nodes out, so the structural flags are computed from the links.
+    """
+
+    __slots__ = ("value", "weight", "best")
+
+    # Links only ever point at other ternary search tree nodes.
+    parent: "TernarySearchTreeNode | None"
+    left_child: "TernarySearchTreeNode | None"
+    middle_child: "TernarySearchTreeNode | None"
+    right_child: "TernarySearchTreeNode | None"
+
+    def __init__(self, data: str, parent: "TernarySearchTreeNode | None" = None):
+        # Sets every slot here rather than through TernaryTreeNode.__init__;
+        # bulk builds create millions of nodes and the extra call shows.
+        self.data = data
+        self.parent = parent
+        self.left_child = self.middle_child = self.right_child = None
+        self._flags = 0
+        self.value: Any = None
+        self.weight: float | None = None
+        self.best = NO_WEIGHT
+
+    @property
+    def is_key(self) -> bool:
+        """Whether a key ends at this node."""
+        return self.weight is not None
+
+    is_root = _derived_flag_property(lambda node: node.parent is None, "is the root")
+    is_parent = _derived_flag_property(lambda node: not node.is_leaf, "has children")
+    is_leaf = _derived_flag_property(
+        lambda node: node.left_child is None
+        and node.middle_child is None
+        and node.right_child is None,
+        "is a leaf",
+    )
+    is_left = _derived_flag_property(
+        lambda node: node.parent is not None and node.parent.left_child is node,
+        "is a left child",
+    )
+    is_middle = _derived_flag_property(
+        lambda node: node.parent is not None and node.parent.middle_child is node,
+        "is a middle child",
+    )
+    is_right = _derived_flag_property(
+        lambda node: node.parent is not None and node.parent.right_child is node,
+        "is a right child",
+    )
+
+
+class TernarySearchTree:
+    """
+    Map from non-empty strings to values, with a weight per key.
+
+    Lookups cost O(len(key) + log(alphabet)) character comparisons in a
+    balanced tree. Iteration yields the keys in sorted order; see
+    ternary_search_tree_operations for prefix search and autocomplete.
+
+    Attributes:
+        root (TernarySearchTreeNode | None): The root node, None when empty
+        size (int): The number of keys
+
+    Example:
+        >>> tree = build_ternary_search_tree(["car", "cat", "dog"])
+        >>> print(list(tst_iter_prefix(tree, "ca")))  # ["car", "cat"]
+    """
+
+    __slots__ = ("root", "size")
+
+    def __init__(self, root: TernarySearchTreeNode | None = None, size: int = 0):
+        self.root = root
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    def __contains__(self, key: Any) -> bool:
+        if not isinstance(key, str) or not key:
+            return False
+        node, i, last = self.root, 0, len(key) - 1
+        while node is not None:
+            char = key[i]
+            if char < node.data:
+                node = node.left_child
+            elif node.data < char:
+                node = node.right_child
+            elif i == last:
+                return node.weight is not None
+            else:
+                node = node.middle_child
+                i += 1
+        return False
+
+    def __iter__(self) -> Iterator[str]:
+        return _iter_keys(self.root, "")
+
+
+def _iter_keys(node: TernarySearchTreeNode | None, prefix: str) -> Iterator[str]:
+    # In-order walk of the subtree at node: left, the key ending at the node,
+    # middle (one character longer), right. ``prefix`` is the part of the
+    # keys above node. Marked entries are nodes whose left side is done.
+    stack = [(node, prefix, False)]
+    while stack:
+        node, prefix, visited = stack.pop()
+        if node is None:
+            continue
+        if visited:
+            if node.weight is not None:
+                yield prefix + node.data
+        else:
+            stack.append((node.right_child, prefix, False))
+            stack.append((node.middle_child, prefix + node.data, False))
+            stack.append((node, prefix, True))
+            stack.append((node.left_child, prefix, False))
@@ -0,0 +1,462 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from itertools import count
+from typing import Any, Iterable, Iterator
+
+from .ternary_search_tree import (
+    NO_WEIGHT,
+    TernarySearchTree,
+    TernarySearchTreeNode,
+    _iter_keys,
+)
+
+_LAST_CHAR = chr(0x10FFFF)
+
+
+def _check_key(key: Any) -> None:
+    if not isinstance(key, str) or not key:
+        raise ValueError("Keys must be non-empty strings")
+
+
+def _find(tree: TernarySearchTree, key: str) -> TernarySearchTreeNode | None:
+    # The node of the last character of key, whether or not a key ends there.
+    node, i, last = tree.root, 0, len(key) - 1
+    while node is not None:
+        char = key[i]
+        if char < node.data:
+            node = node.left_child
+        elif node.data < char:
+            node = node.right_child
+        elif i == last:
+            return node
+        else:
+            node = node.middle_child
+            i += 1
+    return None
+
+
+def _own_best(node: TernarySearchTreeNode) -> float:
+    best = node.weight if node.weight is not None else NO_WEIGHT
+    for child in (node.left_child, node.middle_child, node.right_child):
+        if child is not None and child.best > best:
+            best = child.best
+    return best
+
+
+def _refresh_best(node: TernarySearchTreeNode | None, full: bool = False) -> None:
+    # Recomputes ``best`` from node up to the root. Unless the links changed
+    # (full), the walk stops at the first node whose best is unchanged.
+    while node is not None:
+        best = _own_best(node)
+        if best == node.best and not full:
+            return
+        node.best = best
+        node = node.parent
+
+
+def _replace_child(
+    tree: TernarySearchTree,
+    parent: TernarySearchTreeNode | None,
+    old: TernarySearchTreeNode,
+    new: TernarySearchTreeNode | None,
+) -> None:
+    if parent is None:
+        tree.root = new
+    elif parent.left_child is old:
+        parent.left_child = new
+    elif parent.middle_child is old:
+        parent.middle_child = new
+    else:
+        parent.right_child = new
+
+    if new is not None:
+        new.parent = parent
+
+
+def create_ternary_search_tree() -> TernarySearchTree:
+    """
+    Create an empty ternary search tree.
+
+    Example:
+        >>> tree = create_ternary_search_tree()
+        >>> print(len(tree))  # 0
+    """
+    return TernarySearchTree()
+
+
+def build_ternary_search_tree(
+    keys: Iterable[str],
+    values: Iterable[Any] | None = None,
+    weights: Iterable[float] | None = None,
+) -> TernarySearchTree:
+    """
+    Build a balanced ternary search tree from keys in any order.
+
+    The keys are sorted once and every node is created directly at its
+    final place, choosing for each character position the median character
+    by number of keys, so the tree is as balanced as inserting the keys in
+    median order would make it, without walking from the root per key.
+
+    Args:
+        keys (Iterable[str]): The keys; a repeated key keeps its last value
+        values (Iterable[Any] | None): The value of every key; None by default
+        weights (Iterable[float] | None): The weight of every key; 0 by default
+
+    Returns:
+        TernarySearchTree: The built tree
+
+    Raises:
+        ValueError: If a key is not a non-empty string, or values or weights
+            has a different length than keys
+
+    Example:
+        >>> tree = build_ternary_search_tree(["to", "tea", "ten"], weights=[5, 1, 3])
+        >>> print(tst_autocomplete(tree, "te", 1))  # ["ten"]
+    """
+    keys = list(keys)
+    values = [None] * len(keys) if values is None else list(values)
+    weights = [0] * len(keys) if weights is None else list(weights)
+    if not len(keys) == len(values) == len(weights):
+        raise ValueError("Keys, values and weights must have the same length")
+
+    entries = {}
+    for key, value, weight in zip(keys, values, weights):
+        _check_key(key)
+        entries[key] = (value, weight)
+    keys = sorted(entries)
+
+    tree = TernarySearchTree(size=len(keys))
+    if not keys:
+        return tree
+
+    created = []
+    # Each range of keys shares its first ``depth`` characters and is longer
+    # than depth; it becomes the subtree linked as ``attribute`` of parent,
+    # or the root when parent is None.
+    ranges: list[tuple[int, int, int, TernarySearchTreeNode | None, str]] = [
+        (0, len(keys), 0, None, "")
+    ]
+
+    while ranges:
+        low, high, depth, parent, attribute = ranges.pop()
+
+        if high - low == 1:
+            # The rest of a lone key is a chain of middle children.
+            key = keys[low]
+            for char in key[depth:]:
+                node = TernarySearchTreeNode(char, parent)
+                if parent is None:
+                    tree.root = node
+                else:
+                    setattr(parent, attribute, node)
+                created.append(node)
+                parent, attribute = node, "middle_child"
+            node.value, node.weight = entries[key]
+            continue
+
+        # Runs of keys with the same character at depth, found by bisection.
+        prefix = keys[low][:depth]
+        starts, chars = [], []
+        i = low
+        while i < high:
+            char = keys[i][depth]
+            starts.append(i)
+            chars.append(char)
+            if char == _LAST_CHAR:
+                i = high
+            else:
+                i = bisect_left(keys, prefix + chr(ord(char) + 1), i, high)
+        starts.append(high)
+
+        # The runs form a binary search tree rooted at the run holding the
+        # median key of each range of runs.
+        sides = [(0, len(chars), parent, attribute)]
+        while sides:
+            first, last, side_parent, side_attribute = sides.pop()
+            median = (starts[first] + starts[last]) // 2
+            run = bisect_right(starts, median, first, last) - 1
+
+            node = TernarySearchTreeNode(chars[run], side_parent)
+            if side_parent is None:
+                tree.root = node
+            else:
+                setattr(side_parent, side_attribute, node)
+            created.append(node)
+
+            run_low, run_high = starts[run], starts[run + 1]
+            if len(keys[run_low]) == depth + 1:
+                node.value, node.weight = entries[keys[run_low]]
+                run_low += 1
+            if run_low < run_high:
+                ranges.append((run_low, run_high, depth + 1, node, "middle_child"))
+            if first < run:
+                sides.append((first, run, node, "left_child"))
+            if run + 1 < last:
+                sides.append((run + 1, last, node, "right_child"))
+
+    # Nodes were created after their parents, so this is bottom-up.
+    for node in reversed(created):
+        node.best = _own_best(node)
+
+    return tree
+
+
+def tst_insert(
+    tree: TernarySearchTree, key: str, value: Any = None, weight: float = 0
+) -> TernarySearchTreeNode:
+    """
+    Insert ``key``, or replace its value and weight if it exists.
+
+    Args:
+        tree (TernarySearchTree): The tree
+        key (str): The key, a non-empty string
+        value (Any): The value to map the key to
+        weight (float): The key's weight, used to rank autocomplete results
+
+    Returns:
+        TernarySearchTreeNode: The node where the key ends
+
+    Raises:
+        ValueError: If tree is None or key is not a non-empty string
+
+    Example:
+        >>> tree = create_ternary_search_tree()
+        >>> tst_insert(tree, "cat", 1)
+        >>> print(tst_get(tree, "cat"))  # 1
+    """
+    if tree is None:
+        raise ValueError("Tree cannot be None")
+    _check_key(key)
+
+    node, i, last = tree.root, 0, len(key) - 1
+    if node is None:
+        node = tree.root = TernarySearchTreeNode(key[0])
+
+    while True:
+        char = key[i]
+        if char < node.data:
+            child = node.left_child
+            if child is None:
+                child = node.left_child = TernarySearchTreeNode(char, node)
+        elif node.data < char:
+            child = node.right_child
+            if child is None:
+                child = node.right_child = TernarySearchTreeNode(char, node)
+        elif i == last:
+            break
+        else:
+            i += 1
+            child = node.middle_child
+            if child is None:
+                child = node.middle_child = TernarySearchTreeNode(key[i], node)
+        node = child
+
+    if node.weight is None:
+        tree.size += 1
+    node.value, node.weight = value, weight
+    _refresh_best(node)
+    return node
+
+
+def tst_search(tree: TernarySearchTree, key: str) -> TernarySearchTreeNode | None:
+    """Return the node where ``key`` ends, or None if the key is absent."""
+    _check_key(key)
+    node = _find(tree, key)
+    return node if node is not None and node.weight is not None else None
+
+
+def tst_get(tree: TernarySearchTree, key: str, default: Any = None) -> Any:
+    """
+    Return the value of ``key``, or ``default`` if the key is absent.
+
+    Example:
+        >>> tree = build_ternary_search_tree(["cat"], [1])
+        >>> print(tst_get(tree, "cat"), tst_get(tree, "ca"))  # 1 None
+    """
+    node = tst_search(tree, key)
+    return node.value if node is not None else default
+
+
+def tst_delete(tree: TernarySearchTree, key: str) -> bool:
+    """
+    Remove ``key`` and prune the nodes no other key needs.
+
+    Returns:
+        bool: True if the key was present
+
+    Example:
+        >>> tree = build_ternary_search_tree(["car", "cart"])
+        >>> print(tst_delete(tree, "car"), list(tree))  # True ["cart"]
+    """
+    if tree is None:
+        raise ValueError("Tree cannot be None")
+
+    node = tst_search(tree, key)
+    if node is None:
+        return False
+
+    node.value = node.weight = None
+    tree.size -= 1
+    lowest: TernarySearchTreeNode | None = node
+
+    # A node is needed while a key ends at it or continues below it. Only a
+    # childless middle child can leave its parent unneeded, so the loop goes
+    # on only after such a node, and ``lowest`` always ends up below every
+    # node whose subtree changed.
+    while node is not None and node.weight is None and node.middle_child is None:
+        parent, left, right = node.parent, node.left_child, node.right_child
+        if left is None or right is None:
+            replacement = left if left is not None else right
+            lowest = replacement if replacement is not None else parent
+        else:
+            # The smallest node on the right takes the node's place.
+            replacement = right
+            while replacement.left_child is not None:
+                replacement = replacement.left_child
+            lowest = replacement
+            if replacement is not right:
+                lowest = replacement.parent
+                _replace_child(tree, lowest, replacement, replacement.right_child)
+                replacement.right_child = right
+                right.parent = replacement
+            replacement.left_child = left
+            left.parent = replacement
+
+        _replace_child(tree, parent, node, replacement)
+        node.parent = node.left_child = node.right_child = None
+        node = parent
+
+    _refresh_best(lowest, full=True)
+    return True
+
+
+def tst_iter_prefix(tree: TernarySearchTree, prefix: str) -> Iterator[str]:
+    """
+    Lazily yield the keys starting with ``prefix``, in sorted order.
+
+    Args:
+        tree (TernarySearchTree): The tree
+        prefix (str): The prefix; "" yields every key
+
+    Yields:
+        str: The matching keys
+
+    Example:
+        >>> tree = build_ternary_search_tree(["car", "cat", "dog"])
+        >>> print(list(tst_iter_prefix(tree, "ca")))  # ["car", "cat"]
+    """
+    if not prefix:
+        yield from _iter_keys(tree.root, "")
+        return
+
+    node = _find(tree, prefix)
+    if node is None:
+        return
+    if node.weight is not None:
+        yield prefix
+    yield from _iter_keys(node.middle_child, prefix)
+
+
+def tst_autocomplete(tree: TernarySearchTree, prefix: str, k: int) -> list[str]:
+    """
+    Return the ``k`` heaviest keys starting with ``prefix``, heaviest first.
+
+    Subtrees are explored best-first by their cached best weight, so only
+    the paths to the results and their immediate siblings are visited.
+    Keys of equal weight come out in no particular order.
+
+    Args:
+        tree (TernarySearchTree): The tree
+        prefix (str): The prefix; "" ranks every key
+        k (int): The number of keys to return
+
+    Returns:
+        list[str]: Up to k keys, by decreasing weight
+
+    Example:
+        >>> tree = build_ternary_search_tree(["tea", "ten", "to"], weights=[1, 3, 5])
+        >>> print(tst_autocomplete(tree, "t", 2))  # ["to", "ten"]
+    """
+    if k <= 0:
+        return []
+
+    # Entries are (-weight, kind, order, item, prefix); kind 0 is a finished
+    # key and sorts before a subtree of the same weight.
+    order = count()
+    heap: list[tuple[Any, int, int, Any, str | None]] = []
+    if not prefix:
+        start = tree.root
+    else:
+        node = _find(tree, prefix)
+        if node is None:
+            return []
+        if node.weight is not None:
+            heap.append((-node.weight, 0, next(order), prefix, None))
+        start = node.middle_child
+    if start is not None:
+        heap.append((-start.best, 1, next(order), start, prefix))
+    heapq.heapify(heap)
+
+    results: list[str] = []
+    while heap and len(results) < k:
+        _, kind, _, item, item_prefix = heapq.heappop(heap)
+        if kind == 0:
+            results.append(item)
+            continue
+
+        if item.weight is not None:
+            key = item_prefix + item.data
+            heapq.heappush(heap, (-item.weight, 0, next(order), key, None))
+        for child, child_prefix in (
+            (item.left_child, item_prefix),
+            (item.middle_child, item_prefix + item.data),
+            (item.right_child, item_prefix),
+        ):
+            if child is not None and child.best != NO_WEIGHT:
+                heapq.heappush(heap, (-child.best, 1, next(order), child, child_prefix))
+
+    return results
+
+
+def tst_hamming_neighbors(
+    tree: TernarySearchTree, key: str, distance: int
+) -> list[str]:
+    """
+    Return the keys of the same length as ``key`` that differ from it in at
+    most ``distance`` positions, in sorted order.
+
+    Branches are abandoned as soon as they use up the allowed mismatches, so
+    small distances visit a small part of the tree.
+
+    Example:
+        >>> tree = build_ternary_search_tree(["cat", "cot", "cut", "dog"])
+        >>> print(tst_hamming_neighbors(tree, "cat", 1))  # ["cat", "cot", "cut"]
+    """
+    _check_key(key)
+    if distance < 0:
+        raise ValueError("Distance cannot be negative")
+
+    last = len(key) - 1
+    results = []
+    stack = [(tree.root, 0, distance, "")]
+    while stack:
+        node, i, budget, prefix = stack.pop()
+        if node is None:
+            continue
+
+        char = key[i]
+        if budget or char < node.data:
+            stack.append((node.left_child, i, budget, prefix))
+        if budget or node.data < char:
+            stack.append((node.right_child, i, budget, prefix))
+
+        remaining = budget if char == node.data else budget - 1
+        if remaining >= 0:
+            if i == last:
+                if node.weight is not None:
+                    results.append(prefix + node.data)
+            else:
+                stack.append((node.middle_child, i + 1, remaining, prefix + node.data))
+
+    results.sort()
+    return results
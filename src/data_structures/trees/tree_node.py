@@ -1,7 +1,68 @@
 from typing import Any
 
+# Bits of the packed flag word. Every node stores its boolean flags in one
+# small int instead of one attribute per flag.
+IS_ROOT = 1
+IS_PARENT = 2
+IS_LEFT = 4
+IS_RIGHT = 8
+IS_LEAF = 16
+IS_MIDDLE = 32
+
+# Shared by every node that has never had a child.
+_NO_CHILDREN: tuple[()] = ()
+
+
+def _flag_property(bit: int, name: str) -> property:
+    def getter(node: "_FlaggedNode") -> bool:
+        return bool(node._flags & bit)
+
+    def setter(node: "_FlaggedNode", value: bool) -> None:
+        if value:
+            node._flags |= bit
+        else:
+            node._flags &= ~bit
+
+    return property(getter, setter, doc=f"Whether the node {name}.")
+
+
+def _derived_flag_property(test: Any, name: str) -> property:
+    # For nodes whose links are rewired after creation (rotations, splices),
+    # where packed flags would go stale: the flag is computed from the links.
+    return property(test, doc=f"Whether the node {name}.")
+
+
+class _FlaggedNode:
+    """Base class holding the packed flag word shared by all tree nodes."""
+
+    __slots__ = ("_flags",)
+    _flags: int
+
+    is_root = _flag_property(IS_ROOT, "is the root of its tree")
+    is_parent = _flag_property(IS_PARENT, "has children")
+    is_left = _flag_property(IS_LEFT, "is a left child")
+    is_right = _flag_property(IS_RIGHT, "is a right child")
+    is_leaf = _flag_property(IS_LEAF, "is a leaf")
+
+
+class TreeNode(_FlaggedNode):
+    """
+    Node of an n-ary tree.
+
+    Nodes use ``__slots__`` and keep their boolean flags packed in a single
+    int, and the children list is only allocated when it is first needed.
+    ``observers`` is the list of tree observers shared by every node of the
+    tree (see tree_observers), or None when nothing observes the tree. The
+    slot costs one pointer per node even in unobserved trees (a bare node
+    takes 72 bytes on 64-bit CPython instead of 64); in exchange any node
+    reaches the observers in O(1), without walking up to the root.
+    Reading ``children_nodes`` always returns a real list (allocating an
+    empty one for a childless node) so that code appending to it keeps
+    working; read-only code should use ``children``, which never allocates.
+    """
+
+    __slots__ = ("data", "parent", "_children", "observers")
 
-class TreeNode:
     def __init__(
         self,
         data: Any,
@@ -10,15 +71,31 @@ class TreeNode:
     ):
         self.data = data
         self.parent = parent
-        self.children_nodes = children_nodes if children_nodes is not None else []
-        self.is_root = False
-        self.is_parent = False
-        self.is_left = False
-        self.is_right = False
-        self.is_leaf = False
+        self._children = children_nodes
+        self.observers: "list | None" = None
+        self._flags = 0
+
+    @property
+    def children_nodes(self) -> "list[TreeNode]":
+        children = self._children
+        if children is None:
+            children = self._children = []
+        return children
 
+    @children_nodes.setter
+    def children_nodes(self, children: "list[TreeNode] | None") -> None:
+        self._children = children
+
+    @property
+    def children(self) -> "list[TreeNode] | tuple[()]":
+        """The children list, or an empty tuple if the node never had a child."""
+        children = self._children
+        return children if children is not None else _NO_CHILDREN
+
+
+class BinaryTreeNode(_FlaggedNode):
+    __slots__ = ("data", "parent", "left_child", "right_child")
 
-class BinaryTreeNode:
     def __init__(
         self,
         data: Any,
@@ -30,14 +107,14 @@ class BinaryTreeNode:
         self.parent = parent
         self.left_child = left_child
         self.right_child = right_child
-        self.is_root = False
-        self.is_parent = False
-        self.is_left = False
-        self.is_right = False
-        self.is_leaf = False
+        self._flags = 0
+
+
+class TernaryTreeNode(_FlaggedNode):
+    __slots__ = ("data", "parent", "left_child", "middle_child", "right_child")
 
+    is_middle = _flag_property(IS_MIDDLE, "is a middle child")
 
-class TernaryTreeNode:
     def __init__(
         self,
         data: Any,
@@ -51,9 +128,4 @@ class TernaryTreeNode:
         self.left_child = left_child
         self.middle_child = middle_child
         self.right_child = right_child
-        self.is_root = False
-        self.is_parent = False
-        self.is_left = False
-        self.is_middle = False
-        self.is_right = False
-        self.is_leaf = False
+        self._flags = 0
@@ -0,0 +1,3 @@
+"""
+Rendering of the data structures as Graphviz (DOT) graphs.
+"""
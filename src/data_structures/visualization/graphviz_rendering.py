@@ -0,0 +1,320 @@
+"""
+Graphviz (DOT) rendering of trees and linked lists that stays bounded on
+huge inputs.
+
+DOT text is streamed to the destination as nodes are visited, so memory is
+bounded by the widest level drawn, not by the size of the structure. Caps on
+depth, children per node, nodes per level and nodes overall replace what is
+cut off with dashed "N more" summary nodes; each cap is checked with
+``len(node.children)`` rather than by walking the hidden part. Writing DOT
+needs nothing beyond the standard library; only render_dot, which lays the
+file out into an image, needs the graphviz package
+(``poetry install --extras visualization``) and the Graphviz binaries.
+"""
+
+import os
+import random
+from bisect import bisect_right
+from typing import IO, Any, Callable
+
+from ..trees.n_ary_trees.merkle_hashes import MerkleHashes, subtree_hashes
+from ..trees.n_ary_trees.tree_observers import find_observer
+from ..trees.tree_node import TreeNode
+
+SUMMARY_STYLE = 'shape=box, style=dashed, fontcolor="#555555"'
+
+
+def _quote(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+class _DotWriter:
+    # Numbers the nodes and summary nodes and writes one statement per line.
+
+    def __init__(self, output: IO[str], label: Callable[[Any], str]):
+        self.output = output
+        self.label = label
+        self.nodes = 0
+        self.summaries = 0
+
+    def node(self, data: Any) -> str:
+        name = f"n{self.nodes}"
+        self.nodes += 1
+        self.output.write(f"  {name} [label={_quote(self.label(data))}];\n")
+        return name
+
+    def summary(self, parent: str | None, hidden: int | None) -> str:
+        name = f"s{self.summaries}"
+        self.summaries += 1
+        label = _quote(f"{hidden} more" if hidden is not None else "more")
+        self.output.write(f"  {name} [label={label}, {SUMMARY_STYLE}];\n")
+        if parent is not None:
+            self.edge(parent, name, "style=dashed")
+        return name
+
+    def edge(self, tail: str, head: str, attributes: str = "") -> None:
+        suffix = f" [{attributes}]" if attributes else ""
+        self.output.write(f"  {tail} -> {head}{suffix};\n")
+
+
+def write_tree_dot(
+    root: TreeNode,
+    destination: str | os.PathLike | IO[str],
+    max_depth: int | None = None,
+    max_children: int | None = None,
+    max_level_nodes: int | None = None,
+    max_nodes: int | None = 10_000,
+    collapse_duplicates: bool = False,
+    label: Callable[[Any], str] = str,
+    seed: int = 0,
+) -> int:
+    """
+    Stream the n-ary tree rooted at ``root`` to a DOT file, level by level.
+
+    Each level is drawn from the children of the nodes drawn on the level
+    above. Only the first ``max_children`` children of a node are
+    candidates. When a level has more candidates than ``max_level_nodes``
+    (or than what is left of ``max_nodes``), a uniform random sample of them
+    is drawn, by index, without looking at the others. Children that are not
+    drawn are counted in one summary node per parent, and nodes at
+    ``max_depth`` summarize their children the same way.
+
+    With ``collapse_duplicates``, a subtree equal to one already drawn (same
+    Merkle hash) is drawn as a dashed edge to the earlier copy. The hashes
+    come from a tracked MerkleHashes observer if the tree has one; otherwise
+    they are computed once, which costs O(n) time and memory.
+
+    Args:
+        root (TreeNode): The root of the tree
+        destination (str | os.PathLike | IO[str]): A path or a text file
+            opened for writing
+        max_depth (int | None): The deepest level drawn (the root is level 0)
+        max_children (int | None): The most children drawn per node
+        max_level_nodes (int | None): The most nodes drawn per level
+        max_nodes (int | None): The most tree nodes drawn overall (the root
+            is always drawn); None draws everything the other caps allow
+        collapse_duplicates (bool): Draw equal subtrees once
+        label (Callable[[Any], str]): Turns node data into a label
+        seed (int): Seed of the level sampling, for reproducible drawings
+
+    Returns:
+        int: The number of tree nodes drawn (summary nodes not included)
+
+    Raises:
+        ValueError: If root is None or a cap is negative
+
+    Example:
+        >>> root = create_root_with_children_data_list("root", list(range(100)))
+        >>> write_tree_dot(root, "tree.dot", max_children=3)  # root, 0, 1, 2
+        4
+    """
+    if root is None:
+        raise ValueError("Root node cannot be None")
+    caps = (max_depth, max_children, max_level_nodes, max_nodes)
+    if any(cap is not None and cap < 0 for cap in caps):
+        raise ValueError("Caps cannot be negative")
+
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, "w", encoding="utf-8") as output:
+            return write_tree_dot(
+                root,
+                output,
+                max_depth=max_depth,
+                max_children=max_children,
+                max_level_nodes=max_level_nodes,
+                max_nodes=max_nodes,
+                collapse_duplicates=collapse_duplicates,
+                label=label,
+                seed=seed,
+            )
+
+    hash_of = None
+    if collapse_duplicates:
+        tracked = find_observer(root, MerkleHashes)
+        hash_of = (tracked if tracked is not None else subtree_hashes(root)).__getitem__
+    drawn_hashes: dict[bytes, str] = {}
+    rng = random.Random(seed)
+
+    writer = _DotWriter(destination, label)
+    destination.write("digraph tree {\n  graph [ordering=out];\n")
+    level = [(root, writer.node(root.data))]
+    depth = 0
+
+    while level:
+        budget = None if max_nodes is None else max(max_nodes - writer.nodes, 0)
+        if max_level_nodes is not None:
+            budget = max_level_nodes if budget is None else min(budget, max_level_nodes)
+
+        if (max_depth is not None and depth >= max_depth) or budget == 0:
+            for node, name in level:
+                if node.children:
+                    writer.summary(name, len(node.children))
+            break
+
+        # Candidates are numbered across the level, parent by parent, so that
+        # a sample of numbers maps back to (parent, child position).
+        offsets, total = [], 0
+        for node, _ in level:
+            offsets.append(total)
+            count = len(node.children)
+            total += count if max_children is None else min(count, max_children)
+
+        picked: range | list[int]
+        if budget is None or total <= budget:
+            picked = range(total)
+        else:
+            picked = sorted(rng.sample(range(total), budget))
+
+        next_level = []
+        drawn = [0] * len(level)
+        for number in picked:
+            index = bisect_right(offsets, number) - 1
+            parent, parent_name = level[index]
+            child = parent.children[number - offsets[index]]
+            drawn[index] += 1
+
+            if hash_of is not None and child.children:
+                digest = hash_of(child)
+                copy = drawn_hashes.get(digest)
+                if copy is not None:
+                    writer.edge(parent_name, copy, "style=dashed")
+                    continue
+
+            name = writer.node(child.data)
+            writer.edge(parent_name, name)
+            if hash_of is not None and child.children:
+                drawn_hashes[digest] = name
+            next_level.append((child, name))
+
+        for (node, name), count in zip(level, drawn):
+            hidden = len(node.children) - count
+            if hidden:
+                writer.summary(name, hidden)
+
+        level = next_level
+        depth += 1
+
+    destination.write("}\n")
+    return writer.nodes
+
+
+def write_linked_list_dot(
+    linked_list: Any,
+    destination: str | os.PathLike | IO[str],
+    max_nodes: int | None = 1_000,
+    label: Callable[[Any], str] = str,
+) -> int:
+    """
+    Stream a singly, doubly or circular linked list to a DOT file, left to right.
+
+    Doubly linked nodes get two-way edges and circular lists an edge from the
+    tail back to the head. Past ``max_nodes`` nodes, the rest of the list is
+    drawn as one summary node followed by the tail, so that the ends of the
+    list stay visible without walking the middle.
+
+    Args:
+        linked_list: Any of the linked list types (with head, tail and size)
+        destination (str | os.PathLike | IO[str]): A path or a text file
+            opened for writing
+        max_nodes (int | None): The most nodes walked from the head; None
+            walks the whole list
+        label (Callable[[Any], str]): Turns node data into a label
+
+    Returns:
+        int: The number of list nodes drawn (summary nodes not included)
+
+    Raises:
+        ValueError: If linked_list is None or max_nodes is negative
+
+    Example:
+        >>> sll = SinglyLinkedList()
+        >>> for value in range(10**6):
+        ...     insert_sll_element(sll, value)
+        >>> write_linked_list_dot(sll, "list.dot", max_nodes=5)  # 5 + the tail
+        6
+    """
+    if linked_list is None:
+        raise ValueError("Linked list cannot be None")
+    if max_nodes is not None and max_nodes < 0:
+        raise ValueError("max_nodes cannot be negative")
+
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, "w", encoding="utf-8") as output:
+            return write_linked_list_dot(linked_list, output, max_nodes, label)
+
+    writer = _DotWriter(destination, label)
+    destination.write("digraph linked_list {\n  graph [rankdir=LR];\n")
+    head = linked_list.head
+    tail = getattr(linked_list, "tail", None)
+    circular = tail is not None and tail.next is head
+
+    def link(previous_node: Any, previous: str, node: Any, name: str) -> None:
+        two_way = getattr(node, "prev", None) is previous_node
+        writer.edge(previous, name, "dir=both" if two_way else "")
+
+    node, previous_node, previous, walked = head, None, None, 0
+    while node is not None and (max_nodes is None or walked < max_nodes):
+        name = writer.node(node.data)
+        if previous is not None:
+            link(previous_node, previous, node, name)
+        previous_node, previous, walked = node, name, walked + 1
+        node = node.next
+        if node is head:
+            node = None
+
+    if node is not None:
+        # Cut off before the end: summarize the middle and draw the tail.
+        size = getattr(linked_list, "size", None)
+        hidden = None
+        if size is not None:
+            hidden = size - walked - (tail is not None)
+        if hidden == 0 and tail is not None:
+            # Only the tail is left, so it is drawn as the next node.
+            name = writer.node(tail.data)
+            if previous is not None:
+                link(previous_node, previous, tail, name)
+            previous = name
+        else:
+            summary = writer.summary(previous, hidden)
+            if tail is not None:
+                previous = writer.node(tail.data)
+                writer.edge(summary, previous, "style=dashed")
+
+    if circular and walked and previous is not None:
+        writer.edge(previous, "n0", "constraint=false")
+
+    destination.write("}\n")
+    return writer.nodes
+
+
+def render_dot(
+    source: str | os.PathLike, format: str = "svg", engine: str = "dot"
+) -> str:
+    """
+    Lay out a DOT file with Graphviz and write the image next to it.
+
+    Args:
+        source (str | os.PathLike): The DOT file
+        format (str): The output format, such as "svg", "png" or "pdf"
+        engine (str): The Graphviz layout engine; "sfdp" handles big graphs
+
+    Returns:
+        str: The path of the written image
+
+    Raises:
+        ImportError: If the graphviz package is not installed
+
+    Example:
+        >>> write_tree_dot(root, "tree.dot", max_depth=3)
+        >>> print(render_dot("tree.dot"))  # tree.dot.svg
+    """
+    try:
+        import graphviz  # type: ignore[import-untyped]
+    except ImportError as error:
+        raise ImportError(
+            "render_dot needs graphviz; install it with "
+            "`poetry install --extras visualization`"
+        ) from error
+
+    return graphviz.render(engine, format, os.fspath(source))
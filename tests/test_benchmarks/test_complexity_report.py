@@ -0,0 +1,127 @@
+import json
+import math
+import time
+
+import pytest
+
+from benchmarks.complexity_report import (
+    ComplexityCase,
+    fit_complexity,
+    format_summary_table,
+    geometric_sizes,
+    main,
+    run_report,
+)
+
+SIZES = [2**k for k in range(8, 16)]
+
+
+@pytest.mark.parametrize(
+    "model, timing",
+    [
+        ("O(1)", lambda n: 2e-4),
+        ("O(log n)", lambda n: 1e-5 * math.log2(n)),
+        ("O(n)", lambda n: 1e-6 * n + 1e-5),
+        ("O(n log n)", lambda n: 1e-7 * n * math.log2(n)),
+        ("O(n^2)", lambda n: 1e-9 * n * n + 1e-4),
+    ],
+)
+def test_fit_complexity_recovers_synthetic_models(model, timing):
+    observed, errors, coefficients = fit_complexity(SIZES, [timing(n) for n in SIZES])
+    assert observed == model
+    assert set(errors) == set(coefficients)
+
+
+def test_fit_complexity_prefers_slower_model_under_noise():
+    noise = [1.0, 1.04, 0.97, 1.03, 0.98, 1.05, 0.96, 1.02]
+    timings = [1e-6 * n * factor for n, factor in zip(SIZES, noise)]
+    assert fit_complexity(SIZES, timings)[0] == "O(n)"
+
+
+def test_fit_complexity_needs_three_sizes():
+    assert fit_complexity([1, 2], [1.0, 2.0]) == (None, {}, {})
+    with pytest.raises(ValueError):
+        fit_complexity([1, 2, 3], [1.0])
+
+
+def test_geometric_sizes():
+    assert geometric_sizes(256, 2048) == [256, 512, 1024, 2048]
+    assert geometric_sizes(300, 1024) == [512, 1024]
+    with pytest.raises(ValueError):
+        geometric_sizes(1024, 256)
+
+
+def test_unknown_documented_model_rejected():
+    with pytest.raises(ValueError):
+        ComplexityCase("op", "group", "O(n^3)", lambda n: n, lambda state: None)
+
+
+def test_quadratic_operation_flagged_worse_than_documented():
+    case = ComplexityCase(
+        "quadratic",
+        "synthetic",
+        "O(n)",
+        lambda n: n,
+        lambda n: sum(i * j for i in range(n) for j in range(n)),
+    )
+    (result,) = run_report([case], [32, 64, 128, 256], repeat=1)
+    assert result.observed in ("O(n log n)", "O(n^2)")
+    assert result.is_worse_than_documented
+    assert "WORSE THAN DOCUMENTED" in format_summary_table([result])
+
+
+def _busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_constant_time_operation_is_not_flagged_after_a_slow_spell():
+    # Every call takes the same time except during a slow spell of the
+    # machine covering the last six calls, which used to be every run of the
+    # two largest sizes.
+    calls = []
+
+    def run(size):
+        calls.append(size)
+        _busy_wait(2e-3 if len(calls) > 9 else 2e-4)
+
+    case = ComplexityCase("constant", "synthetic", "O(1)", lambda n: n, run)
+    for _ in range(3):
+        calls.clear()
+        (result,) = run_report([case], [256, 512, 1024, 2048, 4096], repeat=3)
+        assert result.observed == "O(1)"
+        assert not result.is_worse_than_documented
+
+
+def test_max_size_caps_measured_sizes():
+    case = ComplexityCase(
+        "capped", "synthetic", "O(n)", lambda n: n, lambda n: None, max_size=64
+    )
+    (result,) = run_report([case], [32, 64, 128], repeat=1)
+    assert result.sizes == [32, 64]
+    assert result.observed is None
+    assert not result.is_worse_than_documented
+
+
+def test_main_writes_summary_and_plots(tmp_path):
+    pytest.importorskip("matplotlib")
+    exit_code = main(
+        [
+            "--only",
+            "depth_first_search",
+            "--min-size",
+            "64",
+            "--max-size",
+            "512",
+            "--repeat",
+            "1",
+            "--output-dir",
+            str(tmp_path),
+        ]
+    )
+    assert exit_code == 0
+    summary = json.loads((tmp_path / "complexity_summary.json").read_text())
+    assert [entry["name"] for entry in summary] == ["depth_first_search (miss)"]
+    assert (tmp_path / "complexity_summary.md").read_text().startswith("| Group")
+    assert list(tmp_path.glob("*.png"))
@@ -0,0 +1,84 @@
+import json
+
+from benchmarks.memory_report import (
+    COMMIT_VARIABLE,
+    MemoryCase,
+    compare_documents,
+    default_cases,
+    main,
+    measure_case,
+)
+
+
+def _case(name):
+    return next(case for case in default_cases() if case.name == name)
+
+
+def test_measure_case_reports_retained_result():
+    case = MemoryCase(
+        "list", "synthetic", lambda n: n, lambda n: [object() for _ in range(n)]
+    )
+    result = measure_case(case, 1000)
+    assert result["retained_bytes"] >= 1000 * 16
+    assert result["peak_bytes"] >= result["retained_bytes"]
+    assert result["bytes_per_element"] == result["retained_bytes"] / 1000
+
+
+def test_shallow_clear_of_doubly_linked_list_waits_for_cycle_collector():
+    shallow = measure_case(_case("shallow_clear_dll"), 2000)
+    deep = measure_case(_case("deep_clear_dll"), 2000)
+    # The prev/next cycles keep the nodes alive until a collection runs.
+    assert shallow["retained_bytes"] > -1000
+    assert shallow["retained_after_gc_bytes"] < -2000 * 50
+    # Breaking the links lets reference counting free the nodes immediately.
+    assert deep["retained_bytes"] < -2000 * 50
+
+
+def _document(peak, retained):
+    return {
+        "metadata": {},
+        "results": [
+            {
+                "group": "build",
+                "name": "build_sll",
+                "size": 10,
+                "peak_bytes": peak,
+                "retained_bytes": retained,
+                "retained_after_gc_bytes": retained,
+                "bytes_per_element": retained / 10,
+            }
+        ],
+    }
+
+
+def test_compare_documents_flags_growth_above_threshold():
+    (comparison,) = compare_documents(_document(1000, 800), _document(1200, 820))
+    assert comparison["regressions"] == ["peak_bytes"]
+    assert comparison["peak_bytes"]["change"] == 0.2
+
+
+def test_compare_documents_skips_unmatched_cases():
+    new = _document(1000, 800)
+    new["results"][0]["size"] = 20
+    assert compare_documents(_document(1000, 800), new) == []
+
+
+def test_main_run_and_compare(tmp_path, capsys):
+    output = tmp_path / "memory.json"
+    assert (
+        main(["run", "--sizes", "50", "--only", "build_sll", "--output", str(output)])
+        == 0
+    )
+    document = json.loads(output.read_text())
+    assert [r["name"] for r in document["results"]] == ["build_sll"]
+    assert document["metadata"]["sizes"] == [50]
+
+    assert main(["compare", str(output), str(output), "--fail-on-regression"]) == 0
+    assert "build_sll" in capsys.readouterr().out
+
+
+def test_run_records_the_commit_passed_by_the_parent(tmp_path, monkeypatch):
+    monkeypatch.setenv(COMMIT_VARIABLE, "0" * 40)
+    output = tmp_path / "memory.json"
+    main(["run", "--sizes", "10", "--only", "build_sll", "--output", str(output)])
+    assert json.loads(output.read_text())["metadata"]["commit"] == "0" * 40
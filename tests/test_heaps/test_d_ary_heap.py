@@ -0,0 +1,144 @@
+import heapq
+import random
+
+import pytest
+
+from src.data_structures.heaps.d_ary_heap.d_ary_heap_operations import (
+    build_d_ary_heap,
+    create_d_ary_heap,
+    heap_decrease_key,
+    heap_peek,
+    heap_pop,
+    heap_push,
+    heap_remove,
+    heap_update_key,
+)
+
+
+def _check_invariants(heap):
+    priorities, handles = heap.priorities, heap.handles
+    assert len(priorities) == len(handles)
+    for index, handle in enumerate(handles):
+        assert handle.index == index
+        assert handle.priority == priorities[index]
+        if index:
+            assert not priorities[index] < priorities[(index - 1) // heap.arity]
+
+
+@pytest.mark.parametrize("arity", [2, 3, 4, 8])
+def test_random_operations_match_a_reference(arity):
+    rng = random.Random(arity)
+    heap = create_d_ary_heap(arity)
+    live = {}
+
+    for step in range(3000):
+        action = rng.random()
+        if action < 0.4 or not live:
+            handle = heap_push(heap, step, rng.randint(0, 1000))
+            live[step] = handle
+        elif action < 0.6:
+            handle = heap_pop(heap)
+            assert handle.priority == min(h.priority for h in live.values())
+            assert handle.index == -1
+            del live[handle.item]
+        elif action < 0.75:
+            handle = rng.choice(list(live.values()))
+            heap_decrease_key(heap, handle, handle.priority - rng.randint(0, 50))
+        elif action < 0.9:
+            handle = rng.choice(list(live.values()))
+            heap_update_key(heap, handle, rng.randint(0, 1000))
+        else:
+            handle = rng.choice(list(live.values()))
+            heap_remove(heap, handle)
+            assert handle not in heap
+            del live[handle.item]
+
+        assert len(heap) == len(live)
+        if step % 100 == 0:
+            _check_invariants(heap)
+
+    _check_invariants(heap)
+    popped = [heap_pop(heap).priority for _ in range(len(heap))]
+    assert popped == sorted(h.priority for h in live.values())
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 5, 100])
+def test_build_heapifies_and_returns_handles_in_input_order(size):
+    rng = random.Random(size)
+    priorities = [rng.randint(0, 50) for _ in range(size)]
+    heap, handles = build_d_ary_heap(range(size), priorities, arity=3)
+
+    _check_invariants(heap)
+    assert [handle.item for handle in handles] == list(range(size))
+    assert all(handle in heap for handle in handles)
+    assert [heap_pop(heap).priority for _ in range(size)] == sorted(priorities)
+
+
+def test_dijkstra_matches_heapq_with_lazy_deletion():
+    rng = random.Random(0)
+    size = 300
+    graph = [
+        [(rng.randrange(size), rng.randint(1, 20)) for _ in range(5)]
+        for _ in range(size)
+    ]
+
+    expected = [None] * size
+    queue = [(0, 0)]
+    while queue:
+        distance, node = heapq.heappop(queue)
+        if expected[node] is not None:
+            continue
+        expected[node] = distance
+        for neighbour, weight in graph[node]:
+            if expected[neighbour] is None:
+                heapq.heappush(queue, (distance + weight, neighbour))
+
+    distances = [None] * size
+    heap = create_d_ary_heap()
+    handles = {0: heap_push(heap, 0, 0)}
+    while heap:
+        handle = heap_pop(heap)
+        node = handle.item
+        distances[node] = handle.priority
+        for neighbour, weight in graph[node]:
+            candidate = handle.priority + weight
+            known = handles.get(neighbour)
+            if known is None:
+                handles[neighbour] = heap_push(heap, neighbour, candidate)
+            elif known in heap and candidate < known.priority:
+                heap_decrease_key(heap, known, candidate)
+
+    assert distances == expected
+
+
+def test_handles_and_peek():
+    heap = create_d_ary_heap(arity=2)
+    first = heap_push(heap, "first", (1, "tie"))
+    heap_push(heap, "second", (2, "a"))
+    assert heap_peek(heap) is first
+    assert first in heap
+    assert repr(first) == "HeapHandle('first', priority=(1, 'tie'))"
+    assert {handle.item for handle in heap} == {"first", "second"}
+
+
+def test_invalid_input_raises():
+    with pytest.raises(ValueError):
+        create_d_ary_heap(1)
+    with pytest.raises(ValueError):
+        build_d_ary_heap([1, 2], [1])
+    with pytest.raises(ValueError):
+        heap_pop(create_d_ary_heap())
+    with pytest.raises(ValueError):
+        heap_peek(create_d_ary_heap())
+    with pytest.raises(ValueError):
+        heap_push(None, "item", 1)
+
+    heap = create_d_ary_heap()
+    handle = heap_push(heap, "item", 5)
+    with pytest.raises(ValueError):
+        heap_decrease_key(heap, handle, 6)
+    heap_remove(heap, handle)
+    with pytest.raises(ValueError):
+        heap_remove(heap, handle)
+    with pytest.raises(ValueError):
+        heap_update_key(create_d_ary_heap(), heap_push(heap, "other", 1), 0)
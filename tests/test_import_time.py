@@ -0,0 +1,69 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPOSITORY_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time allowed for each package, in microseconds. The real
+# cost is well under a millisecond; the budget leaves room for slow CI hosts
+# while still catching an eager import of a submodule or a heavy dependency.
+IMPORT_BUDGET_US = 25_000
+
+HEAVY_MODULES = ("matplotlib", "graphviz", "IPython", "jupyter", "numpy")
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Run ``statement`` under ``-X importtime`` and return cumulative times."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPOSITORY_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize("package", ["src.data_structures", "src.algorithms"])
+def test_package_import_within_budget(package):
+    times = _import_times(f"import {package}")
+    assert times[package] < IMPORT_BUDGET_US
+
+
+@pytest.mark.performance_test
+def test_package_import_is_lazy():
+    times = _import_times("import src.data_structures, src.algorithms")
+    assert "src.data_structures.linked_lists" not in times
+    assert "src.data_structures.trees" not in times
+    assert not [name for name in times if name.split(".")[0] in HEAVY_MODULES]
+
+
+@pytest.mark.performance_test
+def test_core_modules_do_not_import_heavy_dependencies():
+    times = _import_times(
+        "import src.data_structures.trees.n_ary_trees.n_ary_tree_operations, "
+        "src.data_structures.linked_lists.singly_linked_list.singly_linked_list_operations"
+    )
+    assert not [name for name in times if name.split(".")[0] in HEAVY_MODULES]
+
+
+def test_lazy_attribute_access_loads_submodules():
+    import src.data_structures as data_structures
+    from src.data_structures.linked_lists import singly_linked_list
+
+    assert data_structures.trees.tree_node.TreeNode.__name__ == "TreeNode"
+    assert "linked_lists" in dir(data_structures)
+    assert singly_linked_list.SinglyLinkedList.__name__ == "SinglyLinkedList"
+    assert "insert_sll_element" in dir(singly_linked_list)
+    assert "SinglyLinkedList" in vars(singly_linked_list)
+    with pytest.raises(AttributeError):
+        data_structures.not_a_submodule
@@ -0,0 +1,19 @@
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_builders import (
+    build_tree_from_parent_array,
+)
+
+
+def _build_random_tree(rng, size, values=None):
+    # Every node's parent is drawn uniformly from the nodes before it. Node
+    # data is drawn from range(values), or is the node index without values.
+    parents = [-1] + [rng.randrange(value) for value in range(1, size)]
+    data = None if values is None else [rng.randrange(values) for _ in parents]
+    return build_tree_from_parent_array(parents, data)
+
+
+@pytest.fixture
+def random_tree():
+    """Build random n-ary trees: ``random_tree(rng, size, values=None)``."""
+    return _build_random_tree
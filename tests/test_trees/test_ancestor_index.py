@@ -0,0 +1,124 @@
+import random
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.data_structures.trees.flat_tree.ancestor_index_operations import (  # noqa: E402
+    are_ancestors,
+    create_ancestor_index,
+    is_ancestor,
+    lowest_common_ancestor,
+    lowest_common_ancestors,
+    node_distance,
+    node_distances,
+)
+from src.data_structures.trees.flat_tree.flat_tree_operations import (  # noqa: E402
+    create_flat_tree_from_parent_array,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (  # noqa: E402
+    add_child_node,
+    create_root,
+    create_root_with_children_data_list,
+    iter_pre_order,
+)
+
+
+def _random_tree(seed, size=200):
+    rng = random.Random(seed)
+    root = create_root(0)
+    nodes = [root]
+    for value in range(1, size):
+        nodes.append(add_child_node(rng.choice(nodes), value))
+    return root
+
+
+def _ancestors(node):
+    path = []
+    while node is not None:
+        path.append(node)
+        node = node.parent
+    return path
+
+
+def _naive_lca(first, second):
+    first_ancestors = _ancestors(first)
+    return next(node for node in _ancestors(second) if node in first_ancestors)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_queries_match_parent_pointer_walks(seed):
+    root = _random_tree(seed)
+    index = create_ancestor_index(root)
+    nodes = list(iter_pre_order(root))
+    rng = random.Random(seed)
+
+    for _ in range(500):
+        u, v = rng.choice(nodes), rng.choice(nodes)
+        lca = _naive_lca(u, v)
+        assert lowest_common_ancestor(index, u, v) is lca
+        assert is_ancestor(index, u, v) == (u in _ancestors(v))
+        assert node_distance(index, u, v) == (
+            len(_ancestors(u)) + len(_ancestors(v)) - 2 * len(_ancestors(lca))
+        )
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_batch_queries_match_scalar_queries(seed):
+    root = _random_tree(seed)
+    index = create_ancestor_index(root)
+    rng = np.random.default_rng(seed)
+    u = rng.integers(0, len(index), 1_000)
+    v = rng.integers(0, len(index), 1_000)
+
+    lcas = lowest_common_ancestors(index, u, v)
+    assert list(lcas) == [lowest_common_ancestor(index, a, b) for a, b in zip(u, v)]
+    assert list(are_ancestors(index, u, v)) == [
+        is_ancestor(index, a, b) for a, b in zip(u, v)
+    ]
+    assert list(node_distances(index, u, v)) == [
+        node_distance(index, a, b) for a, b in zip(u, v)
+    ]
+
+
+def test_small_trees_and_flat_tree_input():
+    single = create_ancestor_index(create_root("only"))
+    assert lowest_common_ancestor(single, 0, 0) == 0
+    assert list(lowest_common_ancestors(single, [0], [0])) == [0]
+
+    # 0 -> [1 -> [2], 3]
+    index = create_ancestor_index(create_flat_tree_from_parent_array([-1, 0, 1, 0]))
+    assert index.nodes is None
+    assert lowest_common_ancestor(index, 2, 3) == 0
+    assert lowest_common_ancestor(index, 2, 1) == 1
+    assert node_distance(index, 2, 3) == 3
+    assert list(are_ancestors(index, [0, 1, 2], [2, 2, 1])) == [True, True, False]
+
+
+def test_deep_path_tree():
+    depth = sys.getrecursionlimit() * 5
+    index = create_ancestor_index(
+        create_flat_tree_from_parent_array([-1] + list(range(depth - 1)))
+    )
+    assert lowest_common_ancestor(index, depth - 1, 17) == 17
+    assert node_distance(index, 0, depth - 1) == depth - 1
+
+
+def test_invalid_queries():
+    root = create_root_with_children_data_list("a", ["b"])
+    index = create_ancestor_index(root)
+    with pytest.raises(ValueError):
+        lowest_common_ancestor(index, root, create_root("other"))
+    with pytest.raises(ValueError):
+        is_ancestor(index, 0, 5)
+    with pytest.raises(ValueError):
+        lowest_common_ancestors(index, [0, 1], [1])
+    with pytest.raises(ValueError):
+        node_distances(index, [0], [-1])
+    with pytest.raises(ValueError):
+        create_ancestor_index(None)
+
+    id_index = create_ancestor_index(create_flat_tree_from_parent_array([-1, 0]))
+    with pytest.raises(ValueError):
+        is_ancestor(id_index, root, root)
@@ -0,0 +1,188 @@
+import bisect
+import random
+
+import pytest
+
+from src.data_structures.trees.avl_tree.avl_tree import AVLTree, AVLTreeNode
+from src.data_structures.trees.avl_tree.avl_tree_operations import (
+    avl_ceiling,
+    avl_delete,
+    avl_floor,
+    avl_get,
+    avl_insert,
+    avl_iter_range,
+    avl_rank,
+    avl_search,
+    avl_select,
+    build_avl_tree,
+    create_avl_tree,
+)
+
+
+def _check_invariants(tree):
+    def check(node, parent, low, high):
+        if node is None:
+            return 0, 0
+        assert node.parent is parent
+        assert low is None or low < node.data
+        assert high is None or node.data < high
+        left_height, left_size = check(node.left_child, node, low, node.data)
+        right_height, right_size = check(node.right_child, node, node.data, high)
+        assert abs(left_height - right_height) <= 1
+        assert node.height == 1 + max(left_height, right_height)
+        assert node.size == 1 + left_size + right_size
+        return node.height, node.size
+
+    check(tree.root, None, None, None)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_operations_match_a_sorted_list(seed):
+    rng = random.Random(seed)
+    tree = create_avl_tree()
+    keys, values = [], {}
+
+    for step in range(600):
+        key = rng.randrange(200)
+        if rng.random() < 0.6:
+            avl_insert(tree, key, step)
+            if key not in values:
+                bisect.insort(keys, key)
+            values[key] = step
+        else:
+            assert avl_delete(tree, key) == (key in values)
+            if key in values:
+                keys.remove(key)
+                del values[key]
+
+        if step % 50 == 0:
+            _check_invariants(tree)
+
+    _check_invariants(tree)
+    assert list(tree) == keys
+    assert len(tree) == len(keys)
+    for key in range(-1, 201):
+        assert avl_get(tree, key, "missing") == values.get(key, "missing")
+        assert (key in tree) == (key in values)
+        assert avl_rank(tree, key) == bisect.bisect_left(keys, key)
+
+
+def test_sequential_inserts_stay_balanced():
+    tree = create_avl_tree()
+    for key in range(1024):
+        avl_insert(tree, key)
+    _check_invariants(tree)
+    assert tree.root.height == 11
+
+    for key in range(0, 1024, 2):
+        avl_delete(tree, key)
+    _check_invariants(tree)
+    assert list(tree) == list(range(1, 1024, 2))
+
+
+def test_insert_replaces_the_value_of_an_existing_key():
+    tree = build_avl_tree(["a", "b"], [1, 2])
+    node = avl_insert(tree, "a", 10)
+    assert node is avl_search(tree, "a")
+    assert avl_get(tree, "a") == 10
+    assert len(tree) == 2
+
+
+def test_delete_missing_key_and_empty_tree():
+    tree = create_avl_tree()
+    assert not tree
+    assert avl_delete(tree, 1) is False
+    avl_insert(tree, 1)
+    assert avl_delete(tree, 1) is True
+    assert tree.root is None and len(tree) == 0
+
+
+def test_floor_and_ceiling():
+    tree = build_avl_tree([10, 20, 30])
+    assert avl_floor(tree, 25).data == 20
+    assert avl_floor(tree, 20).data == 20
+    assert avl_floor(tree, 5) is None
+    assert avl_ceiling(tree, 25).data == 30
+    assert avl_ceiling(tree, 30).data == 30
+    assert avl_ceiling(tree, 31) is None
+    assert avl_floor(create_avl_tree(), 1) is None
+
+
+def test_select_is_the_inverse_of_rank():
+    keys = list(range(0, 300, 3))
+    tree = build_avl_tree(keys)
+    for index, key in enumerate(keys):
+        assert avl_select(tree, index).data == key
+        assert avl_rank(tree, key) == index
+
+    with pytest.raises(IndexError):
+        avl_select(tree, len(keys))
+    with pytest.raises(IndexError):
+        avl_select(tree, -1)
+
+
+def test_range_iteration():
+    tree = build_avl_tree(range(0, 100, 2))
+    assert [node.data for node in avl_iter_range(tree, 11, 21)] == [12, 14, 16, 18, 20]
+    assert [node.data for node in avl_iter_range(tree, 10, 12)] == [10]
+    assert [node.data for node in avl_iter_range(tree, None, 5)] == [0, 2, 4]
+    assert [node.data for node in avl_iter_range(tree, 95)] == [96, 98]
+    assert list(avl_iter_range(tree, 50, 50)) == []
+    assert len(list(avl_iter_range(tree))) == 50
+
+
+class Key:
+    """Key that counts how often it is compared."""
+
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        Key.comparisons += 1
+        return self.value < other.value
+
+
+def test_range_iteration_is_lazy():
+    tree = build_avl_tree([Key(value) for value in range(10_000)])
+    Key.comparisons = 0
+    iterator = avl_iter_range(tree, Key(5000), Key(9000))
+    assert [next(iterator).data.value for _ in range(3)] == [5000, 5001, 5002]
+    assert Key.comparisons < 40
+
+
+def test_bulk_build():
+    tree = build_avl_tree(range(1000), [key * 2 for key in range(1000)])
+    _check_invariants(tree)
+    assert tree.root.height == 10
+    assert avl_get(tree, 321) == 642
+
+    empty = build_avl_tree([])
+    assert len(empty) == 0 and list(empty) == []
+
+    with pytest.raises(ValueError):
+        build_avl_tree([1, 1, 2])
+    with pytest.raises(ValueError):
+        build_avl_tree([2, 1])
+    with pytest.raises(ValueError):
+        build_avl_tree([1, 2], [1])
+
+
+def test_node_flags_follow_rotations():
+    tree = create_avl_tree()
+    for key in (1, 2, 3):
+        avl_insert(tree, key)
+
+    root = tree.root
+    assert isinstance(root, AVLTreeNode) and isinstance(tree, AVLTree)
+    assert root.data == 2 and root.is_root and root.is_parent
+    assert root.left_child.is_left and root.left_child.is_leaf
+    assert root.right_child.is_right and not root.right_child.is_root
+
+
+def test_none_tree_raises():
+    with pytest.raises(ValueError):
+        avl_insert(None, 1)
+    with pytest.raises(ValueError):
+        avl_delete(None, 1)
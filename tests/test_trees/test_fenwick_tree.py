@@ -0,0 +1,176 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.data_structures.trees.fenwick_tree.fenwick_tree_operations import (  # noqa: E402
+    create_fenwick_tree,
+    create_fenwick_tree_2d,
+    create_range_fenwick_tree,
+    fenwick_2d_add,
+    fenwick_2d_add_at,
+    fenwick_2d_rectangle_sum,
+    fenwick_2d_rectangle_sums,
+    fenwick_add,
+    fenwick_add_at,
+    fenwick_lower_bound,
+    fenwick_lower_bounds,
+    fenwick_prefix_sum,
+    fenwick_prefix_sums,
+    fenwick_range_sum,
+    fenwick_range_sums,
+    range_fenwick_add,
+    range_fenwick_add_ranges,
+    range_fenwick_prefix_sum,
+    range_fenwick_range_sum,
+    range_fenwick_range_sums,
+)
+
+
+def _random_ranges(rng, size, count):
+    lows = rng.integers(0, size + 1, count)
+    highs = rng.integers(0, size + 1, count)
+    return np.minimum(lows, highs), np.maximum(lows, highs)
+
+
+@pytest.mark.parametrize("size", [1, 2, 13, 64, 100])
+def test_point_updates_and_prefix_sums(size):
+    rng = random.Random(size)
+    expected = np.array([rng.randint(0, 20) for _ in range(size)])
+    tree = create_fenwick_tree(expected)
+    assert len(tree) == size
+
+    for _ in range(300):
+        position = rng.randrange(size)
+        delta = rng.randint(0, 5)
+        fenwick_add(tree, position, delta)
+        expected[position] += delta
+
+        low = rng.randrange(size + 1)
+        high = rng.randrange(low, size + 1)
+        assert fenwick_prefix_sum(tree, high) == expected[:high].sum()
+        assert fenwick_range_sum(tree, low, high) == expected[low:high].sum()
+
+        target = rng.randint(0, int(expected.sum()) + 1)
+        running = np.cumsum(expected)
+        assert fenwick_lower_bound(tree, target) == np.searchsorted(running, target)
+
+
+def test_batched_fenwick_operations():
+    rng = np.random.default_rng(0)
+    size = 1000
+    expected = rng.integers(0, 10, size)
+    tree = create_fenwick_tree(expected)
+
+    positions = rng.integers(0, size, 5000)
+    deltas = rng.integers(0, 10, 5000)
+    fenwick_add_at(tree, positions, deltas)
+    np.add.at(expected, positions, deltas)
+
+    running = np.concatenate(([0], np.cumsum(expected)))
+    counts = rng.integers(0, size + 1, 500)
+    np.testing.assert_array_equal(fenwick_prefix_sums(tree, counts), running[counts])
+
+    lows, highs = _random_ranges(rng, size, 500)
+    np.testing.assert_array_equal(
+        fenwick_range_sums(tree, lows, highs), running[highs] - running[lows]
+    )
+
+    targets = rng.integers(0, running[-1] + 10, 500)
+    np.testing.assert_array_equal(
+        fenwick_lower_bounds(tree, targets), np.searchsorted(running[1:], targets)
+    )
+
+
+def test_float_values():
+    tree = create_fenwick_tree([0.5, 0.25, 0.25])
+    assert fenwick_lower_bound(tree, 0.6) == 1
+    fenwick_add_at(tree, [2], 1.5)
+    assert fenwick_prefix_sum(tree, 3) == 2.5
+
+
+@pytest.mark.parametrize("size", [1, 7, 50])
+def test_range_updates_and_range_sums(size):
+    rng = np.random.default_rng(size)
+    expected = rng.integers(-20, 20, size)
+    tree = create_range_fenwick_tree(expected)
+
+    for _ in range(100):
+        low, high = sorted(rng.integers(0, size + 1, 2))
+        delta = int(rng.integers(-5, 6))
+        range_fenwick_add(tree, int(low), int(high), delta)
+        expected[low:high] += delta
+
+        count = int(rng.integers(0, size + 1))
+        assert range_fenwick_prefix_sum(tree, count) == expected[:count].sum()
+        assert range_fenwick_range_sum(tree, int(low), int(high)) == (
+            expected[low:high].sum()
+        )
+
+    lows, highs = _random_ranges(rng, size, 200)
+    deltas = rng.integers(-5, 6, 200)
+    range_fenwick_add_ranges(tree, lows, highs, deltas)
+    for low, high, delta in zip(lows, highs, deltas):
+        expected[low:high] += delta
+
+    lows, highs = _random_ranges(rng, size, 200)
+    np.testing.assert_array_equal(
+        range_fenwick_range_sums(tree, lows, highs),
+        [expected[low:high].sum() for low, high in zip(lows, highs)],
+    )
+
+
+def test_two_dimensional_tree():
+    rng = np.random.default_rng(3)
+    expected = rng.integers(0, 10, (9, 14))
+    tree = create_fenwick_tree_2d(expected)
+    assert tree.shape == (9, 14)
+
+    for _ in range(100):
+        row, column = int(rng.integers(0, 9)), int(rng.integers(0, 14))
+        delta = int(rng.integers(-5, 6))
+        fenwick_2d_add(tree, row, column, delta)
+        expected[row, column] += delta
+
+        top, bottom = sorted(int(value) for value in rng.integers(0, 10, 2))
+        left, right = sorted(int(value) for value in rng.integers(0, 15, 2))
+        assert fenwick_2d_rectangle_sum(tree, top, left, bottom, right) == (
+            expected[top:bottom, left:right].sum()
+        )
+
+    rows, columns = rng.integers(0, 9, 300), rng.integers(0, 14, 300)
+    deltas = rng.integers(-5, 6, 300)
+    fenwick_2d_add_at(tree, rows, columns, deltas)
+    np.add.at(expected, (rows, columns), deltas)
+
+    tops, bottoms = _random_ranges(rng, 9, 100)
+    lefts, rights = _random_ranges(rng, 14, 100)
+    np.testing.assert_array_equal(
+        fenwick_2d_rectangle_sums(tree, tops, lefts, bottoms, rights),
+        [
+            expected[top:bottom, left:right].sum()
+            for top, left, bottom, right in zip(tops, lefts, bottoms, rights)
+        ],
+    )
+
+
+def test_invalid_input_raises():
+    with pytest.raises(ValueError):
+        create_fenwick_tree([])
+    with pytest.raises(ValueError):
+        create_fenwick_tree_2d([1, 2])
+    with pytest.raises(ValueError):
+        create_range_fenwick_tree(["a"])
+
+    tree = create_fenwick_tree([1, 2, 3])
+    with pytest.raises(ValueError):
+        fenwick_add(tree, 3, 1)
+    with pytest.raises(ValueError):
+        fenwick_prefix_sum(tree, 4)
+    with pytest.raises(ValueError):
+        fenwick_range_sums(tree, [2], [1])
+    with pytest.raises(ValueError):
+        fenwick_add_at(tree, [0, 3], 1)
+    with pytest.raises(ValueError):
+        fenwick_2d_add(create_fenwick_tree_2d([[1]]), 0, 1, 1)
@@ -0,0 +1,174 @@
+import random
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.data_structures.trees.flat_tree.flat_tree_operations import (  # noqa: E402
+    create_flat_tree,
+    create_flat_tree_from_parent_array,
+    flat_tree_children,
+    flat_tree_depths,
+    flat_tree_level_order,
+    flat_tree_post_order,
+    flat_tree_pre_order,
+    flat_tree_subtree_sizes,
+    flat_tree_to_tree_node,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (  # noqa: E402
+    add_child_node,
+    create_root,
+    create_root_with_children_data_list,
+    iter_level_order,
+    iter_post_order,
+    iter_pre_order,
+)
+
+
+def _random_tree(seed, size=300):
+    rng = random.Random(seed)
+    root = create_root("n0")
+    nodes = [root]
+    for value in range(1, size):
+        nodes.append(add_child_node(rng.choice(nodes), f"n{value}"))
+    return root
+
+
+def _path_tree(size):
+    root = create_root(0)
+    current = root
+    for value in range(1, size):
+        current = add_child_node(current, value)
+    return root
+
+
+def _depth(node):
+    depth = 0
+    while node.parent is not None:
+        node, depth = node.parent, depth + 1
+    return depth
+
+
+@pytest.fixture
+def nested_tree():
+    # A -> [B, C, D], B -> [E, F], D -> [G]
+    root = create_root_with_children_data_list("A", ["B", "C", "D"])
+    add_child_node(root.children[0], "E")
+    add_child_node(root.children[0], "F")
+    add_child_node(root.children[2], "G")
+    return root
+
+
+def test_create_flat_tree_layout(nested_tree):
+    tree = create_flat_tree(nested_tree)
+    assert len(tree) == 7
+    assert list(tree.payload) == ["A", "B", "E", "F", "C", "D", "G"]
+    assert list(tree.parent) == [-1, 0, 1, 1, 0, 0, 5]
+    assert list(flat_tree_children(tree, 0)) == [1, 4, 5]
+    assert list(flat_tree_children(tree, 1)) == [2, 3]
+    assert list(flat_tree_children(tree, 4)) == []
+    assert tree[6] == "G"
+
+
+def test_flat_tree_arrays_are_read_only(nested_tree):
+    tree = create_flat_tree(nested_tree)
+    with pytest.raises(ValueError):
+        tree.parent[0] = 3
+    with pytest.raises(ValueError):
+        flat_tree_depths(tree)[0] = 3
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_traversals_match_tree_node_traversals(seed):
+    root = _random_tree(seed)
+    tree = create_flat_tree(root)
+
+    assert list(tree.payload[flat_tree_pre_order(tree)]) == [
+        n.data for n in iter_pre_order(root)
+    ]
+    assert list(tree.payload[flat_tree_post_order(tree)]) == [
+        n.data for n in iter_post_order(root)
+    ]
+    assert list(tree.payload[flat_tree_level_order(tree)]) == [
+        n.data for n in iter_level_order(root)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_depths_and_subtree_sizes(seed):
+    root = _random_tree(seed)
+    tree = create_flat_tree(root)
+    nodes = list(iter_pre_order(root))
+
+    assert list(flat_tree_depths(tree)) == [_depth(n) for n in nodes]
+    assert list(flat_tree_subtree_sizes(tree)) == [
+        sum(1 for _ in iter_pre_order(n)) for n in nodes
+    ]
+
+
+def test_round_trip_through_tree_node(nested_tree):
+    tree = create_flat_tree(nested_tree)
+    root = flat_tree_to_tree_node(tree)
+
+    assert [n.data for n in iter_pre_order(root)] == list(tree.payload)
+    assert root.is_root and root.is_parent and root.parent is None
+    for node in iter_pre_order(root):
+        assert all(child.parent is node for child in node.children)
+        assert node.is_leaf == (not node.children)
+        assert node.is_parent == bool(node.children)
+    assert list(create_flat_tree(root).parent) == list(tree.parent)
+
+
+def test_deep_trees_do_not_recurse():
+    size = sys.getrecursionlimit() * 5
+    tree = create_flat_tree(_path_tree(size))
+    assert flat_tree_depths(tree)[-1] == size - 1
+    assert flat_tree_subtree_sizes(tree)[0] == size
+    assert flat_tree_post_order(tree)[0] == size - 1
+    root = flat_tree_to_tree_node(tree)
+    assert sum(1 for _ in iter_pre_order(root)) == size
+
+
+def test_numeric_payload():
+    tree = create_flat_tree(_path_tree(10), dtype=np.int64)
+    assert tree.payload.dtype == np.int64
+    assert tree.payload.sum() == 45
+
+
+def test_nested_sequences_stay_objects():
+    root = create_root_with_children_data_list(("a", 1), [[1, 2], [3, 4]])
+    tree = create_flat_tree(root)
+    assert tree.payload.shape == (3,)
+    assert tree[1] == [1, 2]
+
+
+def test_create_from_parent_array():
+    tree = create_flat_tree_from_parent_array([-1, 0, 1, 0], "abcd")
+    assert list(tree.payload[flat_tree_level_order(tree)]) == ["a", "b", "d", "c"]
+    assert list(flat_tree_depths(tree)) == [0, 1, 2, 1]
+
+    default = create_flat_tree_from_parent_array([-1, 0, 0], dtype=np.int32)
+    assert default.payload.dtype == np.int32
+    assert list(default.payload) == [0, 1, 2]
+
+
+@pytest.mark.parametrize(
+    "parent, payload",
+    [
+        ([], None),
+        ([0, 0], None),
+        ([-1, 1], None),
+        ([-1, 0, -1], None),
+        ([-1, 0, 0, 1], None),  # Node 3 is inside node 1's subtree
+        ([-1, 0], "abc"),
+    ],
+)
+def test_create_from_parent_array_rejects_invalid_input(parent, payload):
+    with pytest.raises(ValueError):
+        create_flat_tree_from_parent_array(parent, payload)
+
+
+def test_create_flat_tree_rejects_none():
+    with pytest.raises(ValueError):
+        create_flat_tree(None)
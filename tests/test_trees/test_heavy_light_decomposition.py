@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.heavy_light_decomposition import (
+    create_heavy_light_decomposition,
+    hld_get_weight,
+    hld_lowest_common_ancestor,
+    hld_path_max,
+    hld_path_maxima,
+    hld_path_min,
+    hld_path_minima,
+    hld_path_sum,
+    hld_path_sums,
+    hld_set_weight,
+    hld_set_weights,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_builders import (
+    build_tree_from_parent_array,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    iter_pre_order,
+)
+from src.data_structures.trees.tree_node import TreeNode
+
+
+def _random_tree(rng, size):
+    parents = [-1] + [
+        rng.randrange(max(0, value - 5), value) for value in range(1, size)
+    ]
+    return build_tree_from_parent_array(parents, list(range(size)))
+
+
+def _path(first, second):
+    ancestors = []
+    node = first
+    while node is not None:
+        ancestors.append(node)
+        node = node.parent
+    up = []
+    node = second
+    while node not in ancestors:
+        up.append(node)
+        node = node.parent
+    # The lowest common ancestor is ``node``.
+    return ancestors[: ancestors.index(node) + 1] + up[::-1], node
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_path_queries_match_walking_the_path(seed):
+    rng = random.Random(seed)
+    root = _random_tree(rng, 300)
+    nodes = list(iter_pre_order(root))
+    weights = {node: rng.randint(-50, 50) for node in nodes}
+    hld = create_heavy_light_decomposition(root, weight=lambda data: data % 7 - 3)
+    hld_set_weights(hld, weights.items())
+    assert len(hld) == len(nodes)
+
+    for _ in range(300):
+        u, v = rng.choice(nodes), rng.choice(nodes)
+        path, lca = _path(u, v)
+        path = [weights[node] for node in path]
+        assert hld_path_sum(hld, u, v) == sum(path)
+        assert hld_path_max(hld, u, v) == max(path)
+        assert hld_path_min(hld, u, v) == min(path)
+        assert hld_lowest_common_ancestor(hld, u, v) is lca
+
+        node = rng.choice(nodes)
+        weights[node] = rng.randint(-50, 50)
+        hld_set_weight(hld, node, weights[node])
+        assert hld_get_weight(hld, node) == weights[node]
+
+
+def test_lowest_common_ancestor():
+    root = build_tree_from_parent_array([-1, 0, 0, 1, 1, 3], list(range(6)))
+    nodes = {node.data: node for node in iter_pre_order(root)}
+    hld = create_heavy_light_decomposition(root)
+    assert hld_lowest_common_ancestor(hld, nodes[5], nodes[4]) is nodes[1]
+    assert hld_lowest_common_ancestor(hld, nodes[5], nodes[2]) is root
+    assert hld_lowest_common_ancestor(hld, nodes[3], nodes[5]) is nodes[3]
+
+
+def test_batched_queries_and_updates():
+    rng = random.Random(7)
+    root = _random_tree(rng, 500)
+    nodes = list(iter_pre_order(root))
+    hld = create_heavy_light_decomposition(root)
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(200)]
+
+    assert hld_path_sums(hld, pairs) == [hld_path_sum(hld, u, v) for u, v in pairs]
+    assert hld_path_maxima(hld, pairs) == [hld_path_max(hld, u, v) for u, v in pairs]
+    assert hld_path_minima(hld, pairs) == [hld_path_min(hld, u, v) for u, v in pairs]
+
+    # Later updates of the same node win.
+    updates = [(node, -node.data) for node in nodes[::3]] + [(nodes[0], 1000)]
+    hld_set_weights(hld, updates)
+    expected = create_heavy_light_decomposition(root)
+    for node, weight in updates:
+        hld_set_weight(expected, node, weight)
+    assert hld.sums == expected.sums
+    assert hld.maxima == expected.maxima and hld.minima == expected.minima
+
+
+def test_path_tree_is_one_chain():
+    root = build_tree_from_parent_array(list(range(-1, 999)), [1] * 1000)
+    hld = create_heavy_light_decomposition(root)
+    assert set(hld.heads) == {0}
+    leaf = hld.nodes[-1]
+    assert hld_path_sum(hld, root, leaf) == 1000
+    assert hld_path_sum(hld, leaf, leaf) == 1
+
+
+def test_single_node_tree():
+    root = TreeNode(5)
+    hld = create_heavy_light_decomposition(root)
+    assert hld_path_sum(hld, root, root) == 5
+    hld_set_weights(hld, [(root, 2)])
+    assert hld_path_max(hld, root, root) == 2
+
+
+def test_invalid_input_raises():
+    with pytest.raises(ValueError):
+        create_heavy_light_decomposition(None)
+
+    hld = create_heavy_light_decomposition(TreeNode(1))
+    with pytest.raises(ValueError):
+        hld_path_sum(hld, TreeNode(1), TreeNode(1))
+    with pytest.raises(ValueError):
+        hld_path_sums(hld, [(TreeNode(1), TreeNode(1))])
+    with pytest.raises(ValueError):
+        hld_set_weights(hld, [(TreeNode(1), 3)])
+    assert hld_get_weight(hld, hld.nodes[0]) == 1
@@ -0,0 +1,183 @@
+import pytest
+
+from src.data_structures.trees.n_ary_trees.lazy_tree import (
+    LazyTreeCache,
+    LazyTreeNode,
+    create_lazy_root,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_builders import (
+    build_tree_from_edges,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    breadth_first_search,
+    depth_first_search,
+    iter_level_order,
+    iter_post_order,
+    level_order_traversal,
+    post_order_traversal,
+    pre_order_traversal,
+)
+
+
+class CountingLoader:
+    """Children of n are 3n + 1 .. 3n + 3, below ``limit`` (no limit if None)."""
+
+    def __init__(self, limit=None):
+        self.limit = limit
+        self.calls = []
+
+    def __call__(self, value):
+        self.calls.append(value)
+        children = range(3 * value + 1, 3 * value + 4)
+        return [child for child in children if self.limit is None or child < self.limit]
+
+
+def _eager_tree(limit):
+    return build_tree_from_edges(
+        [((child - 1) // 3, child) for child in range(1, limit)]
+    )
+
+
+def test_children_are_loaded_on_first_access():
+    loader = CountingLoader()
+    root = create_lazy_root(0, loader)
+
+    assert root.is_root and not root.is_loaded
+    assert loader.calls == []
+
+    assert [child.data for child in root.children] == [1, 2, 3]
+    assert root.is_loaded and root.is_parent
+    assert all(isinstance(child, LazyTreeNode) for child in root.children)
+    assert all(child.parent is root for child in root.children)
+
+    root.children_nodes
+    assert loader.calls == [0]
+
+
+@pytest.mark.parametrize(
+    "traversal", [pre_order_traversal, post_order_traversal, level_order_traversal]
+)
+def test_traversals_match_an_eager_tree(traversal):
+    root = create_lazy_root(0, CountingLoader(limit=200))
+    assert traversal(root, []) == traversal(_eager_tree(200), [])
+
+
+def test_searches_only_load_what_they_visit():
+    loader = CountingLoader()
+    root = create_lazy_root(0, loader)
+
+    # The tree is infinite, so a full load would never finish.
+    assert breadth_first_search(root, 20).data == 20
+    assert loader.calls == list(range(20))
+
+    root = create_lazy_root(0, CountingLoader(limit=40))
+    assert depth_first_search(root, 5).data == 5
+    assert root.cache.loader.calls == [0, 1, 4, 13, 14, 15]
+
+
+def test_leaves_are_marked_after_loading():
+    root = create_lazy_root(0, CountingLoader(limit=4))
+    leaf = root.children[0]
+    assert not leaf.is_leaf
+    assert leaf.children == []
+    assert leaf.is_leaf and not leaf.is_parent
+
+
+def test_cache_stays_bounded_and_reloads_evicted_subtrees():
+    loader = CountingLoader(limit=3000)
+    root = create_lazy_root(0, loader, max_nodes=100)
+
+    visited = [node.data for node in iter_post_order(root)]
+    assert sorted(visited) == list(range(3000))
+    assert len(root.cache) <= 100
+
+    calls = len(loader.calls)
+    assert len(list(iter_level_order(root))) == 3000
+    assert len(loader.calls) > calls
+
+
+def test_recently_read_subtrees_are_kept():
+    loader = CountingLoader()
+    root = create_lazy_root(0, loader, max_nodes=20)
+    hot = root.children[0]
+    hot.children
+
+    for cold in root.children[1:]:
+        for child in cold.children:
+            child.children
+            hot.children
+            root.children
+
+    calls = len(loader.calls)
+    hot.children
+    root.children
+    assert len(loader.calls) == calls
+
+
+def test_nodes_survive_eviction_of_their_parent():
+    root = create_lazy_root(0, CountingLoader(), max_nodes=5)
+    parent = root.children[0]
+    first = parent.children[0]
+
+    root.children[1].children
+    assert not parent.is_loaded and root.is_loaded
+
+    assert first.data == 4 and first.parent is parent
+    assert [child.data for child in parent.children] == [4, 5, 6]
+    assert parent.children[0] is not first
+
+
+def test_deep_descent_keeps_the_path_loaded():
+    loader = CountingLoader()
+    root = create_lazy_root(0, loader, max_nodes=10)
+
+    node = root
+    for depth in range(1, 12):
+        children = node.children
+        assert node.is_loaded and node.children is children
+        assert len(loader.calls) == depth
+        node = children[0]
+
+    path = node.parent
+    while path is not None:
+        assert path.is_loaded
+        path = path.parent
+
+
+def test_node_wider_than_the_cache_is_still_readable():
+    root = create_lazy_root("root", lambda data: range(50) if data == "root" else [])
+    root.cache.max_nodes = 10
+    assert len(root.children) == 50
+    assert root.is_loaded
+
+
+def test_unload_and_clear():
+    root = create_lazy_root(0, CountingLoader())
+    child = root.children[0]
+    child.children
+
+    root.cache.unload(child)
+    assert not child.is_loaded and root.is_loaded
+    assert len(root.cache) == 4
+
+    root.cache.clear()
+    assert not root.is_loaded and len(root.cache) == 0
+
+
+def test_assigning_children_registers_them():
+    root = create_lazy_root(0, CountingLoader())
+    other = LazyTreeNode("x", root.cache)
+
+    root.children_nodes = [other]
+    assert root.children == [other] and other.parent is root
+    assert root.cache.loader.calls == []
+
+    root.children_nodes = None
+    assert [child.data for child in root.children] == [1, 2, 3]
+
+
+def test_invalid_cache_size_raises():
+    with pytest.raises(ValueError):
+        create_lazy_root(0, CountingLoader(), max_nodes=0)
+    with pytest.raises(ValueError):
+        LazyTreeCache(CountingLoader(), -1)
@@ -0,0 +1,161 @@
+import random
+import sys
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.merkle_hashes import (
+    MerkleHashes,
+    merkle_hash,
+    track_merkle_hashes,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_builders import (
+    build_tree_from_parent_array,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    add_child_node,
+    add_child_nodes_from_index,
+    create_root,
+    create_root_with_children_data_list,
+    iter_pre_order,
+    search_and_remove_node,
+    search_and_remove_nodes,
+)
+from src.data_structures.trees.n_ary_trees.tree_observers import (
+    ValueIndex,
+    register_observer,
+)
+
+
+def _check_all(hashes, root):
+    for node in iter_pre_order(root):
+        assert hashes[node] == merkle_hash(node)
+
+
+def test_equal_trees_have_equal_hashes(random_tree):
+    first = random_tree(random.Random(1), 200, 10)
+    second = random_tree(random.Random(1), 200, 10)
+    assert merkle_hash(first) == merkle_hash(second)
+    assert track_merkle_hashes(first)[first] == track_merkle_hashes(second)[second]
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        ("a", ["c", "b"]),  # sibling order
+        ("a", ["b", "x"]),  # payload
+        ("a", ["b"]),  # missing leaf
+        ("a", ["b", "c", "d"]),  # extra leaf
+    ],
+)
+def test_different_trees_have_different_hashes(other):
+    base = create_root_with_children_data_list("a", ["b", "c"])
+    assert merkle_hash(base) != merkle_hash(create_root_with_children_data_list(*other))
+
+
+def test_shape_changes_the_hash():
+    flat = create_root_with_children_data_list("a", ["b", "c"])
+    nested = create_root("a")
+    add_child_node(add_child_node(nested, "b"), "c")
+    assert merkle_hash(flat) != merkle_hash(nested)
+
+
+def test_equal_subtrees_compare_equal():
+    root = create_root("r")
+    for _ in range(2):
+        child = add_child_node(root, "x")
+        add_child_nodes_from_index(child, ["y", "z"], 0)
+
+    hashes = track_merkle_hashes(root)
+    first, second = root.children_nodes
+    assert hashes[first] == hashes[second]
+    assert hashes[first] != hashes[root]
+
+
+def test_hashes_follow_random_mutations(random_tree):
+    rng = random.Random(5)
+    root = random_tree(random.Random(3), 150, 10)
+    register_observer(root, ValueIndex())
+    hashes = track_merkle_hashes(root)
+
+    for step in range(150):
+        nodes = list(iter_pre_order(root))
+        choice = rng.random()
+        if choice < 0.5:
+            add_child_node(rng.choice(nodes), rng.randrange(10))
+        elif choice < 0.8:
+            search_and_remove_node(root, rng.randrange(1, 10))
+        else:
+            search_and_remove_nodes(root, [rng.randrange(1, 10), rng.randrange(1, 10)])
+
+        assert hashes[root] == merkle_hash(root)
+        if step % 25 == 0:
+            _check_all(hashes, root)
+
+
+def test_hashes_of_wide_nodes_follow_mutations():
+    rng = random.Random(6)
+    root = create_root_with_children_data_list("r", list(range(60)))
+    hashes = track_merkle_hashes(root)
+    _check_all(hashes, root)
+
+    for step in range(200):
+        nodes = list(iter_pre_order(root))
+        choice = rng.random()
+        if choice < 0.4:
+            add_child_node(rng.choice([root, root.children[0]]), rng.randrange(10))
+        elif choice < 0.6:
+            add_child_node(rng.choice(nodes), rng.randrange(10))
+        elif choice < 0.8:
+            search_and_remove_node(root, rng.randrange(60))
+        else:
+            node = rng.choice(nodes)
+            node.data = rng.randrange(100)
+            hashes.refresh(node)
+
+        assert hashes[root] == merkle_hash(root)
+        if step % 25 == 0:
+            _check_all(hashes, root)
+
+
+def test_wide_nodes_hash_their_children_in_order():
+    values = list(range(50))
+    first = create_root_with_children_data_list("r", values)
+    second = create_root_with_children_data_list("r", values[::-1])
+    assert merkle_hash(first) != merkle_hash(second)
+    assert merkle_hash(first) == merkle_hash(
+        create_root_with_children_data_list("r", values)
+    )
+
+
+def test_refresh_after_changing_data():
+    root = create_root_with_children_data_list("a", ["b", "c"])
+    hashes = track_merkle_hashes(root)
+    before = hashes[root]
+
+    child = root.children_nodes[0]
+    child.data = "z"
+    assert hashes[root] == before
+
+    hashes.refresh(child)
+    assert hashes[root] == merkle_hash(root) != before
+
+
+def test_custom_encoder():
+    root = create_root_with_children_data_list("a", ["b"])
+    hashes = track_merkle_hashes(root, encode=str.encode)
+    assert isinstance(hashes, MerkleHashes)
+    assert hashes[root] == merkle_hash(root, encode=str.encode)
+    assert hashes[root] != merkle_hash(root)
+
+
+def test_deep_tree():
+    size = sys.getrecursionlimit() * 3
+    root = build_tree_from_parent_array([-1] + list(range(size - 1)))
+    assert track_merkle_hashes(root)[root] == merkle_hash(root)
+
+
+def test_none_root_raises():
+    with pytest.raises(ValueError):
+        merkle_hash(None)
+    with pytest.raises(ValueError):
+        track_merkle_hashes(None)
@@ -0,0 +1,165 @@
+import json
+import sys
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_builders import (
+    build_tree_from_edges,
+    build_tree_from_json,
+    build_tree_from_nested_dict,
+    build_tree_from_parent_array,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    add_child_node,
+    add_child_nodes_from_index,
+    depth_first_search,
+    iter_pre_order,
+    pre_order_traversal,
+    search_and_remove_node,
+    search_and_remove_nodes,
+)
+from src.data_structures.trees.n_ary_trees.tree_observers import (
+    ValueIndex,
+    find_observer,
+)
+
+
+def _shape(root):
+    return [
+        (node.data, [child.data for child in node.children])
+        for node in iter_pre_order(root)
+    ]
+
+
+def _check_links_and_flags(root):
+    assert root.parent is None and root.is_root
+    for node in iter_pre_order(root):
+        assert all(child.parent is node for child in node.children)
+        assert all(not child.is_root for child in node.children)
+        assert node.is_parent == bool(node.children)
+        assert node.is_leaf == (not node.children)
+
+
+EXPECTED_SHAPE = [
+    ("a", ["b", "c"]),
+    ("b", ["d"]),
+    ("d", []),
+    ("c", []),
+]
+
+
+def test_build_tree_from_parent_array():
+    root = build_tree_from_parent_array([1, -1, 1, 0], ["b", "a", "c", "d"])
+    assert _shape(root) == EXPECTED_SHAPE
+    _check_links_and_flags(root)
+
+
+def test_build_tree_from_parent_array_defaults_to_indices():
+    root = build_tree_from_parent_array([-1, 0, 0])
+    assert pre_order_traversal(root, []) == [0, 1, 2]
+
+
+@pytest.mark.parametrize(
+    "parents, data",
+    [
+        ([0, -1, -1], None),  # Two roots
+        ([0, 0], None),  # No root
+        ([-1, 5], None),  # Out of range
+        ([-1, 2, 1], None),  # Cycle
+        ([-1, 0], ["a"]),  # Length mismatch
+    ],
+)
+def test_build_tree_from_parent_array_rejects_invalid_input(parents, data):
+    with pytest.raises(ValueError):
+        build_tree_from_parent_array(parents, data)
+
+
+def test_build_tree_from_edges():
+    root = build_tree_from_edges([("b", "d"), ("a", "b"), ("a", "c")])
+    assert _shape(root) == EXPECTED_SHAPE
+    _check_links_and_flags(root)
+
+
+@pytest.mark.parametrize(
+    "edges",
+    [
+        [],
+        [("a", "b"), ("c", "b")],  # Two parents
+        [("a", "b"), ("c", "d")],  # Two roots
+        [("a", "b"), ("b", "a")],  # Cycle without a root
+        [("a", "b"), ("c", "d"), ("d", "c")],  # Cycle beside the tree
+    ],
+)
+def test_build_tree_from_edges_rejects_invalid_input(edges):
+    with pytest.raises(ValueError):
+        build_tree_from_edges(edges)
+
+
+NESTED = {
+    "data": "a",
+    "children": [{"data": "b", "children": [{"data": "d"}]}, {"data": "c"}],
+}
+
+
+def test_build_tree_from_nested_dict_and_json():
+    root = build_tree_from_nested_dict(NESTED)
+    assert _shape(root) == EXPECTED_SHAPE
+    _check_links_and_flags(root)
+
+    root = build_tree_from_json(json.dumps(NESTED))
+    assert _shape(root) == EXPECTED_SHAPE
+
+    renamed = {"name": "a", "kids": [{"name": "b", "kids": []}]}
+    root = build_tree_from_nested_dict(renamed, data_key="name", children_key="kids")
+    assert _shape(root) == [("a", ["b"]), ("b", [])]
+
+
+@pytest.mark.parametrize("nested", [[], {"children": []}, {"data": 1, "children": [3]}])
+def test_build_tree_from_nested_dict_rejects_invalid_input(nested):
+    with pytest.raises(ValueError):
+        build_tree_from_nested_dict(nested)
+
+
+def test_builders_handle_deep_trees():
+    depth = sys.getrecursionlimit() * 5
+    root = build_tree_from_parent_array([-1] + list(range(depth - 1)))
+    assert pre_order_traversal(root, [])[-1] == depth - 1
+
+    nested = current = {"data": 0}
+    for value in range(1, depth):
+        current["children"] = [{"data": value}]
+        current = current["children"][0]
+    root = build_tree_from_nested_dict(nested)
+    assert pre_order_traversal(root, [])[-1] == depth - 1
+
+
+def test_builders_keep_falsy_values():
+    root = build_tree_from_parent_array([-1, 0, 0], [0, "", None])
+    assert [child.data for child in root.children] == ["", None]
+
+
+def test_builders_can_index_the_tree():
+    root = build_tree_from_edges([("a", "b"), ("b", "c")], indexed=True)
+    assert find_observer(root, ValueIndex) is not None
+    assert depth_first_search(root, "c").parent.data == "b"
+    add_child_node(root, "e")
+    assert depth_first_search(root, "e").parent is root
+
+
+def test_adding_children_clears_the_leaf_flag():
+    root = build_tree_from_parent_array([-1, 0, 0])
+    first, second = root.children
+    add_child_node(first, "x")
+    add_child_nodes_from_index(second, ["y", "z"], 0)
+    assert first.is_parent and not first.is_leaf
+    assert second.is_parent and not second.is_leaf
+    _check_links_and_flags(root)
+
+
+def test_removing_the_last_child_sets_the_leaf_flag():
+    root = build_tree_from_parent_array([-1, 0, 0, 1, 2], ["r", "a", "b", "c", "d"])
+    search_and_remove_node(root, "c")
+    assert root.children[0].is_leaf and not root.children[0].is_parent
+    search_and_remove_nodes(root, ["a", "b", "d"])
+    assert root.is_leaf and not root.is_parent
+    _check_links_and_flags(root)
@@ -0,0 +1,213 @@
+import pickle
+import random
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.merkle_hashes import (
+    merkle_hash,
+    track_merkle_hashes,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_builders import (
+    build_tree_from_nested_dict,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_diff import (
+    Delete,
+    Insert,
+    Move,
+    Relabel,
+    apply_patch,
+    diff_trees,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    attach_subtree,
+    depth_first_search,
+    detach_subtree,
+    iter_pre_order,
+    move_subtree,
+    set_node_data,
+)
+from src.data_structures.trees.n_ary_trees.tree_observers import (
+    ValueIndex,
+    register_observer,
+)
+from src.data_structures.trees.tree_node import TreeNode
+
+
+def _shape(root):
+    return [
+        (node.data, [child.data for child in node.children])
+        for node in iter_pre_order(root)
+    ]
+
+
+def _tree(description):
+    # ("a", [("b", []), "c"]) -> nested dictionaries; bare values are leaves.
+    def convert(item):
+        if not isinstance(item, tuple):
+            return {"data": item}
+        data, children = item
+        return {"data": data, "children": [convert(child) for child in children]}
+
+    return build_tree_from_nested_dict(convert(description))
+
+
+def _random_pair(random_tree, seed, size=60, edits=6):
+    # Both trees are built from the same draws; the edits continue from there.
+    old = random_tree(random.Random(seed), size, 8)
+    rng = random.Random(seed)
+    new = random_tree(rng, size, 8)
+
+    for _ in range(edits):
+        nodes = list(iter_pre_order(new))
+        node = rng.choice(nodes)
+        action = rng.random()
+        if action < 0.3:
+            index = rng.randrange(len(node.children) + 1)
+            attach_subtree(node, TreeNode(rng.randrange(8)), index)
+        elif action < 0.5 and node.parent is not None:
+            detach_subtree(node)
+        elif action < 0.7 and node.parent is not None:
+            inside = set(iter_pre_order(node))
+            move_subtree(node, rng.choice([n for n in nodes if n not in inside]))
+        else:
+            set_node_data(node, rng.randrange(8))
+
+    return old, new
+
+
+def _check_round_trip(old, new):
+    script = diff_trees(old, new)
+    assert _shape(apply_patch(old, script)) == _shape(new)
+    for node in iter_pre_order(old):
+        assert all(child.parent is node for child in node.children)
+        assert node.is_leaf == (not node.children)
+    return script
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_edits_round_trip(random_tree, seed):
+    _check_round_trip(*_random_pair(random_tree, seed))
+
+
+def test_equal_trees_give_an_empty_script():
+    assert diff_trees(_tree(("a", ["b", "c"])), _tree(("a", ["b", "c"]))) == []
+
+
+def test_single_edits_give_single_edit_scripts():
+    old = ("a", [("b", ["x", "y"]), ("c", ["z"])])
+
+    script = _check_round_trip(
+        _tree(old), _tree(("a", [("b", ["x", "q"]), ("c", ["z"])]))
+    )
+    assert script == [Relabel((0, 1), "q")]
+
+    script = _check_round_trip(_tree(old), _tree(("a", [("b", ["x"]), ("c", ["z"])])))
+    assert script == [Delete((0, 1))]
+
+    script = _check_round_trip(
+        _tree(old), _tree(("a", [("b", ["x", "y"]), ("c", ["z", "w"])]))
+    )
+    assert script == [Insert(0, (1,), 1, "w")]
+
+    script = _check_round_trip(
+        _tree(old), _tree(("a", [("b", ["x"]), ("c", ["y", "z"])]))
+    )
+    assert script == [Move((0, 1), (1,), 0)]
+
+    script = _check_round_trip(
+        _tree(old), _tree(("r", [("b", ["x", "y"]), ("c", ["z"])]))
+    )
+    assert script == [Relabel((), "r")]
+
+
+def test_reordered_siblings_need_one_move():
+    old = _tree(("a", ["b", "c", "d", "e"]))
+    script = _check_round_trip(old, _tree(("a", ["c", "d", "e", "b"])))
+    assert script == [Move((0,), (), 3)]
+
+
+def test_inserted_subtree_is_inserted_top_down():
+    old = _tree(("a", ["b"]))
+    new = _tree(("a", ["b", ("c", [("d", ["e"]), "f"])]))
+    script = _check_round_trip(old, new)
+    assert [type(edit) for edit in script] == [Insert] * 4
+    assert script[0] == Insert(0, (), 1, "c")
+
+
+def test_subtree_moved_out_of_a_deleted_parent():
+    old = _tree(("a", [("gone", [("keep", ["k1", "k2"])]), "b"]))
+    new = _tree(("a", [("b", [("keep", ["k1", "k2"])])]))
+    script = _check_round_trip(old, new)
+    assert Move((0, 0), (1,), 0) in script
+    assert script[-1] == Delete((0,))
+    assert not any(isinstance(edit, Insert) for edit in script)
+
+
+class Payload:
+    """Node data that counts how often it is compared."""
+
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        Payload.comparisons += 1
+        return isinstance(other, Payload) and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+
+def test_unchanged_regions_are_not_compared():
+    def big():
+        return ("big", [(Payload("x"), [Payload(value) for value in range(50)])])
+
+    old = _tree(("a", [big(), "small"]))
+    new = _tree(("a", [big(), "changed"]))
+
+    Payload.comparisons = 0
+    script = diff_trees(old, new)
+    assert script == [Relabel((1,), "changed")]
+    assert Payload.comparisons == 0
+
+
+def test_falsy_and_unhashable_data():
+    old = _tree((0, [[1], "", None]))
+    new = _tree((0, [None, [1, 2], 0, ""]))
+    _check_round_trip(old, new)
+
+
+def test_tracked_hashes_are_reused_and_stay_current(random_tree):
+    old, new = _random_pair(random_tree, 3, size=100, edits=10)
+    register_observer(old, ValueIndex())
+    old_hashes = track_merkle_hashes(old)
+    track_merkle_hashes(new)
+
+    _check_round_trip(old, new)
+    assert old_hashes[old] == merkle_hash(new)
+    for node in iter_pre_order(old):
+        assert depth_first_search(old, node.data) is next(
+            n for n in iter_pre_order(old) if n.data == node.data
+        )
+
+
+def test_scripts_can_be_pickled_and_replayed_on_a_copy(random_tree):
+    old, new = _random_pair(random_tree, 8)
+    copy = pickle.loads(pickle.dumps(old))
+    script = pickle.loads(pickle.dumps(diff_trees(old, new)))
+    assert _shape(apply_patch(copy, script)) == _shape(new)
+
+
+def test_invalid_scripts_raise():
+    root = _tree(("a", ["b"]))
+    with pytest.raises(ValueError):
+        apply_patch(root, [Delete((5,))])
+    with pytest.raises(ValueError):
+        apply_patch(root, [Insert(0, 7, 0, "x")])
+    with pytest.raises(ValueError):
+        apply_patch(root, [Delete(())])
+    with pytest.raises(ValueError):
+        apply_patch(root, ["not an edit"])
+    with pytest.raises(ValueError):
+        diff_trees(None, root)
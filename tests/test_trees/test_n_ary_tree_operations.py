@@ -1,7 +1,8 @@
-# test_nary_tree.py
+import sys
+
 import pytest
 
-from ...src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
     TreeNode,
     create_root,
     create_root_with_children_data_list,
@@ -17,6 +18,13 @@ from ...src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
     depth_first_search,
     search_and_remove_node,
     search_and_remove_nodes,
+    iter_pre_order,
+    iter_post_order,
+    iter_level_order,
+    attach_subtree,
+    detach_subtree,
+    move_subtree,
+    set_node_data,
 )
 
 # ---------------------------
@@ -308,3 +316,213 @@ def test_search_and_remove_nodes_multiple(root_with_nested_tree):
     assert [n.data for n in removed] == ["C", "G"]
     # After removing C and G, root children should be B, D (B has E,F; D becomes leaf)
     # But note earlier tests may have mutated state; use fresh tree in this test!
+
+
+def _shape(node):
+    return (node.data, [_shape(child) for child in node.children])
+
+
+def _expected_shape_after_removal(node, targets):
+    # Reference model: kept children in order, then the (recursively
+    # rebuilt) children of removed children.
+    def remaining_children(parent):
+        kept, moved = [], []
+        for child in parent.children:
+            if child.data in targets:
+                moved.extend(remaining_children(child))
+            else:
+                kept.append(_expected_shape_after_removal(child, targets))
+        return kept + moved
+
+    return (node.data, remaining_children(node))
+
+
+def test_search_and_remove_nodes_removes_chains_and_siblings_in_one_pass():
+    # A -> [B, C, D], B -> [E, F], E -> [G], D -> [H]
+    root = create_root_with_children_data_list("A", ["B", "C", "D"])
+    b, _, d = root.children
+    e, _ = add_child_nodes(b, ["E", "F"])
+    add_child_node(e, "G")
+    add_child_node(d, "H")
+
+    removed = search_and_remove_nodes(root, ["B", "E", "D", "A"])
+
+    assert [n.data for n in removed] == ["B", "E", "D"]
+    assert _shape(root) == ("A", [("C", []), ("F", []), ("G", []), ("H", [])])
+    assert all(child.parent is root for child in root.children)
+    assert all(n.parent is None and n.children == () for n in removed)
+
+
+def test_search_and_remove_nodes_removes_every_duplicate():
+    root = create_root_with_children_data_list("A", ["X", "B", "X"])
+    add_child_node(root.children[1], "X")
+    removed = search_and_remove_nodes(root, ["X"])
+    assert len(removed) == 3
+    assert _shape(root) == ("A", [("B", [])])
+    assert search_and_remove_nodes(root, ["X"]) is None
+    assert search_and_remove_nodes(root, []) is None
+    assert search_and_remove_nodes(None, ["X"]) is None
+
+
+def test_search_and_remove_nodes_matches_reference_model():
+    import random
+
+    rng = random.Random(0)
+    for _ in range(20):
+        root = create_root(0)
+        nodes = [root]
+        for _ in range(150):
+            nodes.append(add_child_node(rng.choice(nodes), rng.randrange(1, 30)))
+        targets = rng.sample(range(1, 30), 8)
+        expected_removed = [
+            n for n in iter_pre_order(root) if n is not root and n.data in targets
+        ]
+        expected_shape = _expected_shape_after_removal(root, set(targets))
+
+        removed = search_and_remove_nodes(root, targets)
+
+        assert removed == (expected_removed or None)
+        assert _shape(root) == expected_shape
+        for node in iter_pre_order(root):
+            assert all(child.parent is node for child in node.children)
+
+
+def test_search_and_remove_nodes_with_unhashable_targets():
+    root = create_root_with_children_data_list("A", [["x"], "B"])
+    removed = search_and_remove_nodes(root, [["x"]])
+    assert [n.data for n in removed] == [["x"]]
+    assert children_data_list(root) == ["B"]
+
+
+def test_removing_the_last_children_makes_the_parent_a_leaf():
+    root = create_root_with_children_data_list("r", ["a", "b"])
+    assert search_and_remove_nodes(root, ["a", "b"]) is not None
+    assert root.children == []
+    assert root.is_leaf and not root.is_parent
+
+    root = create_root_with_children_data_list("r", ["a"])
+    b = add_child_node(root.children[0], "b")
+    search_and_remove_node(root, "b")
+    assert root.children[0].is_leaf and not root.children[0].is_parent
+    search_and_remove_node(root, "a")
+    assert root.is_leaf and not root.is_parent and b.parent is None
+
+
+def test_leaves_do_not_allocate_children_lists(root_with_nested_tree):
+    root = root_with_nested_tree
+    pre_order_traversal(root, [])
+    level_order_traversal(root, [])
+    depth_first_search(root, "missing")
+    e = breadth_first_search(root, "E")
+    assert e.children == ()
+    assert e._children is None
+
+
+# ---------------------------
+# Generator traversals
+# ---------------------------
+
+
+def _path_tree(depth):
+    root = create_root(0)
+    current = root
+    for value in range(1, depth):
+        current = add_child_node(current, value)
+    return root
+
+
+def test_iterators_match_list_traversals(root_with_nested_tree):
+    root = root_with_nested_tree
+    assert [n.data for n in iter_pre_order(root)] == pre_order_traversal(root, [])
+    assert [n.data for n in iter_post_order(root)] == post_order_traversal(root, [])
+    assert [n.data for n in iter_level_order(root)] == level_order_traversal(root, [])
+
+
+def test_iterators_on_none_root_are_empty():
+    assert list(iter_pre_order(None)) == []
+    assert list(iter_post_order(None)) == []
+    assert list(iter_level_order(None)) == []
+
+
+def test_iterators_stop_early(root_with_nested_tree):
+    iterator = iter_level_order(root_with_nested_tree)
+    assert [next(iterator).data, next(iterator).data] == ["A", "B"]
+
+
+def test_traversals_handle_trees_deeper_than_recursion_limit():
+    depth = sys.getrecursionlimit() * 5
+    root = _path_tree(depth)
+    assert pre_order_traversal(root, [])[-1] == depth - 1
+    assert post_order_traversal(root, [])[0] == depth - 1
+    assert level_order_traversal(root, [])[-1] == depth - 1
+    assert depth_first_search(root, depth - 1).data == depth - 1
+    assert breadth_first_search(root, depth - 1).data == depth - 1
+    assert search_and_remove_node(root, depth - 2).data == depth - 2
+    removed = search_and_remove_nodes(root, list(range(1, depth - 3, 2)))
+    assert len(removed) == (depth - 3) // 2
+    assert pre_order_traversal(root, [])[:3] == [0, 2, 4]
+
+
+# ---------------------------
+# Subtree primitives
+# ---------------------------
+
+
+def test_attach_subtree_accepts_falsy_data(simple_root):
+    first = attach_subtree(simple_root, TreeNode(0))
+    second = attach_subtree(simple_root, TreeNode(""), 0)
+    assert [child.data for child in simple_root.children] == ["", 0]
+    assert first.parent is simple_root and second.is_leaf
+    assert simple_root.is_parent and not simple_root.is_leaf
+
+
+def test_attach_subtree_rejects_attached_nodes_and_bad_indices(
+    root_with_children_data,
+):
+    child = root_with_children_data.children_nodes[0]
+    with pytest.raises(ValueError):
+        attach_subtree(root_with_children_data, child)
+    with pytest.raises(ValueError):
+        attach_subtree(child, root_with_children_data)
+    with pytest.raises(IndexError):
+        attach_subtree(root_with_children_data, TreeNode("X"), 4)
+
+
+def test_detach_subtree_keeps_the_subtree(root_with_nested_tree):
+    b = root_with_nested_tree.children_nodes[0]
+    grandchildren = [child.data for child in b.children]
+
+    assert detach_subtree(b) is b
+    assert b.parent is None
+    assert [child.data for child in b.children] == grandchildren
+    assert b not in root_with_nested_tree.children
+
+    with pytest.raises(ValueError):
+        detach_subtree(root_with_nested_tree)
+
+
+def test_detaching_the_last_child_makes_the_parent_a_leaf(simple_root):
+    child = add_child_node(simple_root, "child")
+    detach_subtree(child)
+    assert simple_root.is_leaf and not simple_root.is_parent
+
+
+def test_move_subtree(root_with_children_data):
+    b, c, d = root_with_children_data.children_nodes
+
+    move_subtree(d, root_with_children_data, 0)
+    assert pre_order_traversal(root_with_children_data, []) == ["A", "D", "B", "C"]
+
+    move_subtree(b, c)
+    assert pre_order_traversal(root_with_children_data, []) == ["A", "D", "C", "B"]
+    assert b.parent is c and c.is_parent
+
+    with pytest.raises(ValueError):
+        move_subtree(c, b)
+    with pytest.raises(IndexError):
+        move_subtree(d, root_with_children_data, 2)
+
+
+def test_set_node_data(simple_root):
+    assert set_node_data(simple_root, "new") is simple_root
+    assert simple_root.data == "new"
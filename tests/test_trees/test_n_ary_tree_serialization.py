@@ -0,0 +1,170 @@
+import io
+import random
+import sys
+import tracemalloc
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees import (
+    n_ary_tree_serialization as serialization,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_builders import (
+    build_tree_from_parent_array,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    create_root_with_children_data_list,
+    iter_post_order,
+    iter_pre_order,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_serialization import (
+    FOOTER,
+    RECORD,
+    MappedTree,
+    load_tree,
+    serialize_tree,
+)
+
+
+def _shape(root):
+    return [
+        (node.data, [child.data for child in node.children])
+        for node in iter_pre_order(root)
+    ]
+
+
+def test_round_trip_through_a_path(tmp_path):
+    root = create_root_with_children_data_list("root", ["a", "b", "c"])
+    path = tmp_path / "tree.bin"
+
+    assert serialize_tree(root, path) == 4
+    loaded = load_tree(path)
+
+    assert _shape(loaded) == _shape(root)
+    assert loaded.is_root and loaded.is_parent and not loaded.is_leaf
+    assert all(child.parent is loaded and child.is_leaf for child in loaded.children)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_round_trip_random_trees(random_tree, seed):
+    root = random_tree(random.Random(seed), 300)
+    stream = io.BytesIO()
+    serialize_tree(root, stream)
+
+    loaded = load_tree(stream)
+    assert _shape(loaded) == _shape(root)
+    for node in iter_pre_order(loaded):
+        assert all(child.parent is node for child in node.children)
+        assert node.is_parent == bool(node.children)
+        assert node.is_leaf == (not node.children)
+
+
+def test_single_node_and_arbitrary_payloads():
+    root = create_root_with_children_data_list(None, [(1, "x"), {"k": [2.5]}])
+    stream = io.BytesIO()
+    serialize_tree(root, stream)
+    assert _shape(load_tree(stream)) == _shape(root)
+
+    single = create_root_with_children_data_list(b"\x00", [])
+    stream = io.BytesIO()
+    serialize_tree(single, stream)
+    assert load_tree(stream).data == b"\x00"
+
+
+def test_custom_codec():
+    root = create_root_with_children_data_list("a", ["bb", "ccc"])
+    stream = io.BytesIO()
+    serialize_tree(root, stream, encode=str.encode)
+
+    # One header, 6 payload bytes, 3 records and the footer.
+    assert len(stream.getvalue()) == 8 + 6 + 3 * RECORD.size + FOOTER.size
+    assert _shape(load_tree(stream, decode=bytes.decode)) == _shape(root)
+
+
+def test_deep_tree_does_not_recurse():
+    size = sys.getrecursionlimit() * 3
+    root = build_tree_from_parent_array([-1] + list(range(size - 1)))
+    stream = io.BytesIO()
+    serialize_tree(root, stream)
+
+    loaded = load_tree(stream)
+    assert [node.data for node in iter_pre_order(loaded)] == list(range(size))
+
+
+def test_mapped_tree_matches_the_tree(random_tree, tmp_path):
+    root = random_tree(random.Random(7), 200)
+    path = tmp_path / "tree.bin"
+    serialize_tree(root, path)
+    post_order = list(iter_post_order(root))
+
+    with MappedTree(path) as mapped:
+        assert len(mapped) == 200
+        assert mapped.root == 199
+        for node_id, node in enumerate(post_order):
+            assert mapped.data(node_id) == node.data
+            assert mapped.child_count(node_id) == len(node.children)
+            assert [post_order[child] for child in mapped.children(node_id)] == list(
+                node.children
+            )
+        assert mapped.subtree_size(mapped.root) == 200
+
+        with pytest.raises(IndexError):
+            mapped.data(200)
+
+
+def test_mapped_tree_is_lazy(tmp_path):
+    calls = []
+
+    def decode(payload):
+        calls.append(payload)
+        return payload.decode()
+
+    root = create_root_with_children_data_list("a", ["b", "c"])
+    path = tmp_path / "tree.bin"
+    serialize_tree(root, path, encode=str.encode)
+
+    with MappedTree(path, decode) as mapped:
+        assert mapped.children(mapped.root) == [0, 1]
+        assert calls == []
+        assert mapped.data(1) == "c"
+        assert calls == [b"c"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"not a tree at all, just bytes", b"DSATREE\x01" + b"\x00" * 10],
+)
+def test_invalid_files_raise(content):
+    with pytest.raises(ValueError):
+        load_tree(io.BytesIO(content))
+
+
+def test_truncated_file_raises():
+    stream = io.BytesIO()
+    serialize_tree(create_root_with_children_data_list("a", ["b"]), stream)
+    data = stream.getvalue()
+
+    with pytest.raises(ValueError):
+        load_tree(io.BytesIO(data[:-1]))
+    with pytest.raises(ValueError):
+        load_tree(io.BytesIO(data[:8] + data[9:]))
+
+
+def test_none_root_raises():
+    with pytest.raises(ValueError):
+        serialize_tree(None, io.BytesIO())
+
+
+def test_writer_memory_does_not_grow_with_the_tree(tmp_path, monkeypatch):
+    monkeypatch.setattr(serialization, "SPOOL_MAX_SIZE", 4096)
+    peaks = []
+    for size in (2_000, 50_000):
+        root = build_tree_from_parent_array(
+            [-1] + [(value - 1) // 4 for value in range(1, size)]
+        )
+        tracemalloc.start()
+        serialize_tree(root, tmp_path / f"tree{size}.bin")
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    # Kept in memory, the table of the larger tree alone would take 1.2 MB.
+    assert peaks[1] - peaks[0] < 64_000
@@ -0,0 +1,135 @@
+import random
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_builders import (
+    build_tree_from_parent_array,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    add_child_node,
+    add_child_nodes_from_index,
+    attach_subtree,
+    detach_subtree,
+    iter_level_order,
+    iter_pre_order,
+    move_subtree,
+    search_and_remove_node,
+    search_and_remove_nodes,
+)
+from src.data_structures.trees.n_ary_trees.node_depths import (
+    DepthCache,
+    compute_depths,
+    iter_path_to_root,
+    node_depth,
+    path_from_root,
+    track_depths,
+)
+from src.data_structures.trees.n_ary_trees.subtree_aggregates import (
+    track_subtree_sizes,
+)
+from src.data_structures.trees.n_ary_trees.tree_observers import find_observer
+from src.data_structures.trees.tree_node import TreeNode
+
+
+def _walked_depth(node):
+    return sum(1 for _ in iter_path_to_root(node)) - 1
+
+
+def _check(root, depths):
+    nodes = list(iter_pre_order(root))
+    assert len(depths) == len(nodes)
+    for node in nodes:
+        assert depths[node] == _walked_depth(node)
+
+
+def test_compute_depths_matches_walking(random_tree):
+    root = random_tree(random.Random(0), 500)
+    depths = compute_depths(root)
+    _check(root, depths)
+    assert list(depths) == list(iter_level_order(root))
+
+
+def test_path_queries():
+    root = build_tree_from_parent_array([-1, 0, 1, 2], ["r", "a", "b", "c"])
+    leaf = root.children[0].children[0].children[0]
+    assert [node.data for node in iter_path_to_root(leaf)] == ["c", "b", "a", "r"]
+    assert [node.data for node in path_from_root(leaf)] == ["r", "a", "b", "c"]
+    assert path_from_root(root) == [root]
+    assert node_depth(leaf) == 3 and node_depth(root) == 0
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_cached_depths_follow_random_edits(random_tree, seed):
+    rng = random.Random(seed)
+    root = random_tree(rng, 80)
+    sizes = track_subtree_sizes(root)
+    depths = track_depths(root)
+    next_value = 80
+
+    for _ in range(60):
+        nodes = list(iter_pre_order(root))
+        node = rng.choice(nodes)
+        action = rng.random()
+        if action < 0.25:
+            add_child_node(node, next_value)
+            next_value += 1
+        elif action < 0.35:
+            add_child_nodes_from_index(node, [next_value, next_value + 1], 0)
+            next_value += 2
+        elif action < 0.55 and node is not root:
+            search_and_remove_node(root, node.data)
+        elif action < 0.65:
+            targets = [n.data for n in rng.sample(nodes, min(5, len(nodes)))]
+            search_and_remove_nodes(root, targets)
+        elif action < 0.8 and node is not root:
+            inside = set(iter_pre_order(node))
+            move_subtree(node, rng.choice([n for n in nodes if n not in inside]))
+        elif node is not root:
+            subtree = detach_subtree(node)
+            attach_subtree(rng.choice(list(iter_pre_order(root))), subtree)
+
+        _check(root, depths)
+
+    assert sizes[root] == len(depths)
+
+
+def test_removal_moves_children_up_a_level():
+    root = build_tree_from_parent_array([-1, 0, 1, 2, 2], ["r", "a", "b", "c", "d"])
+    depths = track_depths(root)
+    b = root.children[0].children[0]
+    c, d = b.children
+
+    search_and_remove_node(root, "b")
+    assert depths[c] == depths[d] == 2
+    assert b not in depths
+
+    search_and_remove_nodes(root, ["a", "r"])
+    assert depths[c] == depths[d] == 1
+    assert node_depth(c) == 1
+
+
+def test_node_depth_uses_the_cache():
+    root = build_tree_from_parent_array([-1, 0, 1], ["r", "a", "b"])
+    depths = track_depths(root)
+    assert find_observer(root, DepthCache) is depths
+
+    b = root.children[0].children[0]
+    depths._depths[b] = 99  # Only the cache knows this value.
+    assert node_depth(b) == 99
+
+
+def test_detached_nodes_leave_the_cache():
+    root = build_tree_from_parent_array([-1, 0, 1], ["r", "a", "b"])
+    depths = track_depths(root)
+    a = detach_subtree(root.children[0])
+    assert len(depths) == 1 and a not in depths
+    assert node_depth(a.children[0]) == 1
+
+
+def test_invalid_input_raises():
+    with pytest.raises(ValueError):
+        node_depth(None)
+    with pytest.raises(ValueError):
+        compute_depths(None)
+    with pytest.raises(ValueError):
+        track_depths(add_child_node(TreeNode("r"), "a"))
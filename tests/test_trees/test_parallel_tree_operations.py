@@ -0,0 +1,94 @@
+import operator
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    add_child_node,
+    breadth_first_search,
+    create_root,
+    depth_first_search,
+    iter_pre_order,
+)
+from src.data_structures.trees.n_ary_trees.parallel_tree_operations import (
+    parallel_breadth_first_search,
+    parallel_depth_first_search,
+    parallel_filter,
+    parallel_map_reduce,
+)
+
+
+def _is_multiple_of_seven(value):
+    return value % 7 == 0
+
+
+def _as_list(value):
+    return [value]
+
+
+def _random_tree(seed, size=500, values=40):
+    rng = random.Random(seed)
+    root = create_root(0)
+    nodes = [root]
+    for _ in range(size):
+        nodes.append(add_child_node(rng.choice(nodes), rng.randrange(1, values)))
+    return root
+
+
+@pytest.fixture(scope="module")
+def thread_pool():
+    # Threads exercise the chunking and merging without process start-up.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_searches_match_serial_searches(seed, thread_pool):
+    root = _random_tree(seed)
+    for target in range(-1, 41):
+        assert parallel_depth_first_search(
+            root, target, max_workers=3, executor=thread_pool
+        ) is depth_first_search(root, target)
+        assert parallel_breadth_first_search(
+            root, target, max_workers=3, executor=thread_pool
+        ) is breadth_first_search(root, target)
+
+
+def test_filter_and_map_reduce_keep_pre_order(thread_pool):
+    root = _random_tree(5)
+    expected = [n for n in iter_pre_order(root) if _is_multiple_of_seven(n.data)]
+    assert parallel_filter(root, _is_multiple_of_seven, 3, thread_pool) == expected
+
+    # List concatenation is associative but not commutative.
+    assert parallel_map_reduce(root, _as_list, operator.add, 3, thread_pool) == [
+        n.data for n in iter_pre_order(root)
+    ]
+
+
+def test_small_and_empty_trees(thread_pool):
+    root = create_root(7)
+    assert parallel_depth_first_search(root, 7, 8, thread_pool) is root
+    assert parallel_breadth_first_search(root, 8, 8, thread_pool) is None
+    assert parallel_filter(root, _is_multiple_of_seven, 8, thread_pool) == [root]
+    assert parallel_map_reduce(root, _as_list, operator.add, 8, thread_pool) == [7]
+
+    assert parallel_depth_first_search(None, 7) is None
+    assert parallel_breadth_first_search(None, 7) is None
+    assert parallel_filter(None, _is_multiple_of_seven) == []
+    with pytest.raises(ValueError):
+        parallel_map_reduce(None, _as_list, operator.add)
+
+
+def test_process_pool():
+    root = _random_tree(9, size=2_000)
+    expected = [n for n in iter_pre_order(root) if _is_multiple_of_seven(n.data)]
+
+    assert parallel_filter(root, _is_multiple_of_seven, max_workers=2) == expected
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert parallel_depth_first_search(
+            root, 13, executor=executor
+        ) is depth_first_search(root, 13)
+        assert parallel_map_reduce(root, abs, operator.add, executor=executor) == sum(
+            n.data for n in iter_pre_order(root)
+        )
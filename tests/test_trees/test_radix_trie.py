@@ -0,0 +1,149 @@
+import random
+
+import pytest
+
+from src.data_structures.trees.radix_trie.radix_trie import RadixTrie
+from src.data_structures.trees.radix_trie.radix_trie_operations import (
+    create_radix_trie,
+    radix_delete,
+    radix_get,
+    radix_insert,
+    radix_iter_prefix,
+    radix_longest_prefix,
+    radix_search,
+)
+
+
+def _check_invariants(trie):
+    if trie.root is None:
+        assert len(trie) == 0
+        return
+    nodes = 0
+    keys = 0
+    stack = [(trie.root, None)]
+    while stack:
+        node, path = stack.pop()
+        nodes += 1
+        keys += node.is_key
+        # The node's key object spells the whole path down to it.
+        if path is not None:
+            assert node.key[: node.start] == path
+            assert node.start < node.end
+        if node is not trie.root:
+            assert node.is_key or len(node.children) >= 2
+        if node.children is not None:
+            assert node.children
+            for first, child in node.children.items():
+                assert child.key[child.start] == first
+                stack.append((child, node.key[: node.end]))
+    assert keys == len(trie)
+    assert nodes <= 2 * max(len(trie), 1)
+
+
+def _random_keys(rng, count, alphabet="ab", longest=8):
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, longest)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_random_operations_match_a_dict(seed):
+    rng = random.Random(seed)
+    trie = create_radix_trie()
+    expected = {}
+
+    for key in _random_keys(rng, 600):
+        if rng.random() < 0.6:
+            radix_insert(trie, key, len(expected))
+            expected[key] = len(expected)
+        else:
+            assert radix_delete(trie, key) == (key in expected)
+            expected.pop(key, None)
+        _check_invariants(trie)
+
+    assert list(trie) == sorted(expected)
+    for key in _random_keys(rng, 200):
+        assert (key in trie) == (key in expected)
+        assert radix_get(trie, key, "missing") == expected.get(key, "missing")
+
+        prefixes = [key[:i] for i in range(len(key) + 1) if key[:i] in expected]
+        if prefixes:
+            best = prefixes[-1]
+            assert radix_longest_prefix(trie, key) == (best, expected[best])
+        else:
+            assert radix_longest_prefix(trie, key) is None
+
+        assert list(radix_iter_prefix(trie, key)) == sorted(
+            word for word in expected if word.startswith(key)
+        )
+
+
+def test_edges_share_the_inserted_keys():
+    trie = create_radix_trie()
+    first, second = "".join(["rout", "ing"]), "".join(["rout", "e"])
+    radix_insert(trie, first)
+    radix_insert(trie, second)
+
+    (middle,) = trie.root.children.values()
+    assert middle.label == "rout" and middle.key is first
+    assert middle.children["i"].key is first
+    assert middle.children["e"].key is second
+    assert middle.children["e"].label == "e"
+
+
+def test_bytes_keys():
+    trie = create_radix_trie()
+    routes = {b"\x0a": "A", b"\x0a\x01": "B", b"\x0a\x01\x02\x03": "C", b"": "default"}
+    for key, value in routes.items():
+        radix_insert(trie, key, value)
+
+    assert radix_longest_prefix(trie, b"\x0a\x01\x02\x04") == (b"\x0a\x01", "B")
+    assert radix_longest_prefix(trie, b"\x0b") == (b"", "default")
+    assert list(trie) == sorted(routes)
+    assert list(radix_iter_prefix(trie, b"\x0a\x01")) == [
+        b"\x0a\x01",
+        b"\x0a\x01\x02\x03",
+    ]
+    assert "\x0a" not in trie and radix_search(trie, "\x0a") is None
+
+
+def test_delete_merges_edges():
+    trie = create_radix_trie()
+    for key in ["test", "team", "tea"]:
+        radix_insert(trie, key)
+
+    assert radix_delete(trie, "tea")
+    _check_invariants(trie)
+    assert not radix_delete(trie, "tea") and not radix_delete(trie, "te")
+
+    assert radix_delete(trie, "team")
+    (only,) = trie.root.children.values()
+    assert only.label == "test" and only.children is None
+    _check_invariants(trie)
+
+
+def test_empty_key_and_empty_trie():
+    trie = create_radix_trie()
+    assert not trie and list(trie) == [] and "" not in trie
+    assert radix_longest_prefix(trie, "abc", "none") == "none"
+    assert list(radix_iter_prefix(trie, "")) == []
+
+    radix_insert(trie, "", 0)
+    radix_insert(trie, "", 1)
+    assert len(trie) == 1 and radix_get(trie, "") == 1
+    assert radix_delete(trie, "") and not trie
+
+
+def test_invalid_input_raises():
+    trie = create_radix_trie()
+    with pytest.raises(ValueError):
+        radix_insert(trie, 12)
+    radix_insert(trie, "a")
+    with pytest.raises(ValueError):
+        radix_insert(trie, b"a")
+    with pytest.raises(ValueError):
+        radix_insert(None, "a")
+    with pytest.raises(ValueError):
+        radix_delete(None, "a")
+    assert isinstance(trie, RadixTrie)
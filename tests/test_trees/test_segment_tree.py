@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.data_structures.trees.segment_tree.segment_tree_operations import (  # noqa: E402
+    create_segment_tree,
+    segment_tree_add,
+    segment_tree_add_ranges,
+    segment_tree_assign,
+    segment_tree_assign_ranges,
+    segment_tree_max,
+    segment_tree_maxima,
+    segment_tree_min,
+    segment_tree_minima,
+    segment_tree_sum,
+    segment_tree_sums,
+    segment_tree_values,
+)
+
+
+def _random_range(rng, size):
+    low = rng.randrange(size)
+    return low, rng.randrange(low + 1, size + 1)
+
+
+def _random_ranges(rng, size, count):
+    lows, highs = zip(*(_random_range(rng, size) for _ in range(count)))
+    return np.array(lows), np.array(highs)
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 100])
+def test_single_operations_match_an_array(size):
+    rng = random.Random(size)
+    expected = np.array([rng.randint(-50, 50) for _ in range(size)])
+    tree = create_segment_tree(expected)
+
+    for _ in range(400):
+        low, high = _random_range(rng, size)
+        action = rng.random()
+        if action < 0.25:
+            value = rng.randint(-50, 50)
+            segment_tree_assign(tree, low, high, value)
+            expected[low:high] = value
+        elif action < 0.5:
+            delta = rng.randint(-20, 20)
+            segment_tree_add(tree, low, high, delta)
+            expected[low:high] += delta
+        else:
+            assert segment_tree_sum(tree, low, high) == expected[low:high].sum()
+            assert segment_tree_min(tree, low, high) == expected[low:high].min()
+            assert segment_tree_max(tree, low, high) == expected[low:high].max()
+
+    np.testing.assert_array_equal(segment_tree_values(tree), expected)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_batched_queries_see_pending_updates(seed):
+    rng = random.Random(seed)
+    size = 300
+    expected = np.array([rng.randint(0, 100) for _ in range(size)])
+    tree = create_segment_tree(expected)
+
+    for _ in range(50):
+        low, high = _random_range(rng, size)
+        if rng.random() < 0.5:
+            segment_tree_assign(tree, low, high, rng.randint(0, 100))
+        else:
+            segment_tree_add(tree, low, high, rng.randint(-10, 10))
+        current = segment_tree_values(tree)
+
+        lows, highs = _random_ranges(rng, size, 40)
+        sums = segment_tree_sums(tree, lows, highs)
+        minima = segment_tree_minima(tree, lows, highs)
+        maxima = segment_tree_maxima(tree, lows, highs)
+        for i, (low, high) in enumerate(zip(lows, highs)):
+            assert sums[i] == current[low:high].sum()
+            assert minima[i] == current[low:high].min()
+            assert maxima[i] == current[low:high].max()
+            assert sums[i] == segment_tree_sum(tree, low, high)
+
+
+def test_batched_updates_apply_in_order():
+    rng = random.Random(5)
+    size = 200
+    expected = np.array([rng.randint(0, 100) for _ in range(size)], dtype=float)
+    tree = create_segment_tree(expected)
+    segment_tree_add(tree, 10, 150, 2.5)
+    expected[10:150] += 2.5
+
+    lows, highs = _random_ranges(rng, size, 60)
+    values = np.array([rng.randint(-100, 100) for _ in range(60)], dtype=float)
+    segment_tree_assign_ranges(tree, lows, highs, values)
+    for low, high, value in zip(lows, highs, values):
+        expected[low:high] = value
+    np.testing.assert_array_equal(segment_tree_values(tree), expected)
+
+    segment_tree_add_ranges(tree, lows, highs, values / 2)
+    for low, high, value in zip(lows, highs, values):
+        expected[low:high] += value / 2
+    np.testing.assert_allclose(segment_tree_values(tree), expected)
+    assert segment_tree_max(tree, 0, size) == pytest.approx(expected.max())
+
+    segment_tree_assign_ranges(tree, [0], [size], 1.0)
+    assert segment_tree_sum(tree, 0, size) == size
+
+
+def test_empty_batches():
+    tree = create_segment_tree([1, 2, 3])
+    assert segment_tree_sums(tree, [], []).shape == (0,)
+    segment_tree_add_ranges(tree, [], [], [])
+    np.testing.assert_array_equal(segment_tree_values(tree), [1, 2, 3])
+
+
+def test_invalid_input_raises():
+    with pytest.raises(ValueError):
+        create_segment_tree([])
+    with pytest.raises(ValueError):
+        create_segment_tree([[1, 2], [3, 4]])
+    with pytest.raises(ValueError):
+        create_segment_tree(["a", "b"])
+
+    tree = create_segment_tree([1, 2, 3])
+    with pytest.raises(ValueError):
+        segment_tree_sum(tree, 2, 2)
+    with pytest.raises(ValueError):
+        segment_tree_add(tree, 0, 4, 1)
+    with pytest.raises(ValueError):
+        segment_tree_sums(tree, [0, 1], [3])
+    with pytest.raises(ValueError):
+        segment_tree_assign_ranges(tree, [-1], [2], 0)
@@ -0,0 +1,207 @@
+import operator
+import random
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_builders import (
+    build_tree_from_parent_array,
+)
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    add_child_node,
+    add_child_node_at_index,
+    add_child_nodes_from_index,
+    create_root,
+    detach_subtree,
+    iter_pre_order,
+    move_subtree,
+    search_and_remove_node,
+    search_and_remove_nodes,
+    set_node_data,
+)
+from src.data_structures.trees.n_ary_trees.subtree_aggregates import (
+    SubtreeAggregates,
+    track_subtree_heights,
+    track_subtree_sizes,
+    track_subtree_sums,
+)
+from src.data_structures.trees.n_ary_trees.tree_observers import (
+    ValueIndex,
+    register_observer,
+)
+
+
+def _size(node):
+    return sum(1 for _ in iter_pre_order(node))
+
+
+def _height(node):
+    return max((1 + _height(child) for child in node.children), default=0)
+
+
+def _sum(node):
+    return sum(n.data for n in iter_pre_order(node))
+
+
+def _check(root, sizes, heights, sums):
+    for node in iter_pre_order(root):
+        assert sizes[node] == _size(node)
+        assert heights[node] == _height(node)
+        assert sums[node] == _sum(node)
+
+
+def test_aggregates_of_a_built_tree():
+    root = build_tree_from_parent_array([-1, 0, 0, 1, 3])
+    sizes, heights = track_subtree_sizes(root), track_subtree_heights(root)
+    sums = track_subtree_sums(root)
+    assert (sizes[root], heights[root], sums[root]) == (5, 3, 10)
+    assert (sizes[root.children[1]], heights[root.children[1]]) == (1, 0)
+
+
+def test_aggregates_follow_random_edits():
+    rng = random.Random(1)
+    root = create_root(0)
+    register_observer(root, ValueIndex())
+    sizes, heights = track_subtree_sizes(root), track_subtree_heights(root)
+    sums = track_subtree_sums(root)
+    nodes, next_value = [root], 1
+
+    for step in range(300):
+        action = rng.random()
+        if action < 0.5 or len(nodes) < 5:
+            nodes.append(add_child_node(rng.choice(nodes), next_value))
+            next_value += 1
+        elif action < 0.6:
+            parent = rng.choice(nodes)
+            index = rng.randrange(len(parent.children) + 1)
+            nodes.append(add_child_node_at_index(parent, next_value, index))
+            next_value += 1
+        elif action < 0.7:
+            parent = rng.choice(nodes)
+            nodes.extend(add_child_nodes_from_index(parent, [next_value, -1], 0))
+            next_value += 1
+        elif action < 0.9:
+            removed = search_and_remove_node(root, rng.choice(nodes[1:]).data)
+            if removed is not None:
+                nodes.remove(removed)
+                assert removed not in sizes
+        else:
+            targets = [n.data for n in rng.sample(nodes[1:], 3)]
+            for removed in search_and_remove_nodes(root, targets) or []:
+                nodes.remove(removed)
+
+        if step % 10 == 0:
+            _check(root, sizes, heights, sums)
+
+    _check(root, sizes, heights, sums)
+
+
+def test_aggregates_follow_moves_detaches_and_relabels():
+    rng = random.Random(2)
+    root = build_tree_from_parent_array([-1] + [rng.randrange(v) for v in range(1, 80)])
+    sizes, heights = track_subtree_sizes(root), track_subtree_heights(root)
+    sums = track_subtree_sums(root)
+
+    for _ in range(60):
+        nodes = list(iter_pre_order(root))
+        node = rng.choice(nodes[1:])
+        action = rng.random()
+        if action < 0.4:
+            set_node_data(node, rng.randrange(100))
+        elif action < 0.5:
+            detach_subtree(node)
+            assert node not in sizes
+        else:
+            inside = set(iter_pre_order(node))
+            move_subtree(node, rng.choice([n for n in nodes if n not in inside]))
+        _check(root, sizes, heights, sums)
+
+
+def test_aggregates_under_wide_nodes():
+    # Nodes with more than 32 children fold them through a segment tree;
+    # edits grow and shrink nodes across that threshold.
+    rng = random.Random(3)
+    root = create_root(0)
+    register_observer(root, ValueIndex())
+    sizes, heights = track_subtree_sizes(root), track_subtree_heights(root)
+    sums = track_subtree_sums(root)
+    wide = [add_child_node(root, value) for value in range(1, 40)]
+    next_value = 40
+
+    for step in range(400):
+        nodes = list(iter_pre_order(root))
+        parent = rng.choice([root] + wide)
+        action = rng.random()
+        if action < 0.4:
+            add_child_node(rng.choice(parent.children or [parent]), next_value)
+        elif action < 0.55:
+            index = rng.randrange(len(parent.children) + 1)
+            add_child_node_at_index(parent, next_value, index)
+        elif action < 0.65:
+            add_child_nodes_from_index(parent, [next_value, -next_value], 0)
+        elif action < 0.8 and len(nodes) > 2:
+            search_and_remove_node(root, rng.choice(nodes[1:]).data)
+        elif action < 0.9:
+            set_node_data(rng.choice(nodes), rng.randrange(100))
+        else:
+            node = rng.choice(nodes[1:])
+            inside = set(iter_pre_order(node))
+            move_subtree(node, rng.choice([n for n in nodes if n not in inside]))
+        next_value += 1
+
+        if step % 20 == 0:
+            _check(root, sizes, heights, sums)
+
+    _check(root, sizes, heights, sums)
+
+
+def test_sums_with_key_and_refresh():
+    root = create_root({"weight": 2})
+    child = add_child_node(root, {"weight": 3})
+    sums = track_subtree_sums(root, key=operator.itemgetter("weight"))
+    assert sums[root] == 5
+
+    child.data["weight"] = 10
+    sums.refresh(child)
+    assert (sums[child], sums[root]) == (10, 12)
+
+
+def test_custom_monoid_with_lift():
+    # Deepest leaf value, as (depth below node, value) pairs combined with max.
+    root = build_tree_from_parent_array([-1, 0, 0, 2], ["a", "b", "c", "d"])
+    deepest = register_observer(
+        root,
+        SubtreeAggregates(
+            lambda node: (0, node.data),
+            max,
+            lambda pair: (pair[0] + 1, pair[1]),
+        ),
+    )
+    assert deepest[root] == (2, "d")
+
+    add_child_node(add_child_node(root.children[0], "e"), "f")
+    assert deepest[root] == (3, "f")
+
+
+def test_updates_stop_at_unchanged_ancestors():
+    calls = []
+
+    def value(node):
+        calls.append(node.data)
+        return 0
+
+    # 0 -> 1 -> 2 -> [3 -> 5, 4]
+    root = build_tree_from_parent_array([-1, 0, 1, 2, 2, 3])
+    heights = register_observer(root, SubtreeAggregates(value, max, lambda h: h + 1))
+    calls.clear()
+
+    add_child_node(root.children[0].children[0].children[1], "x")
+    # Height of node 2 does not change, so nodes 1 and 0 are not recomputed.
+    assert calls == ["x", 4, 2]
+    assert heights[root] == 4
+
+
+def test_query_of_unknown_node_raises():
+    root = create_root(1)
+    sizes = track_subtree_sizes(root)
+    with pytest.raises(KeyError):
+        sizes[create_root(2)]
@@ -0,0 +1,227 @@
+import random
+
+import pytest
+
+from src.data_structures.trees.ternary_search_tree.ternary_search_tree import (
+    NO_WEIGHT,
+    TernarySearchTreeNode,
+)
+from src.data_structures.trees.ternary_search_tree.ternary_search_tree_operations import (
+    build_ternary_search_tree,
+    create_ternary_search_tree,
+    tst_autocomplete,
+    tst_delete,
+    tst_get,
+    tst_hamming_neighbors,
+    tst_insert,
+    tst_iter_prefix,
+    tst_search,
+)
+
+
+def _check_invariants(tree):
+    keys = 0
+    stack = [(tree.root, None, None, None)]
+    while stack:
+        node, parent, low, high = stack.pop()
+        if node is None:
+            continue
+        assert node.parent is parent
+        assert low is None or low < node.data
+        assert high is None or node.data < high
+        assert node.weight is not None or node.middle_child is not None
+        keys += node.weight is not None
+
+        best = node.weight if node.weight is not None else NO_WEIGHT
+        for child in (node.left_child, node.middle_child, node.right_child):
+            if child is not None:
+                best = max(best, child.best)
+        assert node.best == best
+
+        stack.append((node.left_child, node, low, node.data))
+        stack.append((node.right_child, node, node.data, high))
+        stack.append((node.middle_child, node, None, None))
+
+    assert keys == len(tree)
+
+
+def _random_words(rng, count, alphabet="abc", longest=5):
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, longest)))
+        for _ in range(count)
+    ]
+
+
+def _height(node):
+    if node is None:
+        return 0
+    return 1 + max(
+        _height(node.left_child), _height(node.middle_child), _height(node.right_child)
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_operations_match_a_dict(seed):
+    rng = random.Random(seed)
+    tree = create_ternary_search_tree()
+    model = {}
+
+    for step, word in enumerate(_random_words(rng, 500)):
+        if rng.random() < 0.6:
+            weight = rng.randrange(20)
+            tst_insert(tree, word, step, weight)
+            model[word] = (step, weight)
+        else:
+            assert tst_delete(tree, word) == (word in model)
+            model.pop(word, None)
+        if step % 50 == 0:
+            _check_invariants(tree)
+
+    _check_invariants(tree)
+    assert list(tree) == sorted(model)
+    for word in _random_words(rng, 200):
+        assert tst_get(tree, word, "missing") == model.get(word, ("missing",))[0]
+        assert (word in tree) == (word in model)
+
+    for prefix in ["", "a", "ab", "cab", "ccccc", "d"]:
+        expected = sorted(word for word in model if word.startswith(prefix))
+        assert list(tst_iter_prefix(tree, prefix)) == expected
+
+        ranked = tst_autocomplete(tree, prefix, 5)
+        weights = sorted((model[word][1] for word in expected), reverse=True)
+        assert [model[word][1] for word in ranked] == weights[:5]
+        assert all(word.startswith(prefix) for word in ranked)
+        assert len(set(ranked)) == len(ranked)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_bulk_build_matches_a_dict(seed):
+    rng = random.Random(seed)
+    words = _random_words(rng, 400, alphabet="abcdefgh", longest=6)
+    weights = [rng.randrange(100) for _ in words]
+    tree = build_ternary_search_tree(words, range(len(words)), weights)
+    _check_invariants(tree)
+
+    model = {}
+    for index, (word, weight) in enumerate(zip(words, weights)):
+        model[word] = (index, weight)
+    assert list(tree) == sorted(model)
+    assert all(tst_get(tree, word) == model[word][0] for word in model)
+    (heaviest,) = tst_autocomplete(tree, "", 1)
+    assert model[heaviest][1] == max(weight for _, weight in model.values())
+
+
+def test_bulk_build_is_balanced():
+    words = [f"{number:06d}" for number in range(4096)]
+    tree = build_ternary_search_tree(reversed(words))
+    # 6 characters, each chosen among at most 10 digits in a balanced
+    # search tree of height 4.
+    assert _height(tree.root) <= 6 * 4
+
+    sorted_inserts = create_ternary_search_tree()
+    for word in words[:200]:
+        tst_insert(sorted_inserts, word)
+    assert list(sorted_inserts) == words[:200]
+
+
+def test_hamming_neighbors():
+    tree = build_ternary_search_tree(["cat", "cot", "cut", "cart", "dog", "dot", "ca"])
+    assert tst_hamming_neighbors(tree, "cat", 0) == ["cat"]
+    assert tst_hamming_neighbors(tree, "cat", 1) == ["cat", "cot", "cut"]
+    assert tst_hamming_neighbors(tree, "cat", 2) == ["cat", "cot", "cut", "dot"]
+    assert tst_hamming_neighbors(tree, "xyz", 3) == ["cat", "cot", "cut", "dog", "dot"]
+    assert tst_hamming_neighbors(tree, "xyz", 2) == []
+
+    with pytest.raises(ValueError):
+        tst_hamming_neighbors(tree, "cat", -1)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_hamming_neighbors(seed):
+    rng = random.Random(seed)
+    words = set(_random_words(rng, 300, alphabet="abcd", longest=4))
+    tree = build_ternary_search_tree(words)
+    for query in _random_words(rng, 20, alphabet="abcde", longest=4):
+        for distance in range(3):
+            expected = sorted(
+                word
+                for word in words
+                if len(word) == len(query)
+                and sum(a != b for a, b in zip(word, query)) <= distance
+            )
+            assert tst_hamming_neighbors(tree, query, distance) == expected
+
+
+def test_autocomplete():
+    tree = build_ternary_search_tree(
+        ["tea", "ten", "to", "inn", "in", "i"], weights=[1, 3, 5, 9, 2, 4]
+    )
+    assert tst_autocomplete(tree, "t", 2) == ["to", "ten"]
+    assert tst_autocomplete(tree, "", 3) == ["inn", "to", "i"]
+    assert tst_autocomplete(tree, "in", 5) == ["inn", "in"]
+    assert tst_autocomplete(tree, "x", 5) == []
+    assert tst_autocomplete(tree, "t", 0) == []
+
+    tst_insert(tree, "inn", None, 0)
+    assert tst_autocomplete(tree, "", 1) == ["to"]
+    tst_delete(tree, "to")
+    assert tst_autocomplete(tree, "", 1) == ["i"]
+
+
+def test_delete_prunes_unneeded_nodes():
+    tree = build_ternary_search_tree(["car", "cart", "cat"])
+    assert tst_delete(tree, "cart")
+    assert tst_search(tree, "car").middle_child is None
+    assert tst_delete(tree, "car") and tst_delete(tree, "cat")
+    assert tree.root is None and len(tree) == 0
+    assert not tst_delete(tree, "car")
+
+    tree = build_ternary_search_tree(["car", "cart"])
+    assert not tst_delete(tree, "ca")
+    assert tst_delete(tree, "car")
+    assert list(tree) == ["cart"]
+
+
+def test_insert_replaces_existing_keys():
+    tree = create_ternary_search_tree()
+    node = tst_insert(tree, "key", 1)
+    assert isinstance(node, TernarySearchTreeNode) and node.is_key
+    assert tst_insert(tree, "key", 2) is node
+    assert len(tree) == 1 and tst_get(tree, "key") == 2
+    assert "ke" not in tree and 5 not in tree
+
+
+def test_build_from_no_keys():
+    tree = build_ternary_search_tree([])
+    assert len(tree) == 0 and tree.root is None
+    assert list(tst_iter_prefix(tree, "")) == []
+
+    tst_insert(tree, "a", 1)
+    assert tst_get(tree, "a") == 1
+
+
+def test_node_flags_follow_the_links():
+    tree = build_ternary_search_tree(["b", "a", "c", "bd"])
+    root = tree.root
+    assert root.data == "b" and root.is_root and root.is_parent
+    assert root.left_child.is_left and root.left_child.is_leaf
+    assert root.middle_child.is_middle and root.right_child.is_right
+
+    tst_delete(tree, "b")
+    assert tree.root.is_root and tree.root.data == "b"
+    tst_delete(tree, "bd")
+    assert tree.root.is_root and tree.root.data in "ac"
+
+
+def test_invalid_input_raises():
+    tree = create_ternary_search_tree()
+    with pytest.raises(ValueError):
+        tst_insert(tree, "")
+    with pytest.raises(ValueError):
+        tst_insert(tree, 5)
+    with pytest.raises(ValueError):
+        tst_insert(None, "a")
+    with pytest.raises(ValueError):
+        build_ternary_search_tree(["a", "b"], [1])
+    with pytest.raises(ValueError):
+        build_ternary_search_tree(["a", ""])
@@ -0,0 +1,97 @@
+import tracemalloc
+
+import pytest
+
+from src.data_structures.trees.tree_node import (
+    BinaryTreeNode,
+    TernaryTreeNode,
+    TreeNode,
+)
+
+FLAGS = ["is_root", "is_parent", "is_left", "is_right", "is_leaf"]
+
+
+@pytest.mark.parametrize("node_type", [TreeNode, BinaryTreeNode, TernaryTreeNode])
+def test_nodes_have_no_instance_dict(node_type):
+    node = node_type("x")
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        node.unknown_attribute = 1
+
+
+@pytest.mark.parametrize("node_type", [TreeNode, BinaryTreeNode, TernaryTreeNode])
+def test_flags_default_false_and_are_independent(node_type):
+    node = node_type("x")
+    flags = FLAGS + (["is_middle"] if node_type is TernaryTreeNode else [])
+    assert all(getattr(node, flag) is False for flag in flags)
+
+    for flag in flags:
+        setattr(node, flag, True)
+        assert getattr(node, flag) is True
+        assert [f for f in flags if getattr(node, f)] == [flag]
+        setattr(node, flag, False)
+
+
+def test_tree_node_has_no_is_middle_flag():
+    assert not hasattr(TreeNode("x"), "is_middle")
+
+
+def test_children_list_allocated_on_first_use():
+    node = TreeNode("x")
+    assert node.children == ()
+    assert node._children is None
+
+    child = TreeNode("c", parent=node)
+    node.children_nodes.append(child)
+    assert node.children == [child]
+    assert node.children is node.children_nodes
+
+
+def test_children_nodes_attribute_compatibility():
+    existing = [TreeNode("a")]
+    node = TreeNode("x", children_nodes=existing)
+    assert node.children_nodes is existing
+
+    node.children_nodes = None
+    assert node.children == ()
+    assert node.children_nodes == []
+    assert isinstance(node.children_nodes, list)
+
+
+def test_binary_and_ternary_child_links():
+    left, right = BinaryTreeNode("l"), BinaryTreeNode("r")
+    node = BinaryTreeNode("x", left_child=left, right_child=right)
+    assert (node.left_child, node.right_child) == (left, right)
+
+    middle = TernaryTreeNode("m")
+    ternary = TernaryTreeNode("x", middle_child=middle)
+    assert ternary.middle_child is middle
+    assert ternary.left_child is None and ternary.right_child is None
+
+
+@pytest.mark.performance_test
+@pytest.mark.parametrize(
+    "factory, budget",
+    # 72, 72 and 80 bytes on 64-bit CPython: the object header plus one
+    # pointer per slot (TreeNode: data, parent, _children, observers and the
+    # flag word), with one pointer of headroom.
+    [
+        (lambda: TreeNode(None), 80),
+        (lambda: BinaryTreeNode(None), 80),
+        (lambda: TernaryTreeNode(None), 88),
+    ],
+)
+def test_bytes_per_node_budget(factory, budget):
+    count = 10_000
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        nodes = [factory() for _ in range(count)]
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    # Subtract the list holding the nodes (one pointer per node).
+    per_node = (retained - 8 * count) / count
+    assert per_node <= budget, per_node
+    assert len(nodes) == count
@@ -0,0 +1,281 @@
+import random
+
+import pytest
+
+from src.data_structures.trees.n_ary_trees.n_ary_tree_operations import (
+    add_child_node,
+    add_child_node_at_index,
+    add_child_nodes,
+    add_child_nodes_from_index,
+    breadth_first_search,
+    create_root,
+    create_root_with_children_data_list,
+    depth_first_search,
+    iter_level_order,
+    iter_pre_order,
+    move_subtree,
+    search_and_remove_node,
+    search_and_remove_nodes,
+    set_node_data,
+)
+from src.data_structures.trees.n_ary_trees.tree_observers import (
+    TreeObserver,
+    ValueIndex,
+    find_observer,
+    register_observer,
+    unregister_observer,
+)
+from src.data_structures.trees.tree_node import TreeNode
+
+
+class RecordingObserver(TreeObserver):
+    def __init__(self):
+        self.events = []
+
+    def nodes_attached(self, parent, nodes):
+        self.events.append(
+            ("attached", parent and parent.data, [node.data for node in nodes])
+        )
+
+    def node_removed(self, node, parent, moved_children):
+        self.events.append(
+            ("removed", node.data, parent.data, [c.data for c in moved_children])
+        )
+
+    def subtree_detached(self, node, parent):
+        self.events.append(("detached", node.data, parent.data))
+
+    def node_relabeled(self, node, old_data):
+        self.events.append(("relabeled", old_data, node.data))
+
+
+def _random_tree(seed, size=200, values=20, indexed=False):
+    rng = random.Random(seed)
+    root = create_root(0, indexed=indexed)
+    nodes = [root]
+    for _ in range(size):
+        parent = rng.choice(nodes)
+        value = rng.randrange(1, values)
+        if rng.random() < 0.3 and parent.children:
+            index = rng.randrange(len(parent.children) + 1)
+            nodes.append(add_child_node_at_index(parent, value, index))
+        else:
+            nodes.append(add_child_node(parent, value))
+    return root, nodes
+
+
+def _shape(root):
+    return [
+        (node.data, [child.data for child in node.children])
+        for node in iter_pre_order(root)
+    ]
+
+
+def _check_index_matches_tree(root):
+    index = find_observer(root, ValueIndex)
+    tree_nodes = list(iter_pre_order(root))
+    assert len(index) == len(tree_nodes)
+    for node in tree_nodes:
+        assert any(n is node for n in index.nodes(node.data))
+        assert node.observers is root.observers
+
+
+def test_indexed_searches_match_traversal_order_with_duplicates():
+    for seed in range(5):
+        plain, plain_nodes = _random_tree(seed)
+        indexed, indexed_nodes = _random_tree(seed, indexed=True)
+        position = {id(node): i for i, node in enumerate(indexed_nodes)}
+        plain_position = {id(node): i for i, node in enumerate(plain_nodes)}
+
+        for value in range(-1, 21):
+            for search in (depth_first_search, breadth_first_search):
+                expected = search(plain, value)
+                found = search(indexed, value)
+                if expected is None:
+                    assert found is None
+                else:
+                    assert position[id(found)] == plain_position[id(expected)]
+
+
+def test_indexed_search_of_a_subtree_only_returns_descendants():
+    root, _ = _random_tree(7, indexed=True)
+    for subtree in list(iter_level_order(root))[1:30]:
+        for value in range(1, 20):
+            expected = next(
+                (n for n in iter_pre_order(subtree) if n.data == value), None
+            )
+            assert depth_first_search(subtree, value) is expected
+            expected = next(
+                (n for n in iter_level_order(subtree) if n.data == value), None
+            )
+            assert breadth_first_search(subtree, value) is expected
+
+
+def test_index_tracks_removals_and_bulk_insertions():
+    plain, _ = _random_tree(3)
+    indexed, _ = _random_tree(3, indexed=True)
+
+    for value in [5, 5, 1, 12, 99, 3, 0]:
+        expected = search_and_remove_node(plain, value)
+        removed = search_and_remove_node(indexed, value)
+        assert (removed and removed.data) == (expected and expected.data)
+        if removed is not None:
+            assert removed.observers is None
+        assert _shape(indexed) == _shape(plain)
+        _check_index_matches_tree(indexed)
+
+    search_and_remove_nodes(plain, [2, 4, 6])
+    search_and_remove_nodes(indexed, [2, 4, 6])
+    add_child_nodes(plain.children[0], [50, 51])
+    add_child_nodes(indexed.children[0], [50, 51])
+    add_child_nodes_from_index(plain, [52, 53], 1)
+    add_child_nodes_from_index(indexed, [52, 53], 1)
+
+    assert _shape(indexed) == _shape(plain)
+    _check_index_matches_tree(indexed)
+    assert depth_first_search(indexed, 53).parent is indexed
+
+
+def test_indexed_multi_removal_matches_a_full_scan():
+    for seed in range(5):
+        rng = random.Random(seed)
+        plain, _ = _random_tree(seed)
+        indexed, _ = _random_tree(seed, indexed=True)
+
+        for _ in range(4):
+            targets = rng.sample(range(0, 20), 3)
+            position = rng.randrange(len(plain.children))
+            for plain_root, indexed_root in (
+                (plain.children[position], indexed.children[position]),
+                (plain, indexed),
+            ):
+                expected = search_and_remove_nodes(plain_root, targets)
+                removed = search_and_remove_nodes(indexed_root, targets)
+                assert [n.data for n in removed or ()] == [
+                    n.data for n in expected or ()
+                ]
+                assert _shape(indexed) == _shape(plain)
+                _check_index_matches_tree(indexed)
+        for node in iter_pre_order(indexed):
+            assert node.is_leaf == (not node.children)
+
+
+def test_create_root_variants_can_be_indexed():
+    root = create_root_with_children_data_list("root", ["a", "b", "a"], indexed=True)
+    assert depth_first_search(root, "a") is root.children[0]
+    _check_index_matches_tree(root)
+
+    subtree = create_root_with_children_data_list("sub", ["x"])
+    other = create_root("other", [subtree], indexed=True)
+    assert depth_first_search(other, "x") is subtree.children[0]
+    _check_index_matches_tree(other)
+
+
+def test_index_handles_unhashable_targets():
+    root = create_root_with_children_data_list("root", ["a"], indexed=True)
+    assert depth_first_search(root, ["a"]) is None
+    assert ["a"] not in find_observer(root, ValueIndex)
+
+
+def test_observer_receives_events():
+    root = create_root_with_children_data_list("root", ["a", "b"])
+    observer = register_observer(root, RecordingObserver())
+    assert observer.events == [("attached", None, ["root"])]
+
+    add_child_node(root.children[0], "c")
+    add_child_nodes_from_index(root, ["d", "e"], 0)
+    search_and_remove_node(root, "a")
+
+    assert observer.events[1:] == [
+        ("attached", "a", ["c"]),
+        ("attached", "root", ["d", "e"]),
+        ("removed", "a", "root", ["c"]),
+    ]
+
+    unregister_observer(root, observer)
+    add_child_node(root, "f")
+    assert len(observer.events) == 4
+
+
+def test_register_observer_requires_the_tree_root():
+    root = create_root_with_children_data_list("root", ["a"])
+    with pytest.raises(ValueError):
+        register_observer(root.children[0], TreeObserver())
+    with pytest.raises(ValueError):
+        register_observer(None, TreeObserver())
+    with pytest.raises(ValueError):
+        unregister_observer(root, TreeObserver())
+
+
+def test_unobserved_trees_do_not_carry_an_observer_list():
+    root = create_root_with_children_data_list("root", ["a"])
+    add_child_node(root, "b")
+    assert all(node.observers is None for node in iter_pre_order(root))
+    assert find_observer(root, ValueIndex) is None
+    assert find_observer(TreeNode("x"), ValueIndex) is None
+
+
+def test_multi_removal_reports_the_receiving_ancestor():
+    # root -> [a -> [b -> [c]], d]
+    root = create_root_with_children_data_list("root", ["a", "d"])
+    b = add_child_node(root.children[0], "b")
+    add_child_node(b, "c")
+    observer = register_observer(root, RecordingObserver())
+
+    removed = search_and_remove_nodes(root, ["a", "b"])
+
+    assert [node.data for node in removed] == ["a", "b"]
+    assert observer.events[1:] == [
+        ("removed", "a", "root", ["b"]),
+        ("removed", "b", "root", ["c"]),
+    ]
+
+
+def test_observer_receives_move_and_relabel_events():
+    root = create_root_with_children_data_list("root", ["a", "b"])
+    observer = register_observer(root, RecordingObserver())
+    a, b = root.children_nodes
+
+    move_subtree(b, a)
+    set_node_data(b, "z")
+    assert observer.events[1:] == [
+        ("detached", "b", "root"),
+        ("attached", "a", ["b"]),
+        ("relabeled", "b", "z"),
+    ]
+    assert b.observers is root.observers
+
+
+def test_index_tracks_moves_and_relabels():
+    root, nodes = _random_tree(11, indexed=True)
+    rng = random.Random(11)
+
+    for _ in range(100):
+        node = rng.choice(nodes[1:])
+        if rng.random() < 0.5:
+            set_node_data(node, rng.randrange(1, 20))
+            continue
+        targets = [n for n in nodes if not any(a is node for a in _ancestors(n))]
+        move_subtree(node, rng.choice(targets))
+
+    _check_index_matches_tree(root)
+    for value in range(1, 20):
+        expected = next((n for n in iter_pre_order(root) if n.data == value), None)
+        assert depth_first_search(root, value) is expected
+
+
+def _ancestors(node):
+    while node is not None:
+        yield node
+        node = node.parent
+
+
+def test_duplicates_under_a_wide_node_resolve_in_order():
+    root = create_root_with_children_data_list(
+        "root", [i if i % 20 else "copy" for i in range(1, 40_001)]
+    )
+    register_observer(root, ValueIndex())
+    add_child_node_at_index(root, "copy", 5)
+
+    assert depth_first_search(root, "copy") is root.children[5]
+    assert breadth_first_search(root, "copy") is root.children[5]
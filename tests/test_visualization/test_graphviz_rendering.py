@@ -0,0 +1,229 @@
+import io
+import re
+import shutil
+
+import pytest
+
+from src.data_structures.linked_lists.circular_doubly_linked_list.circular_doubly_linked_list import (
+    CircularDoublyLinkedList,
+)
+from src.data_structures.linked_lists.circular_doubly_linked_list.circular_doubly_linked_list_operations import (
+    insert_cdll_element,
+)
+from src.data_structures.linked_lists.doubly_linked_list.doubly_linked_list import (
+    DoublyLinkedList,
+)
+from src.data_structures.linked_lists.doubly_linked_list.doubly_linked_list_operations import (
+    insert_dll_element,
+)
+from src.data_structures.linked_lists.singly_linked_list.singly_linked_list import (
+    SinglyLinkedList,
+)
+from src.data_structures.linked_lists.singly_linked_list.singly_linked_list_operations import (
+    insert_sll_element,
+)
+from src.data_structures.trees.n_ary_trees.lazy_tree import create_lazy_root
+from src.data_structures.trees.n_ary_trees.merkle_hashes import track_merkle_hashes
+from src.data_structures.trees.n_ary_trees.n_ary_tree_builders import (
+    build_tree_from_nested_dict,
+    build_tree_from_parent_array,
+)
+from src.data_structures.visualization.graphviz_rendering import (
+    render_dot,
+    write_linked_list_dot,
+    write_tree_dot,
+)
+
+NODE = re.compile(r'^  (n\d+) \[label="(.*)"\];$')
+SUMMARY = re.compile(r'^  (s\d+) \[label="(.*)", ')
+EDGE = re.compile(r"^  (\w+) -> (\w+)(?: \[(.*)\])?;$")
+
+
+def _parse(text):
+    lines = text.splitlines()
+    assert lines[0].startswith("digraph") and lines[-1] == "}"
+    nodes, summaries, edges = {}, {}, []
+    for line in lines[1:-1]:
+        if match := NODE.match(line):
+            nodes[match[1]] = match[2]
+        elif match := SUMMARY.match(line):
+            summaries[match[1]] = match[2]
+        elif match := EDGE.match(line):
+            edges.append((match[1], match[2], match[3] or ""))
+    return nodes, summaries, edges
+
+
+def _tree_dot(root, **caps):
+    output = io.StringIO()
+    drawn = write_tree_dot(root, output, **caps)
+    nodes, summaries, edges = _parse(output.getvalue())
+    assert drawn == len(nodes)
+    return nodes, summaries, edges
+
+
+def _hidden(summaries):
+    return sum(int(label.split()[0]) for label in summaries.values())
+
+
+def _wide_tree(width):
+    return build_tree_from_parent_array([-1] + [0] * width, list(range(width + 1)))
+
+
+def test_small_tree_is_drawn_completely():
+    root = build_tree_from_nested_dict(
+        {"data": "a", "children": [{"data": "b", "children": [{"data": "c"}]}]}
+    )
+    nodes, summaries, edges = _tree_dot(root)
+    assert sorted(nodes.values()) == ["a", "b", "c"]
+    assert summaries == {} and len(edges) == 2
+
+
+def test_max_children_summarizes_the_rest():
+    nodes, summaries, edges = _tree_dot(_wide_tree(100), max_children=3)
+    assert list(nodes.values()) == ["0", "1", "2", "3"]
+    assert list(summaries.values()) == ["97 more"]
+    assert ("n0", "s0", "style=dashed") in edges
+
+
+def test_max_depth_summarizes_deeper_levels():
+    parents = [-1] + [(node - 1) // 2 for node in range(1, 31)]
+    root = build_tree_from_parent_array(parents, list(range(31)))
+    nodes, summaries, _ = _tree_dot(root, max_depth=2)
+    assert len(nodes) == 7
+    assert list(summaries.values()) == ["2 more"] * 4
+
+
+def test_level_sampling_is_bounded_and_reproducible():
+    root = _wide_tree(10_000)
+    first = _tree_dot(root, max_level_nodes=50, seed=3)
+    nodes, summaries, _ = first
+    assert len(nodes) == 51 and _hidden(summaries) == 10_000 - 50
+    assert _tree_dot(root, max_level_nodes=50, seed=3) == first
+    assert _tree_dot(root, max_level_nodes=50, seed=4) != first
+
+
+def test_max_nodes_bounds_an_infinite_tree():
+    root = create_lazy_root(0, lambda value: range(10 * value + 1, 10 * value + 11))
+    nodes, summaries, edges = _tree_dot(root, max_nodes=500)
+    assert len(nodes) == 500
+    assert len(edges) == 499 + len(summaries)
+
+
+def test_every_hidden_child_is_counted():
+    parents = [-1] + [(node - 1) // 5 for node in range(1, 2000)]
+    root = build_tree_from_parent_array(parents, list(range(2000)))
+    nodes, summaries, edges = _tree_dot(
+        root, max_children=3, max_level_nodes=40, max_nodes=None
+    )
+    solid = [edge for edge in edges if not edge[1].startswith("s")]
+    assert len(solid) == len(nodes) - 1
+    # Every drawn node accounts for all its children, drawn or summarized.
+    heads = {}
+    for tail, head, _ in edges:
+        heads.setdefault(tail, []).append(head)
+    for name, data in nodes.items():
+        value = int(data)
+        expected = sum(
+            1 for child in range(5 * value + 1, 5 * value + 6) if child < 2000
+        )
+        shown = [head for head in heads.get(name, []) if head in nodes]
+        hidden = _hidden(
+            {head: summaries[head] for head in heads.get(name, []) if head in summaries}
+        )
+        assert len(shown) + hidden == expected
+        assert len(shown) <= 3
+
+
+def test_collapse_duplicates_draws_equal_subtrees_once():
+    def subtree():
+        return {"data": "x", "children": [{"data": "y"}, {"data": "z"}]}
+
+    root = build_tree_from_nested_dict(
+        {"data": "r", "children": [subtree(), subtree(), {"data": "y"}]}
+    )
+    nodes, _, edges = _tree_dot(root, collapse_duplicates=True)
+    assert sorted(nodes.values()) == ["r", "x", "y", "y", "z"]
+    assert ("n0", "n1", "style=dashed") in edges
+
+    track_merkle_hashes(root)
+    assert _tree_dot(root, collapse_duplicates=True)[0] == nodes
+
+
+def test_labels_are_escaped(tmp_path):
+    root = build_tree_from_nested_dict({"data": 'say "hi"\\\n'})
+    path = tmp_path / "tree.dot"
+    assert write_tree_dot(root, path) == 1
+    assert r'[label="say \"hi\"\\\n"]' in path.read_text()
+
+
+def test_invalid_arguments_raise():
+    with pytest.raises(ValueError):
+        write_tree_dot(None, io.StringIO())
+    with pytest.raises(ValueError):
+        write_tree_dot(_wide_tree(1), io.StringIO(), max_depth=-1)
+    with pytest.raises(ValueError):
+        write_linked_list_dot(None, io.StringIO())
+
+
+def _list_dot(linked_list, max_nodes):
+    output = io.StringIO()
+    drawn = write_linked_list_dot(linked_list, output, max_nodes)
+    nodes, summaries, edges = _parse(output.getvalue())
+    assert drawn == len(nodes)
+    return nodes, summaries, edges
+
+
+def test_singly_linked_list_is_cut_off_with_its_tail():
+    sll = SinglyLinkedList()
+    for value in range(1000):
+        insert_sll_element(sll, value)
+
+    nodes, summaries, edges = _list_dot(sll, 5)
+    assert list(nodes.values()) == ["0", "1", "2", "3", "4", "999"]
+    assert list(summaries.values()) == ["994 more"]
+    assert ("n3", "n4", "") in edges and ("s0", "n5", "style=dashed") in edges
+
+    nodes, summaries, edges = _list_dot(sll, None)
+    assert len(nodes) == 1000 and not summaries and len(edges) == 999
+
+
+def test_list_cut_off_just_before_its_tail_has_no_summary():
+    dll = DoublyLinkedList()
+    for value in range(4):
+        insert_dll_element(dll, value)
+
+    nodes, summaries, edges = _list_dot(dll, 3)
+    assert list(nodes.values()) == ["0", "1", "2", "3"] and not summaries
+    assert ("n2", "n3", "dir=both") in edges
+
+
+def test_doubly_and_circular_lists():
+    dll = DoublyLinkedList()
+    for value in range(3):
+        insert_dll_element(dll, value)
+    _, _, edges = _list_dot(dll, 10)
+    assert edges == [("n0", "n1", "dir=both"), ("n1", "n2", "dir=both")]
+
+    cdll = CircularDoublyLinkedList()
+    for value in range(20):
+        insert_cdll_element(cdll, value)
+    nodes, summaries, edges = _list_dot(cdll, 20)
+    assert len(nodes) == 20 and not summaries
+    assert ("n19", "n0", "constraint=false") in edges
+
+    nodes, summaries, edges = _list_dot(cdll, 4)
+    assert list(summaries.values()) == ["15 more"]
+    assert ("n4", "n0", "constraint=false") in edges
+
+
+def test_empty_list():
+    nodes, summaries, edges = _list_dot(SinglyLinkedList(), 10)
+    assert nodes == summaries == {} and edges == []
+
+
+@pytest.mark.skipif(shutil.which("dot") is None, reason="needs the Graphviz binaries")
+def test_render_dot(tmp_path):
+    pytest.importorskip("graphviz")
+    path = tmp_path / "tree.dot"
+    write_tree_dot(_wide_tree(10), path, max_children=4)
+    assert render_dot(path).endswith(".svg")